@@ -5,6 +5,9 @@ from app.api.v1.routers.charts.natal import router as natal_router
 from app.api.v1.routers.charts.visualization import router as visualization_router
 from app.api.v1.routers.charts.reports import router as reports_router
 from app.api.v1.routers.charts.interpretations import router as interpretations_router
+from app.api.v1.routers.charts.transit import router as transit_router
+from app.api.v1.routers.charts.synastry import router as synastry_router
+from app.api.v1.routers.charts.composite import router as composite_router
 
 # Create the charts router
 router = APIRouter(
@@ -17,6 +20,9 @@ router.include_router(natal_router)
 router.include_router(visualization_router)
 router.include_router(reports_router)
 router.include_router(interpretations_router)
+router.include_router(transit_router)
+router.include_router(synastry_router)
+router.include_router(composite_router)
 
 # Export the router for use in the main API
 __all__ = ["router"]
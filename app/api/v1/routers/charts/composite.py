@@ -1,15 +1,87 @@
 """Composite chart router module."""
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, status
+
+from app.core.dependencies import CompositeServiceDep
+from app.core.exceptions import ChartCalculationError, InvalidBirthDataError, LocationError
+from app.schemas.composite import CompositeChartRequest
+from app.schemas.natal_chart import NatalChartResponse
 
 router = APIRouter(
     prefix="/composite",
     tags=["composite-chart"],
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Invalid input data",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "error": {
+                            "code": 400,
+                            "message": "Either city/nation or longitude/latitude must be provided",
+                            "type": "LocationError",
+                            "path": "/api/v1/charts/composite/"
+                        }
+                    }
+                }
+            }
+        }
+    }
+)
+
+@router.post(
+    "/",
+    response_model=NatalChartResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Calculate Composite Chart",
+    description="""
+    Calculate the midpoint composite chart of two people.
+
+    Every planet, point and house cusp of the composite chart is the midpoint of
+    the two natal positions. Composite points do not move, so `retrograde` is
+    always false, and `birth_date` is the midpoint of the two birth dates.
+    """
 )
+def calculate_composite_chart(
+    request: CompositeChartRequest,
+    composite_service: CompositeServiceDep
+) -> NatalChartResponse:
+    """Calculate a midpoint composite chart."""
+    try:
+        return composite_service.calculate_composite_chart(
+            request.first,
+            request.second,
+            houses_system=request.houses_system
+        )
+    except Exception as e:
+        if isinstance(e, (InvalidBirthDataError, LocationError)):
+            raise
+        raise ChartCalculationError(str(e))
+
+@router.post(
+    "/davison",
+    response_model=NatalChartResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Calculate Davison Chart",
+    description="""
+    Calculate the Davison chart of two people.
 
-@router.get("/", status_code=status.HTTP_501_NOT_IMPLEMENTED)
-async def calculate_composite_chart():
-    """Placeholder for composite chart calculation endpoint."""
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Composite chart calculation not yet implemented"
-    ) 
\ No newline at end of file
+    The Davison chart is a regular natal chart cast for the midpoint in time of
+    the two births, at the midpoint of the two birth places. Its `birth_date`
+    is given in UTC.
+    """
+)
+def calculate_davison_chart(
+    request: CompositeChartRequest,
+    composite_service: CompositeServiceDep
+) -> NatalChartResponse:
+    """Calculate a Davison relationship chart."""
+    try:
+        return composite_service.calculate_davison_chart(
+            request.first,
+            request.second,
+            houses_system=request.houses_system
+        )
+    except Exception as e:
+        if isinstance(e, (InvalidBirthDataError, LocationError)):
+            raise
+        raise ChartCalculationError(str(e))
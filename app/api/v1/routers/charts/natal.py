@@ -1,15 +1,23 @@
 """Natal chart router module."""
-from typing import Annotated
+from typing import Annotated, List
 
 from fastapi import APIRouter, HTTPException, status, Depends
 
-from app.core.dependencies import AstrologyServiceDep
+from app.core.dependencies import AstrologyServiceDep, ChartCacheDep, ComputePoolDep, SettingsDep
 from app.core.exceptions import (
     ChartCalculationError,
+    ComputeCapacityError,
     InvalidBirthDataError,
-    LocationError
+    LocationError,
+    ZodiacEngineException
+)
+from app.schemas.natal_chart import (
+    ChartCacheStats,
+    ComputePoolStats,
+    NatalChartBatchItem,
+    NatalChartRequest,
+    NatalChartResponse
 )
-from app.schemas.natal_chart import NatalChartRequest, NatalChartResponse
 from app.services.astrology import AstrologyService
 
 router = APIRouter(
@@ -61,6 +69,21 @@ router = APIRouter(
                     }
                 }
             }
+        },
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "description": "Chart calculation capacity exhausted; retry after the Retry-After header",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "error": {
+                            "code": 503,
+                            "message": "Chart calculation capacity exhausted, retry later",
+                            "type": "ComputeCapacityError",
+                            "path": "/api/v1/charts/natal/"
+                        }
+                    }
+                }
+            }
         }
     }
 )
@@ -88,6 +111,9 @@ router = APIRouter(
     You can provide either city/country or exact coordinates (longitude/latitude).
     If both are provided, coordinates take precedence.
     
+    Calculations run in a bounded pool of worker processes. When the pool is
+    saturated the request fails fast with 503 and a Retry-After header.
+    
     You can also specify which house system to use. The default is Placidus ('P').
     Other options include:
     - 'W': Whole Sign
@@ -141,9 +167,10 @@ router = APIRouter(
         }
     }
 )
-def calculate_natal_chart(
+async def calculate_natal_chart(
     request: NatalChartRequest,
-    astrology_service: AstrologyServiceDep
+    astrology_service: AstrologyServiceDep,
+    compute_pool: ComputePoolDep
 ) -> NatalChartResponse:
     """Calculate natal chart for given birth data."""
     try:
@@ -157,7 +184,8 @@ def calculate_natal_chart(
                 "Either city/nation or longitude/latitude must be provided"
             )
 
-        return astrology_service.calculate_natal_chart(
+        return await astrology_service.calculate_natal_chart_async(
+            compute_pool,
             name=request.name,
             birth_date=request.birth_date,
             city=request.city,
@@ -168,6 +196,107 @@ def calculate_natal_chart(
             houses_system=request.houses_system
         )
     except Exception as e:
-        if isinstance(e, (InvalidBirthDataError, LocationError)):
+        if isinstance(e, (InvalidBirthDataError, LocationError, ComputeCapacityError)):
             raise
-        raise ChartCalculationError(str(e)) 
\ No newline at end of file
+        raise ChartCalculationError(str(e)) 
+
+@router.post(
+    "/batch",
+    response_model=List[NatalChartBatchItem],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    summary="Calculate Natal Charts in Batch",
+    description="""
+    Calculate many natal charts in a single request.
+    
+    Accepts a list of natal chart requests and returns one result per request, in order.
+    Each result contains either the calculated chart or an error message, so a single
+    invalid entry does not fail the whole batch.
+    
+    Charts with coordinates and a timezone are calculated together directly with the
+    Swiss Ephemeris, which is much faster than calculating them one by one.
+    Charts with only city/country are resolved through geonames individually.
+    
+    Cached charts are answered directly; the others are calculated together in one
+    compute pool worker. When the pool is saturated the request fails with 503.
+    """,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Batch processed; inspect each item for its chart or error",
+            "content": {
+                "application/json": {
+                    "example": [
+                        {
+                            "index": 0,
+                            "chart": {
+                                "name": "John Doe",
+                                "birth_date": "1990-01-01T12:00:00",
+                                "planets": [],
+                                "houses": {},
+                                "aspects": [],
+                                "house_system": {
+                                    "name": "Placidus",
+                                    "identifier": "P"
+                                }
+                            }
+                        },
+                        {
+                            "index": 1,
+                            "error": "Either city/nation or longitude/latitude must be provided",
+                            "error_type": "LocationError"
+                        }
+                    ]
+                }
+            }
+        }
+    }
+)
+async def calculate_natal_charts_batch(
+    requests: List[NatalChartRequest],
+    astrology_service: AstrologyServiceDep,
+    compute_pool: ComputePoolDep,
+    settings: SettingsDep
+) -> List[NatalChartBatchItem]:
+    """Calculate natal charts for a list of birth data."""
+    max_size = settings.NATAL_BATCH_MAX_SIZE
+    if max_size and len(requests) > max_size:
+        raise InvalidBirthDataError(f"Batch size {len(requests)} exceeds the maximum of {max_size} charts")
+
+    results = await astrology_service.calculate_natal_charts_async(requests, compute_pool)
+
+    items = []
+    for index, result in enumerate(results):
+        if isinstance(result, Exception):
+            message = result.detail if isinstance(result, ZodiacEngineException) else str(result)
+            items.append(NatalChartBatchItem(
+                index=index,
+                error=message,
+                error_type=type(result).__name__
+            ))
+        else:
+            items.append(NatalChartBatchItem(index=index, chart=result))
+    return items
+
+@router.get(
+    "/cache",
+    response_model=ChartCacheStats,
+    status_code=status.HTTP_200_OK,
+    summary="Natal Chart Cache Statistics",
+    description="Return size, hit ratio, eviction and expiration statistics of the natal chart cache."
+)
+async def get_chart_cache_stats(chart_cache: ChartCacheDep) -> ChartCacheStats:
+    """Return statistics of the natal chart cache."""
+    if chart_cache is None:
+        return ChartCacheStats(enabled=False)
+    return ChartCacheStats(enabled=True, **chart_cache.stats())
+
+@router.get(
+    "/compute-pool",
+    response_model=ComputePoolStats,
+    status_code=status.HTTP_200_OK,
+    summary="Compute Pool Statistics",
+    description="Return worker count, queue depth and per-route completed, failed and rejected calculations of the compute pool."
+)
+async def get_compute_pool_stats(compute_pool: ComputePoolDep) -> ComputePoolStats:
+    """Return statistics of the chart compute pool."""
+    return ComputePoolStats(**compute_pool.stats())
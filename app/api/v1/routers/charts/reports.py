@@ -143,6 +143,7 @@ def generate_natal_report(
     - Birth data information for both individuals
     - Planet positions, signs, and house placements for both charts
     - House cusp positions and signs for both charts
+    - Aspects between the two charts
     
     The reports are formatted as plain text tables that can be easily displayed
     or used as input for LLM-based relationship interpretations.
@@ -167,7 +168,8 @@ def generate_natal_report(
                             "data_table": "ASCII table with birth data",
                             "planets_table": "ASCII table with planet positions",
                             "houses_table": "ASCII table with house positions"
-                        }
+                        },
+                        "aspects_table": "ASCII table with synastry aspects"
                     }
                 }
             }
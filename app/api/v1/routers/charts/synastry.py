@@ -1,15 +1,186 @@
 """Synastry chart router module."""
-from fastapi import APIRouter, HTTPException, status
+from typing import List
+
+from fastapi import APIRouter, status
+
+from app.core.dependencies import SettingsDep, SynastryServiceDep
+from app.core.exceptions import (
+    ChartCalculationError,
+    InvalidBirthDataError,
+    LocationError,
+    ZodiacEngineException
+)
+from app.schemas.synastry import (
+    SynastryMatchItem,
+    SynastryMatchRequest,
+    SynastryRequest,
+    SynastryResponse
+)
 
 router = APIRouter(
     prefix="/synastry",
     tags=["synastry-chart"],
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Invalid input data",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "error": {
+                            "code": 400,
+                            "message": "Either city/nation or longitude/latitude must be provided",
+                            "type": "LocationError",
+                            "path": "/api/v1/charts/synastry/"
+                        }
+                    }
+                }
+            }
+        }
+    }
+)
+
+@router.post(
+    "/",
+    response_model=SynastryResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Calculate Synastry Aspects",
+    description="""
+    Calculate the aspects between the natal charts of two people.
+
+    Every active point of the first chart is compared with every active point
+    of the second chart. In each returned aspect, `p1_name` refers to the first
+    person and `p2_name` to the second.
+    """,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Successfully calculated synastry aspects",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "first_name": "John Doe",
+                        "second_name": "Jane Smith",
+                        "aspects": [
+                            {
+                                "p1_name": "Sun",
+                                "p2_name": "Moon",
+                                "aspect": "trine",
+                                "orbit": 2.35
+                            }
+                        ]
+                    }
+                }
+            }
+        }
+    }
+)
+def calculate_synastry_chart(
+    request: SynastryRequest,
+    synastry_service: SynastryServiceDep
+) -> SynastryResponse:
+    """Calculate synastry aspects between two natal charts."""
+    try:
+        aspects = synastry_service.calculate_synastry(
+            request.first,
+            request.second,
+            active_points=request.active_points,
+            active_aspects=request.active_aspects
+        )
+        return SynastryResponse(
+            first_name=request.first.name,
+            second_name=request.second.name,
+            aspects=aspects
+        )
+    except Exception as e:
+        if isinstance(e, (InvalidBirthDataError, LocationError)):
+            raise
+        raise ChartCalculationError(str(e))
+
+@router.post(
+    "/matches",
+    response_model=List[SynastryMatchItem],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    summary="Match One Chart Against Many",
+    description="""
+    Compare one natal chart against a list of candidate charts.
+
+    Returns one result per candidate, in order, with the synastry aspects between
+    the subject and that candidate. A candidate with invalid data gets an error
+    message instead, without failing the whole request.
+
+    All candidate charts are calculated together and compared in a single
+    vectorized pass, so thousands of candidates can be matched in one request.
+    """,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Candidates processed; inspect each item for its aspects or error",
+            "content": {
+                "application/json": {
+                    "example": [
+                        {
+                            "index": 0,
+                            "name": "Jane Smith",
+                            "aspect_count": 1,
+                            "aspects": [
+                                {
+                                    "p1_name": "Sun",
+                                    "p2_name": "Moon",
+                                    "aspect": "trine",
+                                    "orbit": 2.35
+                                }
+                            ]
+                        },
+                        {
+                            "index": 1,
+                            "name": "Alex Roe",
+                            "error": "Either city/nation or longitude/latitude must be provided",
+                            "error_type": "LocationError"
+                        }
+                    ]
+                }
+            }
+        }
+    }
 )
+def calculate_synastry_matches(
+    request: SynastryMatchRequest,
+    synastry_service: SynastryServiceDep,
+    settings: SettingsDep
+) -> List[SynastryMatchItem]:
+    """Calculate synastry aspects between one chart and many candidates."""
+    max_candidates = settings.SYNASTRY_MAX_CANDIDATES
+    if max_candidates and len(request.candidates) > max_candidates:
+        raise InvalidBirthDataError(
+            f"{len(request.candidates)} candidates exceed the maximum of {max_candidates}"
+        )
+
+    try:
+        results = synastry_service.calculate_matches(
+            request.subject,
+            request.candidates,
+            active_points=request.active_points,
+            active_aspects=request.active_aspects
+        )
+    except Exception as e:
+        if isinstance(e, (InvalidBirthDataError, LocationError)):
+            raise
+        raise ChartCalculationError(str(e))
 
-@router.get("/", status_code=status.HTTP_501_NOT_IMPLEMENTED)
-async def calculate_synastry_chart():
-    """Placeholder for synastry chart calculation endpoint."""
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Synastry chart calculation not yet implemented"
-    ) 
\ No newline at end of file
+    items = []
+    for index, (candidate, result) in enumerate(zip(request.candidates, results)):
+        if isinstance(result, Exception):
+            message = result.detail if isinstance(result, ZodiacEngineException) else str(result)
+            items.append(SynastryMatchItem(
+                index=index,
+                name=candidate.name,
+                error=message,
+                error_type=type(result).__name__
+            ))
+        else:
+            items.append(SynastryMatchItem(
+                index=index,
+                name=candidate.name,
+                aspect_count=len(result),
+                aspects=result
+            ))
+    return items
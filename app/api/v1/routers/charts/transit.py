@@ -1,15 +1,116 @@
 """Transit chart router module."""
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, status
+
+from app.core.dependencies import AstrologyServiceDep, TransitServiceDep
+from app.core.exceptions import (
+    ChartCalculationError,
+    InvalidBirthDataError,
+    InvalidDateRangeError,
+    LocationError
+)
+from app.schemas.transit import TransitRequest, TransitTimelineResponse
 
 router = APIRouter(
     prefix="/transit",
     tags=["transit-chart"],
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Invalid input data",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "error": {
+                            "code": 400,
+                            "message": "Transit period cannot exceed 3660 days",
+                            "type": "InvalidDateRangeError",
+                            "path": "/api/v1/charts/transit/"
+                        }
+                    }
+                }
+            }
+        }
+    }
 )
 
-@router.get("/", status_code=status.HTTP_501_NOT_IMPLEMENTED)
-async def calculate_transit_chart():
-    """Placeholder for transit chart calculation endpoint."""
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Transit chart calculation not yet implemented"
-    ) 
\ No newline at end of file
+@router.post(
+    "/",
+    response_model=TransitTimelineResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Calculate Transit Timeline",
+    description="""
+    Calculate the exact times transiting planets form aspects to a natal chart.
+
+    Returns every exact aspect between the transiting points and the natal points
+    within the requested period, to the minute, in chronological order.
+
+    Transits are calculated from a precomputed daily ephemeris table, so a
+    twelve-month timeline is returned in well under a second. The table is
+    built, or mapped if it has been built in advance, when the API starts.
+    """,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Successfully calculated transit timeline",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "name": "John Doe",
+                        "start_date": "2025-01-01T00:00:00",
+                        "end_date": "2026-01-01T00:00:00",
+                        "transits": [
+                            {
+                                "date": "2025-01-01T05:00:00Z",
+                                "transiting_point": "Sun",
+                                "natal_point": "Sun",
+                                "aspect": "conjunction",
+                                "transit_longitude": 281.03,
+                                "retrograde": False
+                            }
+                        ]
+                    }
+                }
+            }
+        }
+    }
+)
+def calculate_transit_chart(
+    request: TransitRequest,
+    astrology_service: AstrologyServiceDep,
+    transit_service: TransitServiceDep
+) -> TransitTimelineResponse:
+    """Calculate the transit timeline for a natal chart."""
+    natal = request.natal
+    try:
+        if not (natal.city and natal.nation) and (natal.lng is None or natal.lat is None):
+            raise LocationError(
+                "Either city/nation or longitude/latitude must be provided"
+            )
+
+        natal_longitudes = astrology_service.calculate_point_longitudes(
+            name=natal.name,
+            birth_date=natal.birth_date,
+            city=natal.city,
+            nation=natal.nation,
+            lng=natal.lng,
+            lat=natal.lat,
+            tz_str=natal.tz_str,
+            houses_system=natal.houses_system
+        )
+        transits = transit_service.calculate_transits(
+            natal_longitudes,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            transiting_points=request.transiting_points,
+            natal_points=request.natal_points,
+            aspects=request.aspects
+        )
+
+        return TransitTimelineResponse(
+            name=natal.name,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            transits=transits
+        )
+    except Exception as e:
+        if isinstance(e, (InvalidBirthDataError, InvalidDateRangeError, LocationError)):
+            raise
+        raise ChartCalculationError(str(e))
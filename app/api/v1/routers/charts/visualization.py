@@ -1,18 +1,43 @@
 """Chart visualization API endpoints."""
-from typing import Annotated
+from typing import Annotated, Any, AsyncIterator, Dict, List
+import json
 import uuid
-from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks, Query, Request
+from fastapi.responses import Response, StreamingResponse
 from datetime import datetime
+from starlette.concurrency import run_in_threadpool
 
 from app.core.exceptions import ChartCalculationError, InvalidBirthDataError, LocationError
-from app.core.dependencies import ChartVisualizationServiceDep
+from app.core.dependencies import (
+    ChartVisualizationServiceDep,
+    ComputePoolDep,
+    RenderCacheDep,
+    RenderJobRegistryDep,
+    RenderWorkersDep,
+    SettingsDep
+)
 from app.schemas.chart_visualization import (
+    BulkChartRenderRequest,
+    ChartConfiguration,
     NatalChartVisualizationRequest,
     NatalChartVisualizationResponse,
+    RenderCacheStats,
+    RenderJobResponse,
+    RenderJobStats,
     SynastryChartVisualizationRequest,
     SynastryChartVisualizationResponse
 )
-from app.services.chart_visualization import ChartVisualizationService
+from app.services.bulk_render import stream_chart_archive
+from app.services.chart_visualization import (
+    ChartVisualizationService,
+    map_house_system,
+    save_svg,
+    svg_name_for,
+    svg_url_for,
+)
+from app.services.render_jobs import RenderJobRegistry
+from app.services.render_queue import PRIORITY_API
+from app.services.sky_stream import WHEEL_CENTER, SkyStream
 
 router = APIRouter(
     prefix="/visualization",
@@ -67,6 +92,52 @@ router = APIRouter(
     }
 )
 
+def is_rendered(
+    chart_service: ChartVisualizationService,
+    render_key: str,
+    chart_id: str,
+    derived_chart_id: bool
+) -> bool:
+    """
+    Check whether a chart's SVG file is available without rendering it.
+    
+    A chart_id derived from the render key always names the same rendering,
+    so an existing file can be reused; otherwise the SVG file is written
+    from the render cache when it holds the rendering.
+    """
+    if derived_chart_id and chart_service.artifact_store.exists(svg_name_for(chart_id)):
+        return True
+    return chart_service.publish_cached_svg(render_key, chart_id)
+
+def natal_render_arguments(request: NatalChartVisualizationRequest) -> Dict[str, Any]:
+    """
+    Build the keyword arguments of the natal rendering methods from a request.
+    
+    Raises:
+        HTTPException: 422 if the birth date is not in ISO format
+    """
+    # Convert the birth_date from ISO format string to datetime
+    try:
+        birth_date = datetime.fromisoformat(request.birth_date)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, 
+            detail=f"Invalid birth date format: {request.birth_date}. Use ISO format (YYYY-MM-DDTHH:MM:SS)."
+        )
+    
+    return dict(
+        name=request.name,
+        birth_date=birth_date,
+        city=request.city,
+        nation=request.nation,
+        lng=request.lng,
+        lat=request.lat,
+        tz_str=request.tz_str,
+        theme=request.theme,
+        chart_language=request.language,
+        config=request.config.model_dump() if request.config else None
+    )
+
 @router.post(
     "/natal", 
     response_model=NatalChartVisualizationResponse,
@@ -77,20 +148,28 @@ router = APIRouter(
     Generate and save a natal chart visualization.
     
     This endpoint accepts birth details and configuration options to create a custom chart.
-    The SVG generation happens in the background, and the endpoint returns immediately with a chart ID.
+    The SVG is rendered by the render workers, and the endpoint returns immediately with a chart ID.
     
     You can specify:
     - Theme: dark (default), light, classic, dark-high-contrast
     - Language: EN (default), ES, IT, FR, DE, etc.
     - Configuration options like house system, active points, and aspect orbs
     
-    Returns a chart ID and URL to access the SVG once it's generated.
+    Identical charts (same birth data, theme, language and configuration) get the
+    same chart ID when none is given, and are returned immediately from the
+    render cache instead of being rendered again.
+    
+    Returns a chart ID, a URL to access the SVG once it's generated, and a
+    job URL to poll or wait for the rendering.
     """
 )
 async def generate_natal_chart_visualization(
     request: NatalChartVisualizationRequest,
     background_tasks: BackgroundTasks,
-    chart_service: ChartVisualizationServiceDep
+    chart_service: ChartVisualizationServiceDep,
+    job_registry: RenderJobRegistryDep,
+    render_workers: RenderWorkersDep,
+    http_request: Request
 ) -> NatalChartVisualizationResponse:
     """
     Generate and save a natal chart visualization.
@@ -98,41 +177,34 @@ async def generate_natal_chart_visualization(
     Returns the chart ID and URL to access the SVG.
     """
     try:
-        # Convert the birth_date from ISO format string to datetime
-        try:
-            birth_date = datetime.fromisoformat(request.birth_date)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, 
-                detail=f"Invalid birth date format: {request.birth_date}. Use ISO format (YYYY-MM-DDTHH:MM:SS)."
-            )
+        # Derive the chart_id from the rendering inputs if not provided
+        render = natal_render_arguments(request)
+        render_key = chart_service.natal_render_key(**render)
+        chart_id = request.chart_id or f"natal_{render_key[:16]}"
         
-        # Generate a unique chart_id if not provided
-        chart_id = request.chart_id or f"natal_{uuid.uuid4().hex[:8]}"
+        # Create a placeholder URL that will be valid once the render job completes
+        svg_url = svg_url_for(chart_id)
+        job_url = http_request.url_for("get_render_job", chart_id=chart_id).path
         
-        # Create a placeholder URL that will be valid once the background task completes
-        svg_url = f"/static/images/svg/{chart_id}.svg"
+        # Return identical charts that were already rendered immediately
+        if await run_in_threadpool(is_rendered, chart_service, render_key, chart_id, request.chart_id is None):
+            await job_registry.complete(chart_id, "natal", svg_url)
+            return NatalChartVisualizationResponse(
+                chart_id=chart_id,
+                svg_url=svg_url,
+                job_url=job_url
+            )
         
-        # Schedule the chart generation as a background task
-        background_tasks.add_task(
-            chart_service.generate_natal_chart_svg,
-            name=request.name,
-            birth_date=birth_date,
-            city=request.city,
-            nation=request.nation,
-            lng=request.lng,
-            lat=request.lat,
-            tz_str=request.tz_str,
-            chart_id=chart_id,
-            theme=request.theme,
-            chart_language=request.language,
-            config=request.config.model_dump() if request.config else None
-        )
+        # Queue the chart generation for the render workers
+        job = await job_registry.submit(chart_id, "natal", svg_url, render, priority=PRIORITY_API)
+        if render_workers.renders_inline:
+            background_tasks.add_task(run_in_threadpool, render_workers.render_inline, job_registry.queue, chart_service, job)
         
         # Return the response immediately
         return NatalChartVisualizationResponse(
             chart_id=chart_id,
-            svg_url=svg_url
+            svg_url=svg_url,
+            job_url=job_url
         )
     except HTTPException:
         raise
@@ -152,20 +224,28 @@ async def generate_natal_chart_visualization(
     Generate and save a synastry chart visualization comparing two natal charts.
     
     This endpoint accepts birth details for two individuals and configuration options to create a custom synastry chart.
-    The SVG generation happens in the background, and the endpoint returns immediately with a chart ID.
+    The SVG is rendered by the render workers, and the endpoint returns immediately with a chart ID.
     
     You can specify:
     - Theme: dark (default), light, classic, dark-high-contrast
     - Language: EN (default), ES, IT, FR, DE, etc.
     - Configuration options like house system, active points, and aspect orbs
     
-    Returns a chart ID and URL to access the SVG once it's generated.
+    Identical charts (same birth data, theme, language and configuration) get the
+    same chart ID when none is given, and are returned immediately from the
+    render cache instead of being rendered again.
+    
+    Returns a chart ID, a URL to access the SVG once it's generated, and a
+    job URL to poll or wait for the rendering.
     """
 )
 async def generate_synastry_chart_visualization(
     request: SynastryChartVisualizationRequest,
     background_tasks: BackgroundTasks,
-    chart_service: ChartVisualizationServiceDep
+    chart_service: ChartVisualizationServiceDep,
+    job_registry: RenderJobRegistryDep,
+    render_workers: RenderWorkersDep,
+    http_request: Request
 ) -> SynastryChartVisualizationResponse:
     """
     Generate and save a synastry chart visualization comparing two natal charts.
@@ -183,15 +263,10 @@ async def generate_synastry_chart_visualization(
                 detail=f"Invalid birth date format: {str(e)}. Use ISO format (YYYY-MM-DDTHH:MM:SS)."
             )
         
-        # Generate a unique chart_id if not provided
-        chart_id = request.chart_id or f"synastry_{uuid.uuid4().hex[:8]}"
+        config = request.config.model_dump() if request.config else None
         
-        # Create a placeholder URL that will be valid once the background task completes
-        svg_url = f"/static/images/svg/{chart_id}.svg"
-        
-        # Schedule the chart generation as a background task
-        background_tasks.add_task(
-            chart_service.generate_synastry_chart_svg,
+        # Derive the chart_id from the rendering inputs if not provided
+        render = dict(
             name1=request.name1,
             birth_date1=birth_date1,
             name2=request.name2,
@@ -206,21 +281,443 @@ async def generate_synastry_chart_visualization(
             lng2=request.lng2,
             lat2=request.lat2,
             tz_str2=request.tz_str2,
-            chart_id=chart_id,
             theme=request.theme,
             chart_language=request.language,
-            config=request.config.model_dump() if request.config else None
+            config=config
         )
+        render_key = chart_service.synastry_render_key(**render)
+        chart_id = request.chart_id or f"synastry_{render_key[:16]}"
+        
+        # Create a placeholder URL that will be valid once the render job completes
+        svg_url = svg_url_for(chart_id)
+        job_url = http_request.url_for("get_render_job", chart_id=chart_id).path
+        
+        # Return identical charts that were already rendered immediately
+        if await run_in_threadpool(is_rendered, chart_service, render_key, chart_id, request.chart_id is None):
+            await job_registry.complete(chart_id, "synastry", svg_url)
+            return SynastryChartVisualizationResponse(
+                chart_id=chart_id,
+                svg_url=svg_url,
+                job_url=job_url
+            )
+        
+        # Queue the chart generation for the render workers
+        job = await job_registry.submit(chart_id, "synastry", svg_url, render, priority=PRIORITY_API)
+        if render_workers.renders_inline:
+            background_tasks.add_task(run_in_threadpool, render_workers.render_inline, job_registry.queue, chart_service, job)
         
         # Return the response immediately
         return SynastryChartVisualizationResponse(
             chart_id=chart_id,
-            svg_url=svg_url
+            svg_url=svg_url,
+            job_url=job_url
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail=f"Error generating synastry chart: {str(e)}"
+        ) 
+
+def svg_response(svg: str, chart_id: str | None) -> Response:
+    """
+    Build the response of an in-memory rendered SVG.
+    
+    When the chart was persisted, its static URL and ID are sent in the
+    Content-Location and X-Chart-Id headers.
+    """
+    headers = {}
+    if chart_id:
+        headers["Content-Location"] = svg_url_for(chart_id)
+        headers["X-Chart-Id"] = chart_id
+    return Response(content=svg.encode("utf-8"), media_type="image/svg+xml", headers=headers)
+
+@router.post(
+    "/natal/svg",
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    summary="Render Natal Chart SVG",
+    description="""
+    Render a natal chart and return the SVG directly in the response body.
+    
+    Accepts the same body as the natal visualization endpoint. The chart is
+    rendered in memory and nothing is written to disk, unless `persist=true`
+    is given: then the SVG is also saved to the static SVG directory and its
+    URL is returned in the Content-Location header.
+    """,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "The rendered chart",
+            "content": {"image/svg+xml": {}}
+        }
+    }
+)
+async def render_natal_chart_visualization(
+    request: NatalChartVisualizationRequest,
+    chart_service: ChartVisualizationServiceDep,
+    persist: bool = False
+) -> Response:
+    """
+    Render a natal chart SVG in memory and return it.
+    """
+    try:
+        svg = await run_in_threadpool(chart_service.render_natal_chart_svg, **natal_render_arguments(request))
+        
+        # Only write to disk when persistence is requested
+        chart_id = None
+        if persist:
+            chart_id = request.chart_id or f"natal_{uuid.uuid4().hex[:8]}"
+            await run_in_threadpool(save_svg, chart_id, svg, chart_service.artifact_store)
+        
+        return svg_response(svg, chart_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail=f"Error generating chart: {str(e)}"
+        )
+
+@router.post(
+    "/natal/bulk",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Bulk Render Natal Charts",
+    description="""
+    Render many natal charts in one request and download them as a ZIP archive.
+    
+    Accepts a list of natal chart requests (the same body as the natal
+    visualization endpoint) plus one output format (svg, png or pdf) and DPI.
+    Charts are rendered in parallel in the compute pool worker processes and
+    the archive is streamed as charts finish, so files are in completion
+    order and named after their position in the request. Charts that fail are
+    left out and listed with their error in `manifest.json` at the end of the
+    archive.
+    """,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "ZIP archive of the rendered charts",
+            "content": {"application/zip": {}}
+        }
+    }
+)
+async def render_natal_charts_bulk(
+    request: BulkChartRenderRequest,
+    compute_pool: ComputePoolDep,
+    settings: SettingsDep
+) -> StreamingResponse:
+    """Render natal charts in the compute pool and stream them as a ZIP archive."""
+    max_charts = settings.BULK_RENDER_MAX_CHARTS
+    if max_charts and len(request.charts) > max_charts:
+        raise InvalidBirthDataError(f"Bulk render of {len(request.charts)} charts exceeds the maximum of {max_charts} charts")
+
+    renders = [natal_render_arguments(chart) for chart in request.charts]
+    return StreamingResponse(
+        stream_chart_archive(renders, request.format, request.dpi, compute_pool),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="charts_{request.format}.zip"'}
+    )
+
+@router.post(
+    "/synastry/svg",
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    summary="Render Synastry Chart SVG",
+    description="""
+    Render a synastry chart and return the SVG directly in the response body.
+    
+    Accepts the same body as the synastry visualization endpoint. The chart is
+    rendered in memory and nothing is written to disk, unless `persist=true`
+    is given: then the SVG is also saved to the static SVG directory and its
+    URL is returned in the Content-Location header.
+    """,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "The rendered chart",
+            "content": {"image/svg+xml": {}}
+        }
+    }
+)
+async def render_synastry_chart_visualization(
+    request: SynastryChartVisualizationRequest,
+    chart_service: ChartVisualizationServiceDep,
+    persist: bool = False
+) -> Response:
+    """
+    Render a synastry chart SVG in memory and return it.
+    """
+    try:
+        # Convert the birth dates from ISO format strings to datetime
+        try:
+            birth_date1 = datetime.fromisoformat(request.birth_date1)
+            birth_date2 = datetime.fromisoformat(request.birth_date2)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, 
+                detail=f"Invalid birth date format: {str(e)}. Use ISO format (YYYY-MM-DDTHH:MM:SS)."
+            )
+        
+        svg = await run_in_threadpool(
+            chart_service.render_synastry_chart_svg,
+            name1=request.name1,
+            birth_date1=birth_date1,
+            name2=request.name2,
+            birth_date2=birth_date2,
+            city1=request.city1,
+            nation1=request.nation1,
+            lng1=request.lng1,
+            lat1=request.lat1,
+            tz_str1=request.tz_str1,
+            city2=request.city2,
+            nation2=request.nation2,
+            lng2=request.lng2,
+            lat2=request.lat2,
+            tz_str2=request.tz_str2,
+            theme=request.theme,
+            chart_language=request.language,
+            config=request.config.model_dump() if request.config else None
         )
+        
+        # Only write to disk when persistence is requested
+        chart_id = None
+        if persist:
+            chart_id = request.chart_id or f"synastry_{uuid.uuid4().hex[:8]}"
+            await run_in_threadpool(save_svg, chart_id, svg, chart_service.artifact_store)
+        
+        return svg_response(svg, chart_id)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
             detail=f"Error generating synastry chart: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+
+async def sky_event_stream(
+    request: Request,
+    sky: SkyStream,
+    chart: Dict[str, Any],
+    interval_seconds: float,
+    frames: int | None
+) -> AsyncIterator[str]:
+    """Format the rendered wheel and its position deltas as server-sent events until the client disconnects."""
+    yield f"event: chart\ndata: {json.dumps(chart)}\n\n"
+    async for frame in sky.frames(interval_seconds, frames):
+        if await request.is_disconnected():
+            break
+        if frame is None:
+            yield ": keepalive\n\n"
+        else:
+            yield f"event: positions\ndata: {json.dumps(frame)}\n\n"
+
+@router.get(
+    "/sky/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream Animated Sky Chart",
+    description="""
+    Render the sky over a place once, then stream how its points move as server-sent events.
+    
+    The first event, `chart`, carries the URL of the rendered wheel, the
+    center of the wheel in the coordinates of its `Full_Wheel` group and the
+    position of every point, keyed by the `kr:slug` of its glyph. Each
+    `positions` event then only carries the points that moved at least
+    `min_delta_degrees` since they were last sent, with their longitude and
+    their `offset` in degrees from the rendered wheel (counterclockwise), so
+    clients animate the wheel instead of downloading a new chart per frame.
+    
+    Without `start`, frames follow the clock ("sky now"). With `start`, each
+    frame advances the sky by `step_seconds`, which lets clients scrub
+    through time; `frames` limits the number of frames.
+    """,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Stream of the rendered wheel and its position deltas",
+            "content": {"text/event-stream": {}}
+        }
+    }
+)
+async def stream_sky_chart(
+    request: Request,
+    chart_service: ChartVisualizationServiceDep,
+    lat: Annotated[float, Query(ge=-90, le=90, description="Latitude of the observer")],
+    lng: Annotated[float, Query(ge=-180, le=180, description="Longitude of the observer")],
+    tz_str: Annotated[str, Query(description="Timezone of the observer (e.g., 'Europe/London')")],
+    start: Annotated[datetime | None, Query(description="Local time of the first frame, or an instant with an offset; defaults to now")] = None,
+    step_seconds: Annotated[float, Query(gt=0, le=366 * 86400, description="Sky time between frames with a start time")] = 60,
+    interval_seconds: Annotated[float, Query(ge=0.1, le=3600, description="Seconds between frames")] = 60,
+    frames: Annotated[int | None, Query(ge=1, description="Number of frames; unlimited by default")] = None,
+    min_delta_degrees: Annotated[float, Query(ge=0, le=30, description="Smallest movement of a point that is sent")] = 0.01,
+    houses_system: str = "P",
+    theme: str = "dark",
+    chart_language: str = "EN"
+) -> StreamingResponse:
+    """Render the sky wheel once and stream position deltas as server-sent events."""
+    sky = SkyStream(
+        lat, lng, tz_str,
+        houses_system=map_house_system(houses_system),
+        start=start,
+        step_seconds=step_seconds,
+        min_delta_degrees=min_delta_degrees
+    )
+    render = dict(
+        name="Sky",
+        birth_date=sky.start,
+        lng=lng,
+        lat=lat,
+        tz_str=tz_str,
+        theme=theme,
+        chart_language=chart_language,
+        config=ChartConfiguration(houses_system=houses_system).model_dump()
+    )
+    
+    # Streams of the same place and minute share one wheel
+    chart_id = f"sky_{chart_service.natal_render_key(**render)[:16]}"
+    if not await run_in_threadpool(chart_service.artifact_store.exists, svg_name_for(chart_id)):
+        try:
+            await run_in_threadpool(chart_service.generate_natal_chart_svg, chart_id=chart_id, **render)
+        except Exception as e:
+            raise ChartCalculationError(f"Error rendering the sky chart: {str(e)}")
+    
+    chart = {
+        "chart_id": chart_id,
+        "svg_url": svg_url_for(chart_id),
+        "wheel_center": WHEEL_CENTER,
+        **sky.first_frame()
+    }
+    return StreamingResponse(
+        sky_event_stream(request, sky, chart, interval_seconds, frames),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get(
+    "/render-cache",
+    response_model=RenderCacheStats,
+    status_code=status.HTTP_200_OK,
+    summary="SVG Render Cache Statistics",
+    description="Return size, hit and eviction statistics of the memory and disk tiers of the SVG render cache."
+)
+async def get_render_cache_stats(render_cache: RenderCacheDep) -> RenderCacheStats:
+    """Return statistics of the SVG render cache."""
+    if render_cache is None:
+        return RenderCacheStats(enabled=False)
+    return RenderCacheStats(enabled=True, **render_cache.stats())
+
+@router.get(
+    "/jobs",
+    response_model=RenderJobStats,
+    status_code=status.HTTP_200_OK,
+    summary="Rendering Job Statistics",
+    description="Return the number of rendering jobs in each state and render time percentiles of recent jobs."
+)
+async def get_render_job_stats(job_registry: RenderJobRegistryDep) -> RenderJobStats:
+    """Return statistics of the background rendering jobs."""
+    return RenderJobStats(**await job_registry.stats())
+
+@router.get(
+    "/jobs/failed",
+    response_model=List[RenderJobResponse],
+    status_code=status.HTTP_200_OK,
+    summary="List Failed Rendering Jobs",
+    description="""
+    Return the dead-lettered rendering jobs, most recent first.
+    
+    A job is dead-lettered when all its rendering attempts failed; it is kept
+    with the error of its last attempt until it is retried.
+    """
+)
+async def list_failed_render_jobs(
+    job_registry: RenderJobRegistryDep,
+    limit: Annotated[int, Query(ge=1, le=1000, description="Maximum number of jobs returned")] = 100
+) -> List[RenderJobResponse]:
+    """Return the dead-lettered rendering jobs."""
+    return [RenderJobResponse(**job.to_dict()) for job in await job_registry.failed(limit)]
+
+async def job_event_stream(request: Request, job_registry: RenderJobRegistry) -> AsyncIterator[str]:
+    """Format finished jobs as server-sent events until the client disconnects."""
+    async for job in job_registry.events():
+        if await request.is_disconnected():
+            break
+        if job is None:
+            yield ": keepalive\n\n"
+        else:
+            yield f"event: {job.state}\ndata: {json.dumps(job.to_dict())}\n\n"
+
+@router.get(
+    "/jobs/events",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream Rendering Job Events",
+    description="""
+    Stream finished rendering jobs as server-sent events.
+    
+    Every job that finishes is sent as an event named after its state
+    (`done` or `failed`) with the job as JSON data. A keepalive comment is
+    sent periodically while no job finishes.
+    """,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Stream of finished jobs",
+            "content": {"text/event-stream": {}}
+        }
+    }
+)
+async def stream_render_job_events(request: Request, job_registry: RenderJobRegistryDep) -> StreamingResponse:
+    """Stream finished rendering jobs as server-sent events."""
+    return StreamingResponse(
+        job_event_stream(request, job_registry),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get(
+    "/jobs/{chart_id}",
+    response_model=RenderJobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Rendering Job",
+    description="""
+    Return the state of the rendering job of a chart.
+    
+    With `wait`, the request is held until the job is done or failed, or
+    until `wait` seconds have passed, so clients do not need to poll the SVG
+    URL. The job is returned in its current state either way.
+    """,
+    responses={
+        status.HTTP_404_NOT_FOUND: {"description": "No rendering job for this chart"}
+    }
+)
+async def get_render_job(
+    chart_id: str,
+    job_registry: RenderJobRegistryDep,
+    wait: Annotated[float, Query(ge=0, le=30, description="Seconds to wait for the job to finish")] = 0
+) -> RenderJobResponse:
+    """Return the state of a rendering job, optionally waiting for it to finish."""
+    job = await job_registry.wait(chart_id, wait)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No rendering job found for chart {chart_id}"
+        )
+    return RenderJobResponse(**job.to_dict())
+
+@router.post(
+    "/jobs/{chart_id}/retry",
+    response_model=RenderJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Retry Failed Rendering Job",
+    description="Queue a dead-lettered rendering job again with a fresh set of attempts.",
+    responses={
+        status.HTTP_404_NOT_FOUND: {"description": "No failed rendering job for this chart"}
+    }
+)
+async def retry_render_job(chart_id: str, job_registry: RenderJobRegistryDep) -> RenderJobResponse:
+    """Queue a failed rendering job again."""
+    job = await job_registry.retry(chart_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No failed rendering job found for chart {chart_id}"
+        )
+    return RenderJobResponse(**job.to_dict())
@@ -5,26 +5,38 @@ import pytz
 import os
 from datetime import datetime
 from fastapi import APIRouter, Request, Form, Depends, BackgroundTasks, HTTPException, Header
-from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, Response
-from typing import Optional, Dict, Any, List, Union, Literal
-from pathlib import Path
+from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, Response, StreamingResponse
+from typing import Optional, Dict, Any, BinaryIO, Iterator, List, Union, Literal
 import logging
 from starlette.concurrency import run_in_threadpool
 
 from app.templates import templates
 from app.core.config import settings
 from app.core.dependencies import (
+    ArtifactStoreDep,
+    ChartBookServiceDep,
     ChartVisualizationServiceDep, 
     GeoServiceDep, 
-    FileConversionServiceDep,
     ReportServiceDep,
-    InterpretationServiceDep
+    InterpretationServiceDep,
+    ChartComputationServiceDep,
+    ChartStoreDep,
+    RasterizationEngineDep,
+    RenderJobRegistryDep,
+    RenderWorkersDep,
+    ThumbnailServiceDep
 )
-from app.services.chart_visualization import ChartVisualizationService
+from app.services.chart_book import interpretation_name_for
+from app.services.chart_computation import ChartComputationService, deserialize_subject, serialize_subject
+from app.services.chart_positions import ChartPositions
+from app.services.chart_store import ChartStore, StoredChart
+from app.services.chart_visualization import ChartVisualizationService, map_house_system, svg_name_for, svg_url_for
 from app.services.geo_service import GeoService
-from app.services.file_conversion import FileConversionService, OutputFormat
+from app.services.render_queue import PRIORITY_WEB
+from app.services.file_conversion import FileConversionService, make_conversion_key
 from app.services.report import ReportService
 from app.services.interpretation import InterpretationService
+from app.services.thumbnails import THUMBNAIL_CONTENT_TYPES
 from app.core.exceptions import FileConversionError
 from app.schemas.chart_visualization import AspectConfiguration, ChartConfiguration
 from app.schemas.report import NatalReportData
@@ -33,10 +45,6 @@ router = APIRouter(
     tags=["web"],
 )
 
-# Create a dictionary to temporarily store chart data
-# In a production app, you would use a database
-chart_cache = {}
-
 logger = logging.getLogger(__name__)
 
 def parse_birth_date_from_cache(birth_date_str: str) -> datetime:
@@ -64,6 +72,104 @@ def parse_birth_date_from_cache(birth_date_str: str) -> datetime:
             # This is not ideal, but better than crashing
             return datetime.now()
 
+def build_chart_config(chart_type: str, houses_system: str, sidereal_mode: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build the chart configuration of a web chart.
+    
+    Args:
+        chart_type: Chart type from the form ("western" or "vedic")
+        houses_system: Human-readable house system name
+        sidereal_mode: Sidereal mode of Vedic charts
+        
+    Returns:
+        Chart configuration for ChartVisualizationService
+    """
+    config = {
+        "houses_system": houses_system,
+        "zodiac_type": "Tropic" if chart_type.lower() == "western" else "Sidereal",
+        "perspective_type": "Apparent Geocentric",
+        "active_points": [
+            "Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn",
+            "Uranus", "Neptune", "Pluto", "Ascendant", "Medium_Coeli", 
+            "Descendant", "Imum_Coeli", "Mean_Node", "True_Node", 
+            "Mean_South_Node", "True_South_Node", "Chiron", "Mean_Lilith"
+        ],
+        "active_aspects": [
+            {"name": "conjunction", "orb": 8},
+            {"name": "opposition", "orb": 8},
+            {"name": "trine", "orb": 7},
+            {"name": "square", "orb": 7},
+            {"name": "sextile", "orb": 6},
+            {"name": "semi-sextile", "orb": 3},
+            {"name": "semi-square", "orb": 3},
+            {"name": "quincunx", "orb": 3},
+        ]
+    }
+    
+    # Add sidereal mode for Vedic charts
+    if chart_type.lower() == "vedic" and sidereal_mode:
+        config["sidereal_mode"] = sidereal_mode
+    return config
+
+async def get_chart_subject(
+    chart: StoredChart,
+    chart_store: ChartStore,
+    chart_computation: ChartComputationService
+):
+    """
+    Get the shared subject of a stored chart, computing and storing it on first use.
+    
+    Args:
+        chart: The chart from the chart store
+        chart_store: ChartStore persisting the computed subject and positions
+        chart_computation: ChartComputationService computing the subject once per chart_id
+        
+    Returns:
+        AstrologicalSubjectModel: The chart's subject
+    """
+    if chart.subject is not None:
+        return deserialize_subject(chart.subject)
+    
+    chart_data = chart.data
+    subject = await run_in_threadpool(
+        chart_computation.get_subject,
+        chart.chart_id,
+        name=chart_data["name"],
+        birth_date=parse_birth_date_from_cache(chart_data["birth_date"]),
+        city=chart_data["city"],
+        nation=chart_data["nation"],
+        lng=chart_data["lng"],
+        lat=chart_data["lat"],
+        tz_str=chart_data.get("tz_str"),
+        houses_system=map_house_system(chart_data.get("houses_system", "Placidus")),
+        zodiac_type=chart_data.get("zodiac_type", "Tropic"),
+        sidereal_mode=chart_data.get("sidereal_mode")
+    )
+    await chart_store.save_computed(
+        chart.chart_id,
+        serialize_subject(subject),
+        ChartPositions.from_subject(subject).to_bytes()
+    )
+    return subject
+
+async def render_chart_svg_markup(
+    chart: StoredChart,
+    chart_store: ChartStore,
+    chart_service: ChartVisualizationService,
+    chart_computation: ChartComputationService
+) -> str:
+    """Render the SVG of a chart from its shared subject in memory, without saving it."""
+    subject = await get_chart_subject(chart, chart_store, chart_computation)
+    return await run_in_threadpool(
+        chart_service.render_natal_chart_svg,
+        name=chart.data["name"],
+        birth_date=parse_birth_date_from_cache(chart.data["birth_date"]),
+        theme=chart.data["theme"],
+        chart_language=chart.data["language"],
+        config=build_chart_config(chart.data["chart_type"], chart.data["houses_system"], chart.data.get("sidereal_mode")),
+        subject=subject
+    )
+
 @router.get("/", response_class=HTMLResponse, name="landing")
 async def landing(request: Request):
     """Render the landing page."""
@@ -88,17 +194,18 @@ async def chart_generator(request: Request):
     )
 
 @router.get("/chart/{chart_id}", response_class=HTMLResponse, name="chart_details")
-async def chart_details(request: Request, chart_id: str):
+async def chart_details(request: Request, chart_id: str, chart_store: ChartStoreDep):
     """Render the chart details page."""
-    # Get chart data from cache or storage
-    chart_data = chart_cache.get(chart_id)
+    # Get chart data from the chart store
+    chart = await chart_store.get(chart_id)
     
-    if not chart_data:
+    if chart is None:
         # If chart data is not found, redirect to home
         return RedirectResponse(url="/home", status_code=303)
+    chart_data = chart.data
     
     # Chart URL
-    chart_url = f"/static/images/svg/{chart_id}.svg"
+    chart_url = svg_url_for(chart_id)
     
     # Return the template with chart details
     return templates.TemplateResponse(
@@ -112,74 +219,159 @@ async def chart_details(request: Request, chart_id: str):
         }
     )
 
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag, ignoring weak validator prefixes."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+def iterate_file(file: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield the content of an open file in chunks, closing it when done or when the client disconnects."""
+    with file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
 @router.get("/download-chart/{chart_id}", name="download_chart")
 async def download_chart(
     chart_id: str, 
-    conversion_service: FileConversionServiceDep,
-    format: Literal["svg", "png", "pdf", "jpg"] = "svg",
-    dpi: int = 96
+    raster_engine: RasterizationEngineDep,
+    chart_service: ChartVisualizationServiceDep,
+    chart_computation: ChartComputationServiceDep,
+    chart_store: ChartStoreDep,
+    format: Literal["svg", "png", "pdf", "jpg", "webp", "avif"] = "svg",
+    dpi: int = 96,
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     Download chart in various formats.
     
+    The SVG rendered for the chart page is used when it exists; otherwise the
+    chart is rendered in memory from the chart store. Other formats are
+    converted in the rasterization pool, off the event loop, and streamed
+    from the converted file; repeated conversions are served from the
+    conversion cache.
+    
+    The ETag is the conversion cache key of the SVG and options, so a client
+    revalidating an unchanged chart gets a 304 without any conversion.
+    
     Args:
         chart_id: The unique identifier for the chart
-        conversion_service: FileConversionService dependency
-        format: The desired output format (svg, png, pdf, jpg)
-        dpi: The resolution in dots per inch for raster formats (png, jpg)
+        raster_engine: RasterizationEngine dependency
+        chart_service: ChartVisualizationService dependency
+        chart_computation: ChartComputationService dependency
+        chart_store: ChartStore dependency
+        format: The desired output format (svg, png, pdf, jpg, webp, avif)
+        dpi: The resolution in dots per inch for raster formats (png, jpg, webp, avif)
+        if_none_match: ETags of the versions the client already has
         
     Returns:
         The chart file in the requested format
     """
-    # Base file path for the SVG
-    svg_path = Path(f"app/static/images/svg/{chart_id}.svg")
-    
-    # Check if the file exists
-    if not svg_path.exists():
-        raise HTTPException(status_code=404, detail="Chart not found")
+    try:
+        saved_svg = await run_in_threadpool(chart_service.artifact_store.read, svg_name_for(chart_id))
+    except (FileNotFoundError, ValueError):
+        saved_svg = None
+    chart = None
+    if saved_svg is None:
+        chart = await chart_store.get(chart_id)
+        if chart is None:
+            raise HTTPException(status_code=404, detail="Chart not found")
     
     # Conversion logic based on format
     try:
-        if format == "svg":
-            # SVG doesn't need conversion, just return the file
-            return FileResponse(
-                svg_path,
-                media_type="image/svg+xml",
-                filename=f"{chart_id}.svg"
-            )
-        
-        # For other formats, use the conversion service
-        output_format = OutputFormat(format.upper())
+        if chart is None:
+            svg = saved_svg
+        else:
+            svg = (await render_chart_svg_markup(chart, chart_store, chart_service, chart_computation)).encode("utf-8")
         
-        # Convert file
-        result_path, content_type = conversion_service.convert_svg_file(
-            svg_path, 
-            output_format=output_format,
-            dpi=dpi
-        )
+        etag = f'"{make_conversion_key(svg, format, dpi)}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        headers["Content-Disposition"] = f'attachment; filename="{chart_id}.{format}"'
         
-        # Set the proper filename extension
-        extension = format.lower()
+        if format == "svg":
+            # SVG doesn't need conversion, just return the markup
+            return Response(content=svg, media_type="image/svg+xml", headers=headers)
         
-        # Return the converted file
-        return FileResponse(
-            result_path,
-            media_type=content_type,
-            filename=f"{chart_id}.{extension}"
-        )
+        # For other formats, convert in the rasterization pool and stream the file
+        output, content_type = await raster_engine.open_conversion(svg, output_format=format, dpi=dpi)
+        headers["Content-Length"] = str(os.fstat(output.fileno()).st_size)
+        return StreamingResponse(iterate_file(output), media_type=content_type, headers=headers)
         
     except FileConversionError as e:
         logger.error(f"File conversion error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error converting chart: {str(e)}")
+    except HTTPException:
+        # Size, capacity and timeout errors keep their status codes
+        raise
     except Exception as e:
         logger.error(f"Error in download_chart: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing chart: {str(e)}")
 
+@router.get("/charts/{chart_id}/thumb/{size}", name="chart_thumbnail")
+async def chart_thumbnail(
+    chart_id: str,
+    size: int,
+    thumbnail_service: ThumbnailServiceDep,
+    chart_service: ChartVisualizationServiceDep,
+    chart_computation: ChartComputationServiceDep,
+    chart_store: ChartStoreDep,
+    format: Literal["webp", "png"] = "webp"
+):
+    """
+    Get a raster thumbnail of a chart in one of the preset sizes.
+    
+    Thumbnails are rendered once per chart, by the render workers or on the
+    first request, and then served from files without rasterizing the SVG.
+    A chart whose SVG is not rendered yet is rendered in memory from the
+    chart store.
+    
+    Args:
+        chart_id: The unique identifier for the chart
+        size: Width of the thumbnail in pixels, one of THUMBNAIL_SIZES
+        thumbnail_service: ThumbnailService dependency
+        chart_service: ChartVisualizationService dependency
+        chart_computation: ChartComputationService dependency
+        chart_store: ChartStore dependency
+        format: Thumbnail format (webp, png)
+        
+    Returns:
+        The thumbnail image
+    """
+    if size not in thumbnail_service.sizes or format not in thumbnail_service.formats:
+        raise HTTPException(status_code=404, detail=f"No {size} px {format} thumbnails are rendered")
+    
+    try:
+        thumbnail_name = await run_in_threadpool(thumbnail_service.get, chart_id, size, format)
+        if thumbnail_name is None:
+            chart = await chart_store.get(chart_id)
+            if chart is None:
+                raise HTTPException(status_code=404, detail="Chart not found")
+            svg = await render_chart_svg_markup(chart, chart_store, chart_service, chart_computation)
+            thumbnails = await run_in_threadpool(thumbnail_service.generate, chart_id, svg)
+            thumbnail_name = thumbnails[(size, format)]
+    except FileConversionError as e:
+        logger.error(f"Thumbnail rendering error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error rendering chart thumbnail: {str(e)}")
+    
+    thumbnail_path = thumbnail_service.store.local_path(thumbnail_name)
+    if thumbnail_path is None:
+        return RedirectResponse(thumbnail_service.store.url_for(thumbnail_name), status_code=307)
+    return FileResponse(
+        thumbnail_path,
+        media_type=THUMBNAIL_CONTENT_TYPES[format],
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
+
 @router.get("/chart-report/{chart_id}", response_class=HTMLResponse, name="chart_report")
 async def chart_report(
     request: Request,
     chart_id: str,
     report_service: ReportServiceDep,
+    chart_computation: ChartComputationServiceDep,
+    chart_store: ChartStoreDep,
     hx_request: Optional[str] = Header(None)
 ):
     """
@@ -189,17 +381,20 @@ async def chart_report(
         request: The FastAPI request object
         chart_id: The unique identifier for the chart
         report_service: ReportService dependency
+        chart_computation: ChartComputationService dependency
+        chart_store: ChartStore dependency
         hx_request: HTMX request header
         
     Returns:
         HTML template with the chart report
     """
     try:
-        # Get chart data from cache
-        if chart_id not in chart_cache:
+        # Get chart data from the chart store
+        chart = await chart_store.get(chart_id)
+        if chart is None:
             raise HTTPException(status_code=404, detail="Chart not found")
         
-        chart_data = chart_cache[chart_id]
+        chart_data = chart.data
         
         # Convert birth_date string to datetime
         birth_date_dt = parse_birth_date_from_cache(chart_data["birth_date"])
@@ -207,6 +402,9 @@ async def chart_report(
         # Get birth place information
         birth_place = f"{chart_data['city']}, {chart_data['nation']}"
         
+        # Reuse the chart's shared subject instead of recalculating it
+        subject = await get_chart_subject(chart, chart_store, chart_computation)
+        
         # Generate report using ReportService
         report_data = report_service.generate_natal_report(
             name=chart_data["name"],
@@ -215,7 +413,8 @@ async def chart_report(
             lat=chart_data["lat"],
             lng=chart_data["lng"],
             house_system=chart_data.get("houses_system", "Placidus"),
-            timezone=chart_data.get("tz_str")
+            timezone=chart_data.get("tz_str"),
+            subject=subject
         )
         
         # Check if there's a note about Whole Sign houses in the full report
@@ -252,6 +451,9 @@ async def interpret_chart(
     chart_id: str,
     interpretation_service: InterpretationServiceDep,
     report_service: ReportServiceDep,
+    chart_computation: ChartComputationServiceDep,
+    chart_store: ChartStoreDep,
+    artifact_store: ArtifactStoreDep,
     planets_focus: bool = True,
     houses_focus: bool = True,
     aspects_focus: bool = True,
@@ -262,11 +464,17 @@ async def interpret_chart(
     """
     Generate and display an interpretation for a chart.
     
+    The interpretation HTML is stored next to the chart's SVG, so the chart
+    book includes it without calling the LLM again.
+    
     Args:
         request: The FastAPI request object
         chart_id: The unique identifier for the chart
         interpretation_service: InterpretationService dependency
         report_service: ReportService dependency
+        chart_computation: ChartComputationService dependency
+        chart_store: ChartStore dependency
+        artifact_store: ChartArtifactStore dependency
         planets_focus: Whether to focus on planet interpretations
         houses_focus: Whether to focus on house placement interpretations
         aspects_focus: Whether to focus on aspect interpretations
@@ -278,11 +486,12 @@ async def interpret_chart(
         HTML template with the chart interpretation
     """
     try:
-        # Get chart data from cache
-        if chart_id not in chart_cache:
+        # Get chart data from the chart store
+        chart = await chart_store.get(chart_id)
+        if chart is None:
             raise HTTPException(status_code=404, detail="Chart not found")
         
-        chart_data = chart_cache[chart_id]
+        chart_data = chart.data
         
         # Convert birth_date string to datetime
         birth_date_dt = parse_birth_date_from_cache(chart_data["birth_date"])
@@ -290,6 +499,9 @@ async def interpret_chart(
         # Get birth place information
         birth_place = f"{chart_data['city']}, {chart_data['nation']}"
         
+        # Reuse the chart's shared subject instead of recalculating it
+        subject = await get_chart_subject(chart, chart_store, chart_computation)
+        
         # First generate report to get structured data for interpretation
         report_data = report_service.generate_natal_report(
             name=chart_data["name"],
@@ -298,7 +510,8 @@ async def interpret_chart(
             lat=chart_data["lat"],
             lng=chart_data["lng"],
             house_system=chart_data.get("houses_system", "Placidus"),
-            timezone=chart_data.get("tz_str")
+            timezone=chart_data.get("tz_str"),
+            subject=subject
         )
         
         # Create a NatalReportData object from the report data dictionary
@@ -322,6 +535,13 @@ async def interpret_chart(
             max_length=max_length
         )
         
+        # Keep the interpretation for the chart book
+        await run_in_threadpool(
+            artifact_store.write,
+            interpretation_name_for(chart_id),
+            interpretation_result["interpretation_html"].encode("utf-8")
+        )
+        
         # Return the interpretation fragment
         return templates.TemplateResponse(
             "fragments/interpretation.html",
@@ -345,7 +565,9 @@ async def interpret_chart(
 @router.get("/download-report/{chart_id}", name="download_report")
 async def download_report(
     chart_id: str,
-    report_service: ReportServiceDep
+    report_service: ReportServiceDep,
+    chart_computation: ChartComputationServiceDep,
+    chart_store: ChartStoreDep
 ):
     """
     Download a text report for a chart.
@@ -353,16 +575,19 @@ async def download_report(
     Args:
         chart_id: The unique identifier for the chart
         report_service: ReportService dependency
+        chart_computation: ChartComputationService dependency
+        chart_store: ChartStore dependency
         
     Returns:
         Text file with the chart report
     """
     try:
-        # Get chart data from cache
-        if chart_id not in chart_cache:
+        # Get chart data from the chart store
+        chart = await chart_store.get(chart_id)
+        if chart is None:
             raise HTTPException(status_code=404, detail="Chart not found")
         
-        chart_data = chart_cache[chart_id]
+        chart_data = chart.data
         
         # Convert birth_date string to datetime
         birth_date_dt = parse_birth_date_from_cache(chart_data["birth_date"])
@@ -370,6 +595,9 @@ async def download_report(
         # Get birth place information
         birth_place = f"{chart_data['city']}, {chart_data['nation']}"
         
+        # Reuse the chart's shared subject instead of recalculating it
+        subject = await get_chart_subject(chart, chart_store, chart_computation)
+        
         # Generate report using ReportService
         report_data = report_service.generate_natal_report(
             name=chart_data["name"],
@@ -378,7 +606,8 @@ async def download_report(
             lat=chart_data["lat"],
             lng=chart_data["lng"],
             house_system=chart_data.get("houses_system", "Placidus"),
-            timezone=chart_data.get("tz_str")
+            timezone=chart_data.get("tz_str"),
+            subject=subject
         )
         
         # Use the full_report field from the dictionary
@@ -396,6 +625,87 @@ async def download_report(
         logger.error(f"Error generating report for download: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error generating report: {str(e)}")
 
+@router.get("/download-book/{chart_id}", name="download_book")
+async def download_book(
+    chart_id: str,
+    book_service: ChartBookServiceDep,
+    report_service: ReportServiceDep,
+    chart_service: ChartVisualizationServiceDep,
+    chart_computation: ChartComputationServiceDep,
+    chart_store: ChartStoreDep
+):
+    """
+    Download a PDF book of a chart: the chart wheel, the report tables and the interpretation.
+    
+    The interpretation is the one last generated on the chart page; books of
+    charts without one leave it out. The book is written in the
+    rasterization pool and streamed from the written file.
+    
+    Args:
+        chart_id: The unique identifier for the chart
+        book_service: ChartBookService dependency
+        report_service: ReportService dependency
+        chart_service: ChartVisualizationService dependency
+        chart_computation: ChartComputationService dependency
+        chart_store: ChartStore dependency
+        
+    Returns:
+        PDF file with the chart book
+    """
+    try:
+        # Get chart data from the chart store
+        chart = await chart_store.get(chart_id)
+        if chart is None:
+            raise HTTPException(status_code=404, detail="Chart not found")
+        
+        chart_data = chart.data
+        artifact_store = chart_service.artifact_store
+        
+        # Reuse the SVG rendered for the chart page when it exists
+        try:
+            svg = (await run_in_threadpool(artifact_store.read, svg_name_for(chart_id))).decode("utf-8")
+        except (FileNotFoundError, ValueError):
+            svg = await render_chart_svg_markup(chart, chart_store, chart_service, chart_computation)
+        
+        try:
+            interpretation_html = (await run_in_threadpool(artifact_store.read, interpretation_name_for(chart_id))).decode("utf-8")
+        except (FileNotFoundError, ValueError):
+            interpretation_html = None
+        
+        # Reuse the chart's shared subject instead of recalculating it
+        subject = await get_chart_subject(chart, chart_store, chart_computation)
+        
+        # Generate report using ReportService
+        report_data = report_service.generate_natal_report(
+            name=chart_data["name"],
+            birth_date=parse_birth_date_from_cache(chart_data["birth_date"]),
+            birth_place=f"{chart_data['city']}, {chart_data['nation']}",
+            lat=chart_data["lat"],
+            lng=chart_data["lng"],
+            house_system=chart_data.get("houses_system", "Placidus"),
+            timezone=chart_data.get("tz_str"),
+            subject=subject
+        )
+        
+        output = await book_service.open_book(svg, report_data, interpretation_html)
+        return StreamingResponse(
+            iterate_file(output),
+            media_type="application/pdf",
+            headers={
+                "Content-Disposition": f'attachment; filename="{chart_id}_book.pdf"',
+                "Content-Length": str(os.fstat(output.fileno()).st_size)
+            }
+        )
+    except FileConversionError as e:
+        logger.error(f"Chart book error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error writing chart book: {str(e)}")
+    except HTTPException:
+        # Capacity and timeout errors keep their status codes
+        raise
+    except Exception as e:
+        logger.error(f"Error in download_book: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error generating chart book: {str(e)}")
+
 @router.post("/search-location", response_class=HTMLResponse, name="search_location")
 async def search_location(
     request: Request,
@@ -554,6 +864,10 @@ async def generate_chart(
     request: Request,
     background_tasks: BackgroundTasks,
     chart_service: ChartVisualizationServiceDep,
+    chart_computation: ChartComputationServiceDep,
+    chart_store: ChartStoreDep,
+    job_registry: RenderJobRegistryDep,
+    render_workers: RenderWorkersDep,
     chart_type: str = Form(...),
     name: str = Form(...),
     birth_date: str = Form(...),
@@ -630,61 +944,40 @@ async def generate_chart(
         chart_id = f"{chart_type.lower()}_{uuid.uuid4().hex[:8]}"
         
         # Prepare chart configuration
-        config = {
-            "houses_system": houses_system,
-            "zodiac_type": "Tropic" if chart_type.lower() == "western" else "Sidereal",
-            "perspective_type": "Apparent Geocentric",
-            "active_points": [
-                "Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn",
-                "Uranus", "Neptune", "Pluto", "Ascendant", "Medium_Coeli", 
-                "Descendant", "Imum_Coeli", "Mean_Node", "True_Node", 
-                "Mean_South_Node", "True_South_Node", "Chiron", "Mean_Lilith"
-            ],
-            "active_aspects": [
-                {"name": "conjunction", "orb": 8},
-                {"name": "opposition", "orb": 8},
-                {"name": "trine", "orb": 7},
-                {"name": "square", "orb": 7},
-                {"name": "sextile", "orb": 6},
-                {"name": "semi-sextile", "orb": 3},
-                {"name": "semi-square", "orb": 3},
-                {"name": "quincunx", "orb": 3},
-            ]
-        }
-        
-        # Add sidereal mode for Vedic charts
-        if chart_type.lower() == "vedic" and sidereal_mode:
-            config["sidereal_mode"] = sidereal_mode
+        config = build_chart_config(chart_type, houses_system, sidereal_mode)
             
-        # Generate the chart in the background
-        background_tasks.add_task(
-            chart_service.generate_natal_chart_svg,
-            name=name,
-            birth_date=birth_date_dt,
-            city=city,
-            nation=nation,
-            lng=lng,
-            lat=lat,
-            tz_str=tz_str,
-            chart_id=chart_id,
-            theme=theme,
-            chart_language=language,
-            config=config
-        )
-        
-        # Store chart data in cache
-        chart_cache[chart_id] = {
+        # Store chart data in the chart store
+        await chart_store.save(chart_id, {
             "name": name,
             "birth_date": birth_date_formatted,
             "city": city,
             "nation": nation,
             "lat": lat,
             "lng": lng,
+            "tz_str": tz_str,
             "houses_system": houses_system,
+            "zodiac_type": config["zodiac_type"],
+            "sidereal_mode": config.get("sidereal_mode"),
             "chart_type": chart_type,
             "theme": theme,
             "language": language
-        }
+        })
+        
+        # Compute the chart's shared subject once; the report, interpretation and
+        # downloads read it from the chart store, and the render job draws from it
+        subject = await get_chart_subject(await chart_store.get(chart_id), chart_store, chart_computation)
+        
+        # Queue the SVG rendering ahead of API and batch renders
+        job = await job_registry.submit(chart_id, "natal", svg_url_for(chart_id), {
+            "name": name,
+            "birth_date": birth_date_dt,
+            "theme": theme,
+            "chart_language": language,
+            "config": config,
+            "subject": subject
+        }, priority=PRIORITY_WEB)
+        if render_workers.renders_inline:
+            background_tasks.add_task(run_in_threadpool, render_workers.render_inline, job_registry.queue, chart_service, job)
         
         # If HTMX request, return a redirect instruction
         if hx_request:
@@ -1,4 +1,5 @@
-from typing import List, Optional
+import os
+from typing import List, Optional, Tuple
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -21,6 +22,98 @@ class Settings(BaseSettings):
     LLM_CACHE_ENABLED: Optional[bool] = True
     LLM_CACHE_TTL_HOURS: Optional[int] = 24  # Cache TTL in hours
 
+    # Chart cache settings
+    CHART_CACHE_ENABLED: Optional[bool] = True
+    CHART_CACHE_MAX_ENTRIES: Optional[int] = 10000
+    CHART_CACHE_MAX_BYTES: Optional[int] = 64 * 1024 * 1024  # 64 MB
+    CHART_CACHE_TTL_SECONDS: Optional[int] = 86400  # 24 hours
+    CHART_CACHE_COORD_PRECISION: Optional[int] = 4  # Decimals, roughly 11 m
+    CHART_SUBJECT_MAX_ENTRIES: Optional[int] = 1000  # Web chart subjects kept by chart_id
+
+    # Web chart store settings
+    CHART_STORE_URL: Optional[str] = "sqlite+aiosqlite:///cache/charts.db"
+    CHART_STORE_TTL_SECONDS: Optional[int] = 30 * 86400  # 30 days
+    CHART_STORE_CACHE_ENTRIES: Optional[int] = 1024  # Charts kept in memory per worker
+    CHART_STORE_POOL_SIZE: Optional[int] = 5
+    CHART_STORE_PURGE_INTERVAL_SECONDS: Optional[int] = 3600
+
+    # SVG render cache settings
+    RENDER_CACHE_ENABLED: Optional[bool] = True
+    RENDER_CACHE_DIR: Optional[str] = "cache/svg_render"
+    RENDER_CACHE_MEMORY_ENTRIES: Optional[int] = 256
+    RENDER_CACHE_MEMORY_BYTES: Optional[int] = 64 * 1024 * 1024  # 64 MB
+    RENDER_CACHE_DISK_BYTES: Optional[int] = 512 * 1024 * 1024  # 512 MB
+    RENDER_CACHE_RESCAN_INTERVAL_SECONDS: Optional[int] = 300  # Counts SVGs written by other processes
+
+    # File conversion cache settings (PNG, PDF, JPG, WebP and AVIF downloads, streamed from disk)
+    CONVERSION_CACHE_ENABLED: Optional[bool] = True
+    CONVERSION_CACHE_DIR: Optional[str] = "cache/conversions"
+    CONVERSION_CACHE_DISK_BYTES: Optional[int] = 1024 * 1024 * 1024  # 1 GB
+    CONVERSION_CACHE_RESCAN_INTERVAL_SECONDS: Optional[int] = 300
+
+    # Chart artifact store settings (rendered SVGs, their variants and thumbnails)
+    CHART_ARTIFACT_BACKEND: Optional[str] = "local"  # Options: "local", "s3"
+    CHART_ARTIFACT_DIR: Optional[str] = None  # Local directory, defaults to app/static/images/svg
+    CHART_ARTIFACT_MAX_BYTES: Optional[int] = 1024 * 1024 * 1024  # 1 GB
+    CHART_ARTIFACT_MAX_AGE_SECONDS: Optional[int] = 30 * 86400  # Charts not accessed for 30 days are deleted
+    CHART_ARTIFACT_GC_INTERVAL_SECONDS: Optional[int] = 3600
+    CHART_ARTIFACT_S3_BUCKET: Optional[str] = None
+    CHART_ARTIFACT_S3_PREFIX: Optional[str] = "charts/"
+    CHART_ARTIFACT_S3_ENDPOINT_URL: Optional[str] = None  # e.g. a local MinIO server
+
+    # Chart thumbnail settings
+    THUMBNAIL_SIZES: Optional[list[int]] = [128, 512, 1024]  # Widths in pixels
+    THUMBNAIL_FORMATS: Optional[list[str]] = ["webp", "png"]
+    THUMBNAIL_WEBP_QUALITY: Optional[int] = 80
+    THUMBNAIL_PRERENDER: Optional[bool] = True  # Render workers render thumbnails with each chart
+
+    # Render queue settings
+    RENDER_QUEUE_URL: Optional[str] = "sqlite:///cache/render_queue.db"
+    RENDER_WORKERS: Optional[int] = 1  # Worker processes; 0 runs none in the API process
+    RENDER_POLL_INTERVAL_SECONDS: Optional[float] = 0.25
+    RENDER_MAX_ATTEMPTS: Optional[int] = 3  # Attempts before a job is dead-lettered
+    RENDER_RETRY_BACKOFF_SECONDS: Optional[float] = 2.0  # Doubled for each further retry
+    RENDER_LEASE_SECONDS: Optional[int] = 300  # Jobs of dead workers are retried after this
+    RENDER_JOB_RETENTION_SECONDS: Optional[int] = 86400  # Done jobs are kept 24 hours
+
+    # Worker process budget, shared by the render workers and the compute and raster pools
+    WEB_CONCURRENCY: Optional[int] = 1  # Uvicorn worker processes on the host, each starting its own pools
+    PROCESS_BUDGET: Optional[int] = None  # Worker processes per API process, defaults to the CPU count / WEB_CONCURRENCY
+
+    # Compute pool settings
+    COMPUTE_POOL_WORKERS: Optional[int] = None  # Worker processes, defaults to half the budget left by the render workers
+    COMPUTE_POOL_MAX_PENDING: Optional[int] = None  # Running plus queued calculations, defaults to 4 per worker
+    COMPUTE_POOL_NATAL_LIMIT: Optional[int] = 32  # Concurrent single natal chart calculations
+    COMPUTE_POOL_NATAL_BATCH_LIMIT: Optional[int] = 2  # Concurrent natal batch calculations
+    COMPUTE_POOL_RENDER_BULK_LIMIT: Optional[int] = None  # Concurrent bulk chart renders, defaults to one per worker
+    COMPUTE_POOL_RETRY_AFTER_SECONDS: Optional[int] = 1
+
+    # Rasterization pool settings (PNG, PDF, JPG, WebP and AVIF downloads)
+    RASTER_POOL_WORKERS: Optional[int] = None  # Worker processes, defaults to the other half of the budget
+    RASTER_POOL_MAX_PENDING: Optional[int] = None  # Running plus queued conversions, defaults to 4 per worker
+    RASTER_PNG_LIMIT: Optional[int] = 4  # Concurrent PNG conversions
+    RASTER_PDF_LIMIT: Optional[int] = 2  # Concurrent PDF conversions
+    RASTER_JPG_LIMIT: Optional[int] = 2  # Concurrent JPG conversions
+    RASTER_WEBP_LIMIT: Optional[int] = 2  # Concurrent WebP conversions
+    RASTER_AVIF_LIMIT: Optional[int] = 1  # Concurrent AVIF conversions, the slowest to encode
+    RASTER_BOOK_LIMIT: Optional[int] = 2  # Concurrent PDF chart book exports
+    RASTER_TIMEOUT_SECONDS: Optional[float] = 30.0  # Conversions taking longer fail with 504
+    RASTER_MAX_PIXELS: Optional[int] = 40_000_000  # Largest raster output, about 160 MB as RGBA
+
+    # Chart book settings (multi-page PDF of the chart, report and interpretation)
+    CHART_BOOK_PAGE_SIZE: Optional[str] = "a4"  # Options: "a4", "letter"
+
+    # Batch calculation settings
+    NATAL_BATCH_MAX_SIZE: Optional[int] = 1000  # Maximum charts per batch request
+    SYNASTRY_MAX_CANDIDATES: Optional[int] = 5000  # Maximum candidates per match request
+    BULK_RENDER_MAX_CHARTS: Optional[int] = 1000  # Maximum charts per bulk render archive
+
+    # Transit settings
+    TRANSIT_TABLE_PATH: Optional[str] = "cache/ephemeris/daily_ephemeris.npy"
+    TRANSIT_TABLE_START_YEAR: Optional[int] = 1950
+    TRANSIT_TABLE_END_YEAR: Optional[int] = 2050
+    TRANSIT_MAX_RANGE_DAYS: Optional[int] = 3660  # Roughly ten years
+
     model_config = SettingsConfigDict(
         case_sensitive=True,
         env_file=".env",
@@ -47,4 +140,152 @@ class Settings(BaseSettings):
             "cache_ttl_hours": self.LLM_CACHE_TTL_HOURS
         }
 
+    @property
+    def chart_cache_config(self) -> dict:
+        """Get chart cache configuration as a dictionary."""
+        return {
+            "enabled": self.CHART_CACHE_ENABLED,
+            "max_entries": self.CHART_CACHE_MAX_ENTRIES,
+            "max_bytes": self.CHART_CACHE_MAX_BYTES,
+            "ttl_seconds": self.CHART_CACHE_TTL_SECONDS,
+            "coord_precision": self.CHART_CACHE_COORD_PRECISION
+        }
+
+    @property
+    def chart_store_config(self) -> dict:
+        """Get web chart store configuration as a dictionary."""
+        return {
+            "url": self.CHART_STORE_URL,
+            "ttl_seconds": self.CHART_STORE_TTL_SECONDS,
+            "cache_entries": self.CHART_STORE_CACHE_ENTRIES,
+            "pool_size": self.CHART_STORE_POOL_SIZE,
+            "purge_interval_seconds": self.CHART_STORE_PURGE_INTERVAL_SECONDS
+        }
+
+    @property
+    def render_cache_config(self) -> dict:
+        """Get SVG render cache configuration as a dictionary."""
+        return {
+            "enabled": self.RENDER_CACHE_ENABLED,
+            "directory": self.RENDER_CACHE_DIR,
+            "memory_entries": self.RENDER_CACHE_MEMORY_ENTRIES,
+            "memory_bytes": self.RENDER_CACHE_MEMORY_BYTES,
+            "disk_bytes": self.RENDER_CACHE_DISK_BYTES,
+            "rescan_interval_seconds": self.RENDER_CACHE_RESCAN_INTERVAL_SECONDS
+        }
+
+    @property
+    def conversion_cache_config(self) -> dict:
+        """Get file conversion cache configuration as a dictionary."""
+        return {
+            "enabled": self.CONVERSION_CACHE_ENABLED,
+            "directory": self.CONVERSION_CACHE_DIR,
+            "disk_bytes": self.CONVERSION_CACHE_DISK_BYTES,
+            "rescan_interval_seconds": self.CONVERSION_CACHE_RESCAN_INTERVAL_SECONDS
+        }
+
+    @property
+    def chart_artifact_config(self) -> dict:
+        """Get chart artifact store configuration as a dictionary."""
+        return {
+            "backend": self.CHART_ARTIFACT_BACKEND,
+            "directory": self.CHART_ARTIFACT_DIR,
+            "max_bytes": self.CHART_ARTIFACT_MAX_BYTES,
+            "max_age_seconds": self.CHART_ARTIFACT_MAX_AGE_SECONDS,
+            "gc_interval_seconds": self.CHART_ARTIFACT_GC_INTERVAL_SECONDS,
+            "s3_bucket": self.CHART_ARTIFACT_S3_BUCKET,
+            "s3_prefix": self.CHART_ARTIFACT_S3_PREFIX,
+            "s3_endpoint_url": self.CHART_ARTIFACT_S3_ENDPOINT_URL
+        }
+
+    @property
+    def thumbnail_config(self) -> dict:
+        """Get chart thumbnail configuration as a dictionary."""
+        return {
+            "sizes": self.THUMBNAIL_SIZES,
+            "formats": self.THUMBNAIL_FORMATS,
+            "quality": self.THUMBNAIL_WEBP_QUALITY
+        }
+
+    @property
+    def render_queue_config(self) -> dict:
+        """Get render queue configuration as a dictionary."""
+        return {
+            "url": self.RENDER_QUEUE_URL,
+            "max_attempts": self.RENDER_MAX_ATTEMPTS,
+            "retry_backoff_seconds": self.RENDER_RETRY_BACKOFF_SECONDS,
+            "lease_seconds": self.RENDER_LEASE_SECONDS,
+            "retention_seconds": self.RENDER_JOB_RETENTION_SECONDS
+        }
+
+    @property
+    def process_budget(self) -> int:
+        """Worker processes one API process may start, across its render workers and pools."""
+        if self.PROCESS_BUDGET is not None:
+            return max(1, self.PROCESS_BUDGET)
+        return max(1, (os.cpu_count() or 1) // max(1, self.WEB_CONCURRENCY or 1))
+
+    @property
+    def pool_workers(self) -> Tuple[int, int]:
+        """
+        Worker processes of the compute and raster pools, from their settings or the budget the render workers leave.
+
+        Each pool gets at least one worker, so a budget smaller than the
+        render workers plus two is exceeded by those pool workers.
+        """
+        remaining = self.process_budget - (self.RENDER_WORKERS or 0)
+        compute_workers = self.COMPUTE_POOL_WORKERS if self.COMPUTE_POOL_WORKERS is not None else max(1, remaining - remaining // 2)
+        raster_workers = self.RASTER_POOL_WORKERS if self.RASTER_POOL_WORKERS is not None else max(1, remaining // 2)
+        return compute_workers, raster_workers
+
+    @property
+    def compute_pool_config(self) -> dict:
+        """Get compute pool configuration as a dictionary."""
+        return {
+            "max_workers": self.pool_workers[0],
+            "max_pending": self.COMPUTE_POOL_MAX_PENDING,
+            "route_limits": {
+                "natal": self.COMPUTE_POOL_NATAL_LIMIT,
+                "natal_batch": self.COMPUTE_POOL_NATAL_BATCH_LIMIT,
+                "render_bulk": self.COMPUTE_POOL_RENDER_BULK_LIMIT
+            },
+            "retry_after_seconds": self.COMPUTE_POOL_RETRY_AFTER_SECONDS
+        }
+
+    @property
+    def raster_pool_config(self) -> dict:
+        """Get rasterization pool configuration as a dictionary."""
+        return {
+            "max_workers": self.pool_workers[1],
+            "max_pending": self.RASTER_POOL_MAX_PENDING,
+            "route_limits": {
+                "convert_png": self.RASTER_PNG_LIMIT,
+                "convert_pdf": self.RASTER_PDF_LIMIT,
+                "convert_jpg": self.RASTER_JPG_LIMIT,
+                "convert_webp": self.RASTER_WEBP_LIMIT,
+                "convert_avif": self.RASTER_AVIF_LIMIT,
+                "render_book": self.RASTER_BOOK_LIMIT
+            },
+            "route_timeouts": {
+                "convert_png": self.RASTER_TIMEOUT_SECONDS,
+                "convert_pdf": self.RASTER_TIMEOUT_SECONDS,
+                "convert_jpg": self.RASTER_TIMEOUT_SECONDS,
+                "convert_webp": self.RASTER_TIMEOUT_SECONDS,
+                "convert_avif": self.RASTER_TIMEOUT_SECONDS,
+                "render_book": self.RASTER_TIMEOUT_SECONDS
+            },
+            "retry_after_seconds": self.COMPUTE_POOL_RETRY_AFTER_SECONDS,
+            "warm": False
+        }
+
+    @property
+    def transit_config(self) -> dict:
+        """Get transit calculation configuration as a dictionary."""
+        return {
+            "table_path": self.TRANSIT_TABLE_PATH,
+            "start_year": self.TRANSIT_TABLE_START_YEAR,
+            "end_year": self.TRANSIT_TABLE_END_YEAR,
+            "max_range_days": self.TRANSIT_MAX_RANGE_DAYS
+        }
+
 settings = Settings() 
\ No newline at end of file
@@ -5,12 +5,26 @@ from typing import Annotated
 from fastapi import Depends
 
 from app.core.config import Settings
+from app.services.artifact_store import ChartArtifactStore, LocalDirectoryBackend, S3Backend
 from app.services.astrology import AstrologyService
-from app.services.chart_visualization import ChartVisualizationService
+from app.services.chart_book import ChartBookService
+from app.services.chart_cache import ChartCache
+from app.services.chart_computation import ChartComputationService
+from app.services.chart_store import ChartStore
+from app.services.chart_visualization import SVG_DIR, ChartVisualizationService
+from app.services.compute_pool import ComputePool
 from app.services.file_conversion import FileConversionService
 from app.services.geo_service import GeoService
+from app.services.rasterization import RasterizationEngine
+from app.services.render_cache import RenderCache
+from app.services.render_jobs import RenderJobRegistry
+from app.services.render_queue import RenderQueue, RenderWorkerPool
 from app.services.report import ReportService
 from app.services.interpretation import InterpretationService
+from app.services.synastry import SynastryService
+from app.services.thumbnails import ThumbnailService
+from app.services.composite import CompositeService
+from app.services.transit import TransitService
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
@@ -23,6 +37,25 @@ def get_settings() -> Settings:
 
 SettingsDep = Annotated[Settings, Depends(get_settings)]
 
+@lru_cache(maxsize=1)
+def get_chart_cache() -> ChartCache | None:
+    """
+    Get the process-wide natal chart cache.
+    
+    Returns None when the chart cache is disabled in settings.
+    Uses lru_cache so every service instance shares the same cache.
+    """
+    cache_config = get_settings().chart_cache_config
+    if not cache_config["enabled"]:
+        return None
+    return ChartCache(
+        max_entries=cache_config["max_entries"],
+        max_bytes=cache_config["max_bytes"],
+        ttl_seconds=cache_config["ttl_seconds"]
+    )
+
+ChartCacheDep = Annotated[ChartCache | None, Depends(get_chart_cache)]
+
 @lru_cache(maxsize=32)
 def get_astrology_service() -> AstrologyService:
     """
@@ -31,10 +64,139 @@ def get_astrology_service() -> AstrologyService:
     This dependency can be used in route functions to get access to astrology-related operations.
     Uses lru_cache to reuse the service instance, improving performance.
     """
-    return AstrologyService()
+    return AstrologyService(
+        chart_cache=get_chart_cache(),
+        coord_precision=get_settings().chart_cache_config["coord_precision"]
+    )
 
 AstrologyServiceDep = Annotated[AstrologyService, Depends(get_astrology_service)]
 
+@lru_cache(maxsize=1)
+def get_chart_computation_service() -> ChartComputationService:
+    """
+    Get the process-wide ChartComputationService.
+    
+    Uses lru_cache so the chart page, report, interpretation and download
+    routes share the subjects computed for each chart_id.
+    """
+    settings = get_settings()
+    return ChartComputationService(
+        store=ChartCache(
+            max_entries=settings.CHART_SUBJECT_MAX_ENTRIES,
+            max_bytes=settings.CHART_CACHE_MAX_BYTES,
+            ttl_seconds=settings.CHART_CACHE_TTL_SECONDS
+        ),
+        geonames_username=settings.GEONAMES_USERNAME
+    )
+
+ChartComputationServiceDep = Annotated[ChartComputationService, Depends(get_chart_computation_service)]
+
+@lru_cache(maxsize=1)
+def get_chart_store() -> ChartStore:
+    """
+    Get the process-wide ChartStore holding the web charts.
+    
+    Uses lru_cache so every request shares the connection pool and front cache.
+    """
+    return ChartStore(**get_settings().chart_store_config)
+
+ChartStoreDep = Annotated[ChartStore, Depends(get_chart_store)]
+
+@lru_cache(maxsize=1)
+def get_compute_pool() -> ComputePool:
+    """
+    Get the process-wide ComputePool running chart calculations.
+    
+    Uses lru_cache so all routes share the worker processes and their limits.
+    """
+    return ComputePool(**get_settings().compute_pool_config)
+
+ComputePoolDep = Annotated[ComputePool, Depends(get_compute_pool)]
+
+@lru_cache(maxsize=1)
+def get_render_cache() -> RenderCache | None:
+    """
+    Get the process-wide SVG render cache.
+    
+    Returns None when the render cache is disabled in settings.
+    Uses lru_cache so every visualization service shares the same cache.
+    """
+    cache_config = get_settings().render_cache_config
+    if not cache_config["enabled"]:
+        return None
+    return RenderCache(
+        directory=cache_config["directory"],
+        memory_entries=cache_config["memory_entries"],
+        memory_bytes=cache_config["memory_bytes"],
+        disk_bytes=cache_config["disk_bytes"],
+        rescan_interval_seconds=cache_config["rescan_interval_seconds"]
+    )
+
+RenderCacheDep = Annotated[RenderCache | None, Depends(get_render_cache)]
+
+@lru_cache(maxsize=1)
+def get_artifact_store() -> ChartArtifactStore:
+    """
+    Get the process-wide store of rendered chart files.
+    
+    Uses lru_cache so every route, the static mount and the render workers
+    of a process share one index of the stored charts.
+    """
+    artifact_config = get_settings().chart_artifact_config
+    if artifact_config["backend"] == "s3":
+        backend = S3Backend(
+            bucket=artifact_config["s3_bucket"],
+            prefix=artifact_config["s3_prefix"] or "",
+            endpoint_url=artifact_config["s3_endpoint_url"]
+        )
+    else:
+        backend = LocalDirectoryBackend(artifact_config["directory"] or SVG_DIR)
+    return ChartArtifactStore(
+        backend,
+        max_bytes=artifact_config["max_bytes"],
+        max_age_seconds=artifact_config["max_age_seconds"],
+        gc_interval_seconds=artifact_config["gc_interval_seconds"]
+    )
+
+ArtifactStoreDep = Annotated[ChartArtifactStore, Depends(get_artifact_store)]
+
+@lru_cache(maxsize=1)
+def get_render_queue() -> RenderQueue:
+    """
+    Get the process-wide durable render queue.
+    
+    Uses lru_cache so all routes share its database connections.
+    """
+    return RenderQueue(**get_settings().render_queue_config)
+
+@lru_cache(maxsize=1)
+def get_render_workers() -> RenderWorkerPool:
+    """
+    Get the render worker processes consuming the render queue.
+    
+    Started and stopped with the application.
+    """
+    settings = get_settings()
+    return RenderWorkerPool(
+        settings.render_queue_config,
+        workers=settings.RENDER_WORKERS,
+        poll_interval=settings.RENDER_POLL_INTERVAL_SECONDS
+    )
+
+RenderWorkersDep = Annotated[RenderWorkerPool, Depends(get_render_workers)]
+
+@lru_cache(maxsize=1)
+def get_render_job_registry() -> RenderJobRegistry:
+    """
+    Get the process-wide registry of background rendering jobs.
+    
+    Uses lru_cache so waiters on the same process share one watcher
+    polling the render queue.
+    """
+    return RenderJobRegistry(get_render_queue(), poll_interval=get_settings().RENDER_POLL_INTERVAL_SECONDS)
+
+RenderJobRegistryDep = Annotated[RenderJobRegistry, Depends(get_render_job_registry)]
+
 def get_chart_visualization_service(settings: SettingsDep) -> ChartVisualizationService:
     """
     Get an instance of the ChartVisualizationService.
@@ -42,7 +204,11 @@ def get_chart_visualization_service(settings: SettingsDep) -> ChartVisualization
     This dependency requires settings and can be used in route functions
     to get access to chart visualization operations.
     """
-    return ChartVisualizationService(settings=settings)
+    return ChartVisualizationService(
+        settings=settings,
+        render_cache=get_render_cache(),
+        artifact_store=get_artifact_store()
+    )
 
 ChartVisualizationServiceDep = Annotated[ChartVisualizationService, Depends(get_chart_visualization_service)]
 
@@ -57,6 +223,26 @@ def get_geo_service() -> GeoService:
 
 GeoServiceDep = Annotated[GeoService, Depends(get_geo_service)]
 
+@lru_cache(maxsize=1)
+def get_conversion_cache() -> RenderCache | None:
+    """
+    Get the process-wide cache of converted chart files.
+    
+    Returns None when the conversion cache is disabled in settings.
+    Converted files are streamed from the disk tier, so no memory tier is kept.
+    """
+    cache_config = get_settings().conversion_cache_config
+    if not cache_config["enabled"]:
+        return None
+    return RenderCache(
+        directory=cache_config["directory"],
+        memory_entries=0,
+        memory_bytes=0,
+        disk_bytes=cache_config["disk_bytes"],
+        suffix=".bin",
+        rescan_interval_seconds=cache_config["rescan_interval_seconds"]
+    )
+
 @lru_cache(maxsize=32)
 def get_file_conversion_service() -> FileConversionService:
     """
@@ -65,10 +251,61 @@ def get_file_conversion_service() -> FileConversionService:
     This dependency can be used in route functions to get access to file conversion operations.
     Uses lru_cache to reuse the service instance, improving performance.
     """
-    return FileConversionService()
+    return FileConversionService(cache=get_conversion_cache())
 
 FileConversionServiceDep = Annotated[FileConversionService, Depends(get_file_conversion_service)]
 
+@lru_cache(maxsize=1)
+def get_thumbnail_service() -> ThumbnailService:
+    """
+    Get the process-wide ThumbnailService rendering chart previews.
+    
+    Uses lru_cache so routes and render workers share one configuration.
+    """
+    return ThumbnailService(
+        get_file_conversion_service(),
+        store=get_artifact_store(),
+        **get_settings().thumbnail_config
+    )
+
+ThumbnailServiceDep = Annotated[ThumbnailService, Depends(get_thumbnail_service)]
+
+@lru_cache(maxsize=1)
+def get_raster_pool() -> ComputePool:
+    """
+    Get the process-wide ComputePool running file conversions.
+    
+    Separate from the chart calculation pool, so long exports cannot starve
+    chart calculations of workers.
+    """
+    return ComputePool(**get_settings().raster_pool_config)
+
+@lru_cache(maxsize=1)
+def get_rasterization_engine() -> RasterizationEngine:
+    """
+    Get the process-wide RasterizationEngine converting chart downloads.
+    
+    Uses lru_cache so all routes share the conversion pool and cache.
+    """
+    return RasterizationEngine(
+        get_raster_pool(),
+        cache=get_conversion_cache(),
+        max_pixels=get_settings().RASTER_MAX_PIXELS
+    )
+
+RasterizationEngineDep = Annotated[RasterizationEngine, Depends(get_rasterization_engine)]
+
+@lru_cache(maxsize=1)
+def get_chart_book_service() -> ChartBookService:
+    """
+    Get the process-wide ChartBookService exporting PDF chart books.
+    
+    Books are written in the rasterization pool, next to the other exports.
+    """
+    return ChartBookService(get_raster_pool(), page_size=get_settings().CHART_BOOK_PAGE_SIZE)
+
+ChartBookServiceDep = Annotated[ChartBookService, Depends(get_chart_book_service)]
+
 @lru_cache(maxsize=32)
 def get_report_service() -> ReportService:
     """
@@ -95,4 +332,43 @@ def get_interpretation_service(settings: SettingsDep) -> InterpretationService:
     
     return InterpretationService(llm_api_key=llm_api_key, model_name=model_name, llm_provider=llm_provider)
 
-InterpretationServiceDep = Annotated[InterpretationService, Depends(get_interpretation_service)] 
\ No newline at end of file
+InterpretationServiceDep = Annotated[InterpretationService, Depends(get_interpretation_service)]
+
+@lru_cache(maxsize=1)
+def get_transit_service() -> TransitService:
+    """
+    Get an instance of the TransitService.
+    
+    Uses lru_cache so the memory-mapped ephemeris table is loaded once per process.
+    """
+    transit_config = get_settings().transit_config
+    return TransitService(
+        table_path=transit_config["table_path"],
+        start_year=transit_config["start_year"],
+        end_year=transit_config["end_year"],
+        max_range_days=transit_config["max_range_days"]
+    )
+
+TransitServiceDep = Annotated[TransitService, Depends(get_transit_service)]
+
+@lru_cache(maxsize=1)
+def get_synastry_service() -> SynastryService:
+    """
+    Get an instance of the SynastryService.
+    
+    Shares the AstrologyService so synastry reuses the cached natal positions.
+    """
+    return SynastryService(astrology_service=get_astrology_service())
+
+SynastryServiceDep = Annotated[SynastryService, Depends(get_synastry_service)]
+
+@lru_cache(maxsize=1)
+def get_composite_service() -> CompositeService:
+    """
+    Get an instance of the CompositeService.
+    
+    Shares the AstrologyService so composite charts reuse the cached natal positions.
+    """
+    return CompositeService(astrology_service=get_astrology_service())
+
+CompositeServiceDep = Annotated[CompositeService, Depends(get_composite_service)]
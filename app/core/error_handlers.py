@@ -29,7 +29,8 @@ def add_error_handlers(app: FastAPI) -> None:
                     "type": type(exc).__name__,
                     "path": request.url.path
                 }
-            }
+            },
+            headers=exc.headers
         )
 
     @app.exception_handler(RequestValidationError)
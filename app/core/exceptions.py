@@ -43,4 +43,37 @@ class FileConversionError(ZodiacEngineException):
         super().__init__(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=detail
-        ) 
\ No newline at end of file
+        )
+
+class InvalidDateRangeError(ZodiacEngineException):
+    """Exception for invalid or unsupported date ranges."""
+    def __init__(self, detail: str = "Invalid date range provided"):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
+
+class ComputeCapacityError(ZodiacEngineException):
+    """Exception for chart calculations rejected because the compute pool is saturated."""
+    def __init__(self, detail: str = "Chart calculation capacity exhausted, retry later", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)}
+        )
+
+class ComputeTimeoutError(ZodiacEngineException):
+    """Exception for calculations that did not finish within the timeout of their route."""
+    def __init__(self, detail: str = "Calculation timed out"):
+        super().__init__(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=detail
+        )
+
+class ImageTooLargeError(ZodiacEngineException):
+    """Exception for conversions whose output image would exceed the pixel limit."""
+    def __init__(self, detail: str = "Requested image is too large"):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
@@ -1,6 +1,8 @@
 import re
 import logging
-from typing import Dict
+from typing import Dict, Optional, Tuple
+
+from scour import scour
 
 logger = logging.getLogger(__name__)
 
@@ -184,4 +186,123 @@ def preprocess_svg_for_conversion(svg_content: str) -> str:
     # Substitute variables
     processed_svg = substitute_css_variables(svg_content, variables)
     
-    return processed_svg
\ No newline at end of file
+    return processed_svg
+# Inches per unit of the physical SVG length units; cairosvg scales these with the DPI
+SVG_UNIT_INCHES = {"in": 1.0, "cm": 1 / 2.54, "mm": 1 / 25.4, "pt": 1 / 72, "pc": 1 / 6}
+
+def svg_length_pixels(length: Optional[str], dpi: float) -> Optional[float]:
+    """
+    Converts an SVG length to pixels the way cairosvg does.
+    
+    Physical units are scaled by the DPI; pixels and unitless lengths are not.
+    
+    Args:
+        length (Optional[str]): Length attribute value (e.g., "800", "210mm")
+        dpi (float): Resolution in dots per inch
+        
+    Returns:
+        Optional[float]: Length in pixels, or None if missing or relative (e.g., "100%")
+    """
+    match = re.fullmatch(r'\s*([0-9.eE+-]+)\s*([a-z]*)\s*', length or "")
+    if not match:
+        return None
+    try:
+        number = float(match.group(1))
+    except ValueError:
+        return None
+    unit = match.group(2)
+    if unit in ("", "px"):
+        return number
+    if unit in SVG_UNIT_INCHES:
+        return number * SVG_UNIT_INCHES[unit] * dpi
+    return None
+
+def svg_pixel_size(svg_content: str, dpi: float = 96) -> Optional[Tuple[float, float]]:
+    """
+    Estimates the size in pixels cairosvg rasterizes an SVG to.
+    
+    The size comes from the width and height of the root element, falling
+    back to its viewBox, so oversized conversions can be rejected before
+    rendering.
+    
+    Args:
+        svg_content (str): SVG content as a string
+        dpi (float): Resolution in dots per inch
+        
+    Returns:
+        Optional[Tuple[float, float]]: Width and height in pixels, or None if they cannot be determined
+    """
+    root = re.search(r'<svg\b[^>]*>', svg_content)
+    if not root:
+        return None
+    attributes = dict(re.findall(r'([\w:-]+)\s*=\s*["\']([^"\']*)["\']', root.group(0)))
+    
+    view_box = None
+    try:
+        view_box = [float(value) for value in re.split(r'[\s,]+', attributes.get("viewBox", "").strip())]
+    except ValueError:
+        pass
+    
+    width = svg_length_pixels(attributes.get("width"), dpi)
+    height = svg_length_pixels(attributes.get("height"), dpi)
+    if view_box and len(view_box) == 4:
+        width = view_box[2] if width is None else width
+        height = view_box[3] if height is None else height
+    if width is None or height is None:
+        return None
+    return width, height
+
+# Significant digits kept in coordinates of minified SVGs; a tenth of a pixel on an 800 px chart
+SVG_MINIFY_PRECISION = 5
+
+# Kerykeion's CSS variable prefix and its shortened form in minified SVGs
+KERYKEION_CSS_VARIABLE_PREFIX = "--kerykeion-chart-color-"
+SHORT_CSS_VARIABLE_PREFIX = "--k-"
+
+def minify_css(css: str) -> str:
+    """
+    Minifies a stylesheet by removing comments and insignificant whitespace.
+    
+    Args:
+        css (str): Stylesheet content
+        
+    Returns:
+        str: Minified stylesheet
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,])\s*', r'\1', css)
+    return css.strip()
+
+def minify_svg(svg_content: str, precision: int = SVG_MINIFY_PRECISION) -> str:
+    """
+    Minifies SVG content for serving.
+    
+    Scour rounds coordinates to the given precision, shortens IDs and strips
+    comments, metadata and whitespace; Kerykeion's CSS variables are renamed
+    to a short prefix and the stylesheets are minified. The result renders
+    the same and is still preprocessed correctly for conversion.
+    
+    Args:
+        svg_content (str): SVG content as a string
+        precision (int): Significant digits kept in coordinates
+        
+    Returns:
+        str: Minified SVG content
+    """
+    options = scour.sanitizeOptions()
+    options.digits = precision
+    options.shorten_ids = True
+    options.strip_comments = True
+    options.remove_metadata = True
+    options.strip_xml_space_attribute = True
+    options.indent_type = "none"
+    options.newlines = False
+    
+    svg_content = svg_content.replace(KERYKEION_CSS_VARIABLE_PREFIX, SHORT_CSS_VARIABLE_PREFIX)
+    minified = scour.scourString(svg_content, options)
+    
+    def style_replacer(match):
+        return f"{match.group(1)}{minify_css(match.group(2))}{match.group(3)}"
+    
+    return re.sub(r'(<style[^>]*>)(.*?)(</style>)', style_replacer, minified, flags=re.DOTALL | re.IGNORECASE)
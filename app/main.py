@@ -1,13 +1,25 @@
 """Main application module."""
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import RedirectResponse
+from starlette.concurrency import run_in_threadpool
 
 from app.api import router as api_router
 from app.static import mount_static_files
 from app.core.config import settings
+from app.core.dependencies import (
+    get_artifact_store,
+    get_chart_store,
+    get_compute_pool,
+    get_raster_pool,
+    get_render_queue,
+    get_render_workers,
+    get_transit_service,
+)
 from app.core.error_handlers import add_error_handlers
 
 # Configure logging
@@ -61,6 +73,19 @@ def custom_openapi():
     app.openapi_schema = openapi_schema
     return app.openapi_schema
 
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    """Load the ephemeris table and start the render workers, and stop all worker processes and close the stores on shutdown."""
+    # Build or map the transit table before serving, not in the first transit request
+    await run_in_threadpool(lambda: get_transit_service().table)
+    get_render_workers().start()
+    yield
+    get_render_workers().stop()
+    get_compute_pool().shutdown()
+    get_raster_pool().shutdown()
+    get_render_queue().close()
+    await get_chart_store().close()
+
 def create_application() -> FastAPI:
     """Create FastAPI application with configuration."""
     application = FastAPI(
@@ -69,6 +94,7 @@ def create_application() -> FastAPI:
         description="Astrological API powered by Kerykeion",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
         openapi_tags=[
             {
                 "name": "natal-chart",
@@ -125,7 +151,7 @@ def create_application() -> FastAPI:
     application.include_router(api_router)
     
     # Mount static files
-    mount_static_files(application)
+    mount_static_files(application, get_artifact_store())
 
     @application.get(
         "/",
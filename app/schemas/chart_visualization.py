@@ -23,6 +23,8 @@ Planet = Literal[
 
 AxialCusps = Literal["Ascendant", "Medium_Coeli", "Descendant", "Imum_Coeli"]
 
+RenderJobState = Literal["queued", "running", "done", "failed"]
+
 AspectName = Literal[
     "conjunction", "semi-sextile", "semi-square", "sextile", "quintile", 
     "square", "trine", "sesquiquadrate", "biquintile", "quincunx", "opposition"
@@ -174,16 +176,50 @@ class SynastryChartVisualizationRequest(BaseModel):
             }
         }
 
+class BulkChartRenderRequest(BaseModel):
+    """Schema for bulk natal chart rendering request."""
+    charts: list[NatalChartVisualizationRequest] = Field(..., min_length=1, description="Natal charts to render")
+    format: Literal["svg", "png", "pdf"] = Field("svg", description="Output format of every chart")
+    dpi: int = Field(96, ge=72, le=600, description="Resolution in dots per inch for PNG charts")
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "charts": [
+                    {
+                        "name": "John Doe",
+                        "birth_date": "1990-01-01T12:00:00",
+                        "lng": -74.006,
+                        "lat": 40.7128,
+                        "tz_str": "America/New_York"
+                    },
+                    {
+                        "name": "Jane Smith",
+                        "birth_date": "1992-05-15T15:30:00",
+                        "lng": -0.1278,
+                        "lat": 51.5074,
+                        "tz_str": "Europe/London",
+                        "theme": "light"
+                    }
+                ],
+                "format": "png",
+                "dpi": 150
+            }
+        }
+    }
+
 class ChartVisualizationResponse(BaseModel):
     """Schema for chart visualization response."""
     chart_id: str = Field(..., description="ID of the generated chart")
     svg_url: str = Field(..., description="URL to access the SVG visualization")
+    job_url: str | None = Field(None, description="URL to poll or wait for the rendering job")
 
     model_config = {
         "json_schema_extra": {
             "example": {
                 "chart_id": "natal_12345678",
-                "svg_url": "/static/images/svg/natal_12345678.svg"
+                "svg_url": "/static/images/svg/natal_12345678.svg",
+                "job_url": "/api/v1/charts/visualization/jobs/natal_12345678"
             }
             }
         }
@@ -194,4 +230,48 @@ class NatalChartVisualizationResponse(ChartVisualizationResponse):
 
 class SynastryChartVisualizationResponse(ChartVisualizationResponse):
     """Response schema for synastry chart visualization."""
-    pass 
\ No newline at end of file
+    pass 
+
+class RenderCacheStats(BaseModel):
+    """Schema for SVG render cache statistics."""
+    enabled: bool = Field(..., description="Whether the render cache is enabled")
+    memory_entries: int = Field(0, description="Number of SVGs kept in memory")
+    memory_bytes: int = Field(0, description="Total size of the SVGs kept in memory in bytes")
+    memory_hits: int = Field(0, description="Number of memory tier hits")
+    memory_evictions: int = Field(0, description="Number of SVGs evicted from memory")
+    disk_entries: int = Field(0, description="Number of SVGs kept on disk")
+    disk_bytes: int = Field(0, description="Total size of the SVGs kept on disk in bytes")
+    max_disk_bytes: int | None = Field(None, description="Maximum total size of the SVGs kept on disk in bytes")
+    disk_hits: int = Field(0, description="Number of disk tier hits")
+    disk_evictions: int = Field(0, description="Number of SVGs evicted from disk")
+
+class RenderJobResponse(BaseModel):
+    """Schema for the state of a chart rendering job."""
+    chart_id: str = Field(..., description="ID of the chart")
+    chart_type: str = Field(..., description="Type of chart ('natal' or 'synastry')")
+    state: RenderJobState = Field(..., description="State of the job")
+    svg_url: str = Field(..., description="URL of the SVG once the job is done")
+    priority: int = Field(..., description="Queue priority: 0 web, 1 API, 2 batch")
+    attempts: int = Field(..., description="Rendering attempts started")
+    max_attempts: int = Field(..., description="Attempts before the job is dead-lettered")
+    error: str | None = Field(None, description="Error of the last failed attempt")
+    created_at: float = Field(..., description="Time the job was queued (Unix timestamp)")
+    started_at: float | None = Field(None, description="Time the last attempt started (Unix timestamp)")
+    finished_at: float | None = Field(None, description="Time the job finished (Unix timestamp)")
+    queue_seconds: float | None = Field(None, description="Time spent waiting before rendering")
+    render_seconds: float | None = Field(None, description="Time spent rendering")
+
+class RenderLatencyStats(BaseModel):
+    """Schema for render latency percentiles."""
+    p50: float | None = Field(None, description="Median render time in seconds")
+    p90: float | None = Field(None, description="90th percentile render time in seconds")
+    p99: float | None = Field(None, description="99th percentile render time in seconds")
+    max: float | None = Field(None, description="Longest render time in seconds")
+
+class RenderJobStats(BaseModel):
+    """Schema for rendering job statistics."""
+    queued: int = Field(..., description="Jobs waiting to be rendered")
+    running: int = Field(..., description="Jobs being rendered")
+    done: int = Field(..., description="Jobs finished successfully")
+    failed: int = Field(..., description="Jobs that failed all their attempts (dead-lettered)")
+    render_seconds: RenderLatencyStats = Field(..., description="Render time percentiles of recent jobs")
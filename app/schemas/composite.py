@@ -0,0 +1,32 @@
+"""Schemas for composite and Davison chart calculations."""
+from pydantic import BaseModel, Field
+
+from app.schemas.natal_chart import NatalChartRequest
+
+class CompositeChartRequest(BaseModel):
+    """Schema for composite and Davison chart calculation request."""
+    first: NatalChartRequest = Field(..., description="Birth data of the first person")
+    second: NatalChartRequest = Field(..., description="Birth data of the second person")
+    houses_system: str = Field("P", description="House system identifier used for the composite chart")
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "first": {
+                    "name": "John Doe",
+                    "birth_date": "1990-01-01T12:00:00",
+                    "lng": -74.006,
+                    "lat": 40.7128,
+                    "tz_str": "America/New_York"
+                },
+                "second": {
+                    "name": "Jane Smith",
+                    "birth_date": "1992-05-15T15:30:00",
+                    "lng": -118.243,
+                    "lat": 34.052,
+                    "tz_str": "America/Los_Angeles"
+                },
+                "houses_system": "P"
+            }
+        }
+    }
@@ -57,4 +57,42 @@ class NatalChartResponse(BaseModel):
     planets: list[PlanetPosition] = Field(..., description="List of planet positions")
     houses: dict[int, float] = Field(..., description="House cusps positions")
     aspects: list[AspectInfo] = Field(..., description="List of planetary aspects")
-    house_system: HouseSystem = Field(..., description="House system used for calculations") 
\ No newline at end of file
+    house_system: HouseSystem = Field(..., description="House system used for calculations") 
+class NatalChartBatchItem(BaseModel):
+    """Schema for one result of a batch natal chart calculation."""
+    index: int = Field(..., description="Position of the chart in the request list")
+    chart: NatalChartResponse | None = Field(None, description="Calculated natal chart, if successful")
+    error: str | None = Field(None, description="Error message, if the calculation failed")
+    error_type: str | None = Field(None, description="Type of the error, if the calculation failed")
+
+class ChartCacheStats(BaseModel):
+    """Schema for natal chart cache statistics."""
+    enabled: bool = Field(..., description="Whether the chart cache is enabled")
+    entries: int = Field(0, description="Number of cached charts")
+    size_bytes: int = Field(0, description="Estimated total size of cached charts in bytes")
+    max_entries: int | None = Field(None, description="Maximum number of cached charts")
+    max_bytes: int | None = Field(None, description="Maximum total size of cached charts in bytes")
+    ttl_seconds: float | None = Field(None, description="Time to live of a cached chart in seconds")
+    hits: int = Field(0, description="Number of cache hits")
+    misses: int = Field(0, description="Number of cache misses")
+    hit_ratio: float = Field(0.0, description="Ratio of hits to lookups")
+    evictions: int = Field(0, description="Number of entries evicted to respect size limits")
+    expirations: int = Field(0, description="Number of entries dropped after their TTL")
+
+class ComputeRouteStats(BaseModel):
+    """Schema for compute pool counters of one route."""
+    limit: int | None = Field(None, description="Maximum concurrent calculations of the route, if limited")
+    in_flight: int = Field(0, description="Calculations of the route running or queued")
+    completed: int = Field(0, description="Calculations completed")
+    failed: int = Field(0, description="Calculations that raised an error")
+    rejected: int = Field(0, description="Calculations rejected with 503 because of saturation")
+    timed_out: int = Field(0, description="Calculations that failed with 504 because they exceeded the route's timeout")
+    average_seconds: float = Field(0.0, description="Average time from admission to result in seconds")
+
+class ComputePoolStats(BaseModel):
+    """Schema for chart compute pool statistics."""
+    workers: int = Field(..., description="Number of worker processes")
+    max_pending: int = Field(..., description="Maximum running plus queued calculations")
+    pending: int = Field(..., description="Calculations running or queued")
+    queued: int = Field(..., description="Calculations waiting for a free worker")
+    routes: dict[str, ComputeRouteStats] = Field(..., description="Counters per route")
@@ -88,6 +88,7 @@ class SynastryReportResponse(BaseModel):
     """Schema for synastry report response."""
     person1: Dict[str, str] = Field(..., description="Report data for the first person")
     person2: Dict[str, str] = Field(..., description="Report data for the second person")
+    aspects_table: str | None = Field(None, description="Table containing synastry aspects between the charts")
 
 # Structured report data models for interpretation
 class NatalReportData(BaseModel):
@@ -0,0 +1,86 @@
+"""Schemas for synastry calculations."""
+from pydantic import BaseModel, Field
+
+from app.schemas.chart_visualization import AspectConfiguration, AxialCusps, Planet
+from app.schemas.natal_chart import AspectInfo, NatalChartRequest
+
+DEFAULT_SYNASTRY_POINTS = [
+    "Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus",
+    "Neptune", "Pluto", "Mean_Node", "Chiron", "Ascendant", "Medium_Coeli",
+    "Mean_Lilith", "Mean_South_Node"
+]
+
+DEFAULT_SYNASTRY_ASPECTS = [
+    {"name": "conjunction", "orb": 10},
+    {"name": "opposition", "orb": 10},
+    {"name": "trine", "orb": 8},
+    {"name": "sextile", "orb": 6},
+    {"name": "square", "orb": 5},
+    {"name": "quintile", "orb": 1}
+]
+
+class SynastryRequest(BaseModel):
+    """Schema for synastry aspect calculation request."""
+    first: NatalChartRequest = Field(..., description="Birth data of the first person")
+    second: NatalChartRequest = Field(..., description="Birth data of the second person")
+    active_points: list[Planet | AxialCusps] = Field(
+        default=DEFAULT_SYNASTRY_POINTS,
+        description="Planets and points to compare"
+    )
+    active_aspects: list[AspectConfiguration] = Field(
+        default=DEFAULT_SYNASTRY_ASPECTS,
+        description="List of active aspects with their orbs"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "first": {
+                    "name": "John Doe",
+                    "birth_date": "1990-01-01T12:00:00",
+                    "lng": -74.006,
+                    "lat": 40.7128,
+                    "tz_str": "America/New_York"
+                },
+                "second": {
+                    "name": "Jane Smith",
+                    "birth_date": "1992-05-15T15:30:00",
+                    "lng": -118.243,
+                    "lat": 34.052,
+                    "tz_str": "America/Los_Angeles"
+                }
+            }
+        }
+    }
+
+class SynastryResponse(BaseModel):
+    """Schema for synastry aspect calculation response."""
+    first_name: str = Field(..., description="Name of the first person")
+    second_name: str = Field(..., description="Name of the second person")
+    aspects: list[AspectInfo] = Field(
+        ..., description="Aspects between the charts; p1 belongs to the first person, p2 to the second"
+    )
+
+class SynastryMatchRequest(BaseModel):
+    """Schema for comparing one chart against many candidate charts."""
+    subject: NatalChartRequest = Field(..., description="Birth data of the person to match")
+    candidates: list[NatalChartRequest] = Field(..., description="Birth data of the candidates")
+    active_points: list[Planet | AxialCusps] = Field(
+        default=DEFAULT_SYNASTRY_POINTS,
+        description="Planets and points to compare"
+    )
+    active_aspects: list[AspectConfiguration] = Field(
+        default=DEFAULT_SYNASTRY_ASPECTS,
+        description="List of active aspects with their orbs"
+    )
+
+class SynastryMatchItem(BaseModel):
+    """Schema for the synastry result of one candidate."""
+    index: int = Field(..., description="Position of the candidate in the request list")
+    name: str = Field(..., description="Name of the candidate")
+    aspect_count: int | None = Field(None, description="Number of aspects between the charts")
+    aspects: list[AspectInfo] | None = Field(
+        None, description="Aspects between the charts; p1 belongs to the subject, p2 to the candidate"
+    )
+    error: str | None = Field(None, description="Error message, if the calculation failed")
+    error_type: str | None = Field(None, description="Type of the error, if the calculation failed")
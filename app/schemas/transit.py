@@ -0,0 +1,67 @@
+"""Schemas for transit calculations."""
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from app.schemas.chart_visualization import AspectName, AxialCusps, Planet
+from app.schemas.natal_chart import NatalChartRequest
+
+class TransitRequest(BaseModel):
+    """Schema for transit timeline calculation request."""
+    natal: NatalChartRequest = Field(..., description="Birth data of the natal chart")
+    start_date: datetime = Field(..., description="Start of the period (UTC if no timezone is given)")
+    end_date: datetime = Field(..., description="End of the period (UTC if no timezone is given)")
+    transiting_points: list[Planet] = Field(
+        default=[
+            "Sun", "Moon", "Mercury", "Venus", "Mars",
+            "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"
+        ],
+        description="Transiting planets and points"
+    )
+    natal_points: list[Planet | AxialCusps] = Field(
+        default=[
+            "Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn",
+            "Uranus", "Neptune", "Pluto", "Mean_Node", "Chiron", "Ascendant",
+            "Medium_Coeli", "Mean_Lilith", "Mean_South_Node"
+        ],
+        description="Natal points the transits aspect"
+    )
+    aspects: list[AspectName] = Field(
+        default=["conjunction", "opposition", "trine", "sextile", "square", "quintile"],
+        description="Aspects to find exact transits for"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "natal": {
+                    "name": "John Doe",
+                    "birth_date": "1990-01-01T12:00:00",
+                    "lng": -74.006,
+                    "lat": 40.7128,
+                    "tz_str": "America/New_York",
+                    "houses_system": "P"
+                },
+                "start_date": "2025-01-01T00:00:00",
+                "end_date": "2026-01-01T00:00:00",
+                "transiting_points": ["Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"],
+                "aspects": ["conjunction", "opposition", "square", "trine"]
+            }
+        }
+    }
+
+class TransitEvent(BaseModel):
+    """Schema for an exact transit aspect."""
+    date: datetime = Field(..., description="UTC time the aspect is exact, to the minute")
+    transiting_point: str = Field(..., description="Name of the transiting planet or point")
+    natal_point: str = Field(..., description="Name of the natal planet or point")
+    aspect: str = Field(..., description="Type of aspect")
+    transit_longitude: float = Field(..., description="Absolute longitude of the transiting point in degrees")
+    retrograde: bool = Field(..., description="Whether the transiting point is retrograde")
+
+class TransitTimelineResponse(BaseModel):
+    """Schema for transit timeline calculation response."""
+    name: str = Field(..., description="Name of the person")
+    start_date: datetime = Field(..., description="Start of the period")
+    end_date: datetime = Field(..., description="End of the period")
+    transits: list[TransitEvent] = Field(..., description="Exact transits in chronological order")
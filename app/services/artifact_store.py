@@ -0,0 +1,515 @@
+"""Storage of rendered chart files with a size quota and garbage collection."""
+import logging
+import mimetypes
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Accesses of a chart closer together than this are recorded in the backend once
+ACCESS_RESOLUTION_SECONDS = 60
+
+# Temporary files of interrupted writes older than this are removed by garbage collection
+STALE_TEMPORARY_SECONDS = 3600
+
+# Prefixes of generated chart IDs: API and render queue charts, web form charts and sky streams
+CHART_ID_PREFIXES = ("natal_", "synastry_", "western_", "vedic_", "sky_")
+
+class ArtifactInfo(NamedTuple):
+    """Name, size in bytes, and modification and access times of a stored file."""
+    name: str
+    size: int
+    modified: float
+    accessed: float
+
+def artifact_chart_id(name: str) -> str:
+    """
+    Chart a file belongs to: its name up to the first dot.
+
+    A chart's SVG, its precompressed variants and its thumbnails
+    (natal_1.svg, natal_1.svg.gz, natal_1.512.webp) form one group that is
+    evicted together.
+    """
+    return name.split(".", 1)[0]
+
+def _check_name(name: str) -> None:
+    """Reject names that would escape the storage root."""
+    if not name or name.startswith(".") or "/" in name or "\\" in name:
+        raise ValueError(f"Invalid artifact name: {name!r}")
+
+class ArtifactBackend(ABC):
+    """Flat namespace of files a ChartArtifactStore keeps charts in."""
+
+    @abstractmethod
+    def write(self, name: str, content: bytes) -> ArtifactInfo:
+        """Write a file atomically, replacing any file of the same name."""
+
+    @abstractmethod
+    def read(self, name: str) -> bytes:
+        """
+        Read a file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+
+    @abstractmethod
+    def stat(self, name: str) -> ArtifactInfo | None:
+        """Return the metadata of a file, or None if it does not exist."""
+
+    @abstractmethod
+    def delete(self, name: str) -> None:
+        """Delete a file if it exists."""
+
+    @abstractmethod
+    def scan(self) -> Iterator[ArtifactInfo]:
+        """Yield the metadata of every stored file."""
+
+    def touch(self, name: str, accessed: float) -> None:
+        """Record an access to a file, if the backend keeps access times."""
+
+    def purge_temporary(self, older_than: float) -> int:
+        """Delete leftovers of interrupted writes modified before older_than; return how many."""
+        return 0
+
+    def local_path(self, name: str) -> Path | None:
+        """Path of a file on the local filesystem, or None if the backend is remote."""
+        return None
+
+    def url_for(self, name: str) -> str | None:
+        """URL clients can fetch a file of a remote backend from."""
+        return None
+
+class LocalDirectoryBackend(ArtifactBackend):
+    """
+    Files in a local directory.
+
+    Writes go to a temporary file that is renamed over the target, so
+    readers and the static file mount never see a partial file. Access
+    times are recorded in the files' atime, leaving the mtime to mark when
+    the content last changed.
+    """
+
+    def __init__(self, directory: str | Path):
+        """
+        Initialize the backend.
+
+        Args:
+            directory: Directory of the files, created on first write
+        """
+        self.directory = Path(directory)
+
+    def write(self, name: str, content: bytes) -> ArtifactInfo:
+        path = self._path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        temporary_path.write_bytes(content)
+        os.replace(temporary_path, path)
+        now = time.time()
+        return ArtifactInfo(name, len(content), now, now)
+
+    def read(self, name: str) -> bytes:
+        return self._path(name).read_bytes()
+
+    def stat(self, name: str) -> ArtifactInfo | None:
+        try:
+            stat = self._path(name).stat()
+        except FileNotFoundError:
+            return None
+        return ArtifactInfo(name, stat.st_size, stat.st_mtime, stat.st_atime)
+
+    def delete(self, name: str) -> None:
+        self._path(name).unlink(missing_ok=True)
+
+    def scan(self) -> Iterator[ArtifactInfo]:
+        if not self.directory.exists():
+            return
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".tmp") or entry.name.startswith("."):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                yield ArtifactInfo(entry.name, stat.st_size, stat.st_mtime, stat.st_atime)
+
+    def touch(self, name: str, accessed: float) -> None:
+        path = self._path(name)
+        try:
+            os.utime(path, (accessed, path.stat().st_mtime))
+        except FileNotFoundError:
+            pass
+
+    def purge_temporary(self, older_than: float) -> int:
+        purged = 0
+        for path in self.directory.glob("*.tmp"):
+            try:
+                if path.stat().st_mtime < older_than:
+                    path.unlink()
+                    purged += 1
+            except FileNotFoundError:
+                continue
+        return purged
+
+    def local_path(self, name: str) -> Path | None:
+        return self._path(name)
+
+    def _path(self, name: str) -> Path:
+        """Path of a file in the directory."""
+        _check_name(name)
+        return self.directory / name
+
+class S3Backend(ArtifactBackend):
+    """
+    Objects in an S3-compatible bucket, such as a local MinIO server.
+
+    S3 replaces objects atomically on PUT, so no temporary objects are
+    written. The bucket keeps no access times; the store tracks accesses
+    in memory and falls back to the modification time after a restart.
+    Clients are redirected to presigned URLs of the objects.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        endpoint_url: str | None = None,
+        url_expires_seconds: int = 3600,
+        client: Any = None,
+    ):
+        """
+        Initialize the backend.
+
+        Args:
+            bucket: Name of the bucket
+            prefix: Key prefix of the chart files (e.g., 'charts/')
+            endpoint_url: URL of an S3-compatible server, None for AWS S3
+            url_expires_seconds: Lifetime of the presigned URLs clients are redirected to
+            client: boto3 S3 client, created from the environment's credentials if not given
+
+        Raises:
+            ImportError: If no client is given and boto3 is not installed
+        """
+        if client is None:
+            try:
+                import boto3
+            except ImportError as e:
+                raise ImportError("The s3 chart artifact backend requires the boto3 package") from e
+            client = boto3.client("s3", endpoint_url=endpoint_url)
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+        self.url_expires_seconds = url_expires_seconds
+
+    def write(self, name: str, content: bytes) -> ArtifactInfo:
+        media_type, encoding = mimetypes.guess_type(name)
+        extra = {"ContentType": media_type or "application/octet-stream"}
+        if encoding is not None:
+            extra["ContentEncoding"] = encoding
+        self.client.put_object(Bucket=self.bucket, Key=self._key(name), Body=content, **extra)
+        now = time.time()
+        return ArtifactInfo(name, len(content), now, now)
+
+    def read(self, name: str) -> bytes:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self._key(name))
+        except Exception as e:
+            if _is_missing(e):
+                raise FileNotFoundError(name) from e
+            raise
+        return response["Body"].read()
+
+    def stat(self, name: str) -> ArtifactInfo | None:
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=self._key(name))
+        except Exception as e:
+            if _is_missing(e):
+                return None
+            raise
+        modified = response["LastModified"].timestamp()
+        return ArtifactInfo(name, response["ContentLength"], modified, modified)
+
+    def delete(self, name: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(name))
+
+    def scan(self) -> Iterator[ArtifactInfo]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for item in page.get("Contents", []):
+                name = item["Key"][len(self.prefix):]
+                if not name or "/" in name:
+                    continue
+                modified = item["LastModified"].timestamp()
+                yield ArtifactInfo(name, item["Size"], modified, modified)
+
+    def url_for(self, name: str) -> str | None:
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": self._key(name)},
+            ExpiresIn=self.url_expires_seconds,
+        )
+
+    def _key(self, name: str) -> str:
+        """Object key of a file."""
+        _check_name(name)
+        return f"{self.prefix}{name}"
+
+def _is_missing(error: Exception) -> bool:
+    """Whether a botocore ClientError reports a missing object."""
+    code = getattr(error, "response", {}).get("Error", {}).get("Code")
+    return code in ("404", "NoSuchKey", "NotFound")
+
+class ChartArtifactStore:
+    """
+    Rendered chart files on a pluggable backend, bounded by total size and age.
+
+    Files are grouped by chart (see artifact_chart_id) in an in-memory
+    index ordered by last access, loaded from the backend on first use.
+    When a write takes the total size over max_bytes, the least recently
+    used charts are deleted with all their files. Garbage collection,
+    run every gc_interval_seconds by the writing process, rescans the
+    backend, so files written by other workers sharing it are counted,
+    deletes charts not accessed for max_age_seconds and leftovers of
+    interrupted writes, and enforces the quota.
+
+    Only files whose names start with one of chart_prefixes are indexed,
+    so hand-placed assets sharing the directory, such as sample.svg, are
+    served but never counted or deleted.
+    """
+
+    def __init__(
+        self,
+        backend: ArtifactBackend,
+        max_bytes: int | None = None,
+        max_age_seconds: float | None = None,
+        gc_interval_seconds: float = 3600,
+        clock: Callable[[], float] = time.time,
+        chart_prefixes: Tuple[str, ...] = CHART_ID_PREFIXES,
+    ):
+        """
+        Initialize the artifact store.
+
+        Args:
+            backend: Backend holding the files
+            max_bytes: Maximum total size of the stored files (None for no quota)
+            max_age_seconds: Charts not accessed for this long are deleted (None keeps them)
+            gc_interval_seconds: Minimum time between garbage collections triggered by writes
+            clock: Wall-clock time function, injectable for testing
+            chart_prefixes: Name prefixes of the files the store manages
+        """
+        self.backend = backend
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.gc_interval_seconds = gc_interval_seconds
+        self._clock = clock
+        self.chart_prefixes = chart_prefixes
+        self._charts: "OrderedDict[str, Dict[str, int]] | None" = None
+        self._accessed: Dict[str, float] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._last_gc = clock()
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def local_directory(self) -> Path | None:
+        """Directory of the files if the backend is local, else None."""
+        return getattr(self.backend, "directory", None)
+
+    def write(self, name: str, content: bytes) -> None:
+        """
+        Store a file atomically, evicting least recently used charts if the quota is exceeded.
+
+        Args:
+            name: File name, starting with the ID of its chart
+            content: File content
+        """
+        info = self.backend.write(name, content)
+        if not self.manages(name):
+            return
+        chart_id = artifact_chart_id(name)
+        with self._lock:
+            charts = self._load_index()
+            files = charts.setdefault(chart_id, {})
+            self._size += info.size - files.get(name, 0)
+            files[name] = info.size
+            charts.move_to_end(chart_id)
+            self._accessed[chart_id] = info.accessed
+            victims = self._over_quota(keep=chart_id)
+        self._delete_charts(victims)
+        self._maybe_collect_garbage()
+
+    def manages(self, name: str) -> bool:
+        """Whether a file belongs to a generated chart, which the quota and garbage collection apply to."""
+        return name.startswith(self.chart_prefixes)
+
+    def read(self, name: str) -> bytes:
+        """
+        Read a file, recording the access.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        try:
+            content = self.backend.read(name)
+        except FileNotFoundError:
+            self._forget_file(name)
+            raise
+        self.touch(name)
+        return content
+
+    def stat(self, name: str) -> ArtifactInfo | None:
+        """Return the metadata of a file without recording an access."""
+        return self.backend.stat(name)
+
+    def exists(self, name: str) -> bool:
+        """Whether a file exists."""
+        return self.backend.stat(name) is not None
+
+    def touch(self, name: str) -> None:
+        """Record an access to the chart of a file, moving it to the end of the eviction order."""
+        chart_id = artifact_chart_id(name)
+        now = self._clock()
+        with self._lock:
+            charts = self._load_index()
+            if chart_id not in charts:
+                return
+            charts.move_to_end(chart_id)
+            if now - self._accessed.get(chart_id, 0.0) < ACCESS_RESOLUTION_SECONDS:
+                return
+            self._accessed[chart_id] = now
+        self.backend.touch(name, now)
+
+    def local_path(self, name: str) -> Path | None:
+        """Path of a file on the local filesystem, or None if the backend is remote."""
+        return self.backend.local_path(name)
+
+    def url_for(self, name: str) -> str | None:
+        """URL of a file of a remote backend."""
+        return self.backend.url_for(name)
+
+    def delete_chart(self, chart_id: str) -> None:
+        """Delete every file of a chart."""
+        with self._lock:
+            self._load_index()
+            files = self._forget_chart(chart_id)
+        for name in files:
+            self.backend.delete(name)
+
+    def collect_garbage(self) -> int:
+        """
+        Rescan the backend, delete expired charts and enforce the quota.
+
+        Returns:
+            Number of charts deleted
+        """
+        now = self._clock()
+        self._last_gc = now
+        purged = self.backend.purge_temporary(now - STALE_TEMPORARY_SECONDS)
+        if purged:
+            logger.info(f"Removed {purged} interrupted chart artifact writes")
+
+        with self._lock:
+            self._charts = None
+            charts = self._load_index()
+            expired = []
+            if self.max_age_seconds is not None:
+                cutoff = now - self.max_age_seconds
+                expired = [chart_id for chart_id in charts if self._accessed[chart_id] < cutoff]
+            victims = [(chart_id, self._forget_chart(chart_id)) for chart_id in expired]
+            self._expirations += len(victims)
+            victims += self._over_quota(keep=None)
+        self._delete_charts(victims)
+        if victims:
+            logger.info(f"Chart artifact garbage collection deleted {len(victims)} charts")
+        return len(victims)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return usage statistics of the store."""
+        with self._lock:
+            charts = self._load_index()
+            return {
+                "charts": len(charts),
+                "files": sum(len(files) for files in charts.values()),
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    def _maybe_collect_garbage(self) -> None:
+        """Collect garbage if the interval has elapsed since the last collection."""
+        if self._clock() - self._last_gc >= self.gc_interval_seconds:
+            try:
+                self.collect_garbage()
+            except Exception as e:
+                logger.error(f"Chart artifact garbage collection failed: {str(e)}")
+
+    def _over_quota(self, keep: str | None) -> List[tuple[str, List[str]]]:
+        """Remove least recently used charts from the index until within quota; the caller must hold the lock."""
+        victims = []
+        if self.max_bytes is None:
+            return victims
+        charts = self._charts
+        for chart_id in list(charts):
+            if self._size <= self.max_bytes:
+                break
+            if chart_id == keep:
+                continue
+            victims.append((chart_id, self._forget_chart(chart_id)))
+            self._evictions += 1
+        return victims
+
+    def _delete_charts(self, victims: List[tuple[str, List[str]]]) -> None:
+        """Delete the files of charts removed from the index."""
+        for chart_id, files in victims:
+            for name in files:
+                try:
+                    self.backend.delete(name)
+                except Exception as e:
+                    logger.warning(f"Failed to delete chart artifact {name}: {str(e)}")
+
+    def _load_index(self) -> "OrderedDict[str, Dict[str, int]]":
+        """Index the backend by chart and last access on first use; the caller must hold the lock."""
+        if self._charts is None:
+            charts: Dict[str, Dict[str, int]] = {}
+            accessed: Dict[str, float] = {}
+            for info in self.backend.scan():
+                if not self.manages(info.name):
+                    continue
+                chart_id = artifact_chart_id(info.name)
+                charts.setdefault(chart_id, {})[info.name] = info.size
+                accessed[chart_id] = max(accessed.get(chart_id, 0.0), info.accessed, info.modified)
+            order = sorted(charts, key=accessed.__getitem__)
+            self._charts = OrderedDict((chart_id, charts[chart_id]) for chart_id in order)
+            self._accessed = accessed
+            self._size = sum(sum(files.values()) for files in charts.values())
+            logger.info(f"Chart artifact store holds {len(charts)} charts ({self._size} bytes)")
+        return self._charts
+
+    def _forget_chart(self, chart_id: str) -> List[str]:
+        """Remove a chart from the index and return its file names; the caller must hold the lock."""
+        files = self._charts.pop(chart_id, {})
+        self._accessed.pop(chart_id, None)
+        self._size -= sum(files.values())
+        return list(files)
+
+    def _forget_file(self, name: str) -> None:
+        """Remove a file deleted by another worker from the index."""
+        chart_id = artifact_chart_id(name)
+        with self._lock:
+            files = self._charts.get(chart_id) if self._charts is not None else None
+            if files is None or name not in files:
+                return
+            self._size -= files.pop(name)
+            if not files:
+                self._forget_chart(chart_id)
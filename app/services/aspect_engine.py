@@ -0,0 +1,278 @@
+"""Vectorized aspect calculation on arrays of ecliptic longitudes."""
+import functools
+import logging
+from typing import Iterable, List, Mapping, Sequence, Union
+
+import numpy as np
+
+from app.schemas.chart_visualization import AspectConfiguration
+from app.schemas.natal_chart import AspectInfo
+
+logger = logging.getLogger(__name__)
+
+# Aspect angles in the order Kerykeion checks them; the first match wins
+ASPECT_DEGREES: dict[str, float] = {
+    "conjunction": 0,
+    "semi-sextile": 30,
+    "semi-square": 45,
+    "sextile": 60,
+    "quintile": 72,
+    "square": 90,
+    "trine": 120,
+    "sesquiquadrate": 135,
+    "biquintile": 144,
+    "quincunx": 150,
+    "opposition": 180,
+}
+
+# Chart points in Kerykeion's settings order, which is also the aspect list order
+CELESTIAL_POINTS: List[str] = [
+    "Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus",
+    "Neptune", "Pluto", "Mean_Node", "True_Node", "Chiron", "Ascendant",
+    "Medium_Coeli", "Descendant", "Imum_Coeli", "Mean_Lilith", "Mean_South_Node",
+    "True_South_Node",
+]
+
+# Axes and nodes that are always in opposition and therefore never reported
+OPPOSITE_PAIRS = {
+    frozenset(("Ascendant", "Descendant")),
+    frozenset(("Medium_Coeli", "Imum_Coeli")),
+    frozenset(("True_Node", "True_South_Node")),
+    frozenset(("Mean_Node", "Mean_South_Node")),
+}
+
+ActiveAspects = Iterable[Union[AspectConfiguration, Mapping[str, float]]]
+
+class AspectTable:
+    """Active aspects as parallel arrays, in the order they are matched."""
+
+    __slots__ = ("names", "degrees", "orbs")
+
+    def __init__(self, active_aspects: ActiveAspects):
+        """
+        Args:
+            active_aspects: Active aspects with their orbs, e.g. ChartConfiguration.active_aspects
+        """
+        orbs = {}
+        for aspect in active_aspects:
+            if isinstance(aspect, AspectConfiguration):
+                orbs[aspect.name] = aspect.orb
+            else:
+                orbs[aspect["name"]] = aspect["orb"]
+
+        self.names = [name for name in ASPECT_DEGREES if name in orbs]
+        self.degrees = np.array([ASPECT_DEGREES[name] for name in self.names], dtype=np.float64)
+        self.orbs = np.array([orbs[name] for name in self.names], dtype=np.float64)
+
+def angular_distance(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Shortest angular distance between longitudes, in [0, 180].
+
+    Follows the same floating point steps as swe.difdeg2n, which Kerykeion
+    uses, so orbits are bit-for-bit identical.
+
+    Args:
+        first: Longitudes in degrees
+        second: Longitudes in degrees, broadcastable against first
+
+    Returns:
+        Element-wise distances in degrees
+    """
+    difference = np.fmod(np.asarray(first) - np.asarray(second), 360.0)
+    difference = np.where(np.abs(difference) < 1e-13, 0.0, difference)
+    difference = np.where(difference < 0, difference + 360.0, difference)
+    difference = np.where(difference >= 180.0, difference - 360.0, difference)
+    return np.abs(difference)
+
+def distance_matrix(longitudes: np.ndarray) -> np.ndarray:
+    """
+    Full angular distance matrix between the points of one or many charts.
+
+    Args:
+        longitudes: Longitudes, shape (..., N)
+
+    Returns:
+        Distances, shape (..., N, N)
+    """
+    return angular_distance(longitudes[..., :, None], longitudes[..., None, :])
+
+def cross_distance_matrix(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Angular distance matrix between the points of two sets of charts.
+
+    Args:
+        first: Longitudes, shape (..., N)
+        second: Longitudes, shape (..., M)
+
+    Returns:
+        Distances, shape (..., N, M)
+    """
+    return angular_distance(first[..., :, None], second[..., None, :])
+
+def match_aspects(distances: np.ndarray, table: AspectTable) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Apply the aspect orbs to a distance array as a vectorized mask.
+
+    As in Kerykeion, the whole-degree part of the distance is compared against
+    each aspect's orb window and the first matching aspect wins.
+
+    Args:
+        distances: Angular distances in degrees, any shape
+        table: Active aspects
+
+    Returns:
+        Tuple of aspect indices into table.names (-1 where there is no aspect)
+        and orbits (distance minus the aspect angle), both shaped like distances
+    """
+    if not table.names:
+        return np.full(distances.shape, -1, dtype=np.int8), np.zeros(distances.shape)
+
+    whole_degrees = np.floor(distances)[None, ...]
+    expand = (slice(None),) + (None,) * distances.ndim
+    degrees = table.degrees[expand]
+    orbs = table.orbs[expand]
+    matches = (degrees - orbs <= whole_degrees) & (whole_degrees <= degrees + orbs)
+
+    aspect_index = np.argmax(matches, axis=0).astype(np.int8)
+    aspect_index[~matches.any(axis=0)] = -1
+    orbits = distances - table.degrees[np.maximum(aspect_index, 0)]
+    return aspect_index, orbits
+
+@functools.lru_cache(maxsize=32)
+def pair_mask(point_names: tuple[str, ...]) -> np.ndarray:
+    """
+    Upper-triangle mask of the point pairs to check for aspects.
+
+    Args:
+        point_names: Names of the points, in matrix order
+
+    Returns:
+        Boolean mask, shape (N, N)
+    """
+    mask = np.triu(np.ones((len(point_names), len(point_names)), dtype=bool), k=1)
+    for first, first_name in enumerate(point_names):
+        for second, second_name in enumerate(point_names):
+            if frozenset((first_name, second_name)) in OPPOSITE_PAIRS:
+                mask[first, second] = False
+    mask.flags.writeable = False
+    return mask
+
+def natal_aspect_arrays(
+    longitudes: np.ndarray,
+    point_names: Sequence[str],
+    table: AspectTable,
+) -> tuple[np.ndarray, ...]:
+    """
+    Find the aspects within many charts at once.
+
+    Args:
+        longitudes: Longitudes, shape (C, N) for C charts with the same N points
+        point_names: Names of the N points, in Kerykeion's order
+        table: Active aspects
+
+    Returns:
+        Tuple of (chart, first point, second point, aspect index, orbit) arrays,
+        one entry per aspect, ordered by chart and then as Kerykeion lists them
+    """
+    aspect_index, orbits = match_aspects(distance_matrix(longitudes), table)
+    found = (aspect_index >= 0) & pair_mask(tuple(point_names))[None, :, :]
+    charts, firsts, seconds = np.nonzero(found)
+    return charts, firsts, seconds, aspect_index[found], orbits[found]
+
+def cross_aspect_arrays(
+    first: np.ndarray,
+    second: np.ndarray,
+    table: AspectTable,
+) -> tuple[np.ndarray, ...]:
+    """
+    Find the aspects between the points of two sets of charts.
+
+    Args:
+        first: Longitudes, shape (C, N), or (N,) to compare one chart against all others
+        second: Longitudes, shape (C, M)
+        table: Active aspects
+
+    Returns:
+        Tuple of (chart, first point, second point, aspect index, orbit) arrays
+    """
+    first = np.broadcast_to(first, (second.shape[0],) + first.shape[-1:])
+    aspect_index, orbits = match_aspects(cross_distance_matrix(first, second), table)
+    found = aspect_index >= 0
+    charts, firsts, seconds = np.nonzero(found)
+    return charts, firsts, seconds, aspect_index[found], orbits[found]
+
+def to_aspect_info(
+    firsts: np.ndarray,
+    seconds: np.ndarray,
+    aspect_index: np.ndarray,
+    orbits: np.ndarray,
+    first_names: Sequence[str],
+    second_names: Sequence[str],
+    table: AspectTable,
+) -> List[AspectInfo]:
+    """Convert aspect arrays of a single chart to AspectInfo objects."""
+    return [
+        AspectInfo(
+            p1_name=first_names[first],
+            p2_name=second_names[second],
+            aspect=table.names[index],
+            orbit=orbit,
+        )
+        for first, second, index, orbit in zip(
+            firsts.tolist(), seconds.tolist(), aspect_index.tolist(), orbits.tolist()
+        )
+    ]
+
+def calculate_natal_aspects(
+    point_longitudes: Mapping[str, float],
+    active_aspects: Union[AspectTable, ActiveAspects],
+    active_points: Iterable[str] | None = None,
+) -> List[AspectInfo]:
+    """
+    Calculate the aspects of one chart, producing the same list as NatalAspects.
+
+    Args:
+        point_longitudes: Absolute longitudes keyed by Kerykeion point name
+        active_aspects: Active aspects with their orbs, or a prebuilt AspectTable
+        active_points: Points to include (default: all points with a longitude)
+
+    Returns:
+        List of aspects in Kerykeion's order
+    """
+    active = set(active_points) if active_points is not None else set(point_longitudes)
+    names = [name for name in CELESTIAL_POINTS if name in active and name in point_longitudes]
+    longitudes = np.array([[point_longitudes[name] for name in names]], dtype=np.float64)
+    table = active_aspects if isinstance(active_aspects, AspectTable) else AspectTable(active_aspects)
+
+    _, firsts, seconds, aspect_index, orbits = natal_aspect_arrays(longitudes, names, table)
+    return to_aspect_info(firsts, seconds, aspect_index, orbits, names, names, table)
+
+def calculate_cross_aspects(
+    first_longitudes: Mapping[str, float],
+    second_longitudes: Mapping[str, float],
+    active_aspects: Union[AspectTable, ActiveAspects],
+    active_points: Iterable[str] | None = None,
+) -> List[AspectInfo]:
+    """
+    Calculate the aspects between two charts, producing the same list as SynastryAspects.
+
+    Args:
+        first_longitudes: Absolute longitudes of the first chart keyed by Kerykeion point name
+        second_longitudes: Absolute longitudes of the second chart keyed by Kerykeion point name
+        active_aspects: Active aspects with their orbs, or a prebuilt AspectTable
+        active_points: Points to include (default: all points with a longitude)
+
+    Returns:
+        List of aspects, p1 from the first chart and p2 from the second
+    """
+    active = set(active_points) if active_points is not None else set(first_longitudes)
+    first_names = [name for name in CELESTIAL_POINTS if name in active and name in first_longitudes]
+    second_names = [name for name in CELESTIAL_POINTS if name in active and name in second_longitudes]
+    table = active_aspects if isinstance(active_aspects, AspectTable) else AspectTable(active_aspects)
+
+    _, firsts, seconds, aspect_index, orbits = cross_aspect_arrays(
+        np.array([first_longitudes[name] for name in first_names], dtype=np.float64),
+        np.array([[second_longitudes[name] for name in second_names]], dtype=np.float64),
+        table
+    )
+    return to_aspect_info(firsts, seconds, aspect_index, orbits, first_names, second_names, table)
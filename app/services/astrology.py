@@ -1,41 +1,92 @@
 """Service for astrological calculations using Kerykeion."""
 import logging
-import functools
 from datetime import datetime
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, get_args
 
-from kerykeion import AstrologicalSubject, NatalAspects
+import numpy as np
+from kerykeion import AstrologicalSubject
+from kerykeion.kr_types import HousesSystemIdentifier
+from kerykeion.kr_types.kr_models import AstrologicalSubjectModel
 
-from app.schemas.natal_chart import NatalChartResponse, PlanetPosition, AspectInfo
+from app.core.exceptions import InvalidBirthDataError, LocationError
+from app.schemas.natal_chart import NatalChartRequest, NatalChartResponse, AspectInfo
+from app.services.aspect_engine import natal_aspect_arrays, to_aspect_info
+from app.services.batch_ephemeris import BODY_KEYS, EphemerisBatch, assign_houses, compute_batch, julian_day_ut
+from app.services.chart_cache import ChartCache, make_chart_key, to_utc_instant
+from app.services.chart_positions import (
+    BLOB_SIZE,
+    NATAL_ASPECT_POINTS,
+    NATAL_ASPECTS,
+    ChartPositions,
+)
+from app.services.compute_pool import ComputePool
 
 logger = logging.getLogger(__name__)
 
-def _convert_house_number(house: int | str) -> int | str:
-    """Convert house number from string to int if possible."""
-    if isinstance(house, int):
-        return house
-    try:
-        # Try to extract number from string like "First_House"
-        house_map = {
-            "First": 1, "Second": 2, "Third": 3, "Fourth": 4,
-            "Fifth": 5, "Sixth": 6, "Seventh": 7, "Eighth": 8,
-            "Ninth": 9, "Tenth": 10, "Eleventh": 11, "Twelfth": 12
-        }
-        for name, num in house_map.items():
-            if name in house:
-                return num
-        # If we can't map it, return the original string
-        return house
-    except (ValueError, AttributeError):
-        return house
+# A calculated chart with its aspects, when they were calculated with it
+ComputedChart = Tuple[ChartPositions, List[AspectInfo] | None]
+
+def _validate_request(request: NatalChartRequest) -> str:
+    """
+    Validate the location and house system of a natal chart request.
+
+    Returns:
+        The house system identifier
+    """
+    if not (request.city and request.nation) and (request.lng is None or request.lat is None):
+        raise LocationError("Either city/nation or longitude/latitude must be provided")
+    houses_system = request.houses_system or "P"
+    if houses_system not in get_args(HousesSystemIdentifier):
+        raise InvalidBirthDataError(f"Invalid house system: {houses_system}")
+    return houses_system
 
 class AstrologyService:
     """Service for astrological calculations using Kerykeion."""
 
-    # Cache for natal chart calculations - expires after 1 hour (3600 seconds)
-    # This assumes that astrological calculations don't change frequently,
-    # and caching them will improve performance significantly
-    @functools.lru_cache(maxsize=128)
+    def __init__(self, chart_cache: ChartCache | None = None, coord_precision: int = 4):
+        """
+        Initialize the astrology service.
+
+        Args:
+            chart_cache: Optional cache shared by all charts with the same birth moment and place
+            coord_precision: Number of decimals coordinates are rounded to for cache keys
+        """
+        self.chart_cache = chart_cache
+        self.coord_precision = coord_precision
+
+    def chart_cache_key(
+        self,
+        birth_date: datetime,
+        lng: float | None,
+        lat: float | None,
+        tz_str: str | None,
+        houses_system: str | None = "P",
+        zodiac_type: str = "Tropic",
+        sidereal_mode: str | None = None,
+        perspective_type: str = "Apparent Geocentric",
+    ) -> str | None:
+        """
+        Build the chart cache key for the given inputs.
+
+        Returns None when the chart cannot be keyed without a geonames lookup
+        (missing coordinates or timezone) or when the local time is ambiguous.
+        """
+        if lng is None or lat is None or not tz_str:
+            return None
+        utc_instant = to_utc_instant(birth_date, tz_str)
+        if utc_instant is None:
+            return None
+        return make_chart_key(
+            utc_instant,
+            lat=lat,
+            lng=lng,
+            houses_system=houses_system or "P",
+            zodiac_type=zodiac_type,
+            sidereal_mode=sidereal_mode,
+            perspective_type=perspective_type,
+            precision=self.coord_precision,
+        )
+
     def calculate_natal_chart(
         self,
         name: str,
@@ -46,114 +97,507 @@ class AstrologyService:
         lat: float | None = None,
         tz_str: str | None = None,
         houses_system: str = "P",  # Default to Placidus
+        zodiac_type: str = "Tropic",
+        sidereal_mode: str | None = None,
+        perspective_type: str = "Apparent Geocentric",
+    ) -> NatalChartResponse:
+        """
+        Calculate natal chart for given parameters.
+
+        Results are cached as compact ChartPositions blobs by birth moment,
+        place and calculation settings; the response is built from them with
+        the given name and local birth date.
+        """
+        cache_key, cached = self._cached_natal_chart(
+            birth_date, lng, lat, tz_str, houses_system,
+            zodiac_type, sidereal_mode, perspective_type
+        )
+        if cached is not None:
+            logger.debug(f"Chart cache hit for {name} born on {birth_date}")
+            return cached.to_response(name, birth_date)
+
+        positions = self._compute_natal_chart(
+            name, birth_date, city, nation, lng, lat, tz_str,
+            houses_system, zodiac_type, sidereal_mode, perspective_type
+        )
+
+        if cache_key is not None:
+            self.chart_cache.set(cache_key, positions.to_bytes(), BLOB_SIZE)
+        return positions.to_response(name, birth_date)
+
+    async def calculate_natal_chart_async(
+        self,
+        compute_pool: ComputePool,
+        name: str,
+        birth_date: datetime,
+        city: str | None = None,
+        nation: str | None = None,
+        lng: float | None = None,
+        lat: float | None = None,
+        tz_str: str | None = None,
+        houses_system: str = "P",
+        zodiac_type: str = "Tropic",
+        sidereal_mode: str | None = None,
+        perspective_type: str = "Apparent Geocentric",
+    ) -> NatalChartResponse:
+        """
+        Calculate a natal chart like calculate_natal_chart, on a compute pool.
+
+        The chart cache is checked in this process; only cache misses are
+        sent to a pool worker, which returns the chart as ChartPositions.
+
+        Args:
+            compute_pool: Pool running the calculation
+            (other arguments as for calculate_natal_chart)
+        """
+        cache_key, cached = self._cached_natal_chart(
+            birth_date, lng, lat, tz_str, houses_system,
+            zodiac_type, sidereal_mode, perspective_type
+        )
+        if cached is not None:
+            logger.debug(f"Chart cache hit for {name} born on {birth_date}")
+            return cached.to_response(name, birth_date)
+
+        positions = await compute_pool.run(
+            "natal", compute_natal_chart,
+            name, birth_date, city, nation, lng, lat, tz_str,
+            houses_system, zodiac_type, sidereal_mode, perspective_type
+        )
+
+        if cache_key is not None:
+            self.chart_cache.set(cache_key, positions.to_bytes(), BLOB_SIZE)
+        return positions.to_response(name, birth_date)
+
+    def _cached_natal_chart(
+        self,
+        birth_date: datetime,
+        lng: float | None,
+        lat: float | None,
+        tz_str: str | None,
+        houses_system: str,
+        zodiac_type: str,
+        sidereal_mode: str | None,
+        perspective_type: str,
+    ) -> Tuple[str | None, ChartPositions | None]:
+        """
+        Look up a natal chart in the chart cache.
+
+        Returns:
+            Tuple (cache_key, positions); the key is None when the chart cannot
+            be cached, the positions are None on a cache miss
+        """
+        if self.chart_cache is None:
+            return None, None
+        cache_key = self.chart_cache_key(
+            birth_date, lng, lat, tz_str, houses_system,
+            zodiac_type, sidereal_mode, perspective_type
+        )
+        if cache_key is None:
+            return None, None
+        cached = self.chart_cache.get(cache_key)
+        return cache_key, ChartPositions.from_bytes(cached) if cached is not None else None
+
+    def calculate_point_longitudes(
+        self,
+        name: str,
+        birth_date: datetime,
+        city: str | None = None,
+        nation: str | None = None,
+        lng: float | None = None,
+        lat: float | None = None,
+        tz_str: str | None = None,
+        houses_system: str = "P",
+    ) -> Dict[str, float]:
+        """
+        Calculate the absolute longitudes of all points of a natal chart.
+
+        Returns:
+            Longitudes in degrees keyed by Kerykeion point and house name (e.g., "Sun", "First_House")
+        """
+        result = self.calculate_positions([NatalChartRequest(
+            name=name,
+            birth_date=birth_date,
+            city=city,
+            nation=nation,
+            lng=lng,
+            lat=lat,
+            tz_str=tz_str,
+            houses_system=houses_system
+        )])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def calculate_positions(
+        self,
+        requests: List[NatalChartRequest],
+    ) -> List[Dict[str, float] | Exception]:
+        """
+        Calculate the absolute longitudes of all points for many charts at once.
+
+        Positions share the natal chart cache entries and are calculated with
+        the batch ephemeris engine when coordinates and a timezone are given.
+
+        Args:
+            requests: Natal chart requests
+
+        Returns:
+            One entry per request, in order: longitudes keyed by Kerykeion point
+            and house name (e.g., "Sun", "First_House"), or the exception raised for it
+        """
+        results: List[Dict[str, float] | Exception | None] = [None] * len(requests)
+        pending: List[tuple[int, datetime, str | None]] = []
+
+        for index, request in enumerate(requests):
+            try:
+                houses_system = _validate_request(request)
+                utc_instant = None
+                if request.lng is not None and request.lat is not None and request.tz_str:
+                    utc_instant = to_utc_instant(request.birth_date, request.tz_str)
+
+                cache_key = None
+                if self.chart_cache is not None and utc_instant is not None:
+                    cache_key = make_chart_key(
+                        utc_instant, request.lat, request.lng,
+                        houses_system=houses_system, precision=self.coord_precision
+                    )
+                    cached = self.chart_cache.get(cache_key)
+                    if cached is not None:
+                        results[index] = ChartPositions.from_bytes(cached).point_longitudes()
+                        continue
+
+                if utc_instant is None:
+                    # Needs a geonames lookup or has an ambiguous local time
+                    subject = self._create_subject(
+                        request.name, request.birth_date, request.city, request.nation,
+                        request.lng, request.lat, request.tz_str, houses_system
+                    )
+                    results[index] = ChartPositions.from_subject(subject).point_longitudes()
+                    continue
+                pending.append((index, utc_instant, cache_key))
+            except Exception as e:
+                logger.warning(f"Error calculating positions {index} of batch: {str(e)}")
+                results[index] = e
+
+        if pending:
+            houses_systems = [requests[index].houses_system or "P" for index, _, _ in pending]
+            try:
+                batch = compute_batch(
+                    julian_days=[julian_day_ut(utc_instant) for _, utc_instant, _ in pending],
+                    lats=[requests[index].lat for index, _, _ in pending],
+                    lngs=[requests[index].lng for index, _, _ in pending],
+                    houses_systems=houses_systems
+                )
+                houses = assign_houses(batch.longitudes, batch.cusps)
+            except Exception as e:
+                logger.error(f"Error in batch ephemeris calculation: {str(e)}", exc_info=True)
+                for index, _, _ in pending:
+                    results[index] = e
+                return results
+
+            for row, (index, _, cache_key) in enumerate(pending):
+                positions = ChartPositions.from_batch(batch, row, houses_systems[row], houses[row])
+                if cache_key is not None:
+                    self.chart_cache.set(cache_key, positions.to_bytes(), BLOB_SIZE)
+                results[index] = positions.point_longitudes()
+
+        return results
+
+    def _create_subject(
+        self,
+        name: str,
+        birth_date: datetime,
+        city: str | None,
+        nation: str | None,
+        lng: float | None,
+        lat: float | None,
+        tz_str: str | None,
+        houses_system: str,
+        zodiac_type: str = "Tropic",
+        sidereal_mode: str | None = None,
+        perspective_type: str = "Apparent Geocentric",
+    ) -> AstrologicalSubject:
+        """Create the Kerykeion subject for the given birth data."""
+        return AstrologicalSubject(
+            name=name,
+            year=birth_date.year,
+            month=birth_date.month,
+            day=birth_date.day,
+            hour=birth_date.hour,
+            minute=birth_date.minute,
+            city=city,
+            nation=nation,
+            lng=lng,
+            lat=lat,
+            tz_str=tz_str,
+            houses_system_identifier=houses_system,
+            zodiac_type=zodiac_type,
+            sidereal_mode=sidereal_mode if zodiac_type == "Sidereal" else None,
+            perspective_type=perspective_type,
+        )
+
+    def natal_chart_from_subject(
+        self,
+        subject: AstrologicalSubject | AstrologicalSubjectModel,
+        name: str | None = None,
+        birth_date: datetime | None = None,
     ) -> NatalChartResponse:
-        """Calculate natal chart for given parameters."""
+        """
+        Build a natal chart response from a calculated Kerykeion subject.
+
+        Lets precomputed subjects (e.g. from ChartComputationService) be
+        returned as natal charts without another ephemeris calculation.
+
+        Args:
+            subject: Calculated subject or its serialized model
+            name: Name to report, defaults to the subject's name
+            birth_date: Birth date to report, defaults to the subject's local birth time
+
+        Returns:
+            The natal chart response
+        """
+        return ChartPositions.from_subject(subject).to_response(
+            name=name if name is not None else subject.name,
+            birth_date=birth_date if birth_date is not None else datetime(
+                subject.year, subject.month, subject.day, subject.hour, subject.minute
+            )
+        )
+
+    def _compute_natal_chart(
+        self,
+        name: str,
+        birth_date: datetime,
+        city: str | None,
+        nation: str | None,
+        lng: float | None,
+        lat: float | None,
+        tz_str: str | None,
+        houses_system: str,
+        zodiac_type: str,
+        sidereal_mode: str | None,
+        perspective_type: str,
+    ) -> ChartPositions:
+        """Run the Kerykeion calculation for a natal chart."""
         try:
             logger.info(f"Calculating natal chart for {name} born on {birth_date}")
             logger.debug(f"Location data: city={city}, nation={nation}, lng={lng}, lat={lat}, tz={tz_str}")
             logger.debug(f"House system: {houses_system}")
 
             # Create AstrologicalSubject
-            subject = AstrologicalSubject(
-                name=name,
-                year=birth_date.year,
-                month=birth_date.month,
-                day=birth_date.day,
-                hour=birth_date.hour,
-                minute=birth_date.minute,
-                city=city,
-                nation=nation,
-                lng=lng,
-                lat=lat,
-                tz_str=tz_str,
-                houses_system_identifier=houses_system,
+            subject = self._create_subject(
+                name, birth_date, city, nation, lng, lat, tz_str,
+                houses_system, zodiac_type, sidereal_mode, perspective_type
             )
 
             logger.debug("Created AstrologicalSubject successfully")
 
-            # Calculate aspects
-            aspects = NatalAspects(subject)
-            logger.debug("Calculated aspects successfully")
-
-            # Get planet positions - including additional celestial points
-            planets = []
-            standard_planets = [
-                'sun', 'moon', 'mercury', 'venus', 'mars', 
-                'jupiter', 'saturn', 'uranus', 'neptune', 'pluto'
-            ]
-            
-            # Additional celestial points from Data Completeness requirements
-            additional_points = [
-                'mean_node', 'true_node', 'mean_south_node', 'true_south_node',
-                'mean_lilith', 'chiron'
-            ]
-            
-            # Process standard planets
-            for planet_attr in standard_planets:
-                planet = getattr(subject, planet_attr)
-                planets.append(PlanetPosition(
-                    name=planet_attr.capitalize(),
-                    sign=planet.sign,
-                    position=planet.position,
-                    house=_convert_house_number(planet.house),
-                    retrograde=planet.retrograde
-                ))
-            
-            # Process additional celestial points
-            for point_attr in additional_points:
-                point = getattr(subject, point_attr, None)
-                if point is not None:  # Some points may be None if disabled
-                    # Convert names for better readability
-                    display_name = point_attr.replace('_', ' ').title()
-                    planets.append(PlanetPosition(
-                        name=display_name,
-                        sign=point.sign,
-                        position=point.position,
-                        house=_convert_house_number(point.house),
-                        retrograde=getattr(point, 'retrograde', False)  # Some points don't have retrograde status
-                    ))
-            
-            logger.debug(f"Processed {len(planets)} planets and points successfully")
-
-            # Get house cusps using individual house attributes
-            houses = {}
-            house_attrs = [
-                'first_house', 'second_house', 'third_house', 'fourth_house',
-                'fifth_house', 'sixth_house', 'seventh_house', 'eighth_house',
-                'ninth_house', 'tenth_house', 'eleventh_house', 'twelfth_house'
-            ]
-            for i, attr in enumerate(house_attrs, 1):
-                house = getattr(subject, attr)
-                houses[i] = house.position
-            logger.debug("Processed house cusps successfully")
-
-            # Include complete aspect data with orbs
-            aspect_info = []
-            for aspect in aspects.all_aspects:
-                aspect_info.append(AspectInfo(
-                    p1_name=aspect.p1_name,
-                    p2_name=aspect.p2_name,
-                    aspect=aspect.aspect,
-                    orbit=aspect.orbit,
-                ))
-            
-            # Get house system information
-            house_system_name = subject.houses_system_name
-            house_system_id = subject.houses_system_identifier
-            
-            response = NatalChartResponse(
-                name=name,
-                birth_date=birth_date,
-                planets=planets,
-                houses=houses,
-                aspects=aspect_info,
-                house_system={
-                    "name": house_system_name,
-                    "identifier": house_system_id
-                }
-            )
-            logger.info("Successfully created natal chart response")
-            return response
+            positions = ChartPositions.from_subject(subject)
+            logger.info("Successfully calculated natal chart")
+            return positions
         except Exception as e:
             logger.error(f"Error calculating natal chart: {str(e)}", exc_info=True)
-            raise 
\ No newline at end of file
+            raise
+
+    def calculate_natal_charts(
+        self,
+        requests: List[NatalChartRequest],
+    ) -> List[NatalChartResponse | Exception]:
+        """
+        Calculate many natal charts at once.
+
+        Charts with coordinates and a timezone are calculated together by the
+        batch ephemeris engine, without building an AstrologicalSubject per chart.
+        Charts that need a geonames lookup are calculated one by one with Kerykeion.
+
+        Args:
+            requests: Natal chart requests
+
+        Returns:
+            One entry per request, in order: the chart, or the exception raised for it
+        """
+        results, misses = self._cached_natal_charts(requests)
+        if misses:
+            computed = self.compute_natal_charts([requests[index] for index, _ in misses])
+            self._store_natal_charts(requests, misses, computed, results)
+        return results
+
+    async def calculate_natal_charts_async(
+        self,
+        requests: List[NatalChartRequest],
+        compute_pool: ComputePool,
+    ) -> List[NatalChartResponse | Exception]:
+        """
+        Calculate many natal charts like calculate_natal_charts, on a compute pool.
+
+        Cache hits are answered in this process; the remaining charts are
+        calculated together in a single pool worker call.
+        """
+        results, misses = self._cached_natal_charts(requests)
+        if misses:
+            computed = await compute_pool.run(
+                "natal_batch", compute_natal_charts, [requests[index] for index, _ in misses]
+            )
+            self._store_natal_charts(requests, misses, computed, results)
+        return results
+
+    def compute_natal_charts(
+        self,
+        requests: List[NatalChartRequest],
+    ) -> List[ComputedChart | Exception]:
+        """
+        Calculate natal charts without the chart cache.
+
+        Args:
+            requests: Natal chart requests
+
+        Returns:
+            One entry per request, in order: the positions and, for charts of
+            the batch engine, their aspects; or the exception raised for it
+        """
+        results: List[ComputedChart | Exception | None] = [None] * len(requests)
+        pending: List[tuple[int, datetime]] = []
+
+        for index, request in enumerate(requests):
+            try:
+                houses_system = _validate_request(request)
+
+                utc_instant = None
+                if request.lng is not None and request.lat is not None and request.tz_str:
+                    utc_instant = to_utc_instant(request.birth_date, request.tz_str)
+                if utc_instant is None:
+                    # Needs a geonames lookup or has an ambiguous local time
+                    positions = self._compute_natal_chart(
+                        request.name, request.birth_date, request.city, request.nation,
+                        request.lng, request.lat, request.tz_str, houses_system,
+                        "Tropic", None, "Apparent Geocentric"
+                    )
+                    results[index] = (positions, None)
+                    continue
+                pending.append((index, utc_instant))
+            except Exception as e:
+                logger.warning(f"Error calculating natal chart {index} of batch: {str(e)}")
+                results[index] = e
+
+        if pending:
+            logger.info(f"Calculating {len(pending)} of {len(requests)} natal charts with the batch engine")
+            houses_systems = [requests[index].houses_system or "P" for index, _ in pending]
+            try:
+                batch = compute_batch(
+                    julian_days=[julian_day_ut(utc_instant) for _, utc_instant in pending],
+                    lats=[requests[index].lat for index, _ in pending],
+                    lngs=[requests[index].lng for index, _ in pending],
+                    houses_systems=houses_systems
+                )
+                houses = assign_houses(batch.longitudes, batch.cusps)
+                aspects = _batch_aspects(batch)
+            except Exception as e:
+                logger.error(f"Error in batch ephemeris calculation: {str(e)}", exc_info=True)
+                for index, _ in pending:
+                    results[index] = e
+                return results
+
+            for row, (index, _) in enumerate(pending):
+                try:
+                    positions = ChartPositions.from_batch(batch, row, houses_systems[row], houses[row])
+                except Exception as e:
+                    logger.warning(f"Error building natal chart {index} of batch: {str(e)}")
+                    results[index] = e
+                    continue
+                results[index] = (positions, aspects[row])
+
+        return results
+
+    def _cached_natal_charts(
+        self,
+        requests: List[NatalChartRequest],
+    ) -> Tuple[List[NatalChartResponse | Exception | None], List[tuple[int, str | None]]]:
+        """
+        Answer the requests found in the chart cache.
+
+        Returns:
+            Tuple (results, misses): results hold the cached charts and
+            validation errors; misses list (index, cache_key) of the charts
+            still to calculate
+        """
+        results: List[NatalChartResponse | Exception | None] = [None] * len(requests)
+        misses: List[tuple[int, str | None]] = []
+
+        for index, request in enumerate(requests):
+            try:
+                houses_system = _validate_request(request)
+                cache_key, cached = self._cached_natal_chart(
+                    request.birth_date, request.lng, request.lat, request.tz_str,
+                    houses_system, "Tropic", None, "Apparent Geocentric"
+                )
+                if cached is not None:
+                    results[index] = cached.to_response(request.name, request.birth_date)
+                    continue
+                misses.append((index, cache_key))
+            except Exception as e:
+                logger.warning(f"Error calculating natal chart {index} of batch: {str(e)}")
+                results[index] = e
+
+        return results, misses
+
+    def _store_natal_charts(
+        self,
+        requests: List[NatalChartRequest],
+        misses: List[tuple[int, str | None]],
+        computed: List[ComputedChart | Exception],
+        results: List[NatalChartResponse | Exception | None],
+    ) -> None:
+        """Cache the calculated charts and fill in their responses."""
+        for (index, cache_key), result in zip(misses, computed):
+            if isinstance(result, Exception):
+                results[index] = result
+                continue
+            positions, aspects = result
+            request = requests[index]
+            try:
+                response = positions.to_response(request.name, request.birth_date, aspects=aspects)
+            except Exception as e:
+                logger.warning(f"Error building natal chart {index} of batch: {str(e)}")
+                results[index] = e
+                continue
+            if cache_key is not None:
+                self.chart_cache.set(cache_key, positions.to_bytes(), BLOB_SIZE)
+            results[index] = response
+
+def compute_natal_chart(*args) -> ChartPositions:
+    """
+    Calculate one natal chart without the chart cache; runs in compute pool workers.
+
+    Takes the positional arguments of AstrologyService._compute_natal_chart.
+    """
+    return AstrologyService()._compute_natal_chart(*args)
+
+def compute_natal_charts(requests: List[NatalChartRequest]) -> List[ComputedChart | Exception]:
+    """Calculate natal charts without the chart cache; runs in compute pool workers."""
+    return AstrologyService().compute_natal_charts(requests)
+
+def _batch_aspects(batch: EphemerisBatch) -> List[List[AspectInfo]]:
+    """
+    Calculate the natal aspects of every chart in a batch with one stacked matrix.
+
+    Args:
+        batch: Batch ephemeris calculation
+
+    Returns:
+        One aspect list per chart, in Kerykeion's order
+    """
+    columns = {key.title(): batch.longitudes[:, column] for column, key in enumerate(BODY_KEYS)}
+    columns["Ascendant"] = batch.ascmc[:, 0]
+    columns["Medium_Coeli"] = batch.ascmc[:, 1]
+    longitudes = np.stack([columns[point] for point in NATAL_ASPECT_POINTS], axis=-1)
+
+    charts, firsts, seconds, aspect_index, orbits = natal_aspect_arrays(
+        longitudes, NATAL_ASPECT_POINTS, NATAL_ASPECTS
+    )
+    bounds = np.searchsorted(charts, np.arange(len(batch) + 1))
+    return [
+        to_aspect_info(
+            firsts[start:end], seconds[start:end], aspect_index[start:end], orbits[start:end],
+            NATAL_ASPECT_POINTS, NATAL_ASPECT_POINTS, NATAL_ASPECTS
+        )
+        for start, end in zip(bounds[:-1], bounds[1:])
+    ]
@@ -0,0 +1,150 @@
+"""Batch ephemeris engine calling the Swiss Ephemeris directly for many charts."""
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import List, Sequence
+
+import numpy as np
+import swisseph as swe
+import kerykeion
+
+logger = logging.getLogger(__name__)
+
+# Use the ephemeris files shipped with Kerykeion, as AstrologicalSubject does
+EPHE_PATH = str(Path(kerykeion.__file__).parent.absolute() / "sweph")
+
+# Same flags as a default (tropical, apparent geocentric) AstrologicalSubject
+CALC_FLAGS = swe.FLG_SWIEPH + swe.FLG_SPEED
+
+# Bodies calculated by the Swiss Ephemeris, in chart order: (key, Swiss Ephemeris id)
+EPHEMERIS_BODIES: List[tuple[str, int]] = [
+    ("sun", 0), ("moon", 1), ("mercury", 2), ("venus", 3), ("mars", 4),
+    ("jupiter", 5), ("saturn", 6), ("uranus", 7), ("neptune", 8), ("pluto", 9),
+    ("mean_node", 10), ("true_node", 11), ("chiron", 15), ("mean_lilith", 12),
+]
+
+# South nodes are opposite their north node and share its direction
+DERIVED_BODIES: List[tuple[str, str]] = [
+    ("mean_south_node", "mean_node"),
+    ("true_south_node", "true_node"),
+]
+
+BODY_KEYS: List[str] = [key for key, _ in EPHEMERIS_BODIES] + [key for key, _ in DERIVED_BODIES]
+
+# Kerykeion overrides latitudes inside the polar circles for house calculations
+POLAR_LATITUDE_LIMIT = 66.0
+
+class EphemerisBatch:
+    """Raw positions for a batch of charts, one row per chart."""
+
+    __slots__ = ("julian_days", "longitudes", "speeds", "cusps", "ascmc")
+
+    def __init__(
+        self,
+        julian_days: np.ndarray,
+        longitudes: np.ndarray,
+        speeds: np.ndarray,
+        cusps: np.ndarray,
+        ascmc: np.ndarray,
+    ):
+        """
+        Args:
+            julian_days: Julian days (UT) of the charts, shape (N,)
+            longitudes: Ecliptic longitudes in BODY_KEYS order, shape (N, B)
+            speeds: Longitude speeds in degrees per day, shape (N, B)
+            cusps: House cusps, shape (N, 12)
+            ascmc: Ascendant and Medium Coeli, shape (N, 2)
+        """
+        self.julian_days = julian_days
+        self.longitudes = longitudes
+        self.speeds = speeds
+        self.cusps = cusps
+        self.ascmc = ascmc
+
+    def __len__(self) -> int:
+        return len(self.julian_days)
+
+def julian_day_ut(utc_instant: datetime) -> float:
+    """
+    Convert a UTC instant to a Julian day with minute precision.
+
+    Matches the Julian day AstrologicalSubject computes, which ignores seconds.
+    """
+    hour = utc_instant.hour + utc_instant.minute / 60
+    return float(swe.julday(utc_instant.year, utc_instant.month, utc_instant.day, hour))
+
+def compute_batch(
+    julian_days: Sequence[float],
+    lats: Sequence[float],
+    lngs: Sequence[float],
+    houses_systems: Sequence[str],
+) -> EphemerisBatch:
+    """
+    Calculate planet positions and house cusps for many charts at once.
+
+    Results are identical to Kerykeion's default tropical, apparent geocentric
+    calculation; note that, like Kerykeion, planets are calculated with
+    swe.calc on the UT Julian day.
+
+    Args:
+        julian_days: Julian days (UT) of the charts
+        lats: Latitudes of the birth places
+        lngs: Longitudes of the birth places
+        houses_systems: House system identifiers, one per chart
+
+    Returns:
+        EphemerisBatch with one row per chart
+    """
+    swe.set_ephe_path(EPHE_PATH)
+
+    jds = np.asarray(julian_days, dtype=np.float64)
+    lat_arr = np.clip(np.asarray(lats, dtype=np.float64), -POLAR_LATITUDE_LIMIT, POLAR_LATITUDE_LIMIT)
+    lng_arr = np.asarray(lngs, dtype=np.float64)
+    count = len(jds)
+
+    longitudes = np.empty((count, len(BODY_KEYS)), dtype=np.float64)
+    speeds = np.empty((count, len(BODY_KEYS)), dtype=np.float64)
+
+    # Body-major loops keep the Swiss Ephemeris file caches warm for each body
+    calc = swe.calc
+    for column, (_, body_id) in enumerate(EPHEMERIS_BODIES):
+        for row in range(count):
+            position = calc(jds[row], body_id, CALC_FLAGS)[0]
+            longitudes[row, column] = position[0]
+            speeds[row, column] = position[3]
+
+    body_columns = {key: column for column, key in enumerate(BODY_KEYS)}
+    for key, north_key in DERIVED_BODIES:
+        column = body_columns[key]
+        north_column = body_columns[north_key]
+        longitudes[:, column] = np.fmod(longitudes[:, north_column] + 180.0, 360.0)
+        speeds[:, column] = speeds[:, north_column]
+
+    cusps = np.empty((count, 12), dtype=np.float64)
+    ascmc = np.empty((count, 2), dtype=np.float64)
+    for row in range(count):
+        house_cusps, angles = swe.houses_ex(
+            jds[row], lat_arr[row], lng_arr[row], houses_systems[row].encode("ascii"), 0
+        )
+        cusps[row] = house_cusps[:12]
+        ascmc[row] = angles[:2]
+
+    return EphemerisBatch(jds, longitudes, speeds, cusps, ascmc)
+
+def assign_houses(longitudes: np.ndarray, cusps: np.ndarray) -> np.ndarray:
+    """
+    Find the house (1-12) of every longitude, vectorized over charts.
+
+    A point on a cusp belongs to the house starting at that cusp.
+
+    Args:
+        longitudes: Longitudes, shape (N, B)
+        cusps: House cusps, shape (N, 12)
+
+    Returns:
+        House numbers, shape (N, B)
+    """
+    spans = np.mod(np.roll(cusps, -1, axis=-1) - cusps, 360.0)
+    offsets = np.mod(longitudes[..., :, None] - cusps[..., None, :], 360.0)
+    inside = offsets < spans[..., None, :]
+    return np.argmax(inside, axis=-1) + 1
@@ -0,0 +1,144 @@
+"""Bulk rendering of natal charts into a streamed ZIP archive."""
+import asyncio
+import io
+import json
+import logging
+import re
+import zipfile
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List
+
+from app.core.exceptions import ComputeCapacityError, ZodiacEngineException
+from app.services.compute_pool import ComputePool
+
+logger = logging.getLogger(__name__)
+
+# Compute pool route of bulk renders
+BULK_RENDER_ROUTE = "render_bulk"
+
+@lru_cache(maxsize=1)
+def _worker_services() -> tuple:
+    """Visualization and conversion services of a compute pool worker, created on first use."""
+    from app.core.dependencies import get_file_conversion_service, get_render_cache, get_settings
+    from app.services.chart_visualization import ChartVisualizationService
+
+    return (
+        ChartVisualizationService(settings=get_settings(), render_cache=get_render_cache()),
+        get_file_conversion_service(),
+    )
+
+def render_chart_file(render: Dict[str, Any], output_format: str, dpi: int) -> bytes:
+    """
+    Render a natal chart and convert it to a file format in a compute pool worker.
+
+    Args:
+        render: Keyword arguments of ChartVisualizationService.render_natal_chart_svg
+        output_format: Output format (svg, png, pdf)
+        dpi: Resolution of raster formats
+
+    Returns:
+        The file content
+    """
+    chart_service, conversion_service = _worker_services()
+    svg = chart_service.render_natal_chart_svg(**render)
+    if output_format == "svg":
+        return svg.encode("utf-8")
+    content, _ = conversion_service.convert_svg_to_format(svg, output_format=output_format, dpi=dpi)
+    return content
+
+def archive_filename(index: int, name: str, output_format: str) -> str:
+    """Name of a chart in the archive: its position in the request and a filesystem-safe name."""
+    safe_name = re.sub(r"[^A-Za-z0-9_-]+", "_", name).strip("_") or "chart"
+    return f"{index + 1:04d}_{safe_name[:64]}.{output_format}"
+
+class _ChunkWriter(io.RawIOBase):
+    """Unseekable file object collecting what ZipFile writes until it is drained."""
+
+    def __init__(self):
+        """Initialize an empty writer."""
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        """ZipFile only writes."""
+        return True
+
+    def write(self, data) -> int:
+        """Keep a copy of the written bytes."""
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        """Return and forget the bytes written since the last drain."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+async def stream_chart_archive(
+    renders: List[Dict[str, Any]],
+    output_format: str,
+    dpi: int,
+    compute_pool: ComputePool,
+) -> AsyncIterator[bytes]:
+    """
+    Render charts in the compute pool and yield a ZIP archive of them as they finish.
+
+    At most the bulk render route limit (or one per worker) charts are in
+    flight at once, and each finished chart is written to the archive and
+    yielded right away, so neither the charts nor the archive are held in
+    memory. Charts that fail are listed with their error in manifest.json at
+    the end of the archive instead of failing the whole archive.
+
+    Args:
+        renders: Keyword arguments of render_natal_chart_svg for each chart
+        output_format: Output format (svg, png, pdf)
+        dpi: Resolution of raster formats
+        compute_pool: Pool rendering the charts
+
+    Yields:
+        Chunks of the ZIP archive
+    """
+    # PNG and PDF are already compressed
+    compression = zipfile.ZIP_DEFLATED if output_format == "svg" else zipfile.ZIP_STORED
+    window = compute_pool.route_limits.get(BULK_RENDER_ROUTE) or compute_pool.max_workers
+    writer = _ChunkWriter()
+    manifest = []
+
+    async def render(index: int) -> tuple[int, bytes | Exception]:
+        while True:
+            try:
+                return index, await compute_pool.run(BULK_RENDER_ROUTE, render_chart_file, renders[index], output_format, dpi)
+            except ComputeCapacityError:
+                # Wait for capacity instead of failing charts of a long-running archive
+                await asyncio.sleep(compute_pool.retry_after_seconds)
+            except Exception as e:
+                return index, e
+
+    with zipfile.ZipFile(writer, mode="w", compression=compression) as archive:
+        pending = set()
+        next_index = 0
+        try:
+            while pending or next_index < len(renders):
+                while next_index < len(renders) and len(pending) < window:
+                    pending.add(asyncio.ensure_future(render(next_index)))
+                    next_index += 1
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    index, result = task.result()
+                    if isinstance(result, Exception):
+                        message = result.detail if isinstance(result, ZodiacEngineException) else str(result)
+                        logger.warning(f"Bulk render of chart {index} failed: {message}")
+                        manifest.append({"index": index, "name": renders[index]["name"], "error": message})
+                        continue
+                    filename = archive_filename(index, renders[index]["name"], output_format)
+                    archive.writestr(filename, result)
+                    manifest.append({"index": index, "name": renders[index]["name"], "file": filename})
+                yield writer.drain()
+        finally:
+            # The client may disconnect mid-archive
+            for task in pending:
+                task.cancel()
+
+        manifest.sort(key=lambda item: item["index"])
+        archive.writestr("manifest.json", json.dumps(manifest, indent=2))
+    yield writer.drain()
@@ -0,0 +1,358 @@
+"""Multi-page PDF chart books: the chart wheel, its report tables and its interpretation."""
+import logging
+import os
+import tempfile
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import BinaryIO, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import cairocffi as cairo
+import cairosvg
+
+from app.core.exceptions import FileConversionError
+from app.core.svg_utils import preprocess_svg_for_conversion
+from app.services.compute_pool import ComputePool
+
+logger = logging.getLogger(__name__)
+
+# Compute pool route of book exports
+BOOK_ROUTE = "render_book"
+
+# Page sizes in points
+PAGE_SIZES: Dict[str, Tuple[float, float]] = {
+    "a4": (595.28, 841.89),
+    "letter": (612.0, 792.0),
+}
+
+# Line height as a multiple of the font size
+LINE_SPACING = 1.35
+
+class TextStyle(NamedTuple):
+    """Font and spacing of a kind of text in a book."""
+    family: str
+    size: float
+    bold: bool = False
+    space_before: float = 0.0
+    preformatted: bool = False  # Lines are kept as they are instead of wrapped
+
+# Text styles of the book theme, by name
+BOOK_STYLES: Dict[str, TextStyle] = {
+    "title": TextStyle("sans-serif", 20, bold=True),
+    "heading": TextStyle("sans-serif", 13, bold=True, space_before=14),
+    "body": TextStyle("serif", 10.5, space_before=5),
+    "table": TextStyle("monospace", 8, space_before=6, preformatted=True),
+}
+
+class BookBlock(NamedTuple):
+    """A run of text in a book, laid out in one of the BOOK_STYLES."""
+    style: str
+    text: str
+
+def interpretation_name_for(chart_id: str) -> str:
+    """Name of the interpretation last generated for a chart in the artifact store."""
+    return f"{chart_id}.interpretation.html"
+
+class _InterpretationParser(HTMLParser):
+    """Collects the headings, paragraphs and list items of interpretation HTML as book blocks."""
+
+    BLOCK_STYLES = {
+        "h1": "heading", "h2": "heading", "h3": "heading", "h4": "heading", "h5": "heading", "h6": "heading",
+        "p": "body", "li": "body", "blockquote": "body", "pre": "table",
+    }
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks: List[BookBlock] = []
+        self._style: Optional[str] = None
+        self._text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "br":
+            self._text.append("\n")
+        elif tag in self.BLOCK_STYLES:
+            # A paragraph inside a list item continues the item
+            if tag == "p" and "".join(self._text).strip() == "•":
+                return
+            self._flush()
+            self._style = self.BLOCK_STYLES[tag]
+            if tag == "li":
+                self._text.append("• ")
+
+    def handle_endtag(self, tag):
+        if tag in self.BLOCK_STYLES:
+            self._flush()
+
+    def handle_data(self, data):
+        # Only <br> breaks lines outside preformatted text
+        self._text.append(data if self._style == "table" else data.replace("\n", " "))
+
+    def close(self):
+        super().close()
+        self._flush()
+
+    def _flush(self):
+        text = "".join(self._text)
+        if self._style != "table":
+            text = "\n".join(" ".join(line.split()) for line in text.split("\n")).strip()
+        if text.strip() and text.strip() != "•":
+            self.blocks.append(BookBlock(self._style or "body", text))
+        self._style = None
+        self._text = []
+
+def interpretation_blocks(html: str) -> List[BookBlock]:
+    """
+    Lay out interpretation HTML as book blocks.
+
+    Headings, paragraphs and list items become blocks of their own; inline
+    markup is dropped and line breaks are kept.
+    """
+    parser = _InterpretationParser()
+    parser.feed(html)
+    parser.close()
+    return parser.blocks
+
+def book_sections(report_data: Dict[str, str], interpretation_html: Optional[str] = None) -> List[List[BookBlock]]:
+    """
+    Sections of a chart book after the chart page, each starting on a new page.
+
+    Args:
+        report_data: Report of the chart from ReportService.generate_natal_report
+        interpretation_html: Interpretation of the chart, or None to leave it out
+
+    Returns:
+        The report section, followed by the interpretation section if there is one
+    """
+    report = [
+        BookBlock("heading", "Birth Data"),
+        BookBlock("table", report_data["data_table"]),
+        BookBlock("heading", "Planets"),
+        BookBlock("table", report_data["planets_table"]),
+        BookBlock("heading", "Houses"),
+        BookBlock("table", report_data["houses_table"]),
+    ]
+    if "Note: For Whole Sign houses" in report_data.get("full_report", ""):
+        report.append(BookBlock("body", "Note: For Whole Sign houses, all house positions are 0.0 as each house starts at 0° of its sign."))
+    sections = [report]
+    if interpretation_html:
+        sections.append([BookBlock("heading", "Interpretation"), *interpretation_blocks(interpretation_html)])
+    return sections
+
+class _RecordingSurface(cairosvg.surface.Surface):
+    """cairosvg surface drawing into a cairo recording surface, which PDF pages replay as vectors."""
+
+    def _create_surface(self, width, height):
+        """Create and return ``(cairo_surface, width, height)``."""
+        return cairo.RecordingSurface(cairo.CONTENT_COLOR_ALPHA, (0, 0, width, height)), width, height
+
+class ChartBookWriter:
+    """
+    Writes chart books as PDF with cairo, page by page.
+
+    cairo's PDF surface writes each finished page to the output, embeds
+    every font subset once per document however many pages use it, and
+    stores the chart wheel as vectors. The writer keeps the theme's fonts
+    and the measured widths of words, so a worker writing many books sets
+    up the theme once and only measures new words.
+    """
+
+    # Measured words kept per writer before the measurements are dropped
+    MAX_MEASURED_WORDS = 50_000
+
+    def __init__(self, page_size: str = "a4", margin: float = 48.0, styles: Dict[str, TextStyle] = BOOK_STYLES):
+        """
+        Initialize the writer.
+
+        Args:
+            page_size: One of PAGE_SIZES
+            margin: Page margin in points
+            styles: Text styles by name
+
+        Raises:
+            ValueError: If the page size is unknown
+        """
+        if page_size not in PAGE_SIZES:
+            raise ValueError(f"Unknown page size: {page_size}")
+        self.page_width, self.page_height = PAGE_SIZES[page_size]
+        self.margin = margin
+        self.styles = styles
+        self._fonts: Dict[str, cairo.ScaledFont] = {}
+        self._widths: Dict[Tuple[str, str], float] = {}
+
+    def font(self, style_name: str) -> cairo.ScaledFont:
+        """Scaled font of a text style, created once per writer."""
+        font = self._fonts.get(style_name)
+        if font is None:
+            style = self.styles[style_name]
+            weight = cairo.FONT_WEIGHT_BOLD if style.bold else cairo.FONT_WEIGHT_NORMAL
+            face = cairo.ToyFontFace(style.family, cairo.FONT_SLANT_NORMAL, weight)
+            font = cairo.ScaledFont(face, cairo.Matrix(xx=style.size, yy=style.size))
+            self._fonts[style_name] = font
+        return font
+
+    def measure(self, style_name: str, text: str) -> float:
+        """Advance width of a text in a style, in points."""
+        key = (style_name, text)
+        width = self._widths.get(key)
+        if width is None:
+            if len(self._widths) >= self.MAX_MEASURED_WORDS:
+                self._widths.clear()
+            width = self._widths[key] = self.font(style_name).text_extents(text)[4]
+        return width
+
+    def wrap(self, style_name: str, text: str, width: float) -> List[str]:
+        """Break a text into lines no wider than width, keeping its line breaks."""
+        if self.styles[style_name].preformatted:
+            return text.rstrip("\n").split("\n")
+        space = self.measure(style_name, " ")
+        lines = []
+        for paragraph in text.split("\n"):
+            line: List[str] = []
+            line_width = 0.0
+            for word in paragraph.split():
+                word_width = self.measure(style_name, word)
+                if line and line_width + space + word_width > width:
+                    lines.append(" ".join(line))
+                    line, line_width = [], 0.0
+                line_width += word_width + (space if line else 0.0)
+                line.append(word)
+            lines.append(" ".join(line))
+        return lines
+
+    def write(self, sink: BinaryIO, title: str, svg: str, sections: Sequence[Sequence[BookBlock]]) -> None:
+        """
+        Write a book: the title and chart wheel on the first page, then each section from a new page.
+
+        Args:
+            sink: Binary file object the PDF is written to
+            title: Title of the book
+            svg: SVG markup of the chart
+            sections: Blocks of each section, see book_sections
+
+        Raises:
+            FileConversionError: If the book cannot be written
+        """
+        try:
+            surface = cairo.PDFSurface(sink, self.page_width, self.page_height)
+            context = cairo.Context(surface)
+            context.set_source_rgb(0, 0, 0)
+
+            top = self._draw_blocks(context, [BookBlock("title", title)], self.margin)
+            # Kept referenced until the PDF is finished, as the page replays the recording
+            recording = self._draw_chart(context, svg, top + self.margin / 2)
+            for blocks in sections:
+                context.show_page()
+                self._draw_blocks(context, blocks, self.margin)
+            surface.finish()
+            del recording
+        except Exception as e:
+            logger.error(f"Error writing chart book: {str(e)}", exc_info=True)
+            raise FileConversionError(f"Failed to write chart book: {str(e)}") from e
+
+    def _draw_chart(self, context: cairo.Context, svg: str, top: float) -> _RecordingSurface:
+        """Draw the chart wheel below top, scaled to the rest of the page."""
+        tree = cairosvg.parser.Tree(bytestring=preprocess_svg_for_conversion(svg).encode("utf-8"))
+        chart = _RecordingSurface(tree, None, 96)
+        available_width = self.page_width - 2 * self.margin
+        available_height = self.page_height - self.margin - top
+        scale = min(available_width / chart.width, available_height / chart.height)
+
+        context.save()
+        context.translate(self.margin + (available_width - chart.width * scale) / 2, top)
+        context.scale(scale, scale)
+        context.set_source_surface(chart.cairo, 0, 0)
+        context.paint()
+        context.restore()
+        return chart
+
+    def _draw_blocks(self, context: cairo.Context, blocks: Sequence[BookBlock], top: float) -> float:
+        """Draw blocks from top, continuing on new pages, and return where the last one ends."""
+        bottom = self.page_height - self.margin
+        body_line_height = self.styles["body"].size * LINE_SPACING
+        y = top
+        for block in blocks:
+            style = self.styles[block.style]
+            line_height = style.size * LINE_SPACING
+            if y > self.margin:
+                y += style.space_before
+            # Headings are kept with the first lines after them
+            if block.style == "heading" and y + line_height + 3 * body_line_height > bottom:
+                context.show_page()
+                y = self.margin
+            context.set_scaled_font(self.font(block.style))
+            for line in self.wrap(block.style, block.text, self.page_width - 2 * self.margin):
+                if y + line_height > bottom:
+                    context.show_page()
+                    y = self.margin
+                context.move_to(self.margin, y + style.size)
+                context.show_text(line)
+                y += line_height
+        return y
+
+@lru_cache(maxsize=4)
+def _worker_book_writer(page_size: str) -> ChartBookWriter:
+    """Book writer of a pool worker, reused across the books the worker writes."""
+    return ChartBookWriter(page_size)
+
+def write_book_in_worker(path: str, page_size: str, title: str, svg: str, sections: List[List[BookBlock]]) -> None:
+    """Write a chart book into a file created by the caller, in a compute pool worker."""
+    with open(path, "r+b") as sink:
+        _worker_book_writer(page_size).write(sink, title, svg, sections)
+
+class ChartBookService:
+    """
+    Exports a chart, its report and its interpretation as one multi-page PDF.
+
+    Books are written by ChartBookWriter in a compute pool worker into a
+    temporary file, which the caller streams; only the path and the text
+    of the book cross the process boundary.
+    """
+
+    def __init__(self, compute_pool: ComputePool, page_size: str = "a4"):
+        """
+        Initialize the chart book service.
+
+        Args:
+            compute_pool: Pool writing the books, with the BOOK_ROUTE route
+            page_size: One of PAGE_SIZES
+
+        Raises:
+            ValueError: If the page size is unknown
+        """
+        if page_size not in PAGE_SIZES:
+            raise ValueError(f"Unknown page size: {page_size}")
+        self.compute_pool = compute_pool
+        self.page_size = page_size
+
+    async def open_book(
+        self,
+        svg: str,
+        report_data: Dict[str, str],
+        interpretation_html: Optional[str] = None,
+    ) -> BinaryIO:
+        """
+        Write the book of a chart and open it.
+
+        Args:
+            svg: SVG markup of the chart
+            report_data: Report of the chart from ReportService.generate_natal_report
+            interpretation_html: Interpretation of the chart, or None to leave it out
+
+        Returns:
+            The PDF opened for reading, which the caller closes
+
+        Raises:
+            ComputeCapacityError: If the book route or the pool is saturated
+            ComputeTimeoutError: If the book is not written within the timeout
+            FileConversionError: If the book cannot be written
+        """
+        sections = book_sections(report_data, interpretation_html)
+        descriptor, path = tempfile.mkstemp(suffix=".pdf")
+        os.close(descriptor)
+        try:
+            await self.compute_pool.run(
+                BOOK_ROUTE, write_book_in_worker, path, self.page_size, report_data["title"], svg, sections
+            )
+            # The open file stays readable after it is deleted
+            return open(path, "rb")
+        finally:
+            os.unlink(path)
@@ -0,0 +1,183 @@
+"""Content-addressed cache for computed natal charts."""
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+import pytz
+
+logger = logging.getLogger(__name__)
+
+def to_utc_instant(birth_date: datetime, tz_str: str) -> Optional[datetime]:
+    """
+    Convert a local birth date to the UTC instant Kerykeion calculates with.
+
+    Kerykeion only uses the date, hour and minute of the birth date, so seconds
+    and any tzinfo on the datetime are ignored here as well.
+
+    Args:
+        birth_date: Local birth date and time
+        tz_str: Timezone string (e.g., 'America/New_York')
+
+    Returns:
+        The UTC instant, or None if the local time is ambiguous or the timezone unknown
+    """
+    naive_datetime = birth_date.replace(tzinfo=None, second=0, microsecond=0)
+    try:
+        local_datetime = pytz.timezone(tz_str).localize(naive_datetime, is_dst=None)
+    except (pytz.exceptions.UnknownTimeZoneError, pytz.exceptions.InvalidTimeError):
+        return None
+    return local_datetime.astimezone(pytz.utc)
+
+def make_chart_key(
+    utc_instant: datetime,
+    lat: float,
+    lng: float,
+    houses_system: str = "P",
+    zodiac_type: str = "Tropic",
+    sidereal_mode: str | None = None,
+    perspective_type: str = "Apparent Geocentric",
+    precision: int = 4,
+) -> str:
+    """
+    Build a normalized hash for the inputs that determine a chart.
+
+    The person's name is deliberately not part of the key, so identical birth
+    moments and places share one cached calculation.
+
+    Args:
+        utc_instant: Birth moment in UTC
+        lat: Latitude of the birth place
+        lng: Longitude of the birth place
+        houses_system: House system identifier
+        zodiac_type: Zodiac type ("Tropic" or "Sidereal")
+        sidereal_mode: Sidereal mode, only relevant for sidereal charts
+        perspective_type: Type of perspective used for calculations
+        precision: Number of decimals coordinates are rounded to
+
+    Returns:
+        Hex digest identifying the chart
+    """
+    payload = {
+        "utc": utc_instant.astimezone(pytz.utc).strftime("%Y-%m-%dT%H:%M"),
+        "lat": round(float(lat), precision),
+        "lng": round(float(lng), precision),
+        "houses_system": houses_system,
+        "zodiac_type": zodiac_type,
+        "sidereal_mode": sidereal_mode if zodiac_type == "Sidereal" else None,
+        "perspective_type": perspective_type,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class ChartCache:
+    """
+    Thread-safe LRU cache for chart calculations.
+
+    Entries are bounded by count and by total estimated size in bytes, and
+    expire after a fixed TTL.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float | None = 86400,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the chart cache.
+
+        Args:
+            max_entries: Maximum number of cached charts
+            max_bytes: Maximum total estimated size of cached charts in bytes
+            ttl_seconds: Time to live of an entry in seconds (None disables expiry)
+            clock: Monotonic clock function, injectable for testing
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple[Any, int, float | None]]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for a key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, size, expires_at = entry
+            if expires_at is not None and expires_at <= self._clock():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: Any, size_bytes: int) -> None:
+        """
+        Store a value in the cache, evicting least recently used entries as needed.
+
+        Args:
+            key: Chart key from make_chart_key
+            value: Value to cache
+            size_bytes: Estimated size of the value in bytes
+        """
+        if size_bytes > self.max_bytes:
+            logger.debug(f"Not caching chart {key[:12]}: {size_bytes} bytes exceeds the cache size limit")
+            return
+
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size_bytes, expires_at)
+            self._size_bytes += size_bytes
+
+            while len(self._entries) > self.max_entries or self._size_bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> Dict[str, int | float | None]:
+        """Return cache usage and eviction statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._size_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry; the caller must hold the lock."""
+        _, size, _ = self._entries.pop(key)
+        self._size_bytes -= size
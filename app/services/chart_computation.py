@@ -0,0 +1,124 @@
+"""Shared Kerykeion subject computation for web charts."""
+import logging
+import threading
+import zlib
+from datetime import datetime
+
+from kerykeion import AstrologicalSubject
+from kerykeion.kr_types.kr_models import AstrologicalSubjectModel
+
+from app.services.chart_cache import ChartCache
+
+logger = logging.getLogger(__name__)
+
+# Number of locks chart computations are striped across
+LOCK_STRIPES = 64
+
+def serialize_subject(subject: AstrologicalSubject | AstrologicalSubjectModel) -> bytes:
+    """Serialize a subject to compressed JSON."""
+    model = subject.model() if isinstance(subject, AstrologicalSubject) else subject
+    return zlib.compress(model.model_dump_json().encode("utf-8"))
+
+def deserialize_subject(blob: bytes) -> AstrologicalSubjectModel:
+    """Restore a subject serialized with serialize_subject."""
+    return AstrologicalSubjectModel.model_validate_json(zlib.decompress(blob))
+
+class ChartComputationService:
+    """
+    Compute the Kerykeion subject of a chart once and share it.
+
+    The SVG, report, interpretation and natal chart paths of a chart all read
+    the same stored subject, so a chart_id costs a single ephemeris calculation
+    however many of them are requested. Subjects are stored as compressed JSON
+    of AstrologicalSubjectModel, which Kerykeion's chart and report classes accept.
+    """
+
+    def __init__(self, store: ChartCache | None = None, geonames_username: str | None = None):
+        """
+        Initialize the chart computation service.
+
+        Args:
+            store: Cache holding the serialized subjects by chart_id
+            geonames_username: Geonames username for charts without coordinates
+        """
+        self.store = store if store is not None else ChartCache(max_entries=1000)
+        self.geonames_username = geonames_username
+        self.calculations = 0
+        self._locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+    def get_subject(
+        self,
+        chart_id: str,
+        name: str,
+        birth_date: datetime,
+        city: str | None = None,
+        nation: str | None = None,
+        lng: float | None = None,
+        lat: float | None = None,
+        tz_str: str | None = None,
+        houses_system: str = "P",
+        zodiac_type: str = "Tropic",
+        sidereal_mode: str | None = None,
+        perspective_type: str = "Apparent Geocentric",
+    ) -> AstrologicalSubjectModel:
+        """
+        Return the subject of a chart, computing it on first use.
+
+        Concurrent requests for the same chart_id wait for a single calculation.
+
+        Args:
+            chart_id: Identifier of the chart
+            name: Name of the person
+            birth_date: Local birth date and time
+            city: City of birth (optional)
+            nation: Country of birth (optional)
+            lng: Longitude of birth place (optional)
+            lat: Latitude of birth place (optional)
+            tz_str: Timezone string (optional)
+            houses_system: House system identifier
+            zodiac_type: Zodiac type ("Tropic" or "Sidereal")
+            sidereal_mode: Sidereal mode, only used for sidereal charts
+            perspective_type: Type of perspective used for calculations
+
+        Returns:
+            The chart's subject
+        """
+        subject = self.load_subject(chart_id)
+        if subject is not None:
+            return subject
+
+        with self._locks[hash(chart_id) % LOCK_STRIPES]:
+            subject = self.load_subject(chart_id)
+            if subject is not None:
+                return subject
+
+            logger.info(f"Computing subject for chart {chart_id}")
+            model = AstrologicalSubject(
+                name=name,
+                year=birth_date.year,
+                month=birth_date.month,
+                day=birth_date.day,
+                hour=birth_date.hour,
+                minute=birth_date.minute,
+                city=city,
+                nation=nation,
+                lng=lng,
+                lat=lat,
+                tz_str=tz_str,
+                houses_system_identifier=houses_system,
+                zodiac_type=zodiac_type,
+                sidereal_mode=sidereal_mode if zodiac_type == "Sidereal" else None,
+                perspective_type=perspective_type,
+                geonames_username=self.geonames_username,
+                online=bool(self.geonames_username)  # Use online mode when username is provided
+            ).model()
+            self.calculations += 1
+
+            blob = serialize_subject(model)
+            self.store.set(chart_id, blob, len(blob))
+            return model
+
+    def load_subject(self, chart_id: str) -> AstrologicalSubjectModel | None:
+        """Return the stored subject of a chart, or None if it was not computed."""
+        blob = self.store.get(chart_id)
+        return deserialize_subject(blob) if blob is not None else None
@@ -0,0 +1,245 @@
+"""Compact array-backed representation of a calculated natal chart."""
+import math
+from datetime import datetime
+from typing import Dict, List, Tuple, get_args
+
+import numpy as np
+import swisseph as swe
+from kerykeion import AstrologicalSubject
+from kerykeion.kr_types import Houses
+from kerykeion.kr_types.kr_models import AstrologicalSubjectModel
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS
+
+from app.schemas.chart_visualization import ChartConfiguration
+from app.schemas.natal_chart import AspectInfo, NatalChartResponse, PlanetPosition
+from app.services.aspect_engine import CELESTIAL_POINTS, AspectTable, natal_aspect_arrays, to_aspect_info
+from app.services.batch_ephemeris import BODY_KEYS, EphemerisBatch
+
+# Zodiac sign abbreviations as used by Kerykeion, indexed by sign number
+ZODIAC_SIGNS = ["Ari", "Tau", "Gem", "Can", "Leo", "Vir", "Lib", "Sco", "Sag", "Cap", "Aqu", "Pis"]
+
+# Planets and points of a natal chart response: (key, display name)
+RESPONSE_POINTS = [
+    ("sun", "Sun"), ("moon", "Moon"), ("mercury", "Mercury"), ("venus", "Venus"),
+    ("mars", "Mars"), ("jupiter", "Jupiter"), ("saturn", "Saturn"), ("uranus", "Uranus"),
+    ("neptune", "Neptune"), ("pluto", "Pluto"),
+    ("mean_node", "Mean Node"), ("true_node", "True Node"),
+    ("mean_south_node", "Mean South Node"), ("true_south_node", "True South Node"),
+    ("mean_lilith", "Mean Lilith"), ("chiron", "Chiron"),
+]
+
+# Aspects and points of a natal chart, matching Kerykeion's NatalAspects defaults
+NATAL_ASPECTS = AspectTable(ChartConfiguration().active_aspects)
+NATAL_ASPECT_POINTS = [name for name in CELESTIAL_POINTS if name in DEFAULT_ACTIVE_POINTS]
+
+# House cusps in order, as named by Kerykeion ("First_House", ...)
+HOUSE_POINTS: List[str] = list(get_args(Houses))
+
+# Version of the binary layout, stored in every blob
+BLOB_VERSION = 1
+
+# Fixed binary layout of a chart: one record of BLOB_SIZE bytes
+BLOB_DTYPE = np.dtype([
+    ("version", "u1"),
+    ("houses_system", "S1"),
+    ("houses", "i1", (len(BODY_KEYS),)),
+    ("retrograde", "u1", (len(BODY_KEYS),)),
+    ("longitudes", "<f8", (len(BODY_KEYS),)),
+    ("speeds", "<f8", (len(BODY_KEYS),)),
+    ("cusps", "<f8", (12,)),
+    ("ascmc", "<f8", (2,)),
+])
+BLOB_SIZE = BLOB_DTYPE.itemsize
+
+# Columns of the response points in BODY_KEYS order
+RESPONSE_COLUMNS = [BODY_KEYS.index(key) for key, _ in RESPONSE_POINTS]
+
+class ChartPositions:
+    """
+    Positions of one natal chart, stored in a single fixed-size numpy record.
+
+    Longitudes, speeds and cusps are float64; houses, signs and aspect types
+    are small integer codes. The person's name and birth date are not part of
+    it, so charts of the same moment and place share one instance. Pydantic
+    responses are only built on demand by to_response.
+    """
+
+    __slots__ = ("_record", "_aspects")
+
+    def __init__(self, record: np.ndarray):
+        """
+        Args:
+            record: Zero-dimensional record with dtype BLOB_DTYPE
+        """
+        self._record = record
+        self._aspects: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None = None
+
+    @classmethod
+    def from_batch(cls, batch: EphemerisBatch, row: int, houses_system: str, houses: np.ndarray) -> "ChartPositions":
+        """
+        Build the positions of one row of a batch calculation.
+
+        Args:
+            batch: Batch ephemeris calculation
+            row: Row of the chart in the batch
+            houses_system: House system identifier used for the batch row
+            houses: House numbers of the bodies, shape (B,)
+        """
+        record = np.zeros((), dtype=BLOB_DTYPE)
+        record["version"] = BLOB_VERSION
+        record["houses_system"] = houses_system.encode("ascii")
+        record["houses"] = houses
+        record["retrograde"] = batch.speeds[row] < 0
+        record["longitudes"] = batch.longitudes[row]
+        record["speeds"] = batch.speeds[row]
+        record["cusps"] = batch.cusps[row]
+        record["ascmc"] = batch.ascmc[row]
+        return cls(record)
+
+    @classmethod
+    def from_subject(cls, subject: AstrologicalSubject | AstrologicalSubjectModel) -> "ChartPositions":
+        """
+        Build the positions of a chart calculated by Kerykeion.
+
+        Kerykeion only exposes the direction of motion, so speeds are NaN.
+        """
+        points = [subject[key] for key in BODY_KEYS]
+        record = np.zeros((), dtype=BLOB_DTYPE)
+        record["version"] = BLOB_VERSION
+        record["houses_system"] = subject.houses_system_identifier.encode("ascii")
+        record["houses"] = [HOUSE_POINTS.index(point.house) + 1 for point in points]
+        record["retrograde"] = [bool(point.retrograde) for point in points]
+        record["longitudes"] = [point.abs_pos for point in points]
+        record["speeds"] = np.nan
+        record["cusps"] = [subject[name.lower()].abs_pos for name in HOUSE_POINTS]
+        record["ascmc"] = [subject.ascendant.abs_pos, subject.medium_coeli.abs_pos]
+        return cls(record)
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "ChartPositions":
+        """Restore positions serialized with to_bytes."""
+        if len(blob) != BLOB_SIZE or blob[0] != BLOB_VERSION:
+            raise ValueError(f"Not a version {BLOB_VERSION} chart positions blob of {BLOB_SIZE} bytes")
+        return cls(np.frombuffer(blob, dtype=BLOB_DTYPE).reshape(()))
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a blob of exactly BLOB_SIZE bytes."""
+        return self._record.tobytes()
+
+    @property
+    def houses_system(self) -> str:
+        """House system identifier."""
+        return self._record["houses_system"].item().decode("ascii")
+
+    @property
+    def longitudes(self) -> np.ndarray:
+        """Ecliptic longitudes in BODY_KEYS order."""
+        return self._record["longitudes"]
+
+    @property
+    def speeds(self) -> np.ndarray:
+        """Longitude speeds in degrees per day in BODY_KEYS order, NaN when unknown."""
+        return self._record["speeds"]
+
+    @property
+    def retrograde(self) -> np.ndarray:
+        """Retrograde flags in BODY_KEYS order."""
+        return self._record["retrograde"].astype(bool)
+
+    @property
+    def houses(self) -> np.ndarray:
+        """House numbers (1-12) of the bodies in BODY_KEYS order."""
+        return self._record["houses"]
+
+    @property
+    def signs(self) -> np.ndarray:
+        """Sign numbers (0-11) of the bodies in BODY_KEYS order."""
+        return (self.longitudes // 30).astype(np.int8)
+
+    @property
+    def cusps(self) -> np.ndarray:
+        """House cusp longitudes."""
+        return self._record["cusps"]
+
+    @property
+    def ascmc(self) -> np.ndarray:
+        """Ascendant and Medium Coeli longitudes."""
+        return self._record["ascmc"]
+
+    def point_longitudes(self) -> Dict[str, float]:
+        """Point and house cusp longitudes keyed by Kerykeion name (e.g., "Sun", "First_House")."""
+        ascendant, medium_coeli = self.ascmc.tolist()
+        positions = {key.title(): value for key, value in zip(BODY_KEYS, self.longitudes.tolist())}
+        positions["Ascendant"] = ascendant
+        positions["Medium_Coeli"] = medium_coeli
+        positions["Descendant"] = math.fmod(ascendant + 180, 360)
+        positions["Imum_Coeli"] = math.fmod(medium_coeli + 180, 360)
+        positions.update(zip(HOUSE_POINTS, self.cusps.tolist()))
+        return {point: positions[point] for point in CELESTIAL_POINTS + HOUSE_POINTS}
+
+    def aspect_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Natal aspects between NATAL_ASPECT_POINTS as index arrays, calculated on first use.
+
+        Returns:
+            Tuple (firsts, seconds, aspect_index, orbits); aspect_index indexes NATAL_ASPECTS
+        """
+        if self._aspects is None:
+            positions = self.point_longitudes()
+            longitudes = np.array([[positions[point] for point in NATAL_ASPECT_POINTS]])
+            _, firsts, seconds, aspect_index, orbits = natal_aspect_arrays(
+                longitudes, NATAL_ASPECT_POINTS, NATAL_ASPECTS
+            )
+            self._aspects = (firsts, seconds, aspect_index, orbits)
+        return self._aspects
+
+    def to_response(
+        self,
+        name: str,
+        birth_date: datetime,
+        aspects: List[AspectInfo] | None = None,
+    ) -> NatalChartResponse:
+        """
+        Build the API response for the chart.
+
+        Args:
+            name: Name of the person
+            birth_date: Birth date to report
+            aspects: Precalculated aspects, calculated from the positions if omitted
+
+        Returns:
+            The natal chart response
+        """
+        if aspects is None:
+            firsts, seconds, aspect_index, orbits = self.aspect_arrays()
+            aspects = to_aspect_info(
+                firsts, seconds, aspect_index, orbits,
+                NATAL_ASPECT_POINTS, NATAL_ASPECT_POINTS, NATAL_ASPECTS
+            )
+
+        longitudes = self.longitudes.tolist()
+        houses = self.houses.tolist()
+        retrograde = self.retrograde.tolist()
+        planets = []
+        for (_, display_name), column in zip(RESPONSE_POINTS, RESPONSE_COLUMNS):
+            longitude = longitudes[column]
+            planets.append(PlanetPosition(
+                name=display_name,
+                sign=ZODIAC_SIGNS[int(longitude // 30)],
+                position=longitude % 30,
+                house=houses[column],
+                retrograde=retrograde[column]
+            ))
+
+        houses_system = self.houses_system
+        return NatalChartResponse(
+            name=name,
+            birth_date=birth_date,
+            planets=planets,
+            houses={i: cusp % 30 for i, cusp in enumerate(self.cusps.tolist(), 1)},
+            aspects=aspects,
+            house_system={
+                "name": swe.house_name(houses_system.encode("ascii")),
+                "identifier": houses_system
+            }
+        )
@@ -0,0 +1,235 @@
+"""Persistent SQLite store for charts created through the web interface."""
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from sqlalchemy import Column, Float, LargeBinary, MetaData, String, Table, Text, delete, event, select, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.services.chart_cache import ChartCache
+
+logger = logging.getLogger(__name__)
+
+metadata = MetaData()
+
+charts_table = Table(
+    "charts",
+    metadata,
+    Column("chart_id", String(64), primary_key=True),
+    Column("data", Text, nullable=False),  # JSON of the chart inputs
+    Column("subject", LargeBinary, nullable=True),  # Serialized Kerykeion subject
+    Column("positions", LargeBinary, nullable=True),  # ChartPositions blob
+    Column("created_at", Float, nullable=False),
+    Column("expires_at", Float, nullable=True, index=True),
+)
+
+class StoredChart:
+    """A chart's inputs and, once calculated, its serialized subject and positions."""
+
+    __slots__ = ("chart_id", "data", "subject", "positions", "expires_at")
+
+    def __init__(
+        self,
+        chart_id: str,
+        data: Dict[str, Any],
+        subject: bytes | None = None,
+        positions: bytes | None = None,
+        expires_at: float | None = None,
+    ):
+        """
+        Args:
+            chart_id: Identifier of the chart
+            data: Chart inputs (name, birth data, settings) as shown by the web pages
+            subject: Subject serialized by chart_computation.serialize_subject
+            positions: Blob from ChartPositions.to_bytes
+            expires_at: Wall-clock expiry time, None if the chart never expires
+        """
+        self.chart_id = chart_id
+        self.data = data
+        self.subject = subject
+        self.positions = positions
+        self.expires_at = expires_at
+
+    @property
+    def is_computed(self) -> bool:
+        """Whether the chart's subject and positions are stored."""
+        return self.subject is not None and self.positions is not None
+
+class ChartStore:
+    """
+    Async chart repository on SQLite with an in-memory LRU front.
+
+    The database runs in WAL mode so several uvicorn workers can share it,
+    and connections are pooled by the SQLAlchemy engine. Charts expire after
+    a TTL; expired rows are ignored on read and purged periodically.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        ttl_seconds: float | None = 30 * 86400,
+        cache_entries: int = 1024,
+        pool_size: int = 5,
+        purge_interval_seconds: float = 3600,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the chart store.
+
+        Args:
+            url: SQLAlchemy database URL (e.g., 'sqlite+aiosqlite:///cache/charts.db')
+            ttl_seconds: Time to live of a chart in seconds (None keeps charts forever)
+            cache_entries: Maximum number of charts kept in the in-memory front cache
+            pool_size: Number of pooled database connections
+            purge_interval_seconds: Minimum time between purges of expired charts
+            clock: Wall-clock time function, injectable for testing
+        """
+        self.url = url
+        self.ttl_seconds = ttl_seconds
+        self.purge_interval_seconds = purge_interval_seconds
+        self._clock = clock
+        self._front = ChartCache(max_entries=cache_entries, ttl_seconds=None)
+        self._engine: AsyncEngine | None = None
+        self._pool_size = pool_size
+        self._init_lock = asyncio.Lock()
+        self._last_purge = 0.0
+
+    async def get(self, chart_id: str) -> StoredChart | None:
+        """
+        Get a chart by id.
+
+        Returns:
+            The stored chart, or None if it does not exist or has expired
+        """
+        chart = self._front.get(chart_id)
+        if chart is not None and chart.is_computed and not self._expired(chart.expires_at):
+            return chart
+
+        engine = await self._get_engine()
+        async with engine.connect() as connection:
+            row = (await connection.execute(
+                select(charts_table).where(charts_table.c.chart_id == chart_id)
+            )).first()
+
+        if row is None or self._expired(row.expires_at):
+            return None
+        chart = StoredChart(row.chart_id, json.loads(row.data), row.subject, row.positions, row.expires_at)
+        self._front.set(chart_id, chart, 1)
+        return chart
+
+    async def save(self, chart_id: str, data: Dict[str, Any]) -> StoredChart:
+        """
+        Store the inputs of a new chart.
+
+        Args:
+            chart_id: Identifier of the chart
+            data: JSON-serializable chart inputs
+
+        Returns:
+            The stored chart
+        """
+        now = self._clock()
+        expires_at = now + self.ttl_seconds if self.ttl_seconds else None
+        engine = await self._get_engine()
+        async with engine.begin() as connection:
+            await connection.execute(charts_table.insert().values(
+                chart_id=chart_id,
+                data=json.dumps(data),
+                created_at=now,
+                expires_at=expires_at
+            ))
+
+        chart = StoredChart(chart_id, data, expires_at=expires_at)
+        self._front.set(chart_id, chart, 1)
+        await self._maybe_purge(now)
+        return chart
+
+    async def save_computed(self, chart_id: str, subject: bytes, positions: bytes) -> None:
+        """
+        Store the calculated subject and positions of a chart.
+
+        Args:
+            chart_id: Identifier of the chart
+            subject: Subject serialized by chart_computation.serialize_subject
+            positions: Blob from ChartPositions.to_bytes
+        """
+        engine = await self._get_engine()
+        async with engine.begin() as connection:
+            await connection.execute(
+                update(charts_table)
+                .where(charts_table.c.chart_id == chart_id)
+                .values(subject=subject, positions=positions)
+            )
+
+        chart = self._front.get(chart_id)
+        if chart is not None:
+            chart.subject = subject
+            chart.positions = positions
+
+    async def purge_expired(self) -> int:
+        """
+        Delete expired charts.
+
+        Returns:
+            Number of charts deleted
+        """
+        now = self._clock()
+        self._last_purge = now
+        engine = await self._get_engine()
+        async with engine.begin() as connection:
+            result = await connection.execute(
+                delete(charts_table).where(charts_table.c.expires_at <= now)
+            )
+        if result.rowcount:
+            logger.info(f"Purged {result.rowcount} expired charts")
+        return result.rowcount
+
+    async def close(self) -> None:
+        """Dispose of the pooled database connections."""
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return statistics of the in-memory front cache."""
+        return self._front.stats()
+
+    def _expired(self, expires_at: float | None) -> bool:
+        """Whether an expiry time has passed."""
+        return expires_at is not None and expires_at <= self._clock()
+
+    async def _maybe_purge(self, now: float) -> None:
+        """Purge expired charts if the purge interval has elapsed."""
+        if self.ttl_seconds and now - self._last_purge >= self.purge_interval_seconds:
+            await self.purge_expired()
+
+    async def _get_engine(self) -> AsyncEngine:
+        """Create the engine and schema on first use."""
+        if self._engine is not None:
+            return self._engine
+
+        async with self._init_lock:
+            if self._engine is None:
+                database = make_url(self.url).database
+                if database and database != ":memory:":
+                    Path(database).parent.mkdir(parents=True, exist_ok=True)
+
+                engine = create_async_engine(self.url, pool_size=self._pool_size)
+                event.listen(engine.sync_engine, "connect", _configure_sqlite)
+                async with engine.begin() as connection:
+                    await connection.run_sync(metadata.create_all)
+                self._engine = engine
+                logger.info(f"Chart store ready at {self.url}")
+        return self._engine
+
+def _configure_sqlite(dbapi_connection, connection_record) -> None:
+    """Enable WAL mode and a busy timeout on every new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
@@ -3,13 +3,21 @@ import os
 import uuid
 import logging
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from string import Template
+from typing import Dict, Any, List
 
+import kerykeion.charts.kerykeion_chart_svg
 from kerykeion import AstrologicalSubject, KerykeionChartSVG
+from kerykeion.kr_types.kr_models import AstrologicalSubjectModel
 
 from app.core.config import Settings
+from app.core.svg_utils import minify_svg
 from app.schemas.chart_visualization import ChartConfiguration
+from app.services.artifact_store import ChartArtifactStore, LocalDirectoryBackend
+from app.services.render_cache import RenderCache, make_render_key, render_subject_inputs
+from app.static import precompressed_variants
 
 # Get logger
 logger = logging.getLogger(__name__)
@@ -60,12 +68,215 @@ def map_house_system(house_system: str) -> str:
     logger.warning(f"Unknown house system '{house_system}', defaulting to Placidus (P)")
     return "P"
 
+# Template placeholders of the layers that only depend on the theme, language and chart type
+STATIC_TEMPLATE_KEYS = frozenset({
+    "color_style_tag", "chart_height", "chart_width", "viewbox", "paper_color_0", "paper_color_1",
+})
+STATIC_TEMPLATE_PREFIXES = ("planets_color_", "zodiac_color_", "orb_color_")
+
+@lru_cache(maxsize=1)
+def _chart_template_source() -> str:
+    """Kerykeion's chart.xml template, read once per process."""
+    template_path = Path(kerykeion.charts.kerykeion_chart_svg.__file__).parent / "templates" / "chart.xml"
+    with open(template_path, "r", encoding="utf-8", errors="ignore") as f:
+        return f.read()
+
+@lru_cache(maxsize=32)
+def _precompiled_chart_template(static_layers: tuple[tuple[str, str], ...]) -> Template:
+    """
+    chart.xml with the static layers substituted and its quotes normalized.
+
+    Args:
+        static_layers: Placeholder names and values of the static layers
+
+    Returns:
+        Template left with the placeholders of the dynamic layers only
+    """
+    # Escape "$" so static values are not parsed again by the second substitution
+    escaped = {key: value.replace("$", "$$") for key, value in static_layers}
+    return Template(Template(_chart_template_source()).safe_substitute(escaped).replace('"', "'"))
+
+def render_chart_template(chart: KerykeionChartSVG) -> str:
+    """
+    Render a chart to SVG markup, byte-identical to chart.makeTemplate().
+
+    makeTemplate() builds the template dictionary twice, parses chart.xml on
+    every call and normalizes the quotes of the whole document. Here the
+    dictionary is built once, and the theme CSS, colors and dimensions are
+    substituted into chart.xml once per theme, language and chart type, so
+    only the dynamic layers (rings, planets, aspects, labels) are
+    substituted and normalized per chart.
+
+    Args:
+        chart: Chart to render
+
+    Returns:
+        The SVG markup
+    """
+    static_layers = []
+    dynamic_layers = {}
+    for key, value in chart._create_template_dictionary().items():
+        if key in STATIC_TEMPLATE_KEYS or key.startswith(STATIC_TEMPLATE_PREFIXES):
+            static_layers.append((key, str(value)))
+        else:
+            dynamic_layers[key] = str(value).replace('"', "'")
+    return _precompiled_chart_template(tuple(static_layers)).substitute(dynamic_layers)
+
+def svg_name_for(chart_id: str) -> str:
+    """Name of the persisted SVG file of a chart in the artifact store."""
+    return f"{chart_id}.svg"
+
+def svg_url_for(chart_id: str) -> str:
+    """Static URL of the persisted SVG file of a chart."""
+    return f"/static/images/svg/{chart_id}.svg"
+
+@lru_cache(maxsize=1)
+def default_artifact_store() -> ChartArtifactStore:
+    """Store of the SVG directory without quota, for services created without a configured store."""
+    return ChartArtifactStore(LocalDirectoryBackend(SVG_DIR))
+
+def save_svg(chart_id: str, svg: str, artifact_store: ChartArtifactStore) -> str:
+    """
+    Persist rendered SVG markup to the chart artifact store.
+    
+    The markup is minified, and gzip and brotli variants are written next to
+    the file so the static mount serves them without compressing per request.
+    
+    Args:
+        chart_id: ID of the chart, used as file name
+        svg: SVG markup
+        artifact_store: Store the files are written to
+        
+    Returns:
+        Name of the written file
+    """
+    svg_name = svg_name_for(chart_id)
+    content = minify_svg(svg).encode("utf-8", errors="ignore")
+    artifact_store.write(svg_name, content)
+    for suffix, compressed in precompressed_variants(content).items():
+        artifact_store.write(svg_name + suffix, compressed)
+    return svg_name
+
+def canonical_render_config(config: dict[str, Any] | None) -> dict[str, Any]:
+    """
+    Return the configuration options that affect a rendered chart.
+    
+    Missing options take their ChartConfiguration defaults and the house
+    system is mapped to its identifier, so equivalent configurations match.
+    """
+    current_config = config if config is not None else ChartConfiguration().model_dump()
+    return {
+        "houses_system": map_house_system(current_config.get("houses_system", "P")),
+        "zodiac_type": current_config.get("zodiac_type"),
+        "sidereal_mode": current_config.get("sidereal_mode"),
+        "perspective_type": current_config.get("perspective_type"),
+        "active_points": current_config.get("active_points"),
+        "active_aspects": current_config.get("active_aspects"),
+    }
+
 class ChartVisualizationService:
     """Service for generating and saving chart visualizations."""
     
-    def __init__(self, settings: Settings):
-        """Initialize the chart visualization service with settings."""
+    def __init__(
+        self,
+        settings: Settings,
+        render_cache: RenderCache | None = None,
+        artifact_store: ChartArtifactStore | None = None,
+    ):
+        """
+        Initialize the chart visualization service with settings.
+        
+        Args:
+            settings: Application settings
+            render_cache: Optional cache of rendered SVGs shared by identical charts
+            artifact_store: Store the SVG files are saved to, the SVG directory if not given
+        """
         self.settings = settings
+        self.render_cache = render_cache
+        self.artifact_store = artifact_store if artifact_store is not None else default_artifact_store()
+    
+    def natal_render_key(
+        self,
+        name: str,
+        birth_date: datetime,
+        city: str | None = None,
+        nation: str | None = None,
+        lng: float | None = None,
+        lat: float | None = None,
+        tz_str: str | None = None,
+        theme: str = "dark",
+        chart_language: str = "EN",
+        config: dict[str, Any] | None = None,
+        subject: AstrologicalSubject | AstrologicalSubjectModel | None = None,
+    ) -> str:
+        """
+        Build the render cache key of a natal chart from the arguments of render_natal_chart_svg.
+        
+        When a precomputed subject is given, its birth data and calculation
+        settings are used instead of the birth data arguments.
+        """
+        if subject is not None:
+            subject_inputs = render_subject_inputs(
+                subject.name,
+                datetime(subject.year, subject.month, subject.day, subject.hour, subject.minute),
+                subject.city, subject.nation, subject.lng, subject.lat, subject.tz_str
+            )
+            subject_inputs.update(
+                houses_system=subject.houses_system_identifier,
+                zodiac_type=subject.zodiac_type,
+                sidereal_mode=subject.sidereal_mode,
+                perspective_type=subject.perspective_type
+            )
+        else:
+            subject_inputs = render_subject_inputs(name, birth_date, city, nation, lng, lat, tz_str)
+        return make_render_key("Natal", [subject_inputs], theme, chart_language, canonical_render_config(config))
+    
+    def synastry_render_key(
+        self,
+        name1: str,
+        birth_date1: datetime,
+        name2: str,
+        birth_date2: datetime,
+        city1: str | None = None,
+        nation1: str | None = None,
+        lng1: float | None = None,
+        lat1: float | None = None,
+        tz_str1: str | None = None,
+        city2: str | None = None,
+        nation2: str | None = None,
+        lng2: float | None = None,
+        lat2: float | None = None,
+        tz_str2: str | None = None,
+        theme: str = "dark",
+        chart_language: str = "EN",
+        config: dict[str, Any] | None = None,
+    ) -> str:
+        """Build the render cache key of a synastry chart from the arguments of render_synastry_chart_svg."""
+        subjects: List[dict[str, Any]] = [
+            render_subject_inputs(name1, birth_date1, city1, nation1, lng1, lat1, tz_str1),
+            render_subject_inputs(name2, birth_date2, city2, nation2, lng2, lat2, tz_str2),
+        ]
+        return make_render_key("Synastry", subjects, theme, chart_language, canonical_render_config(config))
+    
+    def publish_cached_svg(self, render_key: str, chart_id: str) -> bool:
+        """
+        Save a cached rendering as the static SVG file of a chart.
+        
+        Args:
+            render_key: Render cache key of the chart
+            chart_id: ID the SVG file is saved under
+            
+        Returns:
+            Whether the rendering was cached; if not, the chart still needs to be generated
+        """
+        if self.render_cache is None:
+            return False
+        svg = self.render_cache.get(render_key)
+        if svg is None:
+            return False
+        save_svg(chart_id, svg.decode("utf-8"), self.artifact_store)
+        logger.info(f"Chart {chart_id} served from the render cache")
+        return True
     
     def generate_natal_chart_svg(
         self,
@@ -80,9 +291,59 @@ class ChartVisualizationService:
         theme: str = "dark",
         chart_language: str = "EN",
         config: dict[str, Any] | None = None,
+        subject: AstrologicalSubject | AstrologicalSubjectModel | None = None,
     ) -> dict[str, str]:
         """
-        Generate a natal chart SVG visualization using Kerykeion.
+        Generate a natal chart SVG visualization and save it to the static SVG directory.
+        
+        Takes the arguments of render_natal_chart_svg, plus:
+            chart_id: Optional custom ID for the chart
+            
+        Returns:
+            Dictionary with chart_id and svg_url
+        """
+        # Generate a unique ID if not provided
+        if not chart_id:
+            chart_id = f"natal_{uuid.uuid4().hex[:8]}"
+        
+        svg = self.render_natal_chart_svg(
+            name=name,
+            birth_date=birth_date,
+            city=city,
+            nation=nation,
+            lng=lng,
+            lat=lat,
+            tz_str=tz_str,
+            theme=theme,
+            chart_language=chart_language,
+            config=config,
+            subject=subject
+        )
+        svg_name = save_svg(chart_id, svg, self.artifact_store)
+        logger.info(f"Chart saved as {svg_name}")
+        
+        # Return the chart ID and URL
+        return {
+            "chart_id": chart_id,
+            "svg_url": svg_url_for(chart_id)
+        }
+    
+    def render_natal_chart_svg(
+        self,
+        name: str,
+        birth_date: datetime,
+        city: str | None = None,
+        nation: str | None = None,
+        lng: float | None = None,
+        lat: float | None = None,
+        tz_str: str | None = None,
+        theme: str = "dark",
+        chart_language: str = "EN",
+        config: dict[str, Any] | None = None,
+        subject: AstrologicalSubject | AstrologicalSubjectModel | None = None,
+    ) -> str:
+        """
+        Render a natal chart SVG in memory using Kerykeion, without writing it to disk.
         
         Args:
             name: Name of the person
@@ -92,7 +353,6 @@ class ChartVisualizationService:
             lng: Longitude of birth place (optional)
             lat: Latitude of birth place (optional)
             tz_str: Timezone string (optional)
-            chart_id: Optional custom ID for the chart
             theme: Chart theme ("light", "dark", "dark-high-contrast", "classic")
             chart_language: Chart language (default: "EN")
             config: Chart configuration options
@@ -102,9 +362,11 @@ class ChartVisualizationService:
                 - perspective_type: Type of perspective ("Apparent Geocentric", "Heliocentric", "Topocentric", "True Geocentric")
                 - active_points: List of active planets and points
                 - active_aspects: List of active aspects with their orbs
+            subject: Precomputed subject of the chart; when given, the birth data
+                and calculation settings above are not used to recompute it
             
         Returns:
-            Dictionary with chart_id and svg_url
+            The SVG markup
         """
         try:
             # Use either the provided config or the default configuration
@@ -127,61 +389,56 @@ class ChartVisualizationService:
             active_points = current_config.get("active_points")
             active_aspects = current_config.get("active_aspects")
             
-            # Generate a unique ID if not provided
-            if not chart_id:
-                chart_id = f"natal_{uuid.uuid4().hex[:8]}"
-                
-            # Define the SVG file path
-            svg_path = os.path.join(SVG_DIR, f"{chart_id}.svg")
-            svg_path_obj = Path(svg_path)
+            # Return the cached rendering of identical inputs
+            render_key = None
+            if self.render_cache is not None:
+                render_key = self.natal_render_key(
+                    name, birth_date, city, nation, lng, lat, tz_str,
+                    theme, chart_language, config, subject
+                )
+                cached_svg = self.render_cache.get(render_key)
+                if cached_svg is not None:
+                    logger.info(f"Render cache hit for natal chart of {name}")
+                    return cached_svg.decode("utf-8")
             
             # Create the AstrologicalSubject with zodiac and house configuration
-            subject = AstrologicalSubject(
-                name=name,
-                year=birth_date.year,
-                month=birth_date.month,
-                day=birth_date.day,
-                hour=birth_date.hour,
-                minute=birth_date.minute,
-                city=city,
-                nation=nation,
-                lng=lng,
-                lat=lat,
-                tz_str=tz_str,
-                houses_system_identifier=houses_system,
-                zodiac_type=zodiac_type,
-                sidereal_mode=sidereal_mode,
-                perspective_type=perspective_type,
-                geonames_username=self.settings.GEONAMES_USERNAME,
-                online=bool(self.settings.GEONAMES_USERNAME)  # Use online mode when username is provided
-            )
+            # unless a precomputed one was given
+            if subject is None:
+                subject = AstrologicalSubject(
+                    name=name,
+                    year=birth_date.year,
+                    month=birth_date.month,
+                    day=birth_date.day,
+                    hour=birth_date.hour,
+                    minute=birth_date.minute,
+                    city=city,
+                    nation=nation,
+                    lng=lng,
+                    lat=lat,
+                    tz_str=tz_str,
+                    houses_system_identifier=houses_system,
+                    zodiac_type=zodiac_type,
+                    sidereal_mode=sidereal_mode,
+                    perspective_type=perspective_type,
+                    geonames_username=self.settings.GEONAMES_USERNAME,
+                    online=bool(self.settings.GEONAMES_USERNAME)  # Use online mode when username is provided
+                )
             
-            # Generate the SVG chart with custom output directory and configuration
+            # Generate the SVG chart with the configured points and aspects
             chart = KerykeionChartSVG(
                 subject, 
                 chart_type='Natal',
                 theme=theme,
                 chart_language=chart_language,
-                new_output_directory=str(Path(SVG_DIR)),
                 active_points=active_points,
                 active_aspects=active_aspects
             )
             
-            # Save the chart with a custom filename
-            # First create the chart's template
-            chart.template = chart.makeTemplate()
-            
-            # Write to custom path (overriding default behavior)
-            with open(svg_path, "w", encoding="utf-8", errors="ignore") as output_file:
-                output_file.write(chart.template)
-            
-            logger.info(f"Chart saved as {svg_path}")
-            
-            # Return the chart ID and URL
-            return {
-                "chart_id": chart_id,
-                "svg_url": f"/static/images/svg/{chart_id}.svg"
-            }
+            # Render the chart's template in memory
+            svg = render_chart_template(chart)
+            if render_key is not None:
+                self.render_cache.set(render_key, svg.encode("utf-8", errors="ignore"))
+            return svg
             
         except Exception as e:
             logger.error(f"Error generating chart visualization: {str(e)}", exc_info=True)
@@ -209,7 +466,68 @@ class ChartVisualizationService:
         config: dict[str, Any] | None = None,
     ) -> dict[str, str]:
         """
-        Generate a synastry chart SVG visualization using Kerykeion.
+        Generate a synastry chart SVG visualization and save it to the static SVG directory.
+        
+        Takes the arguments of render_synastry_chart_svg, plus:
+            chart_id: Optional custom ID for the chart
+            
+        Returns:
+            Dictionary with chart_id and svg_url
+        """
+        # Generate a unique ID if not provided
+        if not chart_id:
+            chart_id = f"synastry_{uuid.uuid4().hex[:8]}"
+        
+        svg = self.render_synastry_chart_svg(
+            name1=name1,
+            birth_date1=birth_date1,
+            name2=name2,
+            birth_date2=birth_date2,
+            city1=city1,
+            nation1=nation1,
+            lng1=lng1,
+            lat1=lat1,
+            tz_str1=tz_str1,
+            city2=city2,
+            nation2=nation2,
+            lng2=lng2,
+            lat2=lat2,
+            tz_str2=tz_str2,
+            theme=theme,
+            chart_language=chart_language,
+            config=config
+        )
+        svg_name = save_svg(chart_id, svg, self.artifact_store)
+        logger.info(f"Synastry chart saved as {svg_name}")
+        
+        # Return the chart ID and URL
+        return {
+            "chart_id": chart_id,
+            "svg_url": svg_url_for(chart_id)
+        }
+    
+    def render_synastry_chart_svg(
+        self,
+        name1: str,
+        birth_date1: datetime,
+        name2: str,
+        birth_date2: datetime,
+        city1: str | None = None,
+        nation1: str | None = None,
+        lng1: float | None = None,
+        lat1: float | None = None,
+        tz_str1: str | None = None,
+        city2: str | None = None,
+        nation2: str | None = None,
+        lng2: float | None = None,
+        lat2: float | None = None,
+        tz_str2: str | None = None,
+        theme: str = "dark",
+        chart_language: str = "EN",
+        config: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Render a synastry chart SVG in memory using Kerykeion, without writing it to disk.
         
         Args:
             name1: Name of the first person
@@ -218,7 +536,6 @@ class ChartVisualizationService:
             birth_date2: Birth date and time of the second person
             city1, nation1, lng1, lat1, tz_str1: Location data for first person
             city2, nation2, lng2, lat2, tz_str2: Location data for second person
-            chart_id: Optional custom ID for the chart
             theme: Chart theme ("light", "dark", "dark-high-contrast", "classic")
             chart_language: Chart language (default: "EN")
             config: Chart configuration options
@@ -230,7 +547,7 @@ class ChartVisualizationService:
                 - active_aspects: List of active aspects with their orbs
             
         Returns:
-            Dictionary with chart_id and svg_url
+            The SVG markup
         """
         try:
             # Use either the provided config or the default configuration
@@ -253,13 +570,19 @@ class ChartVisualizationService:
             active_points = current_config.get("active_points")
             active_aspects = current_config.get("active_aspects")
             
-            # Generate a unique ID if not provided
-            if not chart_id:
-                chart_id = f"synastry_{uuid.uuid4().hex[:8]}"
-                
-            # Define the SVG file path
-            svg_path = os.path.join(SVG_DIR, f"{chart_id}.svg")
-            svg_path_obj = Path(svg_path)
+            # Return the cached rendering of identical inputs
+            render_key = None
+            if self.render_cache is not None:
+                render_key = self.synastry_render_key(
+                    name1, birth_date1, name2, birth_date2,
+                    city1, nation1, lng1, lat1, tz_str1,
+                    city2, nation2, lng2, lat2, tz_str2,
+                    theme, chart_language, config
+                )
+                cached_svg = self.render_cache.get(render_key)
+                if cached_svg is not None:
+                    logger.info(f"Render cache hit for synastry chart of {name1} and {name2}")
+                    return cached_svg.decode("utf-8")
             
             # Create the first AstrologicalSubject with zodiac and house configuration
             subject1 = AstrologicalSubject(
@@ -303,33 +626,22 @@ class ChartVisualizationService:
                 online=bool(self.settings.GEONAMES_USERNAME)  # Use online mode when username is provided
             )
             
-            # Generate the SVG chart with custom output directory and configuration
+            # Generate the SVG chart with the configured points and aspects
             chart = KerykeionChartSVG(
                 subject1, 
                 chart_type='Synastry',
                 second_obj=subject2,
                 theme=theme,
                 chart_language=chart_language,
-                new_output_directory=str(Path(SVG_DIR)),
                 active_points=active_points,
                 active_aspects=active_aspects
             )
             
-            # Save the chart with a custom filename
-            # First create the chart's template
-            chart.template = chart.makeTemplate()
-            
-            # Write to custom path (overriding default behavior)
-            with open(svg_path, "w", encoding="utf-8", errors="ignore") as output_file:
-                output_file.write(chart.template)
-            
-            logger.info(f"Synastry chart saved as {svg_path}")
-            
-            # Return the chart ID and URL
-            return {
-                "chart_id": chart_id,
-                "svg_url": f"/static/images/svg/{chart_id}.svg"
-            }
+            # Render the chart's template in memory
+            svg = render_chart_template(chart)
+            if render_key is not None:
+                self.render_cache.set(render_key, svg.encode("utf-8", errors="ignore"))
+            return svg
             
         except Exception as e:
             logger.error(f"Error generating synastry chart visualization: {str(e)}", exc_info=True)
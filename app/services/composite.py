@@ -0,0 +1,196 @@
+"""Service for composite and Davison relationship charts."""
+import logging
+from datetime import datetime, timedelta
+from typing import List
+
+import numpy as np
+import pytz
+import swisseph as swe
+
+from app.core.exceptions import InvalidBirthDataError
+from app.schemas.natal_chart import NatalChartRequest, NatalChartResponse, PlanetPosition
+from app.services.aspect_engine import calculate_natal_aspects
+from app.services.astrology import AstrologyService
+from app.services.batch_ephemeris import assign_houses
+from app.services.chart_cache import to_utc_instant
+from app.services.chart_positions import (
+    HOUSE_POINTS,
+    NATAL_ASPECTS,
+    NATAL_ASPECT_POINTS,
+    RESPONSE_POINTS,
+    ZODIAC_SIGNS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Composite planets in response order, as named by Kerykeion
+COMPOSITE_PLANETS: List[str] = [key.title() for key, _ in RESPONSE_POINTS]
+
+def circular_midpoints(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Circular mean of pairs of longitudes, as Kerykeion's circular_mean.
+
+    Args:
+        first: Longitudes in degrees
+        second: Longitudes in degrees, same shape as first
+
+    Returns:
+        Midpoints in degrees, in [0, 360)
+    """
+    first_radians = np.radians(first)
+    second_radians = np.radians(second)
+    x = (np.cos(first_radians) + np.cos(second_radians)) / 2
+    y = (np.sin(first_radians) + np.sin(second_radians)) / 2
+    midpoints = np.mod(np.degrees(np.arctan2(y, x)), 360.0)
+    # Tiny negative angles round up to 360.0, which is 0 on the circle
+    return np.where(midpoints >= 360.0, 0.0, midpoints)
+
+def circular_sort(degrees: np.ndarray) -> np.ndarray:
+    """Sort degrees clockwise starting from the first one, as Kerykeion's circular_sort."""
+    distances = np.mod(np.mod(degrees[1:], 360) - np.mod(degrees[0], 360), 360)
+    return np.concatenate([degrees[:1], degrees[1:][np.argsort(distances, kind="stable")]])
+
+class CompositeService:
+    """Service building composite (midpoint) and Davison charts of two people."""
+
+    def __init__(self, astrology_service: AstrologyService):
+        """
+        Initialize the composite service.
+
+        Args:
+            astrology_service: Service providing (cached) natal positions and charts
+        """
+        self.astrology_service = astrology_service
+
+    def calculate_composite_chart(
+        self,
+        first: NatalChartRequest,
+        second: NatalChartRequest,
+        houses_system: str = "P",
+    ) -> NatalChartResponse:
+        """
+        Calculate the midpoint composite chart of two people.
+
+        Every planet, point and house cusp is the circular midpoint of the two
+        natal positions, matching Kerykeion's CompositeSubjectFactory. The
+        natal positions come from the chart cache when available, so building
+        a composite is only a few array operations.
+
+        Args:
+            first: Birth data of the first person
+            second: Birth data of the second person
+            houses_system: House system used for both charts
+
+        Returns:
+            Composite chart; its birth date is the midpoint of the two birth dates
+        """
+        first_positions, second_positions = self.astrology_service.calculate_positions([
+            first.model_copy(update={"houses_system": houses_system}),
+            second.model_copy(update={"houses_system": houses_system}),
+        ])
+        for positions in (first_positions, second_positions):
+            if isinstance(positions, Exception):
+                raise positions
+
+        logger.info(f"Calculating composite chart for {first.name} and {second.name}")
+        names = COMPOSITE_PLANETS + ["Ascendant", "Medium_Coeli"] + HOUSE_POINTS
+        midpoints = circular_midpoints(
+            np.array([first_positions[name] for name in names]),
+            np.array([second_positions[name] for name in names])
+        )
+        composite = dict(zip(names, midpoints.tolist()))
+
+        planet_count = len(COMPOSITE_PLANETS)
+        cusps = circular_sort(midpoints[-len(HOUSE_POINTS):])
+        houses = assign_houses(midpoints[None, :planet_count], cusps[None, :])[0].tolist()
+
+        planets = []
+        for (_, display_name), name, house in zip(RESPONSE_POINTS, COMPOSITE_PLANETS, houses):
+            longitude = composite[name]
+            planets.append(PlanetPosition(
+                name=display_name,
+                sign=ZODIAC_SIGNS[int(longitude // 30)],
+                position=longitude % 30,
+                house=house,
+                retrograde=False  # Composite points have no motion
+            ))
+
+        aspects = calculate_natal_aspects(
+            {point: composite[point] for point in NATAL_ASPECT_POINTS}, NATAL_ASPECTS
+        )
+
+        # Birth dates are local times, as for the positions; offsets are ignored
+        first_date = first.birth_date.replace(tzinfo=None)
+        second_date = second.birth_date.replace(tzinfo=None)
+        return NatalChartResponse(
+            name=f"{first.name} and {second.name} Composite Chart",
+            birth_date=first_date + (second_date - first_date) / 2,
+            planets=planets,
+            houses={i: cusp % 30 for i, cusp in enumerate(cusps.tolist(), 1)},
+            aspects=aspects,
+            house_system={
+                "name": swe.house_name(houses_system.encode("ascii")),
+                "identifier": houses_system
+            }
+        )
+
+    def calculate_davison_chart(
+        self,
+        first: NatalChartRequest,
+        second: NatalChartRequest,
+        houses_system: str = "P",
+    ) -> NatalChartResponse:
+        """
+        Calculate the Davison chart of two people.
+
+        The Davison chart is a real chart cast for the midpoint in time of the
+        two births, at the geographic midpoint of the two birth places.
+
+        Args:
+            first: Birth data of the first person
+            second: Birth data of the second person
+            houses_system: House system to use
+
+        Returns:
+            Davison chart; its birth date is the midpoint time in UTC
+        """
+        first_instant, first_lat, first_lng = self._resolve_birth(first)
+        second_instant, second_lat, second_lng = self._resolve_birth(second)
+
+        midpoint_instant = first_instant + (second_instant - first_instant) / 2
+        midpoint_instant = (midpoint_instant + timedelta(seconds=30)).replace(second=0, microsecond=0)
+        midpoint_lat = (first_lat + second_lat) / 2
+        midpoint_lng = float(circular_midpoints(np.array(first_lng % 360), np.array(second_lng % 360)))
+        if midpoint_lng >= 180:
+            midpoint_lng -= 360
+
+        logger.info(
+            f"Calculating Davison chart for {first.name} and {second.name}: "
+            f"{midpoint_instant} at {midpoint_lat:.4f}, {midpoint_lng:.4f}"
+        )
+        return self.astrology_service.calculate_natal_chart(
+            name=f"{first.name} and {second.name} Davison Chart",
+            birth_date=midpoint_instant.replace(tzinfo=None),
+            lng=midpoint_lng,
+            lat=midpoint_lat,
+            tz_str="UTC",
+            houses_system=houses_system
+        )
+
+    def _resolve_birth(self, request: NatalChartRequest) -> tuple[datetime, float, float]:
+        """Return the UTC birth instant, latitude and longitude, looking up the place if needed."""
+        if request.lng is not None and request.lat is not None and request.tz_str:
+            utc_instant = to_utc_instant(request.birth_date, request.tz_str)
+            if utc_instant is not None:
+                return utc_instant, request.lat, request.lng
+
+        subject = self.astrology_service._create_subject(
+            request.name, request.birth_date, request.city, request.nation,
+            request.lng, request.lat, request.tz_str, request.houses_system or "P"
+        )
+        local_datetime = pytz.timezone(subject.tz_str).localize(
+            request.birth_date.replace(tzinfo=None, second=0, microsecond=0), is_dst=False
+        )
+        if subject.lat is None or subject.lng is None:
+            raise InvalidBirthDataError(f"Could not resolve the birth place of {request.name}")
+        return local_datetime.astimezone(pytz.utc), subject.lat, subject.lng
@@ -0,0 +1,190 @@
+"""Bounded process pool for CPU-bound chart calculations."""
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, TypeVar
+
+from app.core.exceptions import ComputeCapacityError, ComputeTimeoutError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+def warm_worker() -> None:
+    """
+    Prepare a pool worker for chart calculations.
+
+    Imports Kerykeion and the Swiss Ephemeris and calculates one chart, so the
+    ephemeris files are open and the first real request pays no start-up cost.
+    """
+    from app.services.batch_ephemeris import compute_batch
+
+    compute_batch(julian_days=[2451545.0], lats=[51.48], lngs=[0.0], houses_systems=["P"])
+
+class ComputePool:
+    """
+    Process pool running chart math outside the event loop and its threadpool.
+
+    Calculations run in warm worker processes, so they do not compete with
+    I/O-bound requests for the GIL. Admission is bounded: when the pool
+    already holds max_pending calculations, or a route reaches its own
+    concurrency limit, new calls fail fast with ComputeCapacityError
+    (HTTP 503 with Retry-After) instead of queueing without bound. Calls
+    of a route with a timeout that do not finish in time fail with
+    ComputeTimeoutError; a call that already started keeps its worker and
+    its admission slot until it finishes, since workers cannot be interrupted.
+    Workers are spawned rather than forked, so they do not inherit the
+    server's threads or the locks they hold.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        route_limits: Dict[str, int] | None = None,
+        retry_after_seconds: int = 1,
+        warm: bool = True,
+        route_timeouts: Dict[str, float] | None = None,
+    ):
+        """
+        Initialize the compute pool.
+
+        Args:
+            max_workers: Number of worker processes (defaults to the CPU count)
+            max_pending: Maximum running plus queued calculations (defaults to 4 per worker)
+            route_limits: Maximum concurrent calculations per route name
+            retry_after_seconds: Retry-After value sent when the pool is saturated
+            warm: Whether workers preload Kerykeion and the ephemeris files on start
+            route_timeouts: Seconds a call of a route may take, queueing included
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 4 * self.max_workers
+        self.route_limits = dict(route_limits or {})
+        self.retry_after_seconds = retry_after_seconds
+        self.warm = warm
+        self.route_timeouts = dict(route_timeouts or {})
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending = 0
+        self._in_flight: Dict[str, int] = defaultdict(int)
+        self._completed: Dict[str, int] = defaultdict(int)
+        self._failed: Dict[str, int] = defaultdict(int)
+        self._rejected: Dict[str, int] = defaultdict(int)
+        self._timed_out: Dict[str, int] = defaultdict(int)
+        self._busy_seconds: Dict[str, float] = defaultdict(float)
+
+    async def run(self, route: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a calculation in a worker process.
+
+        Args:
+            route: Name the call is limited and reported under (e.g., "natal")
+            fn: Picklable module-level function to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            The result of fn
+
+        Raises:
+            ComputeCapacityError: If the pool or the route is saturated
+            ComputeTimeoutError: If the route has a timeout and the call did not finish in time
+        """
+        limit = self.route_limits.get(route)
+        if self._pending >= self.max_pending or (limit and self._in_flight[route] >= limit):
+            self._rejected[route] += 1
+            logger.warning(f"Compute pool saturated, rejecting {route} calculation")
+            raise ComputeCapacityError(retry_after=self.retry_after_seconds)
+
+        self._pending += 1
+        self._in_flight[route] += 1
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+
+        def release() -> None:
+            self._busy_seconds[route] += time.perf_counter() - started
+            self._pending -= 1
+            self._in_flight[route] -= 1
+
+        try:
+            future = self._get_executor().submit(functools.partial(fn, *args, **kwargs))
+            wrapped = asyncio.wrap_future(future)
+            done, _ = await asyncio.wait({wrapped}, timeout=self.route_timeouts.get(route))
+            if done:
+                result = wrapped.result()
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool for the next calls
+            logger.error("Compute pool worker died, restarting the pool")
+            self._failed[route] += 1
+            self._reset_executor()
+            release()
+            raise
+        except asyncio.CancelledError:
+            future.cancel()
+            release()
+            raise
+        except Exception:
+            self._failed[route] += 1
+            release()
+            raise
+
+        if not done:
+            self._timed_out[route] += 1
+            logger.warning(f"Compute pool {route} calculation timed out")
+            if future.cancel():
+                release()
+            else:
+                # Still running: keep the slot taken until the worker is free again
+                future.add_done_callback(lambda _future: loop.call_soon_threadsafe(release))
+            raise ComputeTimeoutError(f"Calculation did not finish within {self.route_timeouts[route]} seconds")
+        self._completed[route] += 1
+        release()
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, capacity and per-route counters."""
+        routes = {}
+        for route in sorted(set(self._in_flight) | set(self._rejected) | set(self.route_limits)):
+            finished = self._completed[route] + self._failed[route]
+            routes[route] = {
+                "limit": self.route_limits.get(route),
+                "in_flight": self._in_flight[route],
+                "completed": self._completed[route],
+                "failed": self._failed[route],
+                "rejected": self._rejected[route],
+                "timed_out": self._timed_out[route],
+                "average_seconds": self._busy_seconds[route] / finished if finished else 0.0,
+            }
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "queued": max(0, self._pending - self.max_workers),
+            "routes": routes,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self._reset_executor()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker processes on first use."""
+        if self._executor is None:
+            logger.info(f"Starting compute pool with {self.max_workers} workers")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=warm_worker if self.warm else None
+            )
+        return self._executor
+
+    def _reset_executor(self) -> None:
+        """Shut down the current executor without waiting for its workers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,187 @@
+"""Precomputed daily ephemeris table, stored as a memory-mapped NumPy array."""
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import swisseph as swe
+
+from app.services.batch_ephemeris import EPHE_PATH, EPHEMERIS_BODIES
+
+logger = logging.getLogger(__name__)
+
+# Format version of the table files; bump when the layout changes
+TABLE_VERSION = 1
+
+# Positions are tabulated in UT, so transit times need no Delta T correction
+TABLE_FLAGS = swe.FLG_SWIEPH + swe.FLG_SPEED
+
+# Julian day of the J2000 epoch, 2000-01-01 12:00 UTC
+J2000_JD = 2451545.0
+J2000_DATETIME = datetime(2000, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+def datetime_to_jd(moment: datetime) -> float:
+    """Convert a datetime (naive datetimes are taken as UTC) to a Julian day (UT)."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return J2000_JD + (moment - J2000_DATETIME) / timedelta(days=1)
+
+def jd_to_datetime(julian_day: float) -> datetime:
+    """Convert a Julian day (UT) to a timezone-aware UTC datetime."""
+    return J2000_DATETIME + timedelta(days=julian_day - J2000_JD)
+
+class EphemerisTable:
+    """
+    Daily longitudes and speeds of the transiting bodies.
+
+    The data array has shape (days, bodies, 2), holding the ecliptic longitude
+    and its speed in degrees per day for every body at 0:00 UT of each day.
+    """
+
+    __slots__ = ("start_jd", "step_days", "bodies", "data")
+
+    def __init__(self, start_jd: float, step_days: float, bodies: List[str], data: np.ndarray):
+        """
+        Args:
+            start_jd: Julian day (UT) of the first row
+            step_days: Interval between rows in days
+            bodies: Body keys, in column order
+            data: Longitudes and speeds, shape (days, bodies, 2)
+        """
+        self.start_jd = start_jd
+        self.step_days = step_days
+        self.bodies = bodies
+        self.data = data
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    @property
+    def end_jd(self) -> float:
+        """Julian day (UT) of the last row."""
+        return self.start_jd + (len(self) - 1) * self.step_days
+
+    def covers(self, start_jd: float, end_jd: float) -> bool:
+        """Whether the table covers the given range of Julian days."""
+        return self.start_jd <= start_jd and end_jd <= self.end_jd
+
+    def window(self, start_jd: float, end_jd: float, bodies: List[str]) -> tuple[np.ndarray, ...]:
+        """
+        Return the rows bracketing a range of Julian days for some bodies.
+
+        Args:
+            start_jd: Start of the range
+            end_jd: End of the range
+            bodies: Body keys to return, in order
+
+        Returns:
+            Tuple of Julian days (T,), longitudes (T, B) and speeds (T, B)
+        """
+        first = max(int(np.floor((start_jd - self.start_jd) / self.step_days)), 0)
+        last = min(int(np.ceil((end_jd - self.start_jd) / self.step_days)), len(self) - 1)
+        columns = [self.bodies.index(body) for body in bodies]
+        rows = np.asarray(self.data[first:last + 1, columns, :])
+        julian_days = self.start_jd + np.arange(first, last + 1) * self.step_days
+        return julian_days, rows[..., 0], rows[..., 1]
+
+def _replace_atomically(path: Path, write) -> None:
+    """Write a file through a temporary file renamed into place, so readers never see it partially written."""
+    temporary_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp{path.suffix}")
+    try:
+        write(temporary_path)
+        os.replace(temporary_path, path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+def build_ephemeris_table(path: str | Path, start_year: int, end_year: int) -> EphemerisTable:
+    """
+    Calculate a daily ephemeris table and write it to disk.
+
+    The array is written to a file named after a digest of its metadata,
+    next to path, and the manifest at path with a .json suffix is then
+    replaced to point at it. The manifest is the only file that changes
+    in place and is renamed into place in one step, so concurrent readers
+    always find metadata matching the array they map.
+
+    Args:
+        path: Path of the table; its manifest is written next to it as .json
+        start_year: First year of the table
+        end_year: Last year of the table (inclusive)
+
+    Returns:
+        The calculated table
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    swe.set_ephe_path(EPHE_PATH)
+
+    start_jd = swe.julday(start_year, 1, 1, 0.0)
+    end_jd = swe.julday(end_year + 1, 1, 1, 0.0)
+    julian_days = np.arange(start_jd, end_jd + 1)
+    bodies = [key for key, _ in EPHEMERIS_BODIES]
+    logger.info(f"Building ephemeris table for {start_year}-{end_year} ({len(julian_days)} days) at {path}")
+
+    data = np.empty((len(julian_days), len(bodies), 2), dtype=np.float64)
+    calc_ut = swe.calc_ut
+    for column, (_, body_id) in enumerate(EPHEMERIS_BODIES):
+        for row, julian_day in enumerate(julian_days.tolist()):
+            position = calc_ut(julian_day, body_id, TABLE_FLAGS)[0]
+            data[row, column, 0] = position[0]
+            data[row, column, 1] = position[3]
+
+    metadata = {
+        "version": TABLE_VERSION,
+        "start_year": start_year,
+        "end_year": end_year,
+        "start_jd": float(start_jd),
+        "step_days": 1.0,
+        "bodies": bodies,
+        "flags": TABLE_FLAGS,
+    }
+    digest = hashlib.sha256(json.dumps(metadata, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    data_path = path.with_name(f"{path.stem}.{digest}.npy")
+    _replace_atomically(data_path, lambda temporary_path: np.save(temporary_path, data))
+    manifest = {**metadata, "data_file": data_path.name}
+    _replace_atomically(path.with_suffix(".json"), lambda temporary_path: temporary_path.write_text(json.dumps(manifest)))
+
+    return EphemerisTable(float(start_jd), 1.0, bodies, data)
+
+def load_ephemeris_table(path: str | Path, start_year: int, end_year: int) -> EphemerisTable:
+    """
+    Memory-map an ephemeris table, building it first if it is missing or stale.
+
+    Args:
+        path: Path of the table, as given to build_ephemeris_table
+        start_year: First year the table must cover
+        end_year: Last year the table must cover
+
+    Returns:
+        The table, backed by a read-only memory map
+    """
+    path = Path(path)
+    metadata_path = path.with_suffix(".json")
+    expected_bodies = [key for key, _ in EPHEMERIS_BODIES]
+
+    if metadata_path.exists():
+        metadata = json.loads(metadata_path.read_text())
+        data_path = path.with_name(metadata.get("data_file", ""))
+        if (
+            "data_file" in metadata
+            and data_path.exists()
+            and metadata.get("version") == TABLE_VERSION
+            and metadata.get("bodies") == expected_bodies
+            and metadata.get("flags") == TABLE_FLAGS
+            and metadata.get("start_year", end_year + 1) <= start_year
+            and metadata.get("end_year", start_year - 1) >= end_year
+        ):
+            data = np.load(data_path, mmap_mode="r")
+            logger.debug(f"Memory-mapped ephemeris table {data_path} with {data.shape[0]} days")
+            return EphemerisTable(metadata["start_jd"], metadata["step_days"], metadata["bodies"], data)
+        logger.info(f"Ephemeris table {path} does not match the configured range, rebuilding")
+
+    build_ephemeris_table(path, start_year, end_year)
+    return load_ephemeris_table(path, start_year, end_year)
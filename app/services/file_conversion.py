@@ -1,6 +1,8 @@
+import hashlib
 import io
 import os
 import logging
+import sys
 from pathlib import Path
 from typing import Dict, Literal, Optional, BinaryIO, Union, Tuple
 
@@ -9,11 +11,12 @@ from PIL import Image
 
 from app.core.svg_utils import preprocess_svg_for_conversion
 from app.core.exceptions import FileConversionError
+from app.services.render_cache import RenderCache
 
 logger = logging.getLogger(__name__)
 
 # Supported output formats
-OutputFormat = Literal["svg", "png", "pdf", "jpg"]
+OutputFormat = Literal["svg", "png", "pdf", "jpg", "webp", "avif"]
 
 # Content type mapping for HTTP responses
 CONTENT_TYPE_MAP: Dict[str, str] = {
@@ -21,7 +24,9 @@ CONTENT_TYPE_MAP: Dict[str, str] = {
     "png": "image/png",
     "pdf": "application/pdf",
     "jpg": "image/jpeg",
-    "jpeg": "image/jpeg"
+    "jpeg": "image/jpeg",
+    "webp": "image/webp",
+    "avif": "image/avif"
 }
 
 # File extension mapping (normalized)
@@ -30,34 +35,158 @@ FILE_EXTENSION_MAP: Dict[str, str] = {
     "png": "png",
     "pdf": "pdf",
     "jpg": "jpg",
-    "jpeg": "jpg"
+    "jpeg": "jpg",
+    "webp": "webp",
+    "avif": "avif"
 }
 
+# Pillow encoders of the formats encoded from the rendered pixels, by file extension
+PILLOW_FORMATS: Dict[str, str] = {
+    "jpg": "JPEG",
+    "webp": "WEBP",
+    "avif": "AVIF"
+}
+
+# Bump when the conversion pipeline changes in a way that alters the output
+CONVERSION_CACHE_VERSION = 2
+
+def make_conversion_key(
+    svg_content: Union[str, bytes],
+    output_format: OutputFormat,
+    dpi: int = 96,
+    quality: int = 90
+) -> str:
+    """
+    Build the conversion cache key of an SVG from its SHA-256 and the conversion options.
+
+    The key also serves as the ETag of the converted file.
+
+    Args:
+        svg_content: The SVG content as a string or bytes
+        output_format: The desired output format (svg, png, pdf, jpg, webp, avif)
+        dpi: The resolution in dots per inch (for raster formats)
+        quality: The quality of lossy formats (jpg, webp, avif)
+
+    Returns:
+        Hex digest identifying the converted file
+    """
+    if isinstance(svg_content, str):
+        svg_content = svg_content.encode("utf-8")
+    svg_digest = hashlib.sha256(svg_content).hexdigest()
+    output_format = FILE_EXTENSION_MAP.get(output_format, output_format)
+    options = f"{CONVERSION_CACHE_VERSION}:{svg_digest}:{output_format}:{dpi}:{quality}"
+    return hashlib.sha256(options.encode("utf-8")).hexdigest()
+
+def rasterize_svg(svg_bytes: bytes, dpi: int = 96) -> Image.Image:
+    """
+    Render an SVG onto a cairo image surface and hand its pixels to Pillow.
+
+    cairosvg's svg2png encodes the surface as PNG, which Pillow would decode
+    again before encoding the target format. Here Image.frombuffer reads the
+    surface buffer in place instead, unpacking cairo's premultiplied,
+    native-endian ARGB32 into RGBA in a single pass.
+
+    Args:
+        svg_bytes: The preprocessed SVG content
+        dpi: The resolution in dots per inch
+
+    Returns:
+        The rendered chart as an RGBA image
+    """
+    surface = cairosvg.surface.PNGSurface(cairosvg.parser.Tree(bytestring=svg_bytes), None, dpi)
+    try:
+        image_surface = surface.cairo
+        image_surface.flush()
+        if sys.byteorder != "little":
+            # Pillow has no unpacker of premultiplied big-endian ARGB
+            png_buffer = io.BytesIO()
+            image_surface.write_to_png(png_buffer)
+            png_buffer.seek(0)
+            with Image.open(png_buffer) as png_image:
+                return png_image.convert("RGBA")
+        # frombuffer unpacks the pixels immediately, before the surface is finished
+        return Image.frombuffer(
+            "RGBA",
+            (image_surface.get_width(), image_surface.get_height()),
+            image_surface.get_data(),
+            "raw",
+            "BGRa",
+            image_surface.get_stride(),
+            1
+        )
+    finally:
+        surface.finish()
+
+def encode_image(image: Image.Image, output_format: OutputFormat, sink: BinaryIO, quality: int = 90) -> None:
+    """
+    Encode a rendered chart with Pillow.
+
+    Args:
+        image: The rendered chart as an RGBA image
+        output_format: One of the formats in PILLOW_FORMATS (jpg, jpeg, webp, avif)
+        sink: Binary file object the output is written to
+        quality: The quality of the lossy encoding
+    """
+    pillow_format = PILLOW_FORMATS[FILE_EXTENSION_MAP[output_format]]
+    if pillow_format == "JPEG":
+        image = image.convert("RGB")  # Remove alpha channel
+    image.save(sink, format=pillow_format, quality=quality)
+
 
 class FileConversionService:
     """Service for converting files between different formats."""
 
-    def __init__(self):
-        """Initialize the FileConversionService."""
-        pass
+    def __init__(self, cache: Optional[RenderCache] = None):
+        """
+        Initialize the FileConversionService.
+
+        Args:
+            cache: Optional cache of converted files by conversion key
+        """
+        self.cache = cache
 
     def convert_svg_to_format(
         self,
         svg_content: Union[str, bytes],
         output_format: OutputFormat,
-        dpi: int = 96
+        dpi: int = 96,
+        quality: int = 90
     ) -> Tuple[bytes, str]:
         """
         Convert SVG content to the specified format.
 
+        Conversions are cached by make_conversion_key, so converting the same
+        SVG again with the same options costs a hash lookup instead of a
+        cairo render.
+
         Args:
             svg_content: The SVG content as a string or bytes
-            output_format: The desired output format (svg, png, pdf, jpg)
+            output_format: The desired output format (svg, png, pdf, jpg, webp, avif)
             dpi: The resolution in dots per inch (for raster formats)
+            quality: The quality of lossy formats (jpg, webp, avif)
 
         Returns:
             Tuple[bytes, str]: The converted content as bytes and the appropriate content type
         """
+        if self.cache is None or output_format not in CONTENT_TYPE_MAP:
+            return self._convert_svg(svg_content, output_format, dpi, quality)
+
+        cache_key = make_conversion_key(svg_content, output_format, dpi, quality)
+        output_bytes = self.cache.get(cache_key)
+        if output_bytes is not None:
+            return output_bytes, CONTENT_TYPE_MAP[output_format]
+        output_bytes, content_type = self._convert_svg(svg_content, output_format, dpi, quality)
+        self.cache.set(cache_key, output_bytes)
+        return output_bytes, content_type
+
+    def _convert_svg(
+        self,
+        svg_content: Union[str, bytes],
+        output_format: OutputFormat,
+        dpi: int,
+        quality: int
+    ) -> Tuple[bytes, str]:
+        """Convert SVG content to the specified format without the cache."""
         if isinstance(svg_content, bytes):
             svg_content = svg_content.decode("utf-8")
 
@@ -83,22 +212,13 @@ class FileConversionService:
                 )
                 return output_bytes, CONTENT_TYPE_MAP["pdf"]
             
-            elif output_format in ("jpg", "jpeg"):
-                # CairoSVG doesn't directly support JPEG output,
-                # so we convert to PNG first and then to JPEG
-                png_bytes = cairosvg.svg2png(
-                    bytestring=processed_svg.encode("utf-8"),
-                    dpi=dpi
-                )
-                
-                # Use PIL to convert PNG to JPEG
-                with Image.open(io.BytesIO(png_bytes)) as img:
-                    img = img.convert("RGB")  # Remove alpha channel
-                    jpeg_buffer = io.BytesIO()
-                    img.save(jpeg_buffer, format="JPEG", quality=90)
-                    jpeg_bytes = jpeg_buffer.getvalue()
-                
-                return jpeg_bytes, CONTENT_TYPE_MAP["jpg"]
+            elif FILE_EXTENSION_MAP.get(output_format) in PILLOW_FORMATS:
+                # CairoSVG doesn't directly support these formats,
+                # so Pillow encodes the pixels cairo rendered
+                image = rasterize_svg(processed_svg.encode("utf-8"), dpi)
+                output_buffer = io.BytesIO()
+                encode_image(image, output_format, output_buffer, quality)
+                return output_buffer.getvalue(), CONTENT_TYPE_MAP[output_format]
             
             else:
                 raise FileConversionError(f"Unsupported output format: {output_format}")
@@ -107,6 +227,87 @@ class FileConversionService:
             logger.error(f"Error converting SVG to {output_format}: {str(e)}", exc_info=True)
             raise FileConversionError(f"Failed to convert SVG to {output_format}: {str(e)}") from e
 
+    def convert_svg_to_file(
+        self,
+        svg_content: Union[str, bytes],
+        output_format: OutputFormat,
+        sink: BinaryIO,
+        dpi: int = 96,
+        quality: int = 90
+    ) -> str:
+        """
+        Convert SVG content to the specified format, writing the output to a file object.
+
+        cairosvg writes straight into the sink and each intermediate buffer is
+        released once the next stage has consumed it, so peak memory follows
+        the size of the output rather than holding every stage at once. JPEG,
+        WebP and AVIF output is encoded by Pillow from the pixels cairo
+        rendered, see rasterize_svg.
+
+        Args:
+            svg_content: The SVG content as a string or bytes
+            output_format: The desired output format (svg, png, pdf, jpg, webp, avif)
+            sink: Binary file object the output is written to
+            dpi: The resolution in dots per inch (for raster formats)
+            quality: The quality of lossy formats (jpg, webp, avif)
+
+        Returns:
+            str: The content type of the output
+        """
+        if isinstance(svg_content, bytes):
+            svg_content = svg_content.decode("utf-8")
+
+        try:
+            processed_svg = preprocess_svg_for_conversion(svg_content)
+            svg_bytes = processed_svg.encode("utf-8")
+            del processed_svg
+
+            if output_format == "svg":
+                sink.write(svg_bytes)
+                return CONTENT_TYPE_MAP["svg"]
+
+            if output_format == "png":
+                cairosvg.svg2png(bytestring=svg_bytes, dpi=dpi, write_to=sink)
+                return CONTENT_TYPE_MAP["png"]
+
+            elif output_format == "pdf":
+                cairosvg.svg2pdf(bytestring=svg_bytes, dpi=dpi, write_to=sink)
+                return CONTENT_TYPE_MAP["pdf"]
+
+            elif FILE_EXTENSION_MAP.get(output_format) in PILLOW_FORMATS:
+                image = rasterize_svg(svg_bytes, dpi)
+                del svg_bytes
+                encode_image(image, output_format, sink, quality)
+                return CONTENT_TYPE_MAP[output_format]
+
+            else:
+                raise FileConversionError(f"Unsupported output format: {output_format}")
+
+        except Exception as e:
+            logger.error(f"Error converting SVG to {output_format}: {str(e)}", exc_info=True)
+            raise FileConversionError(f"Failed to convert SVG to {output_format}: {str(e)}") from e
+
+    def render_svg_to_png(self, svg_content: Union[str, bytes], width: int) -> bytes:
+        """
+        Rasterize SVG content to a PNG of a given width, keeping its aspect ratio.
+
+        Args:
+            svg_content: The SVG content as a string or bytes
+            width: Width of the PNG in pixels
+
+        Returns:
+            bytes: The PNG content
+        """
+        if isinstance(svg_content, bytes):
+            svg_content = svg_content.decode("utf-8")
+
+        try:
+            processed_svg = preprocess_svg_for_conversion(svg_content)
+            return cairosvg.svg2png(bytestring=processed_svg.encode("utf-8"), output_width=width)
+        except Exception as e:
+            logger.error(f"Error rendering SVG to a {width} px PNG: {str(e)}", exc_info=True)
+            raise FileConversionError(f"Failed to render SVG to a {width} px PNG: {str(e)}") from e
+
     def convert_svg_file_to_format(
         self,
         svg_file_path: Union[str, Path],
@@ -119,7 +320,7 @@ class FileConversionService:
 
         Args:
             svg_file_path: Path to the SVG file
-            output_format: The desired output format (svg, png, pdf, jpg)
+            output_format: The desired output format (svg, png, pdf, jpg, webp, avif)
             output_file_path: Optional path for the output file. If not provided,
                             uses the original filename with the new extension.
             dpi: The resolution in dots per inch (for raster formats)
@@ -0,0 +1,155 @@
+"""Chart file conversions in a bounded process pool, off the event loop."""
+import logging
+import os
+import tempfile
+from functools import lru_cache
+from typing import BinaryIO, Tuple, Union
+
+from app.core.exceptions import ImageTooLargeError
+from app.core.svg_utils import svg_pixel_size
+from app.services.compute_pool import ComputePool
+from app.services.file_conversion import (
+    CONTENT_TYPE_MAP,
+    FILE_EXTENSION_MAP,
+    FileConversionService,
+    OutputFormat,
+    make_conversion_key,
+)
+from app.services.render_cache import RenderCache
+
+logger = logging.getLogger(__name__)
+
+# Formats rasterized to a bitmap, whose memory grows with the pixel count
+RASTER_FORMATS = ("png", "jpg", "webp", "avif")
+
+def conversion_route(output_format: str) -> str:
+    """Compute pool route of conversions to a format, limited separately per format."""
+    return f"convert_{FILE_EXTENSION_MAP.get(output_format, output_format)}"
+
+@lru_cache(maxsize=1)
+def _worker_conversion_service() -> FileConversionService:
+    """Conversion service of a pool worker; results are cached by the calling process."""
+    return FileConversionService()
+
+def convert_in_worker(svg: bytes, output_format: OutputFormat, dpi: int, quality: int, path: str) -> str:
+    """
+    Convert an SVG into a file in a compute pool worker with cairosvg and Pillow.
+
+    Only the path crosses the process boundary, not the output. The file is
+    created by the caller and opened without creating it, so a conversion
+    that finishes after its caller gave up and deleted the file leaves
+    nothing behind.
+
+    Returns:
+        The content type of the output
+    """
+    with open(path, "r+b") as sink:
+        return _worker_conversion_service().convert_svg_to_file(svg, output_format, sink, dpi=dpi, quality=quality)
+
+class RasterizationEngine:
+    """
+    Converts chart SVGs to PNG, PDF, JPG, WebP and AVIF in a dedicated process pool.
+
+    cairosvg and Pillow run in worker processes, so a large export neither
+    blocks the event loop nor competes with requests for the GIL. The pool
+    limits concurrent conversions per format and times out slow ones;
+    raster conversions whose output would exceed max_pixels are rejected
+    before they reach a worker. Workers write the output to a file that is
+    moved into the disk tier of the cache by make_conversion_key and
+    streamed from there, so no process holds a whole export in memory and
+    repeated downloads skip the pool.
+    """
+
+    def __init__(
+        self,
+        compute_pool: ComputePool,
+        cache: RenderCache | None = None,
+        max_pixels: int | None = 40_000_000,
+    ):
+        """
+        Initialize the rasterization engine.
+
+        Args:
+            compute_pool: Pool running the conversions, with routes from conversion_route
+            cache: Optional disk cache of converted files by conversion key
+            max_pixels: Maximum width times height of raster output (None for no limit)
+        """
+        self.compute_pool = compute_pool
+        self.cache = cache
+        self.max_pixels = max_pixels
+
+    def check_size(self, svg: str, output_format: str, dpi: int) -> None:
+        """
+        Reject raster conversions whose output would exceed max_pixels.
+
+        Raises:
+            ImageTooLargeError: If the estimated output has more than max_pixels pixels
+        """
+        if self.max_pixels is None or FILE_EXTENSION_MAP.get(output_format) not in RASTER_FORMATS:
+            return
+        size = svg_pixel_size(svg, dpi)
+        if size is None:
+            return
+        width, height = size
+        if width * height > self.max_pixels:
+            raise ImageTooLargeError(
+                f"A {round(width)}x{round(height)} px {output_format} exceeds the limit of "
+                f"{self.max_pixels} pixels; lower the DPI"
+            )
+
+    async def open_conversion(
+        self,
+        svg_content: Union[str, bytes],
+        output_format: OutputFormat,
+        dpi: int = 96,
+        quality: int = 90,
+    ) -> Tuple[BinaryIO, str]:
+        """
+        Convert SVG content to a format in the process pool and open the converted file.
+
+        Args:
+            svg_content: The SVG content as a string or bytes
+            output_format: The desired output format (svg, png, pdf, jpg, webp, avif)
+            dpi: The resolution in dots per inch
+            quality: The quality of lossy formats (jpg, webp, avif)
+
+        Returns:
+            The converted file opened for reading, which the caller closes, and its content type
+
+        Raises:
+            ImageTooLargeError: If the raster output would exceed max_pixels
+            ComputeCapacityError: If the format's concurrency limit or the pool is saturated
+            ComputeTimeoutError: If the conversion does not finish within the timeout
+            FileConversionError: If the conversion fails
+        """
+        svg = svg_content.encode("utf-8") if isinstance(svg_content, str) else svg_content
+        self.check_size(svg.decode("utf-8", errors="ignore"), output_format, dpi)
+
+        cache_key = None
+        staging_directory = None
+        if self.cache is not None and output_format in CONTENT_TYPE_MAP:
+            cache_key = make_conversion_key(svg, output_format, dpi, quality)
+            cached = self.cache.open(cache_key)
+            if cached is not None:
+                return cached, CONTENT_TYPE_MAP[output_format]
+            # Staged in the cache directory so the finished file is moved, not copied
+            staging_directory = self.cache.directory
+            staging_directory.mkdir(parents=True, exist_ok=True)
+
+        descriptor, path = tempfile.mkstemp(suffix=".tmp", dir=staging_directory)
+        os.close(descriptor)
+        try:
+            content_type = await self.compute_pool.run(
+                conversion_route(output_format), convert_in_worker, svg, output_format, dpi, quality, path
+            )
+            output = open(path, "rb")
+        except BaseException:
+            os.unlink(path)
+            raise
+
+        # The open file stays readable after it is moved into the cache or deleted
+        if cache_key is not None:
+            self.cache.set_file(cache_key, path)
+        else:
+            os.unlink(path)
+        return output, content_type
@@ -0,0 +1,310 @@
+"""Content-addressed cache for rendered chart SVGs."""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List
+
+from app.services.chart_cache import ChartCache
+
+logger = logging.getLogger(__name__)
+
+# Bump when the rendering pipeline changes in a way that alters the output
+RENDER_CACHE_VERSION = 1
+
+# Renderings of another Kerykeion version may differ
+KERYKEION_VERSION = version("kerykeion")
+
+def render_subject_inputs(
+    name: str,
+    birth_date: datetime,
+    city: str | None = None,
+    nation: str | None = None,
+    lng: float | None = None,
+    lat: float | None = None,
+    tz_str: str | None = None,
+) -> Dict[str, Any]:
+    """
+    Canonical inputs of one subject drawn on a chart.
+
+    Kerykeion ignores seconds, so the birth date is kept to the minute.
+    """
+    return {
+        "name": name,
+        "birth_date": birth_date.replace(tzinfo=None, second=0, microsecond=0).isoformat(),
+        "city": city,
+        "nation": nation,
+        "lng": lng,
+        "lat": lat,
+        "tz_str": tz_str,
+    }
+
+def make_render_key(
+    chart_type: str,
+    subjects: List[Dict[str, Any]],
+    theme: str,
+    chart_language: str,
+    config: Dict[str, Any],
+) -> str:
+    """
+    Build a hash of every input that determines a rendered chart.
+
+    Args:
+        chart_type: Type of chart ("Natal" or "Synastry")
+        subjects: Subject inputs from render_subject_inputs, in chart order
+        theme: Chart theme
+        chart_language: Chart language
+        config: Chart configuration, with the house system already mapped to its identifier
+
+    Returns:
+        Hex digest identifying the rendered SVG
+    """
+    payload = {
+        "version": RENDER_CACHE_VERSION,
+        "kerykeion": KERYKEION_VERSION,
+        "chart_type": chart_type,
+        "subjects": subjects,
+        "theme": theme,
+        "language": chart_language.upper(),
+        "config": config,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class RenderCache:
+    """
+    Two-tier cache of rendered SVGs by render key.
+
+    Hot renders are kept in a bounded in-memory LRU; every render is also
+    written to a disk directory bounded by total size, where the least
+    recently used files are evicted. Disk entries survive restarts and are
+    shared by all workers using the same directory: a key missing from the
+    index is looked up on disk and adopted, and the directory is rescanned
+    every rescan_interval_seconds, so entries written by other processes
+    are found and counted towards disk_bytes. The conversion cache of
+    FileConversionService uses the same tiers for converted files.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        memory_entries: int = 256,
+        memory_bytes: int = 64 * 1024 * 1024,
+        disk_bytes: int = 512 * 1024 * 1024,
+        suffix: str = ".svg",
+        rescan_interval_seconds: float = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the render cache.
+
+        Args:
+            directory: Directory of the disk tier
+            memory_entries: Maximum number of SVGs kept in memory
+            memory_bytes: Maximum total size of the SVGs kept in memory
+            disk_bytes: Maximum total size of the SVGs kept on disk
+            suffix: File name suffix of the disk entries
+            rescan_interval_seconds: Minimum time between rescans of the disk directory
+            clock: Monotonic time function, injectable for testing
+        """
+        self.directory = Path(directory)
+        self.suffix = suffix
+        self.disk_bytes = disk_bytes
+        self.rescan_interval_seconds = rescan_interval_seconds
+        self._clock = clock
+        self._last_scan = 0.0
+        self._memory = ChartCache(max_entries=memory_entries, max_bytes=memory_bytes, ttl_seconds=None)
+        self._disk: "OrderedDict[str, int] | None" = None
+        self._disk_size = 0
+        self._lock = threading.Lock()
+        self._disk_hits = 0
+        self._disk_evictions = 0
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached SVG for a render key, or None on a miss."""
+        svg = self._memory.get(key)
+        if svg is not None:
+            return svg
+
+        path = self._path(key)
+        with self._lock:
+            if not self._touch_disk_entry(key, path):
+                return None
+
+        try:
+            svg = path.read_bytes()
+            os.utime(path)  # Keep the LRU order across restarts
+        except FileNotFoundError:
+            # Evicted by another worker sharing the directory
+            with self._lock:
+                self._forget(key)
+            return None
+
+        with self._lock:
+            self._disk_hits += 1
+        self._memory.set(key, svg, len(svg))
+        return svg
+
+    def set(self, key: str, svg: bytes) -> None:
+        """
+        Store a rendered SVG in both tiers, evicting least recently used files as needed.
+
+        Args:
+            key: Render key from make_render_key
+            svg: SVG document encoded as UTF-8
+        """
+        self._memory.set(key, svg, len(svg))
+        if len(svg) > self.disk_bytes:
+            return
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        temporary_path.write_bytes(svg)
+        os.replace(temporary_path, path)
+
+        with self._lock:
+            disk = self._load_disk_index()
+            self._forget(key)
+            disk[key] = len(svg)
+            self._disk_size += len(svg)
+            self._evict_disk()
+
+    def open(self, key: str) -> BinaryIO | None:
+        """
+        Open the disk entry of a key for reading, or return None on a miss.
+
+        For large entries streamed to clients: the memory tier is skipped, and
+        the open file stays readable even if the entry is evicted meanwhile.
+        """
+        path = self._path(key)
+        with self._lock:
+            if not self._touch_disk_entry(key, path):
+                return None
+
+        try:
+            file = open(path, "rb")
+            os.utime(path)  # Keep the LRU order across restarts
+        except FileNotFoundError:
+            # Evicted by another worker sharing the directory
+            with self._lock:
+                self._forget(key)
+            return None
+
+        with self._lock:
+            self._disk_hits += 1
+        return file
+
+    def set_file(self, key: str, path: str | Path) -> None:
+        """
+        Move a finished file into the disk tier without reading it, evicting least recently used files as needed.
+
+        The file must be on the same filesystem as the cache directory. Files
+        larger than the disk tier are deleted instead.
+
+        Args:
+            key: Cache key
+            path: Path of the file, which is moved into the cache
+        """
+        size = os.path.getsize(path)
+        if size > self.disk_bytes:
+            os.unlink(path)
+            return
+
+        cache_path = self._path(key)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(path, cache_path)
+
+        with self._lock:
+            disk = self._load_disk_index()
+            self._forget(key)
+            disk[key] = size
+            self._disk_size += size
+            self._evict_disk()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return usage statistics of both tiers."""
+        memory = self._memory.stats()
+        with self._lock:
+            disk = self._load_disk_index()
+            return {
+                "memory_entries": memory["entries"],
+                "memory_bytes": memory["size_bytes"],
+                "memory_hits": memory["hits"],
+                "memory_evictions": memory["evictions"],
+                "disk_entries": len(disk),
+                "disk_bytes": self._disk_size,
+                "max_disk_bytes": self.disk_bytes,
+                "disk_hits": self._disk_hits,
+                "disk_evictions": self._disk_evictions,
+            }
+
+    def _path(self, key: str) -> Path:
+        """Path of the disk entry of a key, sharded by its first two characters."""
+        return self.directory / key[:2] / f"{key}{self.suffix}"
+
+    def _touch_disk_entry(self, key: str, path: Path) -> bool:
+        """
+        Move a key to the end of the disk LRU order; return whether it is on disk.
+
+        Keys the index does not hold are looked up on disk, where another
+        process may have written them, and adopted. The caller must hold the lock.
+        """
+        disk = self._load_disk_index()
+        if key in disk:
+            disk.move_to_end(key)
+            return True
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return False
+        disk[key] = size
+        self._disk_size += size
+        self._evict_disk()
+        return key in disk
+
+    def _load_disk_index(self) -> "OrderedDict[str, int]":
+        """
+        Index the disk tier by modification time, on first use and then every rescan interval.
+
+        A rescan counts the entries other processes wrote and evicts the
+        least recently used ones beyond disk_bytes. The caller must hold the lock.
+        """
+        now = self._clock()
+        if self._disk is None or now - self._last_scan >= self.rescan_interval_seconds:
+            self._last_scan = now
+            files = []
+            if self.directory.exists():
+                for path in self.directory.glob(f"*/*{self.suffix}"):
+                    try:
+                        stat = path.stat()
+                    except FileNotFoundError:
+                        continue
+                    files.append((stat.st_mtime, path.name[:-len(self.suffix)], stat.st_size))
+            files.sort()
+            self._disk = OrderedDict((key, size) for _, key, size in files)
+            self._disk_size = sum(size for _, _, size in files)
+            logger.info(f"Render cache holds {len(files)} files ({self._disk_size} bytes) in {self.directory}")
+            self._evict_disk()
+        return self._disk
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used disk entries until within the size limit; the caller must hold the lock."""
+        while self._disk_size > self.disk_bytes:
+            oldest_key = next(iter(self._disk))
+            self._forget(oldest_key)
+            self._path(oldest_key).unlink(missing_ok=True)
+            self._disk_evictions += 1
+
+    def _forget(self, key: str) -> None:
+        """Remove a key from the disk index; the caller must hold the lock."""
+        size = self._disk.pop(key, None) if self._disk is not None else None
+        if size is not None:
+            self._disk_size -= size
@@ -0,0 +1,176 @@
+"""Registry of background chart rendering jobs."""
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Set
+
+from starlette.concurrency import run_in_threadpool
+
+from app.services.render_queue import (
+    DONE,
+    FAILED,
+    PRIORITY_API,
+    QUEUED,
+    RUNNING,
+    RenderJob,
+    RenderQueue,
+)
+
+logger = logging.getLogger(__name__)
+
+class RenderJobRegistry:
+    """
+    Async view of the render queue by chart_id.
+
+    Jobs are submitted to the durable render queue and rendered by the render
+    worker processes. Clients can wait for a job to finish instead of polling
+    the SVG URL, and subscribe to a stream of finished jobs. While anyone is
+    waiting, a single watcher polls the queue for finished jobs and wakes
+    them, however many waiters there are.
+    """
+
+    def __init__(self, queue: RenderQueue, poll_interval: float = 0.25, latency_window: int = 1000):
+        """
+        Initialize the job registry.
+
+        Args:
+            queue: Durable queue the jobs are stored in
+            poll_interval: Seconds between checks for finished jobs while anyone is waiting
+            latency_window: Number of recent render times used for latency statistics
+        """
+        self.queue = queue
+        self.poll_interval = poll_interval
+        self.latency_window = latency_window
+        self._waiters: Dict[str, asyncio.Event] = {}
+        self._waiter_counts: Dict[str, int] = {}
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._watcher: asyncio.Task | None = None
+
+    async def submit(
+        self,
+        chart_id: str,
+        chart_type: str,
+        svg_url: str,
+        render: Dict[str, Any],
+        priority: int = PRIORITY_API
+    ) -> RenderJob:
+        """
+        Queue the rendering of a chart.
+
+        Args:
+            chart_id: ID of the chart to render
+            chart_type: Type of chart ("natal" or "synastry")
+            svg_url: URL of the SVG once rendered
+            render: Keyword arguments of the rendering method
+            priority: PRIORITY_WEB, PRIORITY_API or PRIORITY_BATCH
+        """
+        return await run_in_threadpool(self.queue.enqueue, chart_id, chart_type, svg_url, render, priority)
+
+    async def complete(self, chart_id: str, chart_type: str, svg_url: str) -> RenderJob:
+        """Record a job that is done without rendering, e.g. when it was served from a cache."""
+        return await run_in_threadpool(self.queue.record_done, chart_id, chart_type, svg_url)
+
+    async def get(self, chart_id: str) -> RenderJob | None:
+        """Return the latest job of a chart, or None if it is unknown."""
+        return await run_in_threadpool(self.queue.get, chart_id)
+
+    async def retry(self, chart_id: str) -> RenderJob | None:
+        """Queue a dead-lettered job again, or return None if the chart's job has not failed."""
+        return await run_in_threadpool(self.queue.retry, chart_id)
+
+    async def failed(self, limit: int = 100) -> List[RenderJob]:
+        """Return the dead-lettered jobs, most recent first."""
+        return await run_in_threadpool(self.queue.failed_jobs, limit)
+
+    async def wait(self, chart_id: str, timeout: float) -> RenderJob | None:
+        """
+        Wait until the job of a chart finishes or the timeout expires.
+
+        Returns:
+            The job in its current state, or None if it is unknown
+        """
+        job = await self.get(chart_id)
+        if job is None or job.is_finished or timeout <= 0:
+            return job
+
+        finished = self._waiters.setdefault(chart_id, asyncio.Event())
+        self._waiter_counts[chart_id] = self._waiter_counts.get(chart_id, 0) + 1
+        self._ensure_watcher()
+        try:
+            # The job may have finished before the watcher started
+            job = await self.get(chart_id)
+            if not job.is_finished:
+                await asyncio.wait_for(finished.wait(), timeout)
+                job = await self.get(chart_id)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._waiter_counts[chart_id] -= 1
+            if not self._waiter_counts[chart_id]:
+                del self._waiter_counts[chart_id]
+                if self._waiters.get(chart_id) is finished:
+                    del self._waiters[chart_id]
+        return job
+
+    async def events(self, heartbeat_seconds: float = 15) -> AsyncIterator[RenderJob | None]:
+        """
+        Yield jobs as they finish, and None every heartbeat_seconds without one.
+
+        A subscriber that falls more than 1000 jobs behind misses the older ones.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+        self._subscribers.add(queue)
+        self._ensure_watcher()
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            self._subscribers.discard(queue)
+
+    async def stats(self) -> Dict[str, Any]:
+        """Return job counts by state and render latency percentiles."""
+        counts = await run_in_threadpool(self.queue.counts)
+        latencies = sorted(await run_in_threadpool(self.queue.recent_render_seconds, self.latency_window))
+        return {
+            "queued": counts[QUEUED],
+            "running": counts[RUNNING],
+            "done": counts[DONE],
+            "failed": counts[FAILED],
+            "render_seconds": {
+                f"p{percentile}": _percentile(latencies, percentile)
+                for percentile in (50, 90, 99)
+            } | {"max": latencies[-1] if latencies else None},
+        }
+
+    def _ensure_watcher(self) -> None:
+        """Start the watcher task on the running event loop if it is not running."""
+        if self._watcher is None or self._watcher.done():
+            self._watcher = asyncio.get_running_loop().create_task(self._watch(time.time()))
+
+    async def _watch(self, cursor: float) -> None:
+        """Poll the queue for finished jobs while anyone is waiting, waking waiters and subscribers."""
+        while self._waiters or self._subscribers:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                jobs = await run_in_threadpool(self.queue.finished_since, cursor)
+            except Exception as e:
+                logger.error(f"Error polling the render queue: {str(e)}")
+                continue
+            for job in jobs:
+                cursor = max(cursor, job.finished_at)
+                finished = self._waiters.pop(job.chart_id, None)
+                if finished is not None:
+                    finished.set()
+                for queue in self._subscribers:
+                    if not queue.full():
+                        queue.put_nowait(job)
+
+def _percentile(values: List[float], percentile: int) -> float | None:
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return None
+    rank = max(0, min(len(values) - 1, round(percentile / 100 * len(values)) - 1))
+    return values[rank]
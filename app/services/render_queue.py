@@ -0,0 +1,701 @@
+"""Durable SQLite queue of chart renderings and the worker processes consuming it."""
+import base64
+import functools
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import (
+    Column, Float, Index, Integer, MetaData, String, Table, Text,
+    and_, create_engine, delete, event, func, or_, select, update
+)
+from sqlalchemy.engine import Engine, make_url
+
+from app.services.chart_computation import deserialize_subject, serialize_subject
+
+logger = logging.getLogger(__name__)
+
+# Job states, in lifecycle order; failed jobs form the dead-letter queue
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+FINISHED_STATES = (DONE, FAILED)
+
+# Priorities, lowest first: interactive web pages, then API clients, then batch exports
+PRIORITY_WEB = 0
+PRIORITY_API = 1
+PRIORITY_BATCH = 2
+
+# Rendering method of ChartVisualizationService for each chart type
+RENDER_METHODS = {
+    "natal": "generate_natal_chart_svg",
+    "synastry": "generate_synastry_chart_svg",
+}
+
+# Render arguments stored as ISO strings in the job payload
+DATETIME_ARGUMENTS = ("birth_date", "birth_date1", "birth_date2")
+
+# Render arguments holding a precomputed subject, stored as base64 of serialize_subject
+SUBJECT_ARGUMENTS = ("subject",)
+
+metadata = MetaData()
+
+render_jobs_table = Table(
+    "render_jobs",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("chart_id", String(64), nullable=False, index=True),
+    Column("chart_type", String(16), nullable=False),
+    Column("priority", Integer, nullable=False),
+    Column("state", String(16), nullable=False),
+    Column("svg_url", Text, nullable=False),
+    Column("payload", Text, nullable=False),  # JSON of the render arguments
+    Column("attempts", Integer, nullable=False),
+    Column("max_attempts", Integer, nullable=False),
+    Column("error", Text, nullable=True),
+    Column("worker", String(32), nullable=True),
+    Column("created_at", Float, nullable=False),
+    Column("available_at", Float, nullable=False),  # Earliest start of the next attempt
+    Column("started_at", Float, nullable=True),
+    Column("finished_at", Float, nullable=True, index=True),
+    Column("lease_expires_at", Float, nullable=True),  # A running job is reclaimed after this
+    Index("ix_render_jobs_claim", "state", "priority", "available_at"),
+)
+
+class RenderJob:
+    """State and timings of one chart rendering."""
+
+    __slots__ = ("id", "chart_id", "chart_type", "priority", "state", "svg_url", "payload",
+                 "attempts", "max_attempts", "error", "created_at", "started_at", "finished_at")
+
+    def __init__(
+        self,
+        chart_id: str,
+        chart_type: str,
+        svg_url: str,
+        priority: int = PRIORITY_API,
+        state: str = QUEUED,
+        payload: Dict[str, Any] | None = None,
+        id: int | None = None,
+        attempts: int = 0,
+        max_attempts: int = 1,
+        error: str | None = None,
+        created_at: float | None = None,
+        started_at: float | None = None,
+        finished_at: float | None = None,
+    ):
+        """
+        Args:
+            chart_id: ID of the rendered chart
+            chart_type: Type of chart ("natal" or "synastry")
+            svg_url: URL of the SVG once rendered
+            priority: Queue priority, lower runs first
+            state: Current state of the job
+            payload: Render arguments passed to the rendering method
+            id: Row ID in the queue
+            attempts: Number of rendering attempts started
+            max_attempts: Attempts before the job is dead-lettered
+            error: Error of the last failed attempt
+        """
+        self.id = id
+        self.chart_id = chart_id
+        self.chart_type = chart_type
+        self.priority = priority
+        self.state = state
+        self.svg_url = svg_url
+        self.payload = payload or {}
+        self.attempts = attempts
+        self.max_attempts = max_attempts
+        self.error = error
+        self.created_at = created_at if created_at is not None else time.time()
+        self.started_at = started_at
+        self.finished_at = finished_at
+
+    @classmethod
+    def from_row(cls, row: Any) -> "RenderJob":
+        """Build a job from a render_jobs row."""
+        return cls(
+            chart_id=row.chart_id,
+            chart_type=row.chart_type,
+            svg_url=row.svg_url,
+            priority=row.priority,
+            state=row.state,
+            payload=decode_render_payload(row.payload),
+            id=row.id,
+            attempts=row.attempts,
+            max_attempts=row.max_attempts,
+            error=row.error,
+            created_at=row.created_at,
+            started_at=row.started_at,
+            finished_at=row.finished_at,
+        )
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job is done or failed."""
+        return self.state in FINISHED_STATES
+
+    @property
+    def queue_seconds(self) -> float | None:
+        """Time the job waited before its last attempt started."""
+        if self.started_at is None:
+            return None
+        return self.started_at - self.created_at
+
+    @property
+    def render_seconds(self) -> float | None:
+        """Time spent in the last rendering attempt."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the job as a dictionary for API responses."""
+        return {
+            "chart_id": self.chart_id,
+            "chart_type": self.chart_type,
+            "state": self.state,
+            "svg_url": self.svg_url,
+            "priority": self.priority,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "queue_seconds": self.queue_seconds,
+            "render_seconds": self.render_seconds,
+        }
+
+def encode_render_payload(render: Dict[str, Any]) -> str:
+    """Encode render arguments as JSON, with datetimes as ISO strings and subjects as base64."""
+    render = {
+        argument: base64.b64encode(serialize_subject(value)).decode("ascii")
+        if argument in SUBJECT_ARGUMENTS and value is not None else value
+        for argument, value in render.items()
+    }
+    return json.dumps(render, default=lambda value: value.isoformat() if isinstance(value, datetime) else str(value))
+
+def decode_render_payload(payload: str) -> Dict[str, Any]:
+    """Decode render arguments encoded by encode_render_payload."""
+    render = json.loads(payload)
+    for argument in DATETIME_ARGUMENTS:
+        if isinstance(render.get(argument), str):
+            render[argument] = datetime.fromisoformat(render[argument])
+    for argument in SUBJECT_ARGUMENTS:
+        if isinstance(render.get(argument), str):
+            render[argument] = deserialize_subject(base64.b64decode(render[argument]))
+    return render
+
+class RenderQueue:
+    """
+    Durable queue of chart renderings in a SQLite database.
+
+    Jobs survive restarts and are claimed by worker processes in priority
+    order. A claimed job holds a lease; if its worker dies, the job is
+    claimed again once the lease expires. Failed attempts are retried with
+    exponential backoff, and jobs that run out of attempts stay in the failed
+    state (the dead-letter queue) until they are retried by hand.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        max_attempts: int = 3,
+        retry_backoff_seconds: float = 2.0,
+        lease_seconds: float = 300,
+        retention_seconds: float | None = 86400,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the render queue.
+
+        Args:
+            url: SQLAlchemy database URL (e.g., 'sqlite:///cache/render_queue.db')
+            max_attempts: Rendering attempts before a job is dead-lettered
+            retry_backoff_seconds: Delay before the first retry, doubled for each further one
+            lease_seconds: Time a worker may hold a job before it is claimed again
+            retention_seconds: Time finished jobs are kept (None keeps them forever);
+                failed jobs are kept until retried
+            clock: Wall-clock time function, injectable for testing
+        """
+        self.url = url
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.lease_seconds = lease_seconds
+        self.retention_seconds = retention_seconds
+        self._clock = clock
+        self._engine: Engine | None = None
+        self._init_lock = threading.Lock()
+
+    def enqueue(self, chart_id: str, chart_type: str, svg_url: str, render: Dict[str, Any], priority: int = PRIORITY_API) -> RenderJob:
+        """
+        Queue a rendering.
+
+        Args:
+            chart_id: ID of the chart to render
+            chart_type: Type of chart, a key of RENDER_METHODS
+            svg_url: URL of the SVG once rendered
+            render: Keyword arguments of the rendering method (chart_id is added)
+            priority: PRIORITY_WEB, PRIORITY_API or PRIORITY_BATCH
+
+        Returns:
+            The queued job
+        """
+        if chart_type not in RENDER_METHODS:
+            raise ValueError(f"Unknown chart type: {chart_type}")
+        job = RenderJob(chart_id, chart_type, svg_url, priority=priority, payload=dict(render, chart_id=chart_id),
+                        max_attempts=self.max_attempts, created_at=self._clock())
+        job.id = self._insert(job)
+        return job
+
+    def record_done(self, chart_id: str, chart_type: str, svg_url: str) -> RenderJob:
+        """Record a job that is done without rendering, e.g. when it was served from a cache."""
+        now = self._clock()
+        job = RenderJob(chart_id, chart_type, svg_url, state=DONE, max_attempts=0,
+                        created_at=now, started_at=now, finished_at=now)
+        job.id = self._insert(job)
+        return job
+
+    def claim(self, worker: str, job_id: int | None = None) -> RenderJob | None:
+        """
+        Claim the next job for a worker.
+
+        Returns the queued job with the lowest priority value whose backoff has
+        elapsed, or a running job whose lease expired, oldest first.
+
+        Args:
+            worker: Name of the claiming worker
+            job_id: Only claim this job
+
+        Returns:
+            The claimed job, or None if no job is ready
+        """
+        table = render_jobs_table
+        while True:
+            now = self._clock()
+            ready = or_(
+                and_(table.c.state == QUEUED, table.c.available_at <= now),
+                and_(table.c.state == RUNNING, table.c.lease_expires_at <= now),
+            )
+            if job_id is not None:
+                ready = and_(ready, table.c.id == job_id)
+            next_job = (
+                select(table.c.id)
+                .where(ready)
+                .order_by(table.c.priority, table.c.id)
+                .limit(1)
+                .scalar_subquery()
+            )
+            with self._get_engine().begin() as connection:
+                row = connection.execute(
+                    update(table)
+                    .where(table.c.id == next_job)
+                    .values(
+                        state=RUNNING,
+                        attempts=table.c.attempts + 1,
+                        worker=worker,
+                        started_at=now,
+                        finished_at=None,
+                        lease_expires_at=now + self.lease_seconds,
+                    )
+                    .returning(*table.c)
+                ).first()
+            if row is None:
+                return None
+
+            job = RenderJob.from_row(row)
+            if job.attempts <= job.max_attempts:
+                return job
+            # Reclaimed after its worker died on the last attempt
+            self.fail(job, job.error or "Worker stopped while rendering")
+
+    def complete(self, job: RenderJob) -> bool:
+        """
+        Mark a claimed job done.
+
+        Returns:
+            False if the job was meanwhile reclaimed by another worker
+        """
+        return self._finish_attempt(job, state=DONE, error=None, finished_at=self._clock())
+
+    def fail(self, job: RenderJob, error: str) -> bool:
+        """
+        Record a failed attempt of a claimed job.
+
+        The job is queued again after a backoff, or dead-lettered in the
+        failed state if it has no attempts left.
+
+        Returns:
+            False if the job was meanwhile reclaimed by another worker
+        """
+        now = self._clock()
+        if job.attempts >= job.max_attempts:
+            logger.error(f"Rendering of chart {job.chart_id} failed after {job.attempts} attempts: {error}")
+            return self._finish_attempt(job, state=FAILED, error=error, finished_at=now)
+
+        delay = self.retry_backoff_seconds * 2 ** (job.attempts - 1)
+        logger.warning(f"Rendering of chart {job.chart_id} failed, retrying in {delay:.1f}s: {error}")
+        return self._finish_attempt(job, state=QUEUED, error=error, available_at=now + delay)
+
+    def retry(self, chart_id: str) -> RenderJob | None:
+        """
+        Queue the failed job of a chart again with fresh attempts.
+
+        Returns:
+            The queued job, or None if the chart's latest job has not failed
+        """
+        job = self.get(chart_id)
+        if job is None or job.state != FAILED:
+            return None
+        table = render_jobs_table
+        with self._get_engine().begin() as connection:
+            connection.execute(
+                update(table)
+                .where(table.c.id == job.id)
+                .values(state=QUEUED, attempts=0, available_at=self._clock(),
+                        started_at=None, finished_at=None, lease_expires_at=None)
+            )
+        return self.get(chart_id)
+
+    def get(self, chart_id: str) -> RenderJob | None:
+        """Return the latest job of a chart, or None if it has none."""
+        table = render_jobs_table
+        with self._get_engine().connect() as connection:
+            row = connection.execute(
+                select(table).where(table.c.chart_id == chart_id).order_by(table.c.id.desc()).limit(1)
+            ).first()
+        return RenderJob.from_row(row) if row is not None else None
+
+    def finished_since(self, cursor: float, limit: int = 1000) -> List[RenderJob]:
+        """Return jobs that finished after a wall-clock time, oldest first."""
+        table = render_jobs_table
+        with self._get_engine().connect() as connection:
+            rows = connection.execute(
+                select(table)
+                .where(table.c.finished_at > cursor, table.c.state.in_(FINISHED_STATES))
+                .order_by(table.c.finished_at)
+                .limit(limit)
+            ).all()
+        return [RenderJob.from_row(row) for row in rows]
+
+    def failed_jobs(self, limit: int = 100) -> List[RenderJob]:
+        """Return the dead-lettered jobs, most recent first."""
+        table = render_jobs_table
+        with self._get_engine().connect() as connection:
+            rows = connection.execute(
+                select(table).where(table.c.state == FAILED).order_by(table.c.finished_at.desc()).limit(limit)
+            ).all()
+        return [RenderJob.from_row(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of jobs in each state."""
+        table = render_jobs_table
+        with self._get_engine().connect() as connection:
+            rows = connection.execute(
+                select(table.c.state, func.count()).group_by(table.c.state)
+            ).all()
+        counts = {state: 0 for state in (QUEUED, RUNNING, DONE, FAILED)}
+        counts.update({state: count for state, count in rows})
+        return counts
+
+    def recent_render_seconds(self, limit: int = 1000) -> List[float]:
+        """Return the render times of the most recent rendered jobs."""
+        table = render_jobs_table
+        with self._get_engine().connect() as connection:
+            rows = connection.execute(
+                select(table.c.finished_at - table.c.started_at)
+                .where(table.c.state == DONE, table.c.attempts > 0)
+                .order_by(table.c.finished_at.desc())
+                .limit(limit)
+            ).all()
+        return [seconds for seconds, in rows]
+
+    def purge_finished(self) -> int:
+        """
+        Delete done jobs older than the retention time.
+
+        Returns:
+            Number of jobs deleted
+        """
+        if not self.retention_seconds:
+            return 0
+        table = render_jobs_table
+        with self._get_engine().begin() as connection:
+            result = connection.execute(
+                delete(table).where(table.c.state == DONE, table.c.finished_at <= self._clock() - self.retention_seconds)
+            )
+        if result.rowcount:
+            logger.info(f"Purged {result.rowcount} finished render jobs")
+        return result.rowcount
+
+    def close(self) -> None:
+        """Dispose of the database connections."""
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+
+    def _insert(self, job: RenderJob) -> int:
+        """Insert a job and return its row ID."""
+        with self._get_engine().begin() as connection:
+            result = connection.execute(render_jobs_table.insert().values(
+                chart_id=job.chart_id,
+                chart_type=job.chart_type,
+                priority=job.priority,
+                state=job.state,
+                svg_url=job.svg_url,
+                payload=encode_render_payload(job.payload),
+                attempts=job.attempts,
+                max_attempts=job.max_attempts,
+                created_at=job.created_at,
+                available_at=job.created_at,
+                started_at=job.started_at,
+                finished_at=job.finished_at,
+            ))
+        return result.inserted_primary_key[0]
+
+    def _finish_attempt(self, job: RenderJob, **values: Any) -> bool:
+        """Update a claimed job unless another worker has reclaimed it since."""
+        table = render_jobs_table
+        with self._get_engine().begin() as connection:
+            result = connection.execute(
+                update(table)
+                .where(table.c.id == job.id, table.c.state == RUNNING, table.c.attempts == job.attempts)
+                .values(lease_expires_at=None, **values)
+            )
+        if not result.rowcount:
+            logger.warning(f"Render job of chart {job.chart_id} was reclaimed before attempt {job.attempts} finished")
+            return False
+        job.state = values["state"]
+        job.error = values["error"]
+        job.finished_at = values.get("finished_at")
+        return True
+
+    def _get_engine(self) -> Engine:
+        """Create the engine and schema on first use in this process."""
+        if self._engine is not None:
+            return self._engine
+
+        with self._init_lock:
+            if self._engine is None:
+                database = make_url(self.url).database
+                if database and database != ":memory:":
+                    Path(database).parent.mkdir(parents=True, exist_ok=True)
+
+                engine = create_engine(self.url)
+                event.listen(engine, "connect", _configure_sqlite)
+                metadata.create_all(engine)
+                self._engine = engine
+                logger.info(f"Render queue ready at {self.url}")
+        return self._engine
+
+def _configure_sqlite(dbapi_connection, connection_record) -> None:
+    """Enable WAL mode and a busy timeout on every new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+def render_job(chart_service: Any, job: RenderJob, thumbnail_service: Any = None) -> None:
+    """
+    Render a job's chart with a ChartVisualizationService and save its SVG.
+
+    Jobs carrying the chart's shared subject are drawn from it without
+    another ephemeris calculation. With a ThumbnailService, the chart's thumbnails are rendered as well; a
+    failure there is logged without failing the job, as the thumbnail route
+    renders missing thumbnails on demand.
+    """
+    getattr(chart_service, RENDER_METHODS[job.chart_type])(**job.payload)
+    if thumbnail_service is not None:
+        try:
+            thumbnail_service.generate(job.chart_id)
+        except Exception as e:
+            logger.warning(f"Thumbnails of chart {job.chart_id} not rendered: {str(e)}")
+
+def process_next_job(
+    queue: RenderQueue,
+    render: Callable[[RenderJob], None],
+    worker: str,
+    job_id: int | None = None
+) -> RenderJob | None:
+    """
+    Claim and render one job, recording its outcome in the queue.
+
+    Args:
+        queue: Queue to claim from
+        render: Function rendering a job; exceptions count as failed attempts
+        worker: Name of the worker
+        job_id: Only process this job
+
+    Returns:
+        The processed job, or None if no job was ready
+    """
+    job = queue.claim(worker, job_id)
+    if job is None:
+        return None
+    try:
+        render(job)
+    except Exception as e:
+        queue.fail(job, str(e))
+    else:
+        queue.complete(job)
+    return job
+
+def run_render_worker(queue_config: Dict[str, Any], poll_interval: float, stop: Any) -> None:
+    """
+    Main loop of a render worker process.
+
+    Claims and renders jobs until the stop event is set, sleeping for
+    poll_interval whenever the queue is empty. Purges old finished jobs
+    about once an hour.
+    """
+    from app.core.dependencies import get_artifact_store, get_render_cache, get_settings, get_thumbnail_service
+    from app.services.chart_visualization import ChartVisualizationService
+
+    worker = f"render-{os.getpid()}"
+    queue = RenderQueue(**queue_config)
+    settings = get_settings()
+    chart_service = ChartVisualizationService(
+        settings=settings,
+        render_cache=get_render_cache(),
+        artifact_store=get_artifact_store()
+    )
+    thumbnail_service = get_thumbnail_service() if settings.THUMBNAIL_PRERENDER else None
+    render = functools.partial(render_job, chart_service, thumbnail_service=thumbnail_service)
+    logger.info(f"Render worker {worker} started")
+
+    last_purge = 0.0
+    while not stop.is_set():
+        try:
+            if time.time() - last_purge >= 3600:
+                last_purge = time.time()
+                queue.purge_finished()
+            if process_next_job(queue, render, worker) is None:
+                stop.wait(poll_interval)
+        except Exception as e:
+            # The database may be busy or briefly unavailable; keep the worker alive
+            logger.error(f"Render worker {worker} error: {str(e)}")
+            stop.wait(poll_interval)
+    queue.close()
+
+class RenderWorkerPool:
+    """
+    Separate worker processes consuming the render queue.
+
+    Rendering runs outside the API processes, so bursts of renders do not
+    slow down API requests, and throughput scales with the number of
+    workers. Workers that die are restarted by a supervisor thread; their
+    jobs are reclaimed once their lease expires.
+    """
+
+    def __init__(self, queue_config: Dict[str, Any], workers: int | None = None, poll_interval: float = 0.25):
+        """
+        Initialize the worker pool.
+
+        Args:
+            queue_config: Keyword arguments of RenderQueue for the workers
+            workers: Number of worker processes (defaults to the CPU count, 0 starts none)
+            poll_interval: Seconds a worker sleeps when the queue is empty
+        """
+        self.queue_config = queue_config
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.poll_interval = poll_interval
+        self._context = multiprocessing.get_context("spawn")
+        self._stop = self._context.Event()
+        self._processes: List[Any] = []
+        self._supervisor: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the worker processes and their supervisor."""
+        if self._processes or not self.workers:
+            return
+        self._stop.clear()
+        self._processes = [self._spawn() for _ in range(self.workers)]
+        self._supervisor = threading.Thread(target=self._supervise, name="render-supervisor", daemon=True)
+        self._supervisor.start()
+        logger.info(f"Started {self.workers} render workers")
+
+    def stop(self, timeout: float = 10) -> None:
+        """Ask the workers to finish their current job and stop, terminating them after timeout."""
+        self._stop.set()
+        # The supervisor must not restart workers while they are stopped
+        if self._supervisor is not None:
+            self._supervisor.join()
+            self._supervisor = None
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+
+    def alive(self) -> int:
+        """Return the number of running worker processes."""
+        return sum(process.is_alive() for process in self._processes)
+
+    @property
+    def renders_inline(self) -> bool:
+        """
+        Whether the API process must render jobs itself.
+
+        True when workers are configured but were not started, e.g. when the
+        application runs without its lifespan; with workers set to 0, jobs
+        are left to workers running on their own.
+        """
+        return bool(self.workers) and not self._processes
+
+    def render_inline(self, queue: RenderQueue, chart_service: Any, job: RenderJob) -> RenderJob | None:
+        """Claim and render a submitted job in the calling thread."""
+        return process_next_job(queue, functools.partial(render_job, chart_service), f"inline-{os.getpid()}", job.id)
+
+    def _spawn(self) -> Any:
+        """Start one worker process."""
+        process = self._context.Process(
+            target=run_render_worker,
+            args=(self.queue_config, self.poll_interval, self._stop),
+            name="render-worker",
+            daemon=True
+        )
+        process.start()
+        return process
+
+    def _supervise(self) -> None:
+        """Restart workers that died until the pool is stopped."""
+        while not self._stop.wait(5):
+            for index, process in enumerate(self._processes):
+                if not process.is_alive() and not self._stop.is_set():
+                    logger.error(f"Render worker {process.pid} exited with {process.exitcode}, restarting it")
+                    self._processes[index] = self._spawn()
+
+if __name__ == "__main__":
+    # Run render workers without an API process: python -m app.services.render_queue [--workers N]
+    import argparse
+
+    from app.core.dependencies import get_settings
+
+    logging.basicConfig(level=logging.INFO)
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Run render workers consuming the render queue.")
+    parser.add_argument("--workers", type=int, default=settings.RENDER_WORKERS,
+                        help="Number of worker processes (default: RENDER_WORKERS)")
+    args = parser.parse_args()
+    if not args.workers:
+        parser.error("no workers to run; pass --workers when RENDER_WORKERS is 0 for the API processes")
+    pool = RenderWorkerPool(
+        settings.render_queue_config,
+        workers=args.workers,
+        poll_interval=settings.RENDER_POLL_INTERVAL_SECONDS
+    )
+    pool.start()
+    try:
+        while True:
+            time.sleep(60)
+    except KeyboardInterrupt:
+        pool.stop()
@@ -4,6 +4,11 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 
 from kerykeion import AstrologicalSubject, Report
+from kerykeion.kr_types.kr_models import AstrologicalSubjectModel
+from simple_ascii_tables import AsciiTable
+
+from app.schemas.chart_visualization import ChartConfiguration
+from app.services.aspect_engine import CELESTIAL_POINTS, calculate_cross_aspects
 from app.services.chart_visualization import map_house_system
 
 logger = logging.getLogger(__name__)
@@ -27,7 +32,8 @@ class ReportService:
         lat: float,
         lng: float,
         house_system: Optional[str] = "Placidus",
-        timezone: Optional[str] = None
+        timezone: Optional[str] = None,
+        subject: Optional[AstrologicalSubject | AstrologicalSubjectModel] = None
     ) -> Dict[str, str]:
         """Generate a report for a natal chart.
         
@@ -39,6 +45,8 @@ class ReportService:
             lng: The longitude of the birth place
             house_system: The house system to use (default: Placidus)
             timezone: The timezone of the birth place
+            subject: Precomputed subject of the chart; when given, it is reported
+                instead of calculating a new one from the birth data
             
         Returns:
             Dict[str, str]: Dictionary with report components matching NatalReportResponse
@@ -47,46 +55,50 @@ class ReportService:
             # Log the inputs
             logger.info(f"Generating natal report for {name} born on {birth_date}")
             
-            # Map the house system if needed
-            mapped_house_system = self._map_house_system(house_system)
-            logger.debug(f"Mapped house system from '{house_system}' to '{mapped_house_system}'")
-            
-            # Set a default timezone if none provided
-            if not timezone:
-                logger.warning("No timezone provided for natal report, defaulting to UTC")
-                timezone = "UTC"
+            if subject is not None:
+                # Report the precomputed subject as calculated
+                mapped_house_system = subject.houses_system_identifier
+            else:
+                # Map the house system if needed
+                mapped_house_system = self._map_house_system(house_system)
+                logger.debug(f"Mapped house system from '{house_system}' to '{mapped_house_system}'")
+            
+                # Set a default timezone if none provided
+                if not timezone:
+                    logger.warning("No timezone provided for natal report, defaulting to UTC")
+                    timezone = "UTC"
                 
-            # Create AstrologicalSubject instance
-            year = birth_date.year
-            month = birth_date.month
-            day = birth_date.day
-            hour = birth_date.hour
-            minute = birth_date.minute
-            
-            # Extract country code from birth_place if possible
-            # Format expected: "City, CountryCode"
-            country_code = "US"  # Default
-            if "," in birth_place:
-                country_code = birth_place.split(",")[1].strip()
-                birth_place = birth_place.split(",")[0].strip()
+                # Create AstrologicalSubject instance
+                year = birth_date.year
+                month = birth_date.month
+                day = birth_date.day
+                hour = birth_date.hour
+                minute = birth_date.minute
+            
+                # Extract country code from birth_place if possible
+                # Format expected: "City, CountryCode"
+                country_code = "US"  # Default
+                if "," in birth_place:
+                    country_code = birth_place.split(",")[1].strip()
+                    birth_place = birth_place.split(",")[0].strip()
                 
-            logger.debug(f"Creating AstrologicalSubject with: {name}, {year}, {month}, {day}, {hour}, {minute}, {birth_place}, {country_code}, lng={lng}, lat={lat}")
-            subject = AstrologicalSubject(
-                name=name,
-                year=year,
-                month=month,
-                day=day,
-                hour=hour,
-                minute=minute,
-                city=birth_place,
-                nation=country_code,
-                lng=lng,
-                lat=lat,
-                houses_system_identifier=mapped_house_system,
-                tz_str=timezone
-            )
-            
-            logger.debug("Created AstrologicalSubject successfully")
+                logger.debug(f"Creating AstrologicalSubject with: {name}, {year}, {month}, {day}, {hour}, {minute}, {birth_place}, {country_code}, lng={lng}, lat={lat}")
+                subject = AstrologicalSubject(
+                    name=name,
+                    year=year,
+                    month=month,
+                    day=day,
+                    hour=hour,
+                    minute=minute,
+                    city=birth_place,
+                    nation=country_code,
+                    lng=lng,
+                    lat=lat,
+                    houses_system_identifier=mapped_house_system,
+                    tz_str=timezone
+                )
+            
+                logger.debug("Created AstrologicalSubject successfully")
             
             # Generate report
             report = Report(subject)
@@ -146,7 +158,7 @@ class ReportService:
         person2_lng: float,
         house_system: Optional[str] = "Placidus",
         timezone: Optional[str] = None
-    ) -> Dict[str, Dict[str, str]]:
+    ) -> Dict[str, Any]:
         """Generate a synastry report comparing two natal charts.
         
         Args:
@@ -159,7 +171,7 @@ class ReportService:
             timezone: Timezone for the charts
             
         Returns:
-            Dict[str, Dict[str, str]]: Dictionary with person1 and person2 report data
+            Dict[str, Any]: Dictionary with person1 and person2 report data and the aspects table
         """
         try:
             # Log the inputs
@@ -243,8 +255,8 @@ class ReportService:
             planets_table2 = report2_text[planets_table_start2:planets_table_end2].strip()
             houses_table2 = report2_text[houses_table_start2:houses_table_end2].strip()
             
-            # TODO: Generate aspects table when Kerykeion has direct support for synastry aspects
-            aspects_table = "Synastry aspects analysis is not yet implemented."
+            # Generate aspects table with the vectorized aspect engine
+            aspects_table = self._synastry_aspects_table(person1, person2)
             
             # Create the structured response
             result = {
@@ -259,7 +271,8 @@ class ReportService:
                     "data_table": data_table2,
                     "planets_table": planets_table2,
                     "houses_table": houses_table2
-                }
+                },
+                "aspects_table": aspects_table
             }
             
             # If using Whole Sign houses, add a note in the logs
@@ -273,6 +286,34 @@ class ReportService:
             logger.error(f"Error generating synastry report: {str(e)}")
             raise ReportGenerationError(f"Failed to generate synastry report: {str(e)}")
             
+    def _synastry_aspects_table(self, person1: AstrologicalSubject, person2: AstrologicalSubject) -> str:
+        """Build an ASCII table of the aspects between two subjects.
+        
+        Args:
+            person1: The first person's subject
+            person2: The second person's subject
+            
+        Returns:
+            str: The aspects table in the style of Kerykeion's report tables
+        """
+        chart_configuration = ChartConfiguration()
+        aspects = calculate_cross_aspects(
+            {point: person1[point.lower()].abs_pos for point in CELESTIAL_POINTS},
+            {point: person2[point.lower()].abs_pos for point in CELESTIAL_POINTS},
+            chart_configuration.active_aspects,
+            chart_configuration.active_points
+        )
+        
+        aspects_data = [[person1.name, "Aspect", person2.name, "Orb"]]
+        for aspect in aspects:
+            aspects_data.append([
+                aspect.p1_name.replace("_", " "),
+                aspect.aspect.title(),
+                aspect.p2_name.replace("_", " "),
+                f"{abs(aspect.orbit):.2f}°"
+            ])
+        return AsciiTable(aspects_data).table
+
     def _map_house_system(self, house_system: str) -> str:
         """Map house system names to their single-letter codes for Kerykeion.
         
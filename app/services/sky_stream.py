@@ -0,0 +1,190 @@
+"""Animated sky charts: a wheel rendered once, then planet position deltas as time advances."""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict
+
+import pytz
+import swisseph as swe
+
+from app.core.exceptions import InvalidBirthDataError
+from app.services.batch_ephemeris import BODY_KEYS, compute_batch, julian_day_ut
+from app.services.chart_cache import to_utc_instant
+
+# Center of the wheel in the coordinates of Kerykeion's Full_Wheel group
+WHEEL_CENTER = (240, 240)
+
+# Kerykeion slugs (the kr:slug attribute of each ChartPoint) of the calculated bodies
+POINT_SLUGS: Dict[str, str] = {key: "_".join(part.capitalize() for part in key.split("_")) for key in BODY_KEYS}
+
+# Kerykeion slugs of the angles: the Ascendant, Medium Coeli and their opposites
+ANGLE_SLUGS = ("Ascendant", "Medium_Coeli", "Descendant", "Imum_Coeli")
+
+def _wrap(degrees: float) -> float:
+    """Wrap an angle to the range [-180, 180)."""
+    return (degrees + 180.0) % 360.0 - 180.0
+
+def julian_day_exact(utc_instant: datetime) -> float:
+    """Julian day (UT) of a UTC instant including seconds, unlike julian_day_ut."""
+    hour = utc_instant.hour + utc_instant.minute / 60 + (utc_instant.second + utc_instant.microsecond / 1e6) / 3600
+    return float(swe.julday(utc_instant.year, utc_instant.month, utc_instant.day, hour))
+
+def sky_positions(julian_day: float, lat: float, lng: float, houses_system: str = "P") -> Dict[str, Dict[str, Any]]:
+    """
+    Ecliptic positions of the bodies and angles at an instant, by Kerykeion slug.
+
+    Args:
+        julian_day: Julian day (UT)
+        lat: Latitude of the observer
+        lng: Longitude of the observer
+        houses_system: House system identifier
+
+    Returns:
+        Mapping of slug to its longitude (abs_pos) and whether it is retrograde
+    """
+    batch = compute_batch([julian_day], [lat], [lng], [houses_system])
+    positions = {
+        POINT_SLUGS[key]: {"abs_pos": float(batch.longitudes[0, column]), "retrograde": bool(batch.speeds[0, column] < 0)}
+        for column, key in enumerate(BODY_KEYS)
+    }
+    ascendant, medium_coeli = (float(angle) for angle in batch.ascmc[0])
+    for slug, longitude in zip(ANGLE_SLUGS, (ascendant, medium_coeli, ascendant + 180.0, medium_coeli + 180.0)):
+        positions[slug] = {"abs_pos": longitude % 360.0, "retrograde": False}
+    return positions
+
+def position_deltas(
+    rendered: Dict[str, Dict[str, Any]],
+    previous: Dict[str, Dict[str, Any]],
+    current: Dict[str, Dict[str, Any]],
+    min_delta_degrees: float,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Points that moved at least min_delta_degrees, or changed direction, since they were last sent.
+
+    Each point carries its longitude and its offset from the rendered wheel
+    in degrees, counterclockwise; clients move its glyph by rotating it
+    around WHEEL_CENTER by -offset in SVG coordinates.
+
+    Args:
+        rendered: Positions the wheel was rendered with
+        previous: Positions last sent to the client, empty to send every point
+        current: Positions at the current frame
+        min_delta_degrees: Smallest movement of a point that is sent
+
+    Returns:
+        Changed points by slug
+    """
+    deltas = {}
+    for slug, position in current.items():
+        last = previous.get(slug)
+        if last is not None and abs(_wrap(position["abs_pos"] - last["abs_pos"])) < min_delta_degrees and position["retrograde"] == last["retrograde"]:
+            continue
+        deltas[slug] = {
+            "abs_pos": round(position["abs_pos"], 4),
+            "offset": round(_wrap(position["abs_pos"] - rendered[slug]["abs_pos"]), 4),
+            "retrograde": position["retrograde"],
+        }
+    return deltas
+
+class SkyStream:
+    """
+    Frames of the sky over one place as time advances.
+
+    The wheel is rendered once, for the local minute the stream starts at.
+    Each frame then only carries the points that moved enough since the
+    last frame sent, so clients animate the rendered wheel instead of
+    downloading a new chart. Without a start time the stream follows the
+    clock ("sky now"); with one, each frame advances the sky by
+    step_seconds, which lets clients scrub through time.
+    """
+
+    def __init__(
+        self,
+        lat: float,
+        lng: float,
+        tz_str: str,
+        houses_system: str = "P",
+        start: datetime | None = None,
+        step_seconds: float = 60.0,
+        min_delta_degrees: float = 0.01,
+    ):
+        """
+        Initialize the stream.
+
+        Args:
+            lat: Latitude of the observer
+            lng: Longitude of the observer
+            tz_str: Timezone of the observer
+            houses_system: House system identifier
+            start: Time of the first frame, local unless it carries an offset, or None to follow the clock
+            step_seconds: Sky time between frames when a start time is given
+            min_delta_degrees: Smallest movement of a point that is sent
+
+        Raises:
+            InvalidBirthDataError: If the start time does not exist in the timezone or the timezone is unknown
+        """
+        try:
+            self.timezone = pytz.timezone(tz_str)
+        except pytz.exceptions.UnknownTimeZoneError:
+            raise InvalidBirthDataError(f"Unknown timezone: {tz_str}")
+        self.lat = lat
+        self.lng = lng
+        self.tz_str = tz_str
+        self.houses_system = houses_system
+        self.live = start is None
+        self.step_seconds = step_seconds
+        self.min_delta_degrees = min_delta_degrees
+
+        if start is None:
+            start = datetime.now(self.timezone)
+        elif start.tzinfo is not None:
+            start = start.astimezone(self.timezone)
+        self.start = start.replace(tzinfo=None, second=0, microsecond=0)
+        start_utc = to_utc_instant(self.start, tz_str)
+        if start_utc is None:
+            raise InvalidBirthDataError(f"Start time {self.start.isoformat()} is ambiguous or does not exist in {tz_str}")
+        self.start_utc = start_utc
+
+        # The rendered wheel is calculated like Kerykeion does, to the minute
+        self.rendered = sky_positions(julian_day_ut(start_utc), lat, lng, houses_system)
+
+    def first_frame(self) -> Dict[str, Any]:
+        """Frame of the rendered wheel, with every point at offset 0."""
+        return {
+            "time": self.start_utc.astimezone(self.timezone).isoformat(),
+            "points": position_deltas(self.rendered, {}, self.rendered, 0.0),
+        }
+
+    def frame_instant(self, index: int) -> datetime:
+        """UTC instant of a frame: now when following the clock, else start plus index steps."""
+        if self.live:
+            return datetime.now(pytz.utc)
+        return self.start_utc + timedelta(seconds=self.step_seconds * index)
+
+    async def frames(self, interval_seconds: float, count: int | None = None) -> AsyncIterator[Dict[str, Any] | None]:
+        """
+        Yield a frame every interval_seconds, or None when no point moved enough.
+
+        Args:
+            interval_seconds: Wall-clock seconds between frames
+            count: Number of frames, or None for no limit
+        """
+        sent = self.rendered
+        index = 1
+        next_frame = time.monotonic()
+        while count is None or index <= count:
+            next_frame += interval_seconds
+            await asyncio.sleep(max(0.0, next_frame - time.monotonic()))
+
+            instant = self.frame_instant(index)
+            current = sky_positions(julian_day_exact(instant), self.lat, self.lng, self.houses_system)
+            deltas = position_deltas(self.rendered, sent, current, self.min_delta_degrees)
+            index += 1
+            if not deltas:
+                yield None
+                continue
+            sent = {**sent, **{slug: current[slug] for slug in deltas}}
+            yield {
+                "time": instant.astimezone(self.timezone).isoformat(),
+                "points": deltas,
+            }
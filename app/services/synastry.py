@@ -0,0 +1,111 @@
+"""Service for synastry aspect calculations between natal charts."""
+import logging
+from typing import Iterable, List, Sequence
+
+import numpy as np
+
+from app.schemas.natal_chart import AspectInfo, NatalChartRequest
+from app.services.aspect_engine import (
+    CELESTIAL_POINTS,
+    ActiveAspects,
+    AspectTable,
+    calculate_cross_aspects,
+    cross_aspect_arrays,
+    to_aspect_info,
+)
+from app.services.astrology import AstrologyService
+
+logger = logging.getLogger(__name__)
+
+class SynastryService:
+    """Service comparing natal charts using the vectorized aspect engine."""
+
+    def __init__(self, astrology_service: AstrologyService):
+        """
+        Initialize the synastry service.
+
+        Args:
+            astrology_service: Service providing (cached) natal point positions
+        """
+        self.astrology_service = astrology_service
+
+    def calculate_synastry(
+        self,
+        first: NatalChartRequest,
+        second: NatalChartRequest,
+        active_points: Iterable[str],
+        active_aspects: ActiveAspects,
+    ) -> List[AspectInfo]:
+        """
+        Calculate the aspects between two natal charts.
+
+        Args:
+            first: Birth data of the first person
+            second: Birth data of the second person
+            active_points: Points to compare
+            active_aspects: Active aspects with their orbs
+
+        Returns:
+            Aspects in Kerykeion's order, p1 from the first chart and p2 from the second
+        """
+        first_positions, second_positions = self.astrology_service.calculate_positions([first, second])
+        for positions in (first_positions, second_positions):
+            if isinstance(positions, Exception):
+                raise positions
+
+        logger.info(f"Calculating synastry aspects between {first.name} and {second.name}")
+        return calculate_cross_aspects(first_positions, second_positions, active_aspects, active_points)
+
+    def calculate_matches(
+        self,
+        subject: NatalChartRequest,
+        candidates: Sequence[NatalChartRequest],
+        active_points: Iterable[str],
+        active_aspects: ActiveAspects,
+    ) -> List[List[AspectInfo] | Exception]:
+        """
+        Compare one natal chart against many candidate charts in one pass.
+
+        Positions of all charts are calculated together by the batch engine,
+        and the aspects of every candidate come from a single stacked
+        (candidates, points, points) distance matrix.
+
+        Args:
+            subject: Birth data of the person to match
+            candidates: Birth data of the candidates
+            active_points: Points to compare
+            active_aspects: Active aspects with their orbs
+
+        Returns:
+            One entry per candidate, in order: the aspects, or the exception raised for it
+        """
+        positions = self.astrology_service.calculate_positions([subject, *candidates])
+        subject_positions, candidate_positions = positions[0], positions[1:]
+        if isinstance(subject_positions, Exception):
+            raise subject_positions
+
+        active = set(active_points)
+        names = [name for name in CELESTIAL_POINTS if name in active]
+        table = AspectTable(active_aspects)
+        results: List[List[AspectInfo] | Exception] = list(candidate_positions)
+
+        valid = [index for index, result in enumerate(candidate_positions) if not isinstance(result, Exception)]
+        if not valid:
+            return results
+
+        logger.info(f"Matching {subject.name} against {len(valid)} candidates")
+        first = np.array([subject_positions[name] for name in names], dtype=np.float64)
+        second = np.array(
+            [[candidate_positions[index][name] for name in names] for index in valid],
+            dtype=np.float64
+        )
+        charts, firsts, seconds, aspect_index, orbits = cross_aspect_arrays(first, second, table)
+
+        bounds = np.searchsorted(charts, np.arange(len(valid) + 1))
+        for row, index in enumerate(valid):
+            start, end = bounds[row], bounds[row + 1]
+            results[index] = to_aspect_info(
+                firsts[start:end], seconds[start:end], aspect_index[start:end], orbits[start:end],
+                names, names, table
+            )
+        return results
@@ -0,0 +1,147 @@
+"""Raster thumbnails of chart SVGs in preset sizes."""
+import io
+import logging
+from typing import Dict, Sequence, Tuple
+
+from PIL import Image
+
+from app.core.exceptions import FileConversionError
+from app.services.artifact_store import ChartArtifactStore
+from app.services.chart_visualization import default_artifact_store, svg_name_for
+
+logger = logging.getLogger(__name__)
+
+# Content types of the thumbnail formats
+THUMBNAIL_CONTENT_TYPES: Dict[str, str] = {
+    "webp": "image/webp",
+    "png": "image/png",
+}
+
+def build_pyramid(
+    png: bytes,
+    sizes: Sequence[int],
+    formats: Sequence[str],
+    quality: int = 80,
+) -> Dict[Tuple[int, str], bytes]:
+    """
+    Downscale a PNG rendered at the largest size into every size and format.
+
+    Each size is resampled from the next larger one, so the chart is only
+    rasterized once, at the largest size.
+
+    Args:
+        png: PNG rendered at the largest size
+        sizes: Widths of the thumbnails in pixels
+        formats: Formats of the thumbnails ("webp", "png")
+        quality: WebP quality
+
+    Returns:
+        Encoded thumbnails by (size, format)
+    """
+    thumbnails = {}
+    with Image.open(io.BytesIO(png)) as rendered:
+        image = rendered.convert("RGBA")
+    for size in sorted(sizes, reverse=True):
+        if image.width != size:
+            image = image.resize((size, max(1, round(image.height * size / image.width))), Image.LANCZOS)
+        for output_format in formats:
+            buffer = io.BytesIO()
+            if output_format == "webp":
+                image.save(buffer, format="WEBP", quality=quality, method=4)
+            else:
+                image.save(buffer, format="PNG", optimize=True)
+            thumbnails[(size, output_format)] = buffer.getvalue()
+    return thumbnails
+
+class ThumbnailService:
+    """
+    Raster previews of chart SVGs, rendered once into a pyramid of preset sizes.
+
+    Thumbnails are stored next to the chart's SVG as {chart_id}.{size}.{format},
+    so preview pages are served from files instead of rasterizing the SVG with
+    cairo on every request, and they are evicted together with the SVG.
+    Thumbnails older than their SVG are rendered again.
+    """
+
+    def __init__(
+        self,
+        conversion_service,
+        store: ChartArtifactStore | None = None,
+        sizes: Sequence[int] = (128, 512, 1024),
+        formats: Sequence[str] = ("webp", "png"),
+        quality: int = 80,
+    ):
+        """
+        Initialize the thumbnail service.
+
+        Args:
+            conversion_service: FileConversionService rasterizing the SVGs
+            store: Artifact store of the chart SVGs and their thumbnails, the SVG directory if not given
+            sizes: Widths of the thumbnails in pixels
+            formats: Formats of the thumbnails ("webp", "png")
+            quality: WebP quality
+        """
+        self.conversion_service = conversion_service
+        self.store = store if store is not None else default_artifact_store()
+        self.sizes = tuple(sorted(sizes))
+        self.formats = tuple(formats)
+        self.quality = quality
+
+    def name_for(self, chart_id: str, size: int, output_format: str) -> str:
+        """Name of a thumbnail of a chart in the artifact store."""
+        return f"{chart_id}.{size}.{output_format}"
+
+    def generate(self, chart_id: str, svg: str | None = None) -> Dict[Tuple[int, str], str]:
+        """
+        Render every thumbnail of a chart.
+
+        Args:
+            chart_id: ID of the chart
+            svg: SVG markup of the chart, read from its SVG file if not given
+
+        Returns:
+            Names of the thumbnails by (size, format)
+
+        Raises:
+            FileNotFoundError: If no SVG is given and the chart has no SVG file
+            FileConversionError: If the SVG cannot be rasterized
+        """
+        if svg is None:
+            svg = self.store.read(svg_name_for(chart_id)).decode("utf-8")
+
+        png = self.conversion_service.render_svg_to_png(svg, width=self.sizes[-1])
+        try:
+            thumbnails = build_pyramid(png, self.sizes, self.formats, self.quality)
+        except Exception as e:
+            raise FileConversionError(f"Failed to build thumbnails of chart {chart_id}: {str(e)}") from e
+
+        names = {}
+        for (size, output_format), content in thumbnails.items():
+            name = self.name_for(chart_id, size, output_format)
+            self.store.write(name, content)
+            names[(size, output_format)] = name
+        logger.info(f"Rendered {len(names)} thumbnails of chart {chart_id}")
+        return names
+
+    def get(self, chart_id: str, size: int, output_format: str) -> str | None:
+        """
+        Return a thumbnail of a chart, rendering the chart's thumbnails if it is missing or stale.
+
+        Args:
+            chart_id: ID of the chart
+            size: One of the preset sizes
+            output_format: One of the preset formats
+
+        Returns:
+            Name of the thumbnail in the artifact store, or None if the chart has no SVG file
+        """
+        name = self.name_for(chart_id, size, output_format)
+        svg_info = self.store.stat(svg_name_for(chart_id))
+        thumbnail_info = self.store.stat(name)
+        if svg_info is None:
+            if thumbnail_info is None:
+                return None
+        elif thumbnail_info is None or thumbnail_info.modified < svg_info.modified:
+            return self.generate(chart_id)[(size, output_format)]
+        self.store.touch(name)
+        return name
@@ -0,0 +1,236 @@
+"""Service for transit timelines using a precomputed ephemeris table."""
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from app.core.exceptions import InvalidDateRangeError
+from app.schemas.transit import TransitEvent
+from app.services.aspect_engine import ASPECT_DEGREES
+from app.services.batch_ephemeris import DERIVED_BODIES
+from app.services.ephemeris_table import EphemerisTable, datetime_to_jd, jd_to_datetime, load_ephemeris_table
+
+logger = logging.getLogger(__name__)
+
+# Bisection steps on the interpolated interval; 2**-40 days is far below a minute
+ROOT_ITERATIONS = 40
+
+def _wrap_degrees(angles: np.ndarray) -> np.ndarray:
+    """Wrap angles to the range [-180, 180)."""
+    return np.mod(angles + 180.0, 360.0) - 180.0
+
+def _hermite(p0, p1, m0, m1, s):
+    """Evaluate the cubic Hermite polynomial through (0, p0) and (1, p1) with slopes m0, m1."""
+    s2 = s * s
+    s3 = s2 * s
+    return (
+        (2 * s3 - 3 * s2 + 1) * p0
+        + (s3 - 2 * s2 + s) * m0
+        + (-2 * s3 + 3 * s2) * p1
+        + (s3 - s2) * m1
+    )
+
+def _hermite_slope(p0, p1, m0, m1, s):
+    """Derivative of the cubic Hermite polynomial with respect to s."""
+    s2 = s * s
+    return (
+        (6 * s2 - 6 * s) * p0
+        + (3 * s2 - 4 * s + 1) * m0
+        + (-6 * s2 + 6 * s) * p1
+        + (3 * s2 - 2 * s) * m1
+    )
+
+class TransitService:
+    """
+    Service finding the exact times transiting points aspect a natal chart.
+
+    Positions come from a memory-mapped daily ephemeris table. Between two
+    daily rows a body's longitude is interpolated with a cubic Hermite
+    polynomial through both positions and speeds, which stays within a few
+    seconds of time of the Swiss Ephemeris even for the Moon, and the exact
+    times are found by root-finding on that polynomial.
+    """
+
+    def __init__(
+        self,
+        table_path: str,
+        start_year: int = 1950,
+        end_year: int = 2050,
+        max_range_days: int | None = 3660,
+    ):
+        """
+        Initialize the transit service.
+
+        Args:
+            table_path: Path of the ephemeris table, built on first use if missing
+            start_year: First year the table covers
+            end_year: Last year the table covers
+            max_range_days: Maximum length of a transit period in days
+        """
+        self.table_path = table_path
+        self.start_year = start_year
+        self.end_year = end_year
+        self.max_range_days = max_range_days
+        self._table: EphemerisTable | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def table(self) -> EphemerisTable:
+        """The ephemeris table, loaded or built on first access."""
+        if self._table is None:
+            with self._lock:
+                if self._table is None:
+                    self._table = load_ephemeris_table(self.table_path, self.start_year, self.end_year)
+        return self._table
+
+    def calculate_transits(
+        self,
+        natal_longitudes: Dict[str, float],
+        start_date: datetime,
+        end_date: datetime,
+        transiting_points: Sequence[str],
+        natal_points: Sequence[str],
+        aspects: Sequence[str],
+    ) -> List[TransitEvent]:
+        """
+        Find the exact transits to a natal chart within a period.
+
+        Args:
+            natal_longitudes: Natal longitudes keyed by Kerykeion point name
+            start_date: Start of the period (naive datetimes are UTC)
+            end_date: End of the period (naive datetimes are UTC)
+            transiting_points: Names of the transiting points
+            natal_points: Names of the natal points
+            aspects: Names of the aspects to find
+
+        Returns:
+            Exact transits in chronological order
+
+        Raises:
+            InvalidDateRangeError: If the period is empty, too long or outside the table
+        """
+        start_jd = datetime_to_jd(start_date)
+        end_jd = datetime_to_jd(end_date)
+        if end_jd <= start_jd:
+            raise InvalidDateRangeError("End date must be after start date")
+        if self.max_range_days and end_jd - start_jd > self.max_range_days:
+            raise InvalidDateRangeError(f"Transit period cannot exceed {self.max_range_days} days")
+
+        table = self.table
+        if not table.covers(start_jd, end_jd):
+            raise InvalidDateRangeError(
+                f"Transits can only be calculated between {jd_to_datetime(table.start_jd):%Y-%m-%d} "
+                f"and {jd_to_datetime(table.end_jd):%Y-%m-%d}"
+            )
+
+        transiting_points = list(dict.fromkeys(transiting_points))
+        julian_days, longitudes, speeds = self._transit_positions(table, start_jd, end_jd, transiting_points)
+        target_longitudes, target_points, target_aspects = self._aspect_targets(
+            natal_longitudes, list(dict.fromkeys(natal_points)), list(dict.fromkeys(aspects))
+        )
+        if not len(target_longitudes):
+            return []
+
+        # Signed distance to every aspect target at every row, shape (T, B, K)
+        offsets = _wrap_degrees(longitudes[:, :, None] - target_longitudes[None, None, :])
+        before, after = offsets[:-1], offsets[1:]
+        crossing = (
+            (((before <= 0) & (after > 0)) | ((before >= 0) & (after < 0)))
+            # A jump between -180 and 180 is the far side of the circle, not a hit
+            & (np.abs(after - before) < 180.0)
+        )
+        rows, bodies, targets = np.nonzero(crossing)
+
+        step = table.step_days
+        p0 = before[rows, bodies, targets]
+        p1 = after[rows, bodies, targets]
+        m0 = speeds[rows, bodies] * step
+        m1 = speeds[rows + 1, bodies] * step
+        fractions = self._solve_hermite(p0, p1, m0, m1)
+
+        hit_jds = julian_days[rows] + fractions * step
+        # The offsets differ from the longitudes by a constant, so their slope is the speed
+        hit_speeds = _hermite_slope(p0, p1, m0, m1, fractions)
+        in_period = (hit_jds >= start_jd) & (hit_jds <= end_jd)
+        order = np.argsort(hit_jds[in_period], kind="stable")
+
+        events = []
+        for jd, body, target, speed in zip(
+            hit_jds[in_period][order].tolist(),
+            bodies[in_period][order].tolist(),
+            targets[in_period][order].tolist(),
+            hit_speeds[in_period][order].tolist(),
+        ):
+            hit_time = jd_to_datetime(jd) + timedelta(seconds=30)
+            events.append(TransitEvent(
+                date=hit_time.replace(second=0, microsecond=0),
+                transiting_point=transiting_points[body],
+                natal_point=target_points[target],
+                aspect=target_aspects[target],
+                transit_longitude=float(target_longitudes[target]),
+                retrograde=speed < 0
+            ))
+        logger.debug(f"Found {len(events)} transits between {start_date} and {end_date}")
+        return events
+
+    def _transit_positions(
+        self,
+        table: EphemerisTable,
+        start_jd: float,
+        end_jd: float,
+        transiting_points: List[str],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Read the table rows for the transiting points, deriving the south nodes."""
+        derived = dict(DERIVED_BODIES)
+        source_keys = []
+        for point in transiting_points:
+            key = point.lower()
+            source_keys.append(derived.get(key, key))
+
+        julian_days, longitudes, speeds = table.window(start_jd, end_jd, source_keys)
+        south_nodes = [index for index, point in enumerate(transiting_points) if point.lower() in derived]
+        if south_nodes:
+            longitudes = longitudes.copy()
+            longitudes[:, south_nodes] = np.mod(longitudes[:, south_nodes] + 180.0, 360.0)
+        return julian_days, longitudes, speeds
+
+    def _aspect_targets(
+        self,
+        natal_longitudes: Dict[str, float],
+        natal_points: List[str],
+        aspects: List[str],
+    ) -> tuple[np.ndarray, List[str], List[str]]:
+        """
+        List the longitudes at which a transiting point aspects a natal point.
+
+        Every aspect other than the conjunction and opposition has two targets,
+        one on each side of the natal point.
+        """
+        target_longitudes = []
+        target_points = []
+        target_aspects = []
+        for point in natal_points:
+            natal_longitude = natal_longitudes[point]
+            for aspect in aspects:
+                degrees = ASPECT_DEGREES[aspect]
+                for angle in sorted({degrees % 360, -degrees % 360}):
+                    target_longitudes.append((natal_longitude + angle) % 360)
+                    target_points.append(point)
+                    target_aspects.append(aspect)
+        return np.array(target_longitudes, dtype=np.float64), target_points, target_aspects
+
+    @staticmethod
+    def _solve_hermite(p0: np.ndarray, p1: np.ndarray, m0: np.ndarray, m1: np.ndarray) -> np.ndarray:
+        """Find a root of each interpolated interval by bisection, vectorized over intervals."""
+        low = np.zeros_like(p0)
+        high = np.ones_like(p0)
+        rising = p1 > 0
+        for _ in range(ROOT_ITERATIONS):
+            middle = (low + high) / 2
+            below = _hermite(p0, p1, m0, m1, middle) <= 0
+            move_low = below == rising
+            low = np.where(move_low, middle, low)
+            high = np.where(move_low, high, middle)
+        return (low + high) / 2
@@ -1,13 +1,159 @@
 """Static files initialization."""
+import gzip
 import os
 import logging
+from pathlib import Path
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, RedirectResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+
+try:
+    import brotli
+except ImportError:  # Brotli variants are skipped without the brotli package
+    brotli = None
 
 # Define path to static files
 STATIC_DIR = os.path.dirname(os.path.abspath(__file__))
 logger = logging.getLogger(__name__)
 
+# File suffixes of precompressed variants by content encoding, in order of preference
+PRECOMPRESSED_ENCODINGS = {"br": ".br", "gzip": ".gz"}
+
+# Static files served from precompressed variants when the client accepts them
+PRECOMPRESSED_MEDIA_TYPES = {".svg": "image/svg+xml"}
+
+def precompressed_variants(content: bytes) -> dict[str, bytes]:
+    """
+    Compress a static file into its gzip and brotli variants.
+
+    The brotli variant is skipped if the brotli package is not installed.
+
+    Args:
+        content: Content of the uncompressed file
+
+    Returns:
+        Compressed content by the suffix its variant is stored under
+    """
+    variants = {PRECOMPRESSED_ENCODINGS["gzip"]: gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[PRECOMPRESSED_ENCODINGS["br"]] = brotli.compress(content, mode=brotli.MODE_TEXT, quality=11)
+    return variants
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """Content encodings an Accept-Encoding header allows, ignoring those with q=0."""
+    encodings = set()
+    for item in accept_encoding.split(","):
+        encoding, *params = [part.strip() for part in item.split(";")]
+        quality = next((param[2:] for param in params if param.startswith("q=")), "1")
+        try:
+            if float(quality) > 0:
+                encodings.add(encoding.lower())
+        except ValueError:
+            continue
+    if "*" in encodings:
+        encodings.update(PRECOMPRESSED_ENCODINGS)
+    return encodings
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    Static files that serve precompressed variants by content negotiation.
+
+    A request for an SVG that accepts br or gzip is answered with the
+    .br or .gz variant written next to it, if one exists and is not older
+    than the SVG, so the file is never compressed per request.
+    """
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike,
+        stat_result: os.stat_result,
+        scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Serve the preferred precompressed variant the client accepts, or the file itself."""
+        media_type = PRECOMPRESSED_MEDIA_TYPES.get(Path(full_path).suffix)
+        if media_type is None or status_code != 200:
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        request_headers = Headers(scope=scope)
+        accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS.items():
+            if encoding not in accepted:
+                continue
+            variant_path = f"{full_path}{suffix}"
+            try:
+                variant_stat = os.stat(variant_path)
+            except FileNotFoundError:
+                continue
+            if variant_stat.st_mtime < stat_result.st_mtime:
+                continue  # Left over from an earlier version of the file
+
+            response = FileResponse(
+                variant_path,
+                status_code=status_code,
+                stat_result=variant_stat,
+                media_type=media_type,
+                headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+            )
+            break
+        else:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+            response.headers["Vary"] = "Accept-Encoding"
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+class ChartArtifactFiles(PrecompressedStaticFiles):
+    """
+    Chart files served from the chart artifact store.
+
+    Files of a local backend are served like other static files, including
+    their precompressed variants, and every response counts as an access
+    for the store's LRU garbage collection. Files of a remote backend are
+    answered with a redirect to a short-lived URL of the object.
+    """
+
+    def __init__(self, artifact_store):
+        """
+        Initialize the mount.
+
+        Args:
+            artifact_store: ChartArtifactStore holding the chart files
+        """
+        self.artifact_store = artifact_store
+        super().__init__(directory=artifact_store.local_directory, check_dir=False)
+
+    async def get_response(self, path: str, scope) -> Response:
+        """Serve a file of a local backend, or redirect to a file of a remote backend."""
+        if self.directory is not None:
+            return await super().get_response(path, scope)
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+        try:
+            url = self.artifact_store.url_for(path)
+        except ValueError:
+            url = None
+        if url is None:
+            raise HTTPException(status_code=404)
+        self.artifact_store.touch(path)
+        return RedirectResponse(url, status_code=307)
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike,
+        stat_result: os.stat_result,
+        scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Record the access to the chart and serve the file."""
+        self.artifact_store.touch(Path(full_path).name)
+        return super().file_response(full_path, stat_result, scope, status_code)
+
 def initialize_static_dirs():
     """Ensure all required static directories exist."""
     # Create svg directory if it doesn't exist
@@ -19,11 +165,21 @@ def initialize_static_dirs():
     else:
         logger.info(f"SVG directory already exists at {svg_dir}")
 
-def mount_static_files(app: FastAPI) -> None:
-    """Mount static files to the FastAPI application."""
+def mount_static_files(app: FastAPI, artifact_store=None) -> None:
+    """
+    Mount static files to the FastAPI application.
+
+    With a chart artifact store, chart files under /static/images/svg are
+    served from the store instead of the static directory.
+    """
     # Ensure directories exist
     initialize_static_dirs()
-    
+
+    if artifact_store is not None:
+        # Mounted first so it takes precedence over the static directory
+        app.mount("/static/images/svg", ChartArtifactFiles(artifact_store), name="chart_artifacts")
+        logger.info(f"Chart files mounted from the {type(artifact_store.backend).__name__} artifact store")
+
     # Mount static directory
-    app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
-    logger.info(f"Static files mounted from {STATIC_DIR}") 
\ No newline at end of file
+    app.mount("/static", PrecompressedStaticFiles(directory=STATIC_DIR), name="static")
+    logger.info(f"Static files mounted from {STATIC_DIR}")
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Build the daily ephemeris table used by the transit endpoint.
+
+The API builds the table at startup if it is missing; running this script
+during deployment keeps that out of the startup time.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path so we can import app modules
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from app.services.ephemeris_table import build_ephemeris_table
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", default="cache/ephemeris/daily_ephemeris.npy",
+                        help="Output path (default: the TRANSIT_TABLE_PATH default)")
+    parser.add_argument("--start-year", type=int, default=1950, help="First year of the table")
+    parser.add_argument("--end-year", type=int, default=2050, help="Last year of the table")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    table = build_ephemeris_table(args.path, args.start_year, args.end_year)
+    logger.info(f"Built {len(table)} days for {len(table.bodies)} bodies "
+                f"in {time.perf_counter() - started:.1f}s")
+
+if __name__ == "__main__":
+    main()
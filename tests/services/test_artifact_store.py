@@ -0,0 +1,57 @@
+"""Tests for the chart artifact store."""
+import os
+
+from app.services.artifact_store import ChartArtifactStore, LocalDirectoryBackend
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+def test_quota_evicts_least_recently_used_chart_with_all_its_files(tmp_path):
+    """Exceeding the quota deletes every file of the chart accessed longest ago."""
+    clock = FakeClock()
+    store = ChartArtifactStore(LocalDirectoryBackend(tmp_path), max_bytes=250, clock=clock)
+    store.write("natal_a.svg", b"a" * 100)
+    store.write("natal_a.svg.gz", b"a" * 20)
+    store.write("natal_b.svg", b"b" * 100)
+    clock.now += 120
+    assert store.read("natal_a.svg") == b"a" * 100
+
+    store.write("natal_c.svg", b"c" * 100)
+
+    assert sorted(os.listdir(tmp_path)) == ["natal_a.svg", "natal_a.svg.gz", "natal_c.svg"]
+    assert store.stats()["size_bytes"] == 220
+    assert store.stats()["evictions"] == 1
+
+def test_garbage_collection_expires_idle_charts_and_interrupted_writes(tmp_path):
+    """Charts not accessed within max_age are deleted, along with stale temporary files, after a rescan."""
+    clock = FakeClock()
+    store = ChartArtifactStore(LocalDirectoryBackend(tmp_path), max_age_seconds=3600, clock=clock)
+    store.write("natal_old.svg", b"<svg/>")
+    store.write("natal_new.svg", b"<svg/>")
+    leftover = tmp_path / "natal_new.svg.0123.tmp"
+    leftover.write_bytes(b"<sv")
+    os.utime(tmp_path / "natal_old.svg", (0, 0))
+    os.utime(leftover, (0, 0))
+    os.utime(tmp_path / "natal_new.svg", (clock.now,) * 2)
+
+    assert store.collect_garbage() == 1
+    assert sorted(os.listdir(tmp_path)) == ["natal_new.svg"]
+    assert store.stats()["expirations"] == 1
+
+def test_files_of_other_names_are_never_collected(tmp_path):
+    """Assets that are not generated charts are neither counted nor deleted."""
+    clock = FakeClock()
+    (tmp_path / "sample.svg").write_bytes(b"<svg/>")
+    os.utime(tmp_path / "sample.svg", (0, 0))
+    store = ChartArtifactStore(LocalDirectoryBackend(tmp_path), max_bytes=100, max_age_seconds=3600, clock=clock)
+    store.write("natal_a.svg", b"a" * 100)
+
+    assert store.collect_garbage() == 0
+    assert sorted(os.listdir(tmp_path)) == ["natal_a.svg", "sample.svg"]
+    assert store.stats()["size_bytes"] == 100
@@ -0,0 +1,93 @@
+"""Tests for the vectorized aspect engine."""
+import numpy as np
+import pytest
+from kerykeion import AstrologicalSubject, NatalAspects
+
+from app.schemas.chart_visualization import ChartConfiguration
+from app.services.aspect_engine import (
+    AspectTable,
+    angular_distance,
+    calculate_natal_aspects,
+    cross_aspect_arrays,
+    match_aspects,
+    natal_aspect_arrays,
+)
+from app.services.astrology import NATAL_ASPECT_POINTS
+
+@pytest.fixture
+def default_table():
+    """Aspect table with the default chart configuration orbs."""
+    return AspectTable(ChartConfiguration().active_aspects)
+
+def test_angular_distance_wraps_around():
+    """Distances are measured the short way around the circle."""
+    distances = angular_distance(np.array([350.0, 10.0, 0.0]), np.array([10.0, 350.0, 180.0]))
+    np.testing.assert_allclose(distances, [20.0, 20.0, 180.0])
+
+def test_match_uses_whole_degrees_and_first_aspect(default_table):
+    """Orbs are compared on the whole-degree distance, as in Kerykeion."""
+    aspect_index, orbits = match_aspects(np.array([95.9, 96.0, 124.5]), default_table)
+
+    names = [default_table.names[i] if i >= 0 else None for i in aspect_index]
+    assert names == ["square", None, "trine"]
+    assert orbits[0] == pytest.approx(5.9)
+    assert orbits[2] == pytest.approx(4.5)
+
+def test_matches_natal_aspects(default_table):
+    """The engine reproduces Kerykeion's NatalAspects list exactly."""
+    subject = AstrologicalSubject(
+        "John Doe", 1990, 1, 1, 12, 0,
+        lng=-74.006, lat=40.7128, tz_str="America/New_York", online=False
+    )
+    expected = [
+        (aspect.p1_name, aspect.p2_name, aspect.aspect, aspect.orbit)
+        for aspect in NatalAspects(subject).all_aspects
+    ]
+
+    aspects = calculate_natal_aspects(
+        {point: subject[point.lower()].abs_pos for point in NATAL_ASPECT_POINTS},
+        default_table
+    )
+
+    assert [(a.p1_name, a.p2_name, a.aspect, a.orbit) for a in aspects] == expected
+
+def test_stacked_charts_match_single_charts(default_table):
+    """Stacked matrices give the same aspects as one chart at a time."""
+    rng = np.random.default_rng(42)
+    names = ["Sun", "Moon", "Mercury", "Venus", "Mars"]
+    longitudes = rng.uniform(0, 360, size=(20, len(names)))
+
+    charts, firsts, seconds, aspect_index, orbits = natal_aspect_arrays(longitudes, names, default_table)
+
+    for chart in range(len(longitudes)):
+        single = calculate_natal_aspects(dict(zip(names, longitudes[chart])), default_table)
+        stacked = charts == chart
+        assert [(a.p1_name, a.p2_name, a.aspect) for a in single] == [
+            (names[i], names[j], default_table.names[k])
+            for i, j, k in zip(firsts[stacked], seconds[stacked], aspect_index[stacked])
+        ]
+        np.testing.assert_array_equal([a.orbit for a in single], orbits[stacked])
+
+def test_opposite_axes_are_skipped(default_table):
+    """Axes that are always opposite are not reported as aspects."""
+    aspects = calculate_natal_aspects(
+        {"Ascendant": 10.0, "Descendant": 190.0, "Sun": 10.0},
+        default_table
+    )
+
+    assert [(a.p1_name, a.p2_name, a.aspect) for a in aspects] == [
+        ("Sun", "Ascendant", "conjunction"),
+        ("Sun", "Descendant", "opposition"),
+    ]
+
+def test_cross_aspects_one_against_many():
+    """One chart can be compared against many at once."""
+    table = AspectTable([{"name": "conjunction", "orb": 5}])
+    charts, firsts, seconds, _, orbits = cross_aspect_arrays(
+        np.array([0.0, 90.0]),
+        np.array([[2.0, 200.0], [300.0, 88.0]]),
+        table
+    )
+
+    assert list(zip(charts, firsts, seconds)) == [(0, 0, 0), (1, 1, 1)]
+    np.testing.assert_allclose(orbits, [2.0, 2.0])
@@ -0,0 +1,83 @@
+"""Tests for batch natal chart calculation."""
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.core.exceptions import InvalidBirthDataError, LocationError
+from app.schemas.natal_chart import NatalChartRequest
+from app.services.astrology import AstrologyService
+from app.services.batch_ephemeris import assign_houses
+from app.services.chart_cache import ChartCache
+
+BATCH_REQUESTS = [
+    NatalChartRequest(
+        name="John Doe", birth_date=datetime(1990, 1, 1, 12, 0),
+        lng=-74.006, lat=40.7128, tz_str="America/New_York", houses_system="P"
+    ),
+    NatalChartRequest(
+        name="Jane Smith", birth_date=datetime(1992, 3, 15, 15, 30),
+        lng=-118.2437, lat=34.0522, tz_str="America/Los_Angeles", houses_system="W"
+    ),
+    NatalChartRequest(
+        name="Polar Person", birth_date=datetime(1975, 6, 21, 3, 45),
+        lng=25.7482, lat=69.9689, tz_str="Europe/Helsinki", houses_system="K"
+    ),
+]
+
+class TestBatchNatalCharts:
+    """Test suite for AstrologyService.calculate_natal_charts."""
+
+    @pytest.fixture
+    def service(self):
+        """Create an AstrologyService without a cache."""
+        return AstrologyService()
+
+    def test_batch_matches_single_calculation(self, service):
+        """Batch results are identical to the Kerykeion-based calculation."""
+        results = service.calculate_natal_charts(BATCH_REQUESTS)
+
+        for request, result in zip(BATCH_REQUESTS, results):
+            expected = service.calculate_natal_chart(
+                name=request.name,
+                birth_date=request.birth_date,
+                lng=request.lng,
+                lat=request.lat,
+                tz_str=request.tz_str,
+                houses_system=request.houses_system,
+            )
+            assert result.model_dump() == expected.model_dump()
+
+    def test_per_item_errors(self, service):
+        """Invalid items return their error without failing the batch."""
+        requests = [
+            BATCH_REQUESTS[0],
+            NatalChartRequest(name="No Place", birth_date=datetime(1990, 1, 1, 12, 0)),
+            BATCH_REQUESTS[1].model_copy(update={"houses_system": "Z"}),
+        ]
+
+        results = service.calculate_natal_charts(requests)
+
+        assert results[0].name == "John Doe"
+        assert isinstance(results[1], LocationError)
+        assert isinstance(results[2], InvalidBirthDataError)
+
+    def test_batch_uses_chart_cache(self):
+        """Batch calculations populate and reuse the chart cache."""
+        service = AstrologyService(chart_cache=ChartCache())
+        service.calculate_natal_charts(BATCH_REQUESTS)
+
+        renamed = [request.model_copy(update={"name": "Someone Else"}) for request in BATCH_REQUESTS]
+        results = service.calculate_natal_charts(renamed)
+
+        assert service.chart_cache.stats()["hits"] == len(BATCH_REQUESTS)
+        assert all(result.name == "Someone Else" for result in results)
+
+def test_assign_houses_wraps_around_aries():
+    """Houses spanning 0° Aries are assigned correctly."""
+    cusps = np.array([[350.0 + 30 * i for i in range(12)]]) % 360
+    longitudes = np.array([[350.0, 5.0, 19.9, 20.0, 349.9]])
+
+    houses = assign_houses(longitudes, cusps)
+
+    assert houses.tolist() == [[1, 1, 1, 2, 12]]
@@ -0,0 +1,36 @@
+"""Tests for bulk chart rendering."""
+import asyncio
+import io
+import json
+import zipfile
+from datetime import datetime
+
+from app.services.bulk_render import archive_filename, stream_chart_archive
+from app.services.compute_pool import ComputePool
+
+def test_archive_filename_is_safe_and_ordered():
+    """Archive names keep the request position and drop unsafe characters."""
+    assert archive_filename(0, "John Doe / Natal", "png") == "0001_John_Doe_Natal.png"
+    assert archive_filename(41, "../..", "svg") == "0042_chart.svg"
+
+def test_stream_chart_archive_lists_failures_in_manifest():
+    """Rendered charts are archived as they finish and failures are listed in the manifest."""
+    chart = dict(birth_date=datetime(1990, 1, 1, 12, 0), lng=-74.006, lat=40.7128, tz_str="America/New_York")
+    renders = [dict(chart, name="John"), dict(chart, name="Broken", tz_str="Not/AZone"), dict(chart, name="Jane")]
+    pool = ComputePool(max_workers=1, warm=False)
+
+    async def collect():
+        return [chunk async for chunk in stream_chart_archive(renders, "svg", 96, pool)]
+
+    try:
+        chunks = asyncio.run(collect())
+    finally:
+        pool.shutdown()
+
+    assert len(chunks) > 1
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        assert sorted(archive.namelist()) == ["0001_John.svg", "0003_Jane.svg", "manifest.json"]
+        assert b"<svg" in archive.read("0001_John.svg")
+        manifest = json.loads(archive.read("manifest.json"))
+    assert [item["index"] for item in manifest] == [0, 1, 2]
+    assert "error" in manifest[1] and manifest[2]["file"] == "0003_Jane.svg"
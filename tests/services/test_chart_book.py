@@ -0,0 +1,37 @@
+"""Tests for the layout of PDF chart books."""
+from app.services.chart_book import BookBlock, book_sections, interpretation_blocks
+
+REPORT = {
+    "title": "+- Kerykeion report for Jane -+",
+    "data_table": "+------+\n| Date |\n+------+",
+    "planets_table": "+--------+\n| Planet |\n+--------+",
+    "houses_table": "+-------+\n| House |\n+-------+",
+    "full_report": "report",
+}
+
+def test_interpretation_html_laid_out_as_blocks():
+    """Headings, paragraphs and list items become blocks; inline markup is dropped and line breaks kept."""
+    html = (
+        "<h2>The Sun &amp; Moon</h2>\n"
+        "<p>Your <strong>Sun</strong> is\n   in Leo.<br />\nIt shines.</p>\n"
+        "<ul>\n<li>Warm</li>\n<li>\n<p>Proud</p>\n</li>\n</ul>"
+    )
+
+    assert interpretation_blocks(html) == [
+        BookBlock("heading", "The Sun & Moon"),
+        BookBlock("body", "Your Sun is in Leo.\nIt shines."),
+        BookBlock("body", "• Warm"),
+        BookBlock("body", "• Proud"),
+    ]
+
+def test_book_sections_include_interpretation_only_when_given():
+    """The report tables form the first section; the interpretation follows on its own pages if there is one."""
+    report_only = book_sections(REPORT)
+    with_interpretation = book_sections(REPORT, "<p>Bold and bright.</p>")
+
+    assert len(report_only) == 1
+    assert [block.text for block in report_only[0] if block.style == "table"] == [
+        REPORT["data_table"], REPORT["planets_table"], REPORT["houses_table"]
+    ]
+    assert with_interpretation[0] == report_only[0]
+    assert with_interpretation[1] == [BookBlock("heading", "Interpretation"), BookBlock("body", "Bold and bright.")]
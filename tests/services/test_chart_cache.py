@@ -0,0 +1,152 @@
+"""Tests for the natal chart cache."""
+from datetime import datetime
+
+import pytest
+
+from app.services.astrology import AstrologyService
+from app.services.chart_cache import ChartCache, make_chart_key, to_utc_instant
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestChartKey:
+    """Test suite for chart key normalization."""
+
+    def test_same_instant_in_different_timezones_share_key(self):
+        """Local times describing the same UTC instant produce the same key."""
+        new_york = to_utc_instant(datetime(1990, 1, 1, 12, 0), "America/New_York")
+        london = to_utc_instant(datetime(1990, 1, 1, 17, 0), "Europe/London")
+
+        assert new_york == london
+        assert make_chart_key(new_york, 40.7128, -74.006) == make_chart_key(london, 40.7128, -74.006)
+
+    def test_coordinates_are_rounded(self):
+        """Coordinates differing below the configured precision share a key."""
+        instant = to_utc_instant(datetime(1990, 1, 1, 12, 0), "UTC")
+
+        assert make_chart_key(instant, 40.71281, -74.00601) == make_chart_key(instant, 40.71279, -74.00599)
+        assert make_chart_key(instant, 40.71, -74.0, precision=2) != make_chart_key(instant, 40.72, -74.0, precision=2)
+
+    def test_calculation_settings_change_key(self):
+        """House system, zodiac and perspective are part of the key."""
+        instant = to_utc_instant(datetime(1990, 1, 1, 12, 0), "UTC")
+        base = make_chart_key(instant, 40.7128, -74.006)
+
+        assert make_chart_key(instant, 40.7128, -74.006, houses_system="W") != base
+        assert make_chart_key(instant, 40.7128, -74.006, zodiac_type="Sidereal", sidereal_mode="LAHIRI") != base
+        assert make_chart_key(instant, 40.7128, -74.006, perspective_type="Heliocentric") != base
+
+    def test_ambiguous_local_time_has_no_instant(self):
+        """Ambiguous DST transitions cannot be keyed."""
+        assert to_utc_instant(datetime(2023, 11, 5, 1, 30), "America/New_York") is None
+
+class TestChartCache:
+    """Test suite for ChartCache."""
+
+    def test_get_and_stats(self):
+        """Hits and misses are counted."""
+        cache = ChartCache()
+        cache.set("a", "chart", 10)
+
+        assert cache.get("a") == "chart"
+        assert cache.get("b") is None
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["size_bytes"] == 10
+
+    def test_evicts_least_recently_used_entry(self):
+        """The entry limit evicts the least recently used chart."""
+        cache = ChartCache(max_entries=2)
+        cache.set("a", 1, 1)
+        cache.set("b", 2, 1)
+        cache.get("a")
+        cache.set("c", 3, 1)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_evicts_to_respect_memory_bound(self):
+        """The byte limit evicts entries until the cache fits."""
+        cache = ChartCache(max_bytes=100)
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.stats()["size_bytes"] == 60
+
+    def test_oversized_value_is_not_cached(self):
+        """Values larger than the whole cache are skipped."""
+        cache = ChartCache(max_bytes=10)
+        cache.set("a", 1, 11)
+
+        assert cache.get("a") is None
+
+    def test_entries_expire_after_ttl(self):
+        """Entries older than the TTL are dropped on lookup."""
+        clock = FakeClock()
+        cache = ChartCache(ttl_seconds=60, clock=clock)
+        cache.set("a", 1, 1)
+
+        clock.now = 59
+        assert cache.get("a") == 1
+        clock.now = 61
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["entries"] == 0
+
+class TestAstrologyServiceCache:
+    """Test suite for chart caching in AstrologyService."""
+
+    @pytest.fixture
+    def service(self):
+        """Create an AstrologyService with a fresh cache."""
+        return AstrologyService(chart_cache=ChartCache())
+
+    def test_cache_hit_reapplies_name(self, service):
+        """Two people born at the same moment and place share one calculation."""
+        first = service.calculate_natal_chart(
+            name="John Doe",
+            birth_date=datetime(1990, 1, 1, 12, 0),
+            lng=-74.006,
+            lat=40.7128,
+            tz_str="America/New_York",
+        )
+        second = service.calculate_natal_chart(
+            name="Jane Doe",
+            birth_date=datetime(1990, 1, 1, 12, 0),
+            lng=-74.006,
+            lat=40.7128,
+            tz_str="America/New_York",
+        )
+
+        assert first.name == "John Doe"
+        assert second.name == "Jane Doe"
+        assert second.planets == first.planets
+        assert second.aspects == first.aspects
+        assert service.chart_cache.stats()["hits"] == 1
+
+    def test_different_house_system_is_a_miss(self, service):
+        """Charts with different house systems are cached separately."""
+        for houses_system in ("P", "W"):
+            service.calculate_natal_chart(
+                name="John Doe",
+                birth_date=datetime(1990, 1, 1, 12, 0),
+                lng=-74.006,
+                lat=40.7128,
+                tz_str="America/New_York",
+                houses_system=houses_system,
+            )
+
+        assert service.chart_cache.stats()["hits"] == 0
+        assert service.chart_cache.stats()["entries"] == 2
@@ -0,0 +1,56 @@
+"""Tests for the shared chart subject computation."""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+from kerykeion import AstrologicalSubject
+
+from app.services.astrology import AstrologyService
+from app.services.chart_computation import ChartComputationService
+from app.services.report import ReportService
+
+BIRTH_DATA = {
+    "name": "John Doe",
+    "birth_date": datetime(1990, 1, 1, 12, 0),
+    "city": "New York",
+    "nation": "US",
+    "lng": -74.006,
+    "lat": 40.7128,
+    "tz_str": "America/New_York",
+}
+
+@pytest.fixture
+def service():
+    """Create a ChartComputationService with its own store."""
+    return ChartComputationService()
+
+def test_subject_is_computed_once_per_chart(service):
+    """Every consumer of a chart_id reads the subject computed the first time."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        subjects = list(executor.map(lambda _: service.get_subject("natal_1", **BIRTH_DATA), range(8)))
+    service.get_subject("natal_1", **BIRTH_DATA)
+
+    assert service.calculations == 1
+    assert all(subject == subjects[0] for subject in subjects)
+    assert service.load_subject("unknown") is None
+
+def test_consumers_match_direct_calculation(service):
+    """Reports and natal charts from the stored subject equal freshly calculated ones."""
+    subject = service.get_subject("natal_1", **BIRTH_DATA)
+    direct = AstrologicalSubject(
+        "John Doe", 1990, 1, 1, 12, 0, lng=-74.006, lat=40.7128, tz_str="America/New_York", online=False
+    )
+    report_service = ReportService()
+    astrology_service = AstrologyService()
+
+    shared_report = report_service.generate_natal_report(
+        "John Doe", BIRTH_DATA["birth_date"], "New York, US", 40.7128, -74.006, subject=subject
+    )
+    direct_report = report_service.generate_natal_report(
+        "John Doe", BIRTH_DATA["birth_date"], "New York, US", 40.7128, -74.006,
+        timezone="America/New_York"
+    )
+
+    assert shared_report["planets_table"] == direct_report["planets_table"]
+    assert shared_report["houses_table"] == direct_report["houses_table"]
+    assert astrology_service.natal_chart_from_subject(subject) == astrology_service.natal_chart_from_subject(direct)
@@ -0,0 +1,55 @@
+"""Tests for the compact chart positions representation."""
+from datetime import datetime
+
+import numpy as np
+import pytest
+from kerykeion import AstrologicalSubject
+
+from app.services.batch_ephemeris import assign_houses, compute_batch, julian_day_ut
+from app.services.chart_cache import to_utc_instant
+from app.services.chart_positions import BLOB_SIZE, ChartPositions
+
+BIRTH_DATE = datetime(1990, 1, 1, 12, 0)
+
+@pytest.fixture
+def subject():
+    """Kerykeion subject of the test chart."""
+    return AstrologicalSubject(
+        "John Doe", 1990, 1, 1, 12, 0, lng=-74.006, lat=40.7128, tz_str="America/New_York", online=False
+    )
+
+@pytest.fixture
+def batch_positions():
+    """Positions of the test chart from the batch engine."""
+    utc_instant = to_utc_instant(BIRTH_DATE, "America/New_York")
+    batch = compute_batch([julian_day_ut(utc_instant)], [40.7128], [-74.006], ["P"])
+    houses = assign_houses(batch.longitudes, batch.cusps)
+    return ChartPositions.from_batch(batch, 0, "P", houses[0])
+
+def test_blob_round_trip(batch_positions):
+    """Positions serialize to a fixed-size blob and back without loss."""
+    blob = batch_positions.to_bytes()
+    restored = ChartPositions.from_bytes(blob)
+
+    assert len(blob) == BLOB_SIZE
+    assert restored.to_bytes() == blob
+    assert restored.houses_system == "P"
+    assert restored.to_response("John Doe", BIRTH_DATE) == batch_positions.to_response("John Doe", BIRTH_DATE)
+
+def test_rejects_foreign_blobs(batch_positions):
+    """Blobs of another size or layout version are refused."""
+    blob = batch_positions.to_bytes()
+
+    with pytest.raises(ValueError):
+        ChartPositions.from_bytes(blob[:-1])
+    with pytest.raises(ValueError):
+        ChartPositions.from_bytes(b"\x00" + blob[1:])
+
+def test_subject_and_batch_positions_agree(subject, batch_positions):
+    """Positions taken from a Kerykeion subject match the batch engine's."""
+    from_subject = ChartPositions.from_subject(subject)
+
+    assert np.isnan(from_subject.speeds).all()
+    assert from_subject.point_longitudes() == batch_positions.point_longitudes()
+    assert from_subject.signs.tolist() == batch_positions.signs.tolist()
+    assert from_subject.to_response("John Doe", BIRTH_DATE) == batch_positions.to_response("John Doe", BIRTH_DATE)
@@ -0,0 +1,79 @@
+"""Tests for the persistent chart store."""
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from app.services.chart_store import ChartStore
+
+DATA = {"name": "John Doe", "birth_date": "1990-01-01T12:00:00", "lng": -74.006, "lat": 40.7128}
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def url(tmp_path):
+    """SQLite URL of a fresh database file."""
+    return f"sqlite+aiosqlite:///{tmp_path / 'charts.db'}"
+
+def test_save_and_get(url):
+    """Stored inputs and computed blobs are read back, also from a new store."""
+    async def scenario():
+        store = ChartStore(url)
+        await store.save("abc", DATA)
+        await store.save_computed("abc", b"subject", b"positions")
+        await store.close()
+
+        reopened = ChartStore(url)
+        chart = await reopened.get("abc")
+        missing = await reopened.get("nope")
+        await reopened.close()
+        return chart, missing
+
+    chart, missing = asyncio.run(scenario())
+
+    assert chart.data == DATA
+    assert (chart.subject, chart.positions) == (b"subject", b"positions")
+    assert chart.is_computed
+    assert missing is None
+
+def test_uses_wal_mode(url):
+    """The database runs in write-ahead logging mode."""
+    async def scenario():
+        store = ChartStore(url)
+        await store.save("abc", DATA)
+        engine = await store._get_engine()
+        async with engine.connect() as connection:
+            mode = (await connection.execute(text("PRAGMA journal_mode"))).scalar()
+        await store.close()
+        return mode
+
+    assert asyncio.run(scenario()) == "wal"
+
+def test_expired_charts_are_hidden_and_purged(url):
+    """Charts older than the TTL are not returned and are deleted by a purge."""
+    clock = FakeClock()
+
+    async def scenario():
+        store = ChartStore(url, ttl_seconds=60, clock=clock)
+        await store.save("old", DATA)
+        await store.save_computed("old", b"subject", b"positions")
+        clock.now += 61
+        await store.save("new", DATA)
+        expired = await store.get("old")
+        purged = await store.purge_expired()
+        fresh = await store.get("new")
+        await store.close()
+        return expired, purged, fresh
+
+    expired, purged, fresh = asyncio.run(scenario())
+
+    assert expired is None
+    assert purged == 1
+    assert fresh.data == DATA
@@ -0,0 +1,61 @@
+"""Tests for in-memory chart rendering."""
+import gzip
+import os
+from datetime import datetime
+
+from kerykeion import AstrologicalSubject, KerykeionChartSVG
+
+from app.core.config import Settings
+from app.core.svg_utils import minify_svg, preprocess_svg_for_conversion
+from app.services.chart_visualization import (
+    SVG_DIR,
+    ChartVisualizationService,
+    render_chart_template,
+)
+
+JOHN = dict(name="John Doe", birth_date=datetime(1990, 1, 1, 12, 0), lng=-74.006, lat=40.7128, tz_str="America/New_York")
+
+def test_render_does_not_write_files():
+    """Rendering returns the SVG markup without touching the SVG directory."""
+    before = set(os.listdir(SVG_DIR))
+
+    svg = ChartVisualizationService(Settings()).render_natal_chart_svg(**JOHN)
+
+    assert svg.startswith("<?xml")
+    assert set(os.listdir(SVG_DIR)) == before
+
+def test_generate_persists_rendered_svg():
+    """Generating a chart saves exactly the markup render returns."""
+    service = ChartVisualizationService(Settings())
+
+    result = service.generate_natal_chart_svg(chart_id="test_render_persist", **JOHN)
+    svg_path = service.artifact_store.local_path("test_render_persist.svg")
+    try:
+        assert result["svg_url"] == "/static/images/svg/test_render_persist.svg"
+        saved = svg_path.read_text(encoding="utf-8")
+        assert saved == minify_svg(service.render_natal_chart_svg(**JOHN))
+        assert gzip.decompress(svg_path.with_name(svg_path.name + ".gz").read_bytes()).decode("utf-8") == saved
+    finally:
+        for path in svg_path.parent.glob(f"{svg_path.name}*"):
+            path.unlink()
+
+def test_precompiled_template_matches_kerykeion():
+    """Reusing the static layers renders the same markup as Kerykeion for every theme."""
+    subject = AstrologicalSubject(
+        "Jane", 1985, 6, 3, 8, 30, lng=-0.1276, lat=51.5072, tz_str="Europe/London", online=False
+    )
+
+    for theme in ("dark", "light", "classic"):
+        for chart_language in ("EN", "IT"):
+            chart = KerykeionChartSVG(subject, theme=theme, chart_language=chart_language)
+            assert render_chart_template(chart) == chart.makeTemplate()
+
+def test_minified_svg_keeps_theme_colors():
+    """Minifying shortens the CSS variables without breaking their substitution for conversion."""
+    svg = ChartVisualizationService(Settings()).render_natal_chart_svg(**JOHN)
+
+    minified = minify_svg(svg)
+
+    assert len(minified) < len(svg) * 0.75
+    assert "--kerykeion-chart-color-" not in minified
+    assert preprocess_svg_for_conversion(minified).count("var(") == preprocess_svg_for_conversion(svg).count("var(")
@@ -0,0 +1,86 @@
+"""Tests for the composite service."""
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from kerykeion import AstrologicalSubject
+from kerykeion.composite_subject_factory import CompositeSubjectFactory
+
+from app.schemas.natal_chart import NatalChartRequest
+from app.services.astrology import AstrologyService
+from app.services.chart_cache import ChartCache
+from app.services.composite import CompositeService, circular_midpoints
+
+JOHN = NatalChartRequest(
+    name="John Doe",
+    birth_date=datetime(1990, 1, 1, 12, 0),
+    lng=-74.006,
+    lat=40.7128,
+    tz_str="America/New_York"
+)
+JANE = NatalChartRequest(
+    name="Jane Smith",
+    birth_date=datetime(1992, 5, 15, 15, 30),
+    lng=-118.243,
+    lat=34.052,
+    tz_str="America/Los_Angeles"
+)
+
+@pytest.fixture
+def service():
+    """Create a CompositeService with a fresh chart cache."""
+    return CompositeService(AstrologyService(chart_cache=ChartCache()))
+
+def test_matches_kerykeion_composite(service):
+    """Composite planets and houses are identical to Kerykeion's midpoint composite."""
+    chart = service.calculate_composite_chart(JOHN, JANE)
+
+    subjects = [
+        AstrologicalSubject(
+            r.name, r.birth_date.year, r.birth_date.month, r.birth_date.day,
+            r.birth_date.hour, r.birth_date.minute,
+            lng=r.lng, lat=r.lat, tz_str=r.tz_str, online=False
+        )
+        for r in (JOHN, JANE)
+    ]
+    expected = CompositeSubjectFactory(*subjects).get_midpoint_composite_subject_model()
+
+    for planet in chart.planets:
+        point = getattr(expected, planet.name.lower().replace(" ", "_"))
+        assert planet.sign == point.sign
+        assert planet.position == pytest.approx(point.position, abs=1e-9)
+        assert planet.house == expected.houses_names_list.index(point.house) + 1
+    for number, house_name in enumerate(expected.houses_names_list, 1):
+        assert chart.houses[number] == pytest.approx(getattr(expected, house_name.lower()).position, abs=1e-9)
+
+def test_composite_reuses_cached_positions(service):
+    """A second composite of the same people is built from the cache."""
+    first = service.calculate_composite_chart(JOHN, JANE)
+    second = service.calculate_composite_chart(JANE, JOHN)
+
+    assert service.astrology_service.chart_cache.stats()["hits"] == 2
+    assert [p.position for p in first.planets] == pytest.approx([p.position for p in second.planets])
+
+def test_composite_of_aware_and_naive_birth_dates(service):
+    """A birth date with an offset and one without are both taken as local times."""
+    aware = JOHN.model_copy(update={"birth_date": datetime(1990, 1, 1, 12, 0, tzinfo=timezone.utc)})
+
+    chart = service.calculate_composite_chart(aware, JANE)
+
+    assert chart.birth_date == service.calculate_composite_chart(JOHN, JANE).birth_date
+
+def test_davison_chart_is_cast_at_the_midpoint(service):
+    """The Davison chart is a natal chart for the midpoint time in UTC."""
+    chart = service.calculate_davison_chart(JOHN, JANE)
+
+    assert chart.name == "John Doe and Jane Smith Davison Chart"
+    assert chart.birth_date == datetime(1991, 3, 10, 7, 45)
+    assert len(chart.planets) == 16
+
+def test_circular_midpoints_wrap_into_range():
+    """Midpoints just below 0 wrap to [0, 360) instead of rounding up to 360."""
+    midpoints = circular_midpoints(np.array([359.99999999999994, -1e-16, 350.0]), np.array([0.0, 0.0, 20.0]))
+
+    assert np.all((midpoints >= 0.0) & (midpoints < 360.0))
+    assert midpoints[1] == 0.0
+    assert midpoints[2] == pytest.approx(5.0)
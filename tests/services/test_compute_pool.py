@@ -0,0 +1,70 @@
+"""Tests for the chart compute pool."""
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from app.core.exceptions import ComputeCapacityError, ComputeTimeoutError
+from app.services.astrology import AstrologyService
+from app.services.chart_cache import ChartCache
+from app.services.compute_pool import ComputePool
+
+JOHN = dict(name="John Doe", birth_date=datetime(1990, 1, 1, 12, 0), lng=-74.006, lat=40.7128, tz_str="America/New_York")
+
+@pytest.fixture
+def pool():
+    """Create a single-worker pool and stop it after the test."""
+    compute_pool = ComputePool(max_workers=1, max_pending=2, route_limits={"slow": 1}, retry_after_seconds=3)
+    yield compute_pool
+    compute_pool.shutdown()
+
+def test_natal_chart_matches_sync_calculation(pool):
+    """Charts calculated in a worker are identical and end up in this process's cache."""
+    service = AstrologyService(chart_cache=ChartCache())
+
+    chart = asyncio.run(service.calculate_natal_chart_async(pool, **JOHN))
+
+    assert chart == AstrologyService().calculate_natal_chart(**JOHN)
+    assert service.chart_cache.stats()["entries"] == 1
+    assert pool.stats()["routes"]["natal"]["completed"] == 1
+
+def test_rejects_when_route_is_saturated(pool):
+    """Calls beyond a route's limit fail fast with 503 and Retry-After."""
+    async def scenario():
+        running = asyncio.create_task(pool.run("slow", time.sleep, 0.5))
+        await asyncio.sleep(0)
+        with pytest.raises(ComputeCapacityError) as error:
+            await pool.run("slow", time.sleep, 0)
+        await running
+        return error.value
+
+    error = asyncio.run(scenario())
+
+    assert error.status_code == 503
+    assert error.headers == {"Retry-After": "3"}
+    assert pool.stats()["routes"]["slow"]["rejected"] == 1
+
+def test_timed_out_call_keeps_its_slot_until_the_worker_finishes():
+    """A call over its route's timeout fails with 504 but still counts against the limit while it runs."""
+    pool = ComputePool(max_workers=1, route_limits={"slow": 1}, route_timeouts={"slow": 0.1}, warm=False)
+
+    async def scenario():
+        await pool.run("start", time.sleep, 0)  # Spawn the worker outside the timeout
+        with pytest.raises(ComputeTimeoutError) as error:
+            await pool.run("slow", time.sleep, 0.5)
+        with pytest.raises(ComputeCapacityError):
+            await pool.run("slow", time.sleep, 0)
+        await asyncio.sleep(0.6)
+        await pool.run("slow", time.sleep, 0)
+        return error.value
+
+    try:
+        error = asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+
+    assert error.status_code == 504
+    assert pool.stats()["routes"]["slow"]["timed_out"] == 1
+    assert pool.stats()["routes"]["slow"]["completed"] == 1
+    assert pool.stats()["pending"] == 0
@@ -4,7 +4,10 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from app.services.file_conversion import FileConversionService, OutputFormat, CONTENT_TYPE_MAP
+from PIL import Image
+
+from app.services.file_conversion import FileConversionService, OutputFormat, CONTENT_TYPE_MAP, make_conversion_key, rasterize_svg
+from app.services.render_cache import RenderCache
 from app.core.exceptions import FileConversionError
 
 # Sample SVG content for testing
@@ -55,6 +58,65 @@ class TestFileConversionService:
         mock_preprocess.assert_called_once_with(SAMPLE_SVG)
         mock_svg2png.assert_called_once()
     
+    @patch("cairosvg.svg2png")
+    def test_repeated_conversion_served_from_cache(self, mock_svg2png, tmp_path):
+        """Test that converting the same SVG with the same options rasterizes it once."""
+        mock_svg2png.return_value = b"mock_png_data"
+        service = FileConversionService(cache=RenderCache(tmp_path, suffix=".bin"))
+        
+        assert service.convert_svg_to_format(SAMPLE_SVG, "png", dpi=300) == (b"mock_png_data", "image/png")
+        assert service.convert_svg_to_format(SAMPLE_SVG.encode("utf-8"), "png", dpi=300) == (b"mock_png_data", "image/png")
+        service.convert_svg_to_format(SAMPLE_SVG, "png", dpi=96)
+        
+        assert mock_svg2png.call_count == 2
+        assert make_conversion_key(SAMPLE_SVG, "jpg") == make_conversion_key(SAMPLE_SVG, "jpeg")
+        assert make_conversion_key(SAMPLE_SVG, "jpg", quality=90) != make_conversion_key(SAMPLE_SVG, "jpg", quality=80)
+    
+    @patch("app.services.file_conversion.rasterize_svg")
+    def test_convert_svg_to_jpg_file(self, mock_rasterize, service):
+        """Test that JPEG output is encoded from the rendered pixels and written to the sink."""
+        mock_rasterize.return_value = Image.new("RGBA", (20, 10), (255, 0, 0, 255))
+        sink = io.BytesIO()
+        
+        content_type = service.convert_svg_to_file(SAMPLE_SVG, "jpg", sink, quality=80)
+        
+        assert content_type == "image/jpeg"
+        with Image.open(io.BytesIO(sink.getvalue())) as image:
+            assert image.format == "JPEG"
+            assert image.size == (20, 10)
+    
+    @pytest.mark.parametrize("output_format, pillow_format", [("webp", "WEBP"), ("avif", "AVIF")])
+    @patch("app.services.file_conversion.rasterize_svg")
+    def test_convert_svg_to_modern_formats(self, mock_rasterize, output_format, pillow_format, service):
+        """Test that WebP and AVIF output keeps the alpha channel and has its content type."""
+        mock_rasterize.return_value = Image.new("RGBA", (20, 10), (255, 0, 0, 128))
+        
+        result, content_type = service.convert_svg_to_format(SAMPLE_SVG, output_format, quality=60)
+        
+        assert content_type == CONTENT_TYPE_MAP[output_format]
+        with Image.open(io.BytesIO(result)) as image:
+            assert image.format == pillow_format
+            assert image.size == (20, 10)
+            assert image.mode == "RGBA"
+    
+    def test_rasterize_svg_reads_surface_pixels(self):
+        """Test that cairo's premultiplied BGRA surface buffer is unpacked into straight RGBA."""
+        cairo_surface = MagicMock()
+        cairo_surface.get_width.return_value = 2
+        cairo_surface.get_height.return_value = 1
+        cairo_surface.get_stride.return_value = 8
+        cairo_surface.get_data.return_value = bytes([0, 0, 255, 255, 6, 4, 2, 51])
+        surface = MagicMock(cairo=cairo_surface)
+        
+        with patch("cairosvg.surface.PNGSurface", return_value=surface), patch("cairosvg.parser.Tree"), \
+                patch("app.services.file_conversion.sys.byteorder", "little"):
+            image = rasterize_svg(SAMPLE_SVG.encode("utf-8"), dpi=96)
+        
+        assert image.mode == "RGBA" and image.size == (2, 1)
+        assert image.getpixel((0, 0)) == (255, 0, 0, 255)
+        assert image.getpixel((1, 0)) == (10, 20, 30, 51)
+        surface.finish.assert_called_once()
+    
     @patch("app.services.file_conversion.preprocess_svg_for_conversion")
     @patch("cairosvg.svg2pdf")
     def test_convert_svg_to_pdf(self, mock_svg2pdf, mock_preprocess, service):
@@ -73,32 +135,24 @@ class TestFileConversionService:
         mock_svg2pdf.assert_called_once()
     
     @patch("app.services.file_conversion.preprocess_svg_for_conversion")
-    @patch("cairosvg.svg2png")
-    @patch("PIL.Image.open")
-    def test_convert_svg_to_jpg(self, mock_pil_open, mock_svg2png, mock_preprocess, service):
+    @patch("app.services.file_conversion.rasterize_svg")
+    def test_convert_svg_to_jpg(self, mock_rasterize, mock_preprocess, service):
         """Test converting SVG to JPEG."""
         # Setup mocks
         mock_preprocess.return_value = SAMPLE_SVG
-        mock_svg2png.return_value = b"mock_png_data"
-        
-        # Mock PIL Image handling
         mock_img = MagicMock()
         mock_img.convert.return_value = mock_img
-        mock_pil_open.return_value.__enter__.return_value = mock_img
-        
-        # Mock BytesIO for JPEG output
-        mock_buffer = MagicMock(spec=io.BytesIO)
-        mock_buffer.getvalue.return_value = b"mock_jpg_data"
+        mock_img.save.side_effect = lambda sink, **kwargs: sink.write(b"mock_jpg_data")
+        mock_rasterize.return_value = mock_img
         
-        with patch("io.BytesIO", return_value=mock_buffer):
-            # Call the method
-            result, content_type = service.convert_svg_to_format(SAMPLE_SVG, "jpg")
+        # Call the method
+        result, content_type = service.convert_svg_to_format(SAMPLE_SVG, "jpg")
         
         # Verify results
         assert result == b"mock_jpg_data"
         assert content_type == "image/jpeg"
         mock_preprocess.assert_called_once_with(SAMPLE_SVG)
-        mock_svg2png.assert_called_once()
+        mock_rasterize.assert_called_once_with(SAMPLE_SVG.encode("utf-8"), 96)
         mock_img.convert.assert_called_once_with("RGB")
         mock_img.save.assert_called_once()
     
@@ -147,6 +201,8 @@ class TestFileConversionService:
         assert "png" in OutputFormat.__args__  # type: ignore
         assert "pdf" in OutputFormat.__args__  # type: ignore
         assert "jpg" in OutputFormat.__args__  # type: ignore
+        assert "webp" in OutputFormat.__args__  # type: ignore
+        assert "avif" in OutputFormat.__args__  # type: ignore
     
     def test_content_type_mapping(self):
         """Test that content type mapping is correct."""
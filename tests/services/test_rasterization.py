@@ -0,0 +1,49 @@
+"""Tests for chart conversions in the rasterization pool."""
+import asyncio
+
+import pytest
+
+from app.core.exceptions import ImageTooLargeError
+from app.services.compute_pool import ComputePool
+from app.services.rasterization import RasterizationEngine
+from app.services.render_cache import RenderCache
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="2in" height="2in"><style>:root{--c:#f00}</style><rect fill="var(--c)"/></svg>'
+
+@pytest.fixture
+def pool():
+    """Create a single-worker pool and stop it after the test."""
+    compute_pool = ComputePool(max_workers=1, warm=False)
+    yield compute_pool
+    compute_pool.shutdown()
+
+def test_repeated_conversion_served_from_cache(pool, tmp_path):
+    """Conversions are written to a file by a worker once; the same SVG and options are then opened from the cache."""
+    engine = RasterizationEngine(pool, cache=RenderCache(tmp_path, suffix=".bin"))
+
+    async def scenario():
+        results = []
+        for _ in range(2):
+            output, content_type = await engine.open_conversion(SVG, "svg", dpi=300)
+            with output:
+                results.append((output.read(), content_type))
+        return results
+
+    first, second = asyncio.run(scenario())
+
+    assert first == second
+    assert first[1] == "image/svg+xml" and b"#f00" in first[0]
+    assert pool.stats()["routes"]["convert_svg"]["completed"] == 1
+    assert not list(tmp_path.glob("*.tmp"))
+
+def test_oversized_raster_rejected_before_the_pool(pool):
+    """Raster output beyond max_pixels is rejected with 400 without reaching a worker."""
+    engine = RasterizationEngine(pool, max_pixels=1_000_000)
+
+    with pytest.raises(ImageTooLargeError) as error:
+        asyncio.run(engine.open_conversion(SVG, "png", dpi=600))
+
+    assert error.value.status_code == 400
+    assert pool.stats()["routes"] == {}
+    engine.check_size(SVG, "png", dpi=300)
+    engine.check_size(SVG, "pdf", dpi=600)
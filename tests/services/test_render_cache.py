@@ -0,0 +1,66 @@
+"""Tests for the SVG render cache."""
+from datetime import datetime
+
+from app.core.config import Settings
+from app.schemas.chart_visualization import ChartConfiguration
+from app.services.chart_visualization import ChartVisualizationService
+from app.services.render_cache import RenderCache
+
+JOHN = dict(name="John Doe", birth_date=datetime(1990, 1, 1, 12, 0), lng=-74.006, lat=40.7128, tz_str="America/New_York")
+
+def test_disk_tier_survives_restart(tmp_path):
+    """SVGs written by one cache are found on disk by a new one."""
+    RenderCache(tmp_path).set("ab" * 32, b"<svg/>")
+
+    cache = RenderCache(tmp_path)
+
+    assert cache.get("ab" * 32) == b"<svg/>"
+    assert cache.stats()["disk_hits"] == 1
+
+def test_entries_written_by_another_process_are_found(tmp_path):
+    """A key missing from a loaded index is looked up on disk and adopted."""
+    cache = RenderCache(tmp_path)
+    assert cache.get("ab" * 32) is None
+
+    RenderCache(tmp_path).set("ab" * 32, b"<svg/>")
+
+    assert cache.get("ab" * 32) == b"<svg/>"
+    assert cache.stats()["disk_entries"] == 1
+
+def test_rescan_enforces_size_limit_on_shared_directory(tmp_path):
+    """A rescan counts entries of other processes and evicts beyond the size limit."""
+    now = [0.0]
+    cache = RenderCache(tmp_path, memory_entries=0, disk_bytes=10, rescan_interval_seconds=60, clock=lambda: now[0])
+    cache.set("a" * 64, b"12345")
+    other = RenderCache(tmp_path)
+    other.set("b" * 64, b"12345")
+    other.set("c" * 64, b"12345")
+
+    now[0] = 60.0
+    stats = cache.stats()
+
+    assert stats["disk_bytes"] <= 10
+    assert stats["disk_evictions"] == 1
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    """The disk tier drops the least recently used SVGs beyond its size limit."""
+    cache = RenderCache(tmp_path, memory_entries=1, disk_bytes=10)
+    cache.set("a" * 64, b"12345")
+    cache.set("b" * 64, b"12345")
+    cache.get("a" * 64)
+    cache.set("c" * 64, b"12345")
+
+    assert cache.get("b" * 64) is None
+    assert cache.get("a" * 64) == b"12345"
+    assert cache.stats()["disk_evictions"] == 1
+
+def test_identical_renders_are_cached(tmp_path):
+    """Equivalent configurations share one rendering; other themes do not."""
+    service = ChartVisualizationService(Settings(), render_cache=RenderCache(tmp_path))
+
+    svg = service.render_natal_chart_svg(**JOHN)
+
+    placidus = ChartConfiguration(houses_system="Placidus").model_dump()
+    assert service.render_natal_chart_svg(**JOHN, config=placidus) == svg
+    assert service.render_cache.stats()["memory_hits"] == 1
+    assert service.render_natal_chart_svg(**JOHN, theme="light") != svg
@@ -0,0 +1,43 @@
+"""Tests for the rendering job registry."""
+import asyncio
+
+from app.services.render_jobs import RenderJobRegistry
+from app.services.render_queue import DONE, RenderQueue, process_next_job
+
+def make_registry(tmp_path):
+    return RenderJobRegistry(RenderQueue(f"sqlite:///{tmp_path}/render_queue.db"), poll_interval=0.01)
+
+def test_wait_and_events_see_jobs_finished_by_a_worker(tmp_path):
+    """Waiters and event subscribers are woken when a worker finishes a job."""
+    registry = make_registry(tmp_path)
+
+    async def run():
+        await registry.submit("natal_1", "natal", "/n.svg", {"name": "John"})
+        events = registry.events(heartbeat_seconds=5)
+        next_event = asyncio.ensure_future(events.__anext__())
+        waiter = asyncio.ensure_future(registry.wait("natal_1", 5))
+        await asyncio.sleep(0.05)
+        assert (await registry.wait("natal_1", 0)).state == "queued"
+        await asyncio.to_thread(process_next_job, registry.queue, lambda job: None, "worker")
+        result = await waiter, await next_event
+        await events.aclose()
+        return result
+
+    waited, event = asyncio.run(run())
+    assert waited.state == DONE and event.chart_id == "natal_1"
+    assert asyncio.run(registry.wait("unknown", 1)) is None
+
+def test_stats_exclude_cache_hits_from_latency(tmp_path):
+    """Render time percentiles only cover rendered jobs."""
+    registry = make_registry(tmp_path)
+
+    async def run():
+        await registry.complete("natal_1", "natal", "/n1.svg")
+        await registry.submit("natal_2", "natal", "/n2.svg", {})
+        await asyncio.to_thread(process_next_job, registry.queue, lambda job: None, "worker")
+        return await registry.stats()
+
+    stats = asyncio.run(run())
+    assert (stats["done"], stats["queued"], stats["failed"]) == (2, 0, 0)
+    assert stats["render_seconds"]["p50"] is not None
+    assert stats["render_seconds"]["p50"] == stats["render_seconds"]["max"]
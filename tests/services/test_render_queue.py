@@ -0,0 +1,90 @@
+"""Tests for the durable render queue."""
+from datetime import datetime
+
+from kerykeion import AstrologicalSubject
+
+from app.services.render_queue import (
+    DONE, FAILED, PRIORITY_API, PRIORITY_BATCH, PRIORITY_WEB, QUEUED,
+    RenderQueue, process_next_job, render_job,
+)
+
+class Clock:
+    """Settable wall clock."""
+    def __init__(self):
+        self.now = 1000.0
+    def __call__(self):
+        return self.now
+
+def make_queue(tmp_path, **kwargs):
+    return RenderQueue(f"sqlite:///{tmp_path}/render_queue.db", **kwargs)
+
+def test_claims_by_priority_and_survives_restart(tmp_path):
+    """Jobs are claimed web first, then API, then batch, from a reopened queue."""
+    queue = make_queue(tmp_path)
+    queue.enqueue("batch_1", "natal", "/b.svg", {"name": "B"}, priority=PRIORITY_BATCH)
+    queue.enqueue("api_1", "natal", "/a.svg", {"name": "A"}, priority=PRIORITY_API)
+    queue.enqueue("web_1", "natal", "/w.svg", {"name": "W", "birth_date": datetime(1990, 1, 1, 12)}, priority=PRIORITY_WEB)
+    queue.close()
+
+    queue = make_queue(tmp_path)
+    first = queue.claim("worker")
+    assert first.chart_id == "web_1"
+    assert first.payload == {"name": "W", "birth_date": datetime(1990, 1, 1, 12), "chart_id": "web_1"}
+    assert [queue.claim("worker").chart_id for _ in range(2)] == ["api_1", "batch_1"]
+    assert queue.claim("worker") is None
+
+def test_failed_attempts_are_retried_then_dead_lettered(tmp_path):
+    """Failures back off exponentially and end in the failed state until retried."""
+    clock = Clock()
+    queue = make_queue(tmp_path, max_attempts=2, retry_backoff_seconds=10, clock=clock)
+    queue.enqueue("natal_1", "natal", "/n.svg", {})
+
+    def fail(job):
+        raise ValueError("bad chart")
+
+    assert process_next_job(queue, fail, "worker").attempts == 1
+    assert queue.get("natal_1").state == QUEUED
+    assert process_next_job(queue, fail, "worker") is None  # Backing off
+    clock.now += 10
+    process_next_job(queue, fail, "worker")
+
+    job = queue.get("natal_1")
+    assert (job.state, job.attempts, job.error) == (FAILED, 2, "bad chart")
+    assert [job.chart_id for job in queue.failed_jobs()] == ["natal_1"]
+    assert queue.retry("natal_1").state == QUEUED
+    process_next_job(queue, lambda job: None, "worker")
+    assert queue.get("natal_1").state == DONE
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    """A job of a worker that died is claimed again after its lease expires."""
+    clock = Clock()
+    queue = make_queue(tmp_path, lease_seconds=60, clock=clock)
+    queue.enqueue("natal_1", "natal", "/n.svg", {})
+    stale = queue.claim("dead-worker")
+    assert queue.claim("worker") is None
+
+    clock.now += 61
+    job = queue.claim("worker")
+    assert job.attempts == 2
+    assert not queue.complete(stale)
+    assert queue.complete(job)
+    assert queue.counts()[DONE] == 1
+
+def test_jobs_render_from_the_shared_subject(tmp_path):
+    """A subject in the payload survives the queue and is handed to the renderer instead of birth data."""
+    subject = AstrologicalSubject(
+        "W", 1990, 1, 1, 12, 0, lng=-0.13, lat=51.51, tz_str="Europe/London", online=False
+    ).model()
+    queue = make_queue(tmp_path)
+    queue.enqueue("web_1", "natal", "/w.svg", {"name": "W", "birth_date": datetime(1990, 1, 1, 12), "subject": subject})
+
+    class ChartService:
+        def generate_natal_chart_svg(self, **render):
+            self.render = render
+
+    chart_service = ChartService()
+    process_next_job(queue, lambda job: render_job(chart_service, job), "worker")
+
+    assert queue.get("web_1").state == DONE
+    assert chart_service.render["subject"] == subject
+    assert chart_service.render["chart_id"] == "web_1"
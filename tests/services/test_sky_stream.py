@@ -0,0 +1,41 @@
+"""Tests for animated sky charts."""
+import asyncio
+from datetime import datetime, timezone
+
+from kerykeion import AstrologicalSubject
+
+from app.services.sky_stream import SkyStream
+
+LONDON = dict(lat=51.5072, lng=-0.1276, tz_str="Europe/London")
+
+def test_rendered_positions_match_kerykeion():
+    """The positions of the first frame are those Kerykeion draws the wheel with."""
+    sky = SkyStream(start=datetime(2024, 3, 20, 12, 0), **LONDON)
+    subject = AstrologicalSubject("Sky", 2024, 3, 20, 12, 0, online=False, **LONDON)
+
+    points = sky.first_frame()["points"]
+
+    assert abs(points["Moon"]["abs_pos"] - subject.moon.abs_pos) < 1e-3
+    assert abs(points["Ascendant"]["abs_pos"] - subject.first_house.abs_pos) < 1e-3
+    assert all(point["offset"] == 0 for point in points.values())
+
+def test_frames_only_send_points_that_moved():
+    """Scrubbing through time sends the points that moved, with their offset from the rendered wheel."""
+    sky = SkyStream(start=datetime(2024, 3, 20, 12, 0), step_seconds=3600, min_delta_degrees=0.1, **LONDON)
+
+    async def collect():
+        return [frame async for frame in sky.frames(interval_seconds=0, count=2)]
+
+    first, second = asyncio.run(collect())
+
+    assert first["time"] == "2024-03-20T13:00:00+00:00"
+    assert "Moon" in first["points"] and "Pluto" not in first["points"]
+    assert 0.4 < first["points"]["Moon"]["offset"] < 0.7
+    assert 0.9 < second["points"]["Moon"]["offset"] < 1.3
+
+def test_aware_start_is_converted_to_local_time():
+    """A start time with an offset is the same instant in the observer's timezone."""
+    sky = SkyStream(start=datetime(2024, 3, 1, 12, 0, tzinfo=timezone.utc), lat=40.7128, lng=-74.006, tz_str="America/New_York")
+
+    assert sky.start == datetime(2024, 3, 1, 7, 0)
+    assert sky.first_frame()["time"] == "2024-03-01T07:00:00-05:00"
@@ -0,0 +1,72 @@
+"""Tests for the synastry service."""
+from datetime import datetime
+
+import pytest
+from kerykeion import AstrologicalSubject, SynastryAspects
+
+from app.core.exceptions import LocationError
+from app.schemas.natal_chart import NatalChartRequest
+from app.schemas.synastry import DEFAULT_SYNASTRY_ASPECTS, DEFAULT_SYNASTRY_POINTS
+from app.services.astrology import AstrologyService
+from app.services.chart_cache import ChartCache
+from app.services.synastry import SynastryService
+
+JOHN = NatalChartRequest(
+    name="John Doe",
+    birth_date=datetime(1990, 1, 1, 12, 0),
+    lng=-74.006,
+    lat=40.7128,
+    tz_str="America/New_York"
+)
+JANE = NatalChartRequest(
+    name="Jane Smith",
+    birth_date=datetime(1992, 5, 15, 15, 30),
+    lng=-118.243,
+    lat=34.052,
+    tz_str="America/Los_Angeles"
+)
+
+@pytest.fixture
+def service():
+    """Create a SynastryService with a fresh chart cache."""
+    return SynastryService(AstrologyService(chart_cache=ChartCache()))
+
+def as_tuples(aspects):
+    return [(a.p1_name, a.p2_name, a.aspect, a.orbit) for a in aspects]
+
+def kerykeion_aspects(first: NatalChartRequest, second: NatalChartRequest):
+    """Synastry aspects calculated by Kerykeion."""
+    subjects = [
+        AstrologicalSubject(
+            r.name, r.birth_date.year, r.birth_date.month, r.birth_date.day,
+            r.birth_date.hour, r.birth_date.minute,
+            lng=r.lng, lat=r.lat, tz_str=r.tz_str, online=False
+        )
+        for r in (first, second)
+    ]
+    return as_tuples(SynastryAspects(*subjects).all_aspects)
+
+def test_matches_kerykeion_synastry(service):
+    """Cross aspects are identical to Kerykeion's SynastryAspects."""
+    aspects = service.calculate_synastry(JOHN, JANE, DEFAULT_SYNASTRY_POINTS, DEFAULT_SYNASTRY_ASPECTS)
+
+    assert as_tuples(aspects) == kerykeion_aspects(JOHN, JANE)
+
+def test_positions_are_cached(service):
+    """Repeated comparisons reuse the cached natal positions."""
+    service.calculate_synastry(JOHN, JANE, DEFAULT_SYNASTRY_POINTS, DEFAULT_SYNASTRY_ASPECTS)
+    service.calculate_synastry(JANE, JOHN, DEFAULT_SYNASTRY_POINTS, DEFAULT_SYNASTRY_ASPECTS)
+
+    assert service.astrology_service.chart_cache.stats()["hits"] == 2
+
+def test_one_against_many(service):
+    """Each candidate gets the same aspects as a one-to-one comparison, or its own error."""
+    invalid = NatalChartRequest(name="Nowhere", birth_date=datetime(1990, 1, 1, 12, 0))
+
+    results = service.calculate_matches(
+        JOHN, [JANE, invalid, JOHN], DEFAULT_SYNASTRY_POINTS, DEFAULT_SYNASTRY_ASPECTS
+    )
+
+    assert as_tuples(results[0]) == kerykeion_aspects(JOHN, JANE)
+    assert isinstance(results[1], LocationError)
+    assert as_tuples(results[2]) == kerykeion_aspects(JOHN, JOHN)
@@ -0,0 +1,50 @@
+"""Tests for chart thumbnails."""
+import io
+import os
+
+from PIL import Image
+
+from app.services.artifact_store import ChartArtifactStore, LocalDirectoryBackend
+from app.services.thumbnails import ThumbnailService, build_pyramid
+
+def make_png(width: int, height: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGBA", (width, height), (255, 114, 0, 255)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+class CountingConversion:
+    """Conversion service rendering a blank PNG of the requested width."""
+
+    def __init__(self):
+        self.widths = []
+
+    def render_svg_to_png(self, svg_content, width):
+        self.widths.append(width)
+        return make_png(width, round(width * 550 / 820))
+
+def test_pyramid_keeps_aspect_ratio_in_every_format():
+    """Every size is encoded in every format with the aspect ratio of the render."""
+    thumbnails = build_pyramid(make_png(1024, 687), sizes=[128, 512, 1024], formats=["webp", "png"])
+
+    assert set(thumbnails) == {(size, fmt) for size in (128, 512, 1024) for fmt in ("webp", "png")}
+    with Image.open(io.BytesIO(thumbnails[(128, "webp")])) as image:
+        assert image.format == "WEBP" and image.size == (128, 86)
+    with Image.open(io.BytesIO(thumbnails[(512, "png")])) as image:
+        assert image.format == "PNG" and image.size == (512, 344)
+
+def test_thumbnails_rendered_once_until_svg_changes(tmp_path):
+    """The SVG is rasterized once at the largest size, and again only when it is newer than its thumbnails."""
+    conversion = CountingConversion()
+    service = ThumbnailService(conversion, store=ChartArtifactStore(LocalDirectoryBackend(tmp_path)), sizes=(128, 512))
+    svg_path = tmp_path / "natal_1.svg"
+    svg_path.write_text("<svg/>", encoding="utf-8")
+
+    assert service.get("natal_1", 128, "png") == "natal_1.128.png"
+    assert service.get("natal_1", 512, "webp") == "natal_1.512.webp"
+    assert (tmp_path / "natal_1.512.webp").exists()
+    assert conversion.widths == [512]
+
+    os.utime(svg_path, (svg_path.stat().st_mtime + 10,) * 2)
+    service.get("natal_1", 128, "webp")
+    assert conversion.widths == [512, 512]
+    assert service.get("unknown", 128, "webp") is None
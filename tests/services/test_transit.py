@@ -0,0 +1,107 @@
+"""Tests for the ephemeris table and transit timeline service."""
+import json
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from app.core.exceptions import InvalidDateRangeError
+from app.services.astrology import AstrologyService
+from app.services.ephemeris_table import EPHE_PATH, datetime_to_jd, load_ephemeris_table
+from app.services.transit import TransitService
+
+NATAL_LONGITUDES = {"Sun": 281.03, "Moon": 10.5, "Ascendant": 200.25}
+SWE_IDS = {"Sun": 0, "Moon": 1, "Mars": 4, "Saturn": 6}
+
+@pytest.fixture(scope="module")
+def transit_service(tmp_path_factory):
+    """Transit service with a small table built for the test."""
+    path = tmp_path_factory.mktemp("ephemeris") / "daily.npy"
+    service = TransitService(str(path), start_year=2025, end_year=2025)
+    service.table
+    return service
+
+def longitude_at(point: str, moment: datetime) -> tuple[float, float]:
+    """Longitude and speed of a body straight from the Swiss Ephemeris."""
+    swe.set_ephe_path(EPHE_PATH)
+    position = swe.calc_ut(datetime_to_jd(moment), SWE_IDS[point], swe.FLG_SWIEPH + swe.FLG_SPEED)[0]
+    return position[0], position[3]
+
+def test_table_is_memory_mapped(transit_service):
+    """A table on disk is reopened as a memory map without rebuilding."""
+    table = load_ephemeris_table(transit_service.table_path, 2025, 2025)
+
+    assert isinstance(table.data, np.memmap)
+    assert table.covers(datetime_to_jd(datetime(2025, 1, 1)), datetime_to_jd(datetime(2025, 12, 31)))
+
+def test_manifest_points_at_the_table_it_describes(transit_service):
+    """The manifest names the array it describes, and no temporary files are left behind."""
+    table_path = Path(transit_service.table_path)
+    manifest = json.loads(table_path.with_suffix(".json").read_text())
+
+    assert (manifest["start_year"], manifest["end_year"]) == (2025, 2025)
+    assert np.load(table_path.with_name(manifest["data_file"]), mmap_mode="r").shape[0] == len(transit_service.table)
+    assert not list(table_path.parent.glob("*.tmp*"))
+
+def test_exact_times_match_swiss_ephemeris(transit_service):
+    """Every transit is exact to within a minute of rounding."""
+    transits = transit_service.calculate_transits(
+        NATAL_LONGITUDES, datetime(2025, 1, 1), datetime(2025, 12, 31),
+        transiting_points=["Sun", "Moon", "Saturn"],
+        natal_points=list(NATAL_LONGITUDES),
+        aspects=["conjunction", "square", "trine"]
+    )
+
+    assert transits
+    assert [t.date for t in transits] == sorted(t.date for t in transits)
+    for transit in transits:
+        longitude, speed = longitude_at(transit.transiting_point, transit.date)
+        offset = (longitude - transit.transit_longitude + 180) % 360 - 180
+        assert abs(offset / speed) * 1440 <= 0.51
+        if abs(speed) > 1e-3:
+            assert transit.retrograde == (speed < 0)
+
+def test_finds_every_crossing(transit_service):
+    """The transits match an hourly brute-force search."""
+    start, end = datetime(2025, 1, 1), datetime(2025, 12, 31)
+    transits = transit_service.calculate_transits(
+        NATAL_LONGITUDES, start, end,
+        transiting_points=["Mars"],
+        natal_points=list(NATAL_LONGITUDES),
+        aspects=["conjunction", "opposition", "sextile"]
+    )
+
+    swe.set_ephe_path(EPHE_PATH)
+    julian_days = np.arange(datetime_to_jd(start), datetime_to_jd(end), 1 / 24)
+    longitudes = np.array([swe.calc_ut(jd, SWE_IDS["Mars"], swe.FLG_SWIEPH)[0][0] for jd in julian_days])
+    expected = 0
+    for natal_longitude in NATAL_LONGITUDES.values():
+        for angle in (0, 180, 60, -60):
+            offsets = (longitudes - natal_longitude - angle + 180) % 360 - 180
+            expected += np.sum(
+                (np.sign(offsets[:-1]) != np.sign(offsets[1:]))
+                & (np.abs(offsets[1:] - offsets[:-1]) < 180)
+            )
+
+    assert len(transits) == expected
+
+def test_invalid_ranges(transit_service):
+    """Empty periods and periods outside the table are rejected."""
+    with pytest.raises(InvalidDateRangeError):
+        transit_service.calculate_transits(
+            NATAL_LONGITUDES, datetime(2025, 6, 1), datetime(2025, 1, 1), ["Sun"], ["Sun"], ["conjunction"]
+        )
+    with pytest.raises(InvalidDateRangeError):
+        transit_service.calculate_transits(
+            NATAL_LONGITUDES, datetime(2030, 1, 1), datetime(2030, 6, 1), ["Sun"], ["Sun"], ["conjunction"]
+        )
+
+def test_natal_points_at_null_island():
+    """Longitude and latitude of 0 are a valid place, not missing coordinates."""
+    longitudes = AstrologyService().calculate_point_longitudes(
+        "Null Island", datetime(1990, 1, 1, 12, 0), lng=0.0, lat=0.0, tz_str="UTC"
+    )
+
+    assert 0 <= longitudes["Sun"] < 360
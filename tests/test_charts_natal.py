@@ -148,4 +148,30 @@ def test_calculate_natal_chart_different_house_system(valid_natal_chart_request)
     assert data["house_system"]["identifier"] == "W"
     
     # House systems have different names
-    assert data["house_system"]["name"] != "Placidus" 
\ No newline at end of file
+    assert data["house_system"]["name"] != "Placidus" 
+
+def test_calculate_natal_charts_batch(valid_natal_chart_request):
+    """Test batch natal chart calculation with per-item errors."""
+    invalid_request = {
+        "name": "Jane Doe",
+        "birth_date": "1992-03-15T15:30:00"
+    }
+    
+    response = client.post(
+        "/api/v1/charts/natal/batch",
+        json=[valid_natal_chart_request, invalid_request]
+    )
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert len(data) == 2
+    
+    # First item was calculated
+    assert data[0]["index"] == 0
+    assert data[0]["chart"]["name"] == valid_natal_chart_request["name"]
+    assert len(data[0]["chart"]["houses"]) == 12
+    
+    # Second item reports its error without failing the batch
+    assert data[1]["index"] == 1
+    assert "chart" not in data[1]
+    assert data[1]["error_type"] == "LocationError"
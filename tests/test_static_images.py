@@ -91,6 +91,26 @@ def test_generate_natal_chart_visualization(valid_natal_visualization_request):
     assert svg_response.headers["content-type"] == "image/svg+xml"
     assert "<svg" in svg_response.text
 
+def test_generated_svg_served_precompressed(valid_natal_visualization_request):
+    """A generated SVG is served from its gzip variant to clients that accept gzip."""
+    response = client.post(
+        "/api/v1/charts/visualization/natal",
+        json=valid_natal_visualization_request
+    )
+    svg_url = response.json()["svg_url"]
+
+    compressed = client.get(svg_url, headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["content-type"] == "image/svg+xml"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+
+    identity = client.get(svg_url, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    assert identity.text == compressed.text
+
+    not_modified = client.get(svg_url, headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["etag"]})
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
 def test_generate_synastry_chart_visualization(valid_synastry_visualization_request):
     """Test generating a synastry chart visualization."""
     response = client.post(
@@ -148,7 +168,7 @@ def setup_static_dir():
     os.makedirs("app/static/images/svg", exist_ok=True)
     # Clean any existing SVGs to avoid test interference
     for file in os.listdir("app/static/images/svg"):
-        if file.endswith(".svg"):
+        if file.endswith((".svg", ".svg.gz", ".svg.br")):
             os.remove(os.path.join("app/static/images/svg", file))
     
     # Create a sample.svg file for tests that rely on it
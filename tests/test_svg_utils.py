@@ -1,5 +1,5 @@
 import pytest
-from app.core.svg_utils import parse_css_variables, substitute_css_variables, preprocess_svg_for_conversion
+from app.core.svg_utils import parse_css_variables, substitute_css_variables, preprocess_svg_for_conversion, svg_pixel_size
 
 SAMPLE_SVG_WITH_VARS = """<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" width="500" height="500">
@@ -115,4 +115,11 @@ def test_substitute_css_variables_with_defaults():
     variables = {}
     
     result = substitute_css_variables(svg_with_defaults, variables)
-    assert 'fill: #eeeeee' in result 
\ No newline at end of file
+    assert 'fill: #eeeeee' in result 
+
+def test_svg_pixel_size_scales_physical_units_only():
+    """Test that only physical units grow with the DPI, like cairosvg renders them."""
+    assert svg_pixel_size(SAMPLE_SVG_WITH_VARS, dpi=300) == (500, 500)
+    assert svg_pixel_size('<svg viewBox="0 0 820 550">', dpi=2000) == (820, 550)
+    assert svg_pixel_size('<svg width="2in" height="1in" viewBox="0 0 10 5">', dpi=300) == (600, 300)
+    assert svg_pixel_size('<svg width="100%" height="100%">') is None